@@ -4,8 +4,10 @@ from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache, company_tag
 from app.core.database import get_db
 from app.crud.company import company as company_crud
 from app.crud.industry import industry as industry_crud
@@ -54,7 +56,15 @@ async def get_company(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific company."""
-    company = await company_crud.get(db, company_id)
+    async def load_company():
+        company = await company_crud.get(db, company_id)
+        if not company:
+            return None
+        return jsonable_encoder(CompanyResponse.model_validate(company))
+
+    company = await cache.get_or_set(
+        f"companies:{company_id}", load_company, tags=[company_tag(company_id)]
+    )
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,8 +87,15 @@ async def get_company_rate_sheets(
             detail="Company not found"
         )
 
-    rate_sheets = await rate_sheet_crud.get_by_company(db, company_id)
-    return rate_sheets
+    async def load_rate_sheets():
+        rate_sheets = await rate_sheet_crud.get_by_company(db, company_id)
+        return jsonable_encoder(
+            [RateSheetResponse.model_validate(rs) for rs in rate_sheets]
+        )
+
+    return await cache.get_or_set(
+        f"companies:{company_id}:rate_sheets", load_rate_sheets, tags=[company_tag(company_id)]
+    )
 
 
 @router.post("/", response_model=CompanyResponse, status_code=status.HTTP_201_CREATED)
@@ -143,6 +160,7 @@ async def update_company(
 
     company = await company_crud.update(db, db_obj=company, obj_in=company_in)
     await db.commit()
+    await cache.invalidate_tags(company_tag(company_id))
     return company
 
 
@@ -205,3 +223,4 @@ async def delete_company(
             detail="Company not found"
         )
     await db.commit()
+    await cache.invalidate_tags(company_tag(company_id))
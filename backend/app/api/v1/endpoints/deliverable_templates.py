@@ -22,15 +22,17 @@ router = APIRouter()
 async def get_deliverable_templates(
     company_id: UUID = None,
     project_size: str = None,
+    deliverable: str = None,
     skip: int = 0,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get deliverable templates, optionally filtered by company and/or project size."""
+    """Get deliverable templates, optionally filtered by company, project size and contained deliverable."""
     templates = await template_crud.get_multi(
         db,
         company_id=company_id,
         project_size=project_size,
+        deliverable_name=deliverable,
         skip=skip,
         limit=limit
     )
@@ -1,16 +1,21 @@
 """Deliverables endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 import json
+import logging
 
+from app.core.database import get_db
+from app.crud.deliverable import deliverable_crud
 from app.dependencies import get_current_user
 from app.data.standard_deliverables import get_deliverables_for_discipline, get_all_disciplines
 from app.data.project_templates import get_project_template, get_recommended_deliverables, PROJECT_PHASES
 from app.models.user import User
+from app.schemas.deliverable import CatalogDeliverableResponse
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -29,9 +34,8 @@ async def get_standard_deliverables(
     Returns:
         List of standard deliverables
     """
-    print(f"DEBUG: Received discipline request: {discipline}")
     deliverables = get_deliverables_for_discipline(discipline)
-    print(f"DEBUG: Found {len(deliverables) if deliverables else 0} deliverables")
+    logger.debug(f"Found {len(deliverables) if deliverables else 0} standard deliverables for {discipline}")
 
     if not deliverables:
         raise HTTPException(
@@ -114,14 +118,39 @@ async def get_project_deliverables_template(
         "disciplines": sorted(list(set(d.get("discipline", "Multidiscipline") for d in all_deliverables)))
     }
 
-    print("DEBUG: deliverables_by_phase structure:")
-    for phase_key, phase_data in deliverables_by_phase.items():
-        print(f"  Phase '{phase_key}': type={type(phase_data)}, keys={list(phase_data.keys()) if isinstance(phase_data, dict) else 'N/A'}")
+    logger.debug(
+        f"Template for {project_size}: {len(all_deliverables)} deliverables in phases {list(deliverables_by_phase)}"
+    )
 
     # Use JSONResponse to ensure proper serialization
     return JSONResponse(content=result)
 
 
+@router.get("/catalog", response_model=List[CatalogDeliverableResponse])
+async def list_catalog_deliverables(
+    *,
+    db: AsyncSession = Depends(get_db),
+    phase: Optional[str] = Query(None, description="frame, screen, refine or implement"),
+    discipline: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+) -> List[CatalogDeliverableResponse]:
+    """
+    List the imported Engineering Master Deliverables List.
+
+    Populated by the deliverable_catalog_import job.
+
+    Args:
+        db: Database session
+        phase: Only this phase
+        discipline: Only this discipline
+        current_user: Current authenticated user
+
+    Returns:
+        Catalog entries in phase and list order
+    """
+    return await deliverable_crud.get_catalog(db, phase=phase, discipline=discipline)
+
+
 @router.get("/phases")
 async def list_project_phases(
     current_user: User = Depends(get_current_user)
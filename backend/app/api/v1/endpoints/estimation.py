@@ -3,32 +3,84 @@
 import logging
 from uuid import UUID
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache, COMPLEXITY_COEFFICIENTS_TAG
 from app.core.database import get_db
-from app.dependencies import get_current_user
+from app.core.offload import offloader
+from app.dependencies import get_current_user, get_current_active_superuser, get_websocket_user
 from app.models.user import User
 from app.crud.project import project_crud
+from app.crud.deliverable import deliverable_crud
+from app.crud.complexity_coefficients import complexity_coefficient_set as coefficient_set_crud
 from app.schemas.estimation import (
     EstimationRequest,
     EstimationResponse,
     ComplexityFactorsResponse,
     ComplexityFactorInfo,
     CostCalculationRequest,
-    CostCalculationResponse
+    CostCalculationResponse,
+    PhaseGateEstimateResponse,
+    CampaignEstimateRequest,
+    CampaignEstimateResponse,
+    CashFlowResponse,
+    EstimateVersionSummary,
+    EstimateVersionResponse,
+    EstimateVersionComparison
+)
+from app.schemas.complexity_coefficients import (
+    CalibrationRequest,
+    ComplexityCoefficientSetResponse,
 )
 from app.services.estimation.engine import EstimationEngine
-from app.services.estimation.complexity import ComplexityCalculator
+from app.services.estimation.calibration import calibrate_complexity_factors, store_calibration
+from app.services.estimation.campaign import DEFAULT_HOURLY_RATE, estimate_campaign
+from app.services.estimation.live import LiveEstimateSession
+from app.services.estimation.scenarios import project_base_inputs
+from app.services.estimation.snapshots import (
+    compare_versions,
+    get_version,
+    get_versions,
+    record_estimate_version,
+)
+from app.services.estimation.phase_gate import (
+    phase_gate_estimator,
+    project_phase_deliverables,
+    save_phase_gate_estimate,
+)
+from app.services.cost.cash_flow import generate_cash_flow
 from app.services.cost.cost_calculator import CostCalculator
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 estimation_engine = EstimationEngine()
-complexity_calculator = ComplexityCalculator()
 cost_calculator = CostCalculator()
 
+ACTIVE_COEFFICIENTS_KEY = "complexity_coefficients:active"
+
+
+async def sync_complexity_coefficients(db: AsyncSession) -> None:
+    """
+    Hot-swap the engine to the active coefficient set if it changed.
+
+    The active set is read through the two-tier cache, so this is a local
+    lookup on most requests; activation invalidates it on every worker.
+    """
+    async def load_active():
+        active = await coefficient_set_crud.get_active(db)
+        if not active:
+            return {"version": None, "coefficients": None}
+        return {"version": active.version, "coefficients": active.coefficients}
+
+    active = await cache.get_or_set(
+        ACTIVE_COEFFICIENTS_KEY, load_active, tags=[COMPLEXITY_COEFFICIENTS_TAG]
+    )
+    if active["version"] != estimation_engine.coefficient_version:
+        estimation_engine.use_coefficients(active["coefficients"], active["version"])
+
 
 @router.post("/{project_id}/estimate", response_model=EstimationResponse)
 async def calculate_estimate(
@@ -59,6 +111,11 @@ async def calculate_estimate(
             detail="Project not found"
         )
 
+    await sync_complexity_coefficients(db)
+
+    # Historical accuracy for the project's discipline (one pre-aggregated row)
+    historical_stats = await deliverable_crud.get_historical_stats(db, discipline=project.discipline)
+
     # Calculate estimate
     logger.info(f"Estimation request for project {project_id}: base_hours_override={estimation_request.base_hours_override}, client_complexity={estimation_request.client_complexity}")
     result = estimation_engine.calculate_estimate(
@@ -69,7 +126,8 @@ async def calculate_estimate(
         contingency_percent=estimation_request.contingency_percent,
         overhead_percent=estimation_request.overhead_percent,
         base_hours_override=estimation_request.base_hours_override,
-        client_complexity=estimation_request.client_complexity
+        client_complexity=estimation_request.client_complexity,
+        historical_stats=historical_stats
     )
 
     # Update project with results
@@ -86,12 +144,188 @@ async def calculate_estimate(
         }
     )
 
+    # Keep the run in the project's estimate history
+    await record_estimate_version(
+        db, project_id,
+        inputs=estimation_request.model_dump(mode="json"),
+        outputs=jsonable_encoder(result.to_dict()),
+        user_id=current_user.id
+    )
+
     return EstimationResponse(**result.to_dict())
 
 
+@router.get("/{project_id}/versions", response_model=List[EstimateVersionSummary])
+async def list_estimate_versions(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user)
+) -> List[EstimateVersionSummary]:
+    """
+    List a project's estimate versions, newest first.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        skip: Number of versions to skip
+        limit: Maximum number of versions to return
+        current_user: Current authenticated user
+
+    Returns:
+        Version summaries with the changes from each previous version
+    """
+    versions = await get_versions(db, project_id, skip=skip, limit=limit)
+    return [EstimateVersionSummary.model_validate(v) for v in versions]
+
+
+@router.get("/{project_id}/versions/compare", response_model=EstimateVersionComparison)
+async def compare_estimate_versions(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    a: int,
+    b: int,
+    current_user: User = Depends(get_current_user)
+) -> EstimateVersionComparison:
+    """
+    Compare two estimate versions of a project.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        a: Base version
+        b: Version compared against a
+        current_user: Current authenticated user
+
+    Returns:
+        Input and output diffs (JSON Patch from a to b) and headline deltas
+    """
+    comparison = await compare_versions(db, project_id, a, b)
+    if comparison is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Estimate version not found"
+        )
+    return EstimateVersionComparison(**comparison)
+
+
+@router.get("/{project_id}/versions/{version}", response_model=EstimateVersionResponse)
+async def get_estimate_version(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    version: int,
+    current_user: User = Depends(get_current_user)
+) -> EstimateVersionResponse:
+    """
+    Get an estimate version with its inputs and outputs.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        version: Version number
+        current_user: Current authenticated user
+
+    Returns:
+        Estimate version
+    """
+    found = await get_version(db, project_id, version)
+    if found is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Estimate version not found"
+        )
+    summary = EstimateVersionSummary.model_validate(found["version"])
+    return EstimateVersionResponse(**summary.model_dump(), inputs=found["inputs"], outputs=found["outputs"])
+
+
+@router.post("/{project_id}/phase-gate", response_model=PhaseGateEstimateResponse)
+async def calculate_phase_gate_estimate(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> PhaseGateEstimateResponse:
+    """
+    Estimate a phase-gate project per phase with accuracy bands.
+
+    Only phases whose deliverables changed since the stored estimate are
+    recomputed. Results are saved to the project's financial breakdown
+    (cost_by_phase) and phase_completion.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        current_user: Current authenticated user
+
+    Returns:
+        Per-phase hours, cost and low/high bands
+    """
+    project = await project_crud.get(db, id=project_id)
+
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    previous = await project_crud.get_cost_by_phase(db, project_id)
+    items = project_phase_deliverables(project)
+    estimate = await offloader.run(
+        phase_gate_estimator.estimate, items,
+        multiplier=project.complexity_multiplier or 1.0, previous=previous,
+        size=len(items), kind="thread"
+    )
+    await save_phase_gate_estimate(db, project, estimate)
+    await db.commit()
+
+    logger.info(f"Phase-gate estimate for project {project_id}: recomputed {estimate.recomputed}")
+    return PhaseGateEstimateResponse(phases=estimate.phases, totals=estimate.totals, recomputed=estimate.recomputed)
+
+
+@router.post("/{project_id}/cash-flow", response_model=CashFlowResponse)
+async def calculate_cash_flow(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    force: bool = False,
+    current_user: User = Depends(get_current_user)
+) -> CashFlowResponse:
+    """
+    Time-phased cost (S-curve) and monthly invoicing of a project.
+
+    The stored result is returned unless the deliverables, project or
+    rates changed since it was generated.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        force: Regenerate even if nothing changed
+        current_user: Current authenticated user
+
+    Returns:
+        Weekly S-curve and monthly invoices
+    """
+    project = await project_crud.get(db, id=project_id)
+
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    cash_flow = await generate_cash_flow(db, project, force=force)
+    await db.commit()
+    return CashFlowResponse(**cash_flow)
+
+
 @router.post("/quick-estimate", response_model=EstimationResponse)
 async def quick_estimate(
     *,
+    db: AsyncSession = Depends(get_db),
     estimation_request: EstimationRequest,
     current_user: User = Depends(get_current_user)
 ) -> EstimationResponse:
@@ -99,12 +333,15 @@ async def quick_estimate(
     Quick estimation without saving to project.
 
     Args:
+        db: Database session
         estimation_request: Estimation parameters
         current_user: Current authenticated user
 
     Returns:
         Estimation results
     """
+    await sync_complexity_coefficients(db)
+
     # Calculate estimate
     result = estimation_engine.calculate_estimate(
         project_size=estimation_request.project_size,
@@ -120,20 +357,108 @@ async def quick_estimate(
     return EstimationResponse(**result.to_dict())
 
 
+@router.websocket("/{project_id}/live")
+async def live_estimate(
+    websocket: WebSocket,
+    project_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_websocket_user)
+) -> None:
+    """
+    Live estimate channel for a project editing session.
+
+    The client sends JSON Patch deltas against the session inputs; they
+    are debounced and coalesced, recomputed incrementally and answered
+    with a JSON Patch of the changed result fields (see
+    app.services.estimation.live for the message format).
+
+    Args:
+        websocket: Connection (authenticated with ?token=)
+        project_id: Project ID
+        db: Database session
+        current_user: Current authenticated user
+    """
+    project = await project_crud.get(db, id=project_id)
+    if not project:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Project not found")
+        return
+
+    await sync_complexity_coefficients(db)
+    historical_stats = await deliverable_crud.get_historical_stats(db, discipline=project.discipline)
+    deliverables = await deliverable_crud.get_by_project(db, project_id=project_id)
+
+    inputs = {
+        "estimate": project_base_inputs(project),
+        "deliverables": [{"name": d.name, "hours": d.hours_total or 0} for d in deliverables],
+    }
+    # Don't hold a pooled connection for the life of the socket
+    await db.close()
+
+    session = LiveEstimateSession(inputs, engine=estimation_engine, historical_stats=historical_stats)
+
+    async def send(message: dict) -> None:
+        await websocket.send_json(jsonable_encoder(message))
+
+    await websocket.accept()
+    logger.info(f"Live estimate session opened for project {project_id}")
+    try:
+        await session.run(websocket.receive_json, send)
+    except WebSocketDisconnect:
+        logger.info(f"Live estimate session closed for project {project_id} after {session.recomputes} recomputes")
+
+
+@router.post("/campaign", response_model=CampaignEstimateResponse)
+async def campaign_estimate(
+    *,
+    campaign_request: CampaignEstimateRequest,
+    current_user: User = Depends(get_current_user)
+) -> CampaignEstimateResponse:
+    """
+    Estimate a campaign (retainer) month by month, per discipline and site.
+
+    Args:
+        campaign_request: Duration, sites, recurring hours, scheduled deliverables and pricing
+        current_user: Current authenticated user
+
+    Returns:
+        Totals, monthly projection with billing, and discipline and site totals
+    """
+    params = campaign_request.model_dump()
+    params["scheduled_deliverables"] = [d.model_dump() for d in campaign_request.scheduled_deliverables]
+    params["hourly_rate"] = campaign_request.hourly_rate or DEFAULT_HOURLY_RATE
+
+    try:
+        result = await offloader.run(
+            estimate_campaign, **params,
+            size=campaign_request.duration_months * campaign_request.site_count, kind="thread"
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(f"Campaign estimate: {campaign_request.duration_months} months, "
+                f"{campaign_request.site_count} sites, ${result['summary']['total_cost']:,.2f}")
+    return CampaignEstimateResponse(**result)
+
+
 @router.get("/complexity-factors", response_model=ComplexityFactorsResponse)
 async def get_complexity_factors(
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ) -> ComplexityFactorsResponse:
     """
     Get all available complexity factors.
 
+    Values reflect the active coefficient set, if any.
+
     Args:
+        db: Database session
         current_user: Current authenticated user
 
     Returns:
         Dictionary of complexity factors with metadata
     """
-    factors = complexity_calculator.get_all_factors()
+    await sync_complexity_coefficients(db)
+    factors = estimation_engine.complexity_calculator.get_all_factors()
 
     factors_response = {
         name: ComplexityFactorInfo(**info)
@@ -143,6 +468,117 @@ async def get_complexity_factors(
     return ComplexityFactorsResponse(factors=factors_response)
 
 
+@router.get("/complexity-coefficients", response_model=List[ComplexityCoefficientSetResponse])
+async def list_coefficient_sets(
+    *,
+    db: AsyncSession = Depends(get_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: User = Depends(get_current_user)
+) -> List[ComplexityCoefficientSetResponse]:
+    """
+    List complexity coefficient sets, newest first.
+
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records
+        current_user: Current authenticated user
+
+    Returns:
+        Coefficient sets
+    """
+    return await coefficient_set_crud.get_multi(db, skip=skip, limit=limit)
+
+
+@router.post(
+    "/complexity-coefficients/calibrate",
+    response_model=ComplexityCoefficientSetResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def calibrate_coefficients(
+    *,
+    db: AsyncSession = Depends(get_db),
+    calibration_request: CalibrationRequest,
+    current_user: User = Depends(get_current_active_superuser)
+) -> ComplexityCoefficientSetResponse:
+    """
+    Fit complexity coefficients from completed projects and store a new version.
+
+    Args:
+        db: Database session
+        calibration_request: Calibration parameters
+        current_user: Current superuser
+
+    Returns:
+        New coefficient set
+    """
+    result = await calibrate_complexity_factors(
+        db,
+        ridge_alpha=calibration_request.ridge_alpha,
+        prior=estimation_engine.complexity_calculator.factors
+    )
+    if result.sample_count < calibration_request.min_samples:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Only {result.sample_count} completed projects with actuals "
+                   f"(minimum {calibration_request.min_samples})"
+        )
+
+    return await store_calibration(
+        db, result, notes=calibration_request.notes, activate=calibration_request.activate
+    )
+
+
+@router.post("/complexity-coefficients/{version}/activate", response_model=ComplexityCoefficientSetResponse)
+async def activate_coefficient_set(
+    *,
+    db: AsyncSession = Depends(get_db),
+    version: int,
+    current_user: User = Depends(get_current_active_superuser)
+) -> ComplexityCoefficientSetResponse:
+    """
+    Activate a coefficient set; all workers switch on their next estimate.
+
+    Args:
+        db: Database session
+        version: Coefficient set version
+        current_user: Current superuser
+
+    Returns:
+        Activated coefficient set
+    """
+    coefficient_set = await coefficient_set_crud.get_by_version(db, version=version)
+    if not coefficient_set:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Coefficient set not found"
+        )
+
+    await coefficient_set_crud.activate(db, db_obj=coefficient_set)
+    await db.commit()
+    await cache.invalidate_tags(COMPLEXITY_COEFFICIENTS_TAG)
+    return coefficient_set
+
+
+@router.delete("/complexity-coefficients/active", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate_coefficient_sets(
+    *,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_superuser)
+) -> None:
+    """
+    Revert to the built-in complexity coefficients.
+
+    Args:
+        db: Database session
+        current_user: Current superuser
+    """
+    await coefficient_set_crud.activate(db, db_obj=None)
+    await db.commit()
+    await cache.invalidate_tags(COMPLEXITY_COEFFICIENTS_TAG)
+
+
 @router.post("/calculate-costs", response_model=CostCalculationResponse)
 async def calculate_costs(
     *,
@@ -168,8 +604,10 @@ async def calculate_costs(
         for d in cost_request.deliverables
     ]
 
-    # Calculate project costs
-    result = calculator.calculate_project_cost(deliverables_list)
+    # Calculate project costs (large lists run in the worker pool)
+    result = await offloader.run(
+        calculator.calculate_project_cost, deliverables_list, size=len(deliverables_list)
+    )
 
     logger.info(f"Cost calculation: {len(deliverables_list)} deliverables, "
                 f"total ${result['summary']['total_cost']:,.2f}")
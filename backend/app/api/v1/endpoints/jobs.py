@@ -0,0 +1,137 @@
+"""Background job endpoints."""
+
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.job import JobResponse, JobResultResponse, JobSubmit
+from app.workers.jobs import JobRecord, JobStatus, job_manager, registered_jobs, requires_superuser
+
+
+router = APIRouter()
+
+
+async def get_owned_job(job_id: str, current_user: User) -> JobRecord:
+    """Load a job visible to the current user or raise 404."""
+    record = await job_manager.get(job_id)
+    if not record or (record.user_id != str(current_user.id) and not current_user.is_superuser):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return record
+
+
+@router.get("/types", response_model=List[str])
+async def list_job_types(
+    current_user: User = Depends(get_current_user)
+) -> List[str]:
+    """
+    List registered job names.
+
+    Args:
+        current_user: Current authenticated user
+
+    Returns:
+        Job names the current user may submit
+    """
+    return registered_jobs(include_superuser=current_user.is_superuser)
+
+
+@router.post("/", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    *,
+    job_in: JobSubmit,
+    current_user: User = Depends(get_current_user)
+) -> JobResponse:
+    """
+    Submit a background job.
+
+    Args:
+        job_in: Job name and parameters
+        current_user: Current authenticated user
+
+    Returns:
+        Pending job; poll the status endpoint for progress
+    """
+    if requires_superuser(job_in.name) and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient privileges"
+        )
+    try:
+        record = await job_manager.submit(job_in.name, job_in.params, user_id=current_user.id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return JobResponse.model_validate(record)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+) -> JobResponse:
+    """
+    Get job status and progress.
+
+    Args:
+        job_id: Job ID
+        current_user: Current authenticated user
+
+    Returns:
+        Job status
+    """
+    return JobResponse.model_validate(await get_owned_job(job_id, current_user))
+
+
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+async def get_job_result(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+) -> JobResultResponse:
+    """
+    Get the result of a finished job.
+
+    Args:
+        job_id: Job ID
+        current_user: Current authenticated user
+
+    Returns:
+        Job result (409 while the job is still pending or running)
+    """
+    record = await get_owned_job(job_id, current_user)
+    if not record.is_finished:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is {record.status}"
+        )
+    if record.status == JobStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=record.error or "Job failed"
+        )
+    return JobResultResponse.model_validate(record)
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+) -> JobResponse:
+    """
+    Request cancellation of a job.
+
+    Args:
+        job_id: Job ID
+        current_user: Current authenticated user
+
+    Returns:
+        Job status after the cancellation request
+    """
+    await get_owned_job(job_id, current_user)
+    record = await job_manager.cancel(job_id)
+    return JobResponse.model_validate(record)
@@ -1,23 +1,139 @@
 """Project management endpoints."""
 
-from typing import List, Optional
+from pathlib import Path
+from typing import List, Optional, Union
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from decimal import Decimal
 
+from app.config import settings
 from app.core.database import get_db
 from app.dependencies import get_current_user
 from app.models.user import User
 from app.models.project import ProjectStatus, ProjectType, WorkType, ProcessType
 from app.crud.project import project_crud
 from app.crud.project_size_settings import project_size_settings
-from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectListResponse
+from app.schemas.project import (
+    Project,
+    ProjectCreate,
+    ProjectUpdate,
+    ProjectClone,
+    ProjectListResponse,
+    ProjectSummary,
+    JSONPatchOperation,
+    JSONPatchResponse,
+    ProjectAnalogsResponse,
+    EVMResponse,
+)
+from app.services.analogs import analog_service
+from app.services.export import (
+    PDF_MEDIA_TYPE,
+    XLSX_MEDIA_TYPE,
+    export_cache,
+    export_estimate_report,
+    export_portfolio,
+    export_project,
+)
+from app.services.clone import clone_project
+from app.services.evm import get_portfolio_evm, get_project_evm
+from app.services.json_patch import JSONPatchError
 
 
 router = APIRouter()
 
+FULL_QUERY = Query(
+    False,
+    description="Return full project objects including JSON configuration columns"
+)
+COMPLEXITY_FACTOR_QUERY = Query(
+    None,
+    description="Only projects with all of these complexity factors enabled (e.g. fasttrack)"
+)
+SELECTED_DISCIPLINE_QUERY = Query(
+    None,
+    description="Only projects that include all of these disciplines"
+)
+DELIVERABLE_QUERY = Query(
+    None,
+    description="Only projects whose deliverables configuration contains this deliverable name"
+)
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[tuple]:
+    """
+    Parse a single-range ``Range: bytes=...`` header.
+
+    Returns:
+        Inclusive (start, end), or None to serve the whole file
+
+    Raises:
+        HTTPException: 416 if the range cannot be satisfied
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_text, _, end_text = header[len("bytes="):].strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = min(int(end_text), size - 1) if end_text else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start, end = max(size - int(end_text), 0), size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
+
+
+def stream_export(request: Request, path: Path, filename: str, media_type: str) -> Response:
+    """
+    Stream a cached export file in chunks, honouring Range requests.
+
+    The cache file name ends in the content version, which doubles as the
+    ETag so unchanged exports are answered with 304.
+    """
+    etag = f'"{path.stem.rsplit("-", 1)[-1]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    size = path.stat().st_size
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+    }
+    byte_range = None
+    if request.headers.get("if-range", etag) == etag:
+        byte_range = parse_range(request.headers.get("range"), size)
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(export_cache.iter_file(path), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        export_cache.iter_file(path, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers
+    )
+
+
+def serialize_project_list(projects: list, full: bool) -> Union[List[Project], List[ProjectSummary]]:
+    """Serialize projects as full objects or lean summaries."""
+    schema = Project if full else ProjectSummary
+    return [schema.model_validate(p) for p in projects]
+
 
 async def apply_phase_gate_recommendation(
     db: AsyncSession,
@@ -118,30 +234,129 @@ async def list_projects(
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    full: bool = FULL_QUERY,
+    complexity_factor: Optional[List[str]] = COMPLEXITY_FACTOR_QUERY,
+    selected_discipline: Optional[List[str]] = SELECTED_DISCIPLINE_QUERY,
+    deliverable: Optional[str] = DELIVERABLE_QUERY,
     current_user: User = Depends(get_current_user)
 ) -> ProjectListResponse:
     """
     List all projects.
 
+    Configuration filters are evaluated in PostgreSQL against the
+    GIN-indexed JSONB columns.
+
     Args:
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records
+        full: Return full objects instead of summaries
+        complexity_factor: Required complexity factors
+        selected_discipline: Required selected disciplines
+        deliverable: Required deliverable name
         current_user: Current authenticated user
 
     Returns:
-        List of projects
+        List of project summaries (or full projects if requested)
     """
-    projects = await project_crud.get_multi(db, skip=skip, limit=limit)
+    projects = await project_crud.get_multi(
+        db,
+        skip=skip,
+        limit=limit,
+        full=full,
+        complexity_factors=complexity_factor,
+        selected_disciplines=selected_discipline,
+        deliverable_name=deliverable
+    )
 
     return ProjectListResponse(
-        items=projects,
+        items=serialize_project_list(projects, full),
         total=len(projects),
         skip=skip,
         limit=limit
     )
 
 
+@router.get("/export.xlsx", response_class=StreamingResponse)
+async def export_portfolio_xlsx(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    project_status: Optional[ProjectStatus] = Query(None, alias="status"),
+    complexity_factor: Optional[List[str]] = COMPLEXITY_FACTOR_QUERY,
+    selected_discipline: Optional[List[str]] = SELECTED_DISCIPLINE_QUERY,
+    deliverable: Optional[str] = DELIVERABLE_QUERY,
+    current_user: User = Depends(get_current_user)
+) -> Response:
+    """
+    Export a portfolio of projects to Excel.
+
+    The workbook lists the matching projects with deliverable totals and
+    breaks their deliverable costs down by role.
+
+    Args:
+        request: HTTP request
+        db: Database session
+        project_status: Only projects in this status
+        complexity_factor: Required complexity factors
+        selected_discipline: Required selected disciplines
+        deliverable: Required deliverable name
+        current_user: Current authenticated user
+
+    Returns:
+        Streamed .xlsx file
+    """
+    filters = {
+        "status": project_status,
+        "complexity_factor": sorted(complexity_factor or []),
+        "selected_discipline": sorted(selected_discipline or []),
+        "deliverable": deliverable,
+    }
+    projects = project_crud.id_query(
+        status=project_status,
+        complexity_factors=complexity_factor,
+        selected_disciplines=selected_discipline,
+        deliverable_name=deliverable
+    )
+    path = await export_portfolio(db, projects, filters=filters)
+
+    return stream_export(request, path, "portfolio.xlsx", XLSX_MEDIA_TYPE)
+
+
+@router.get("/evm", response_model=EVMResponse)
+async def get_portfolio_evm_metrics(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_status: Optional[ProjectStatus] = Query(None, alias="status"),
+    complexity_factor: Optional[List[str]] = COMPLEXITY_FACTOR_QUERY,
+    selected_discipline: Optional[List[str]] = SELECTED_DISCIPLINE_QUERY,
+    deliverable: Optional[str] = DELIVERABLE_QUERY,
+    current_user: User = Depends(get_current_user)
+) -> EVMResponse:
+    """
+    Earned value metrics summed over a portfolio of projects.
+
+    Args:
+        db: Database session
+        project_status: Only projects in this status
+        complexity_factor: Required complexity factors
+        selected_discipline: Required selected disciplines
+        deliverable: Required deliverable name
+        current_user: Current authenticated user
+
+    Returns:
+        Portfolio BAC, PV, EV, AC, CPI, SPI and EAC (hours)
+    """
+    projects = project_crud.id_query(
+        status=project_status,
+        complexity_factors=complexity_factor,
+        selected_disciplines=selected_discipline,
+        deliverable_name=deliverable
+    )
+    metrics = await get_portfolio_evm(db, projects)
+    return EVMResponse(**metrics.to_dict())
+
+
 @router.get("/{project_id}", response_model=Project)
 async def get_project(
     *,
@@ -217,6 +432,80 @@ async def update_project(
     return project
 
 
+async def _apply_json_patch(patch_fn, db: AsyncSession, project_id: UUID, operations: List[JSONPatchOperation]) -> JSONPatchResponse:
+    """Run a CRUD patch method and map its outcome to HTTP responses."""
+    try:
+        changes = await patch_fn(
+            db,
+            project_id=project_id,
+            operations=[op.to_operation() for op in operations]
+        )
+    except JSONPatchError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=e.message
+        )
+
+    if changes is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    await db.commit()
+    return JSONPatchResponse(project_id=project_id, changes=changes)
+
+
+@router.patch("/{project_id}/deliverables-config", response_model=JSONPatchResponse)
+async def patch_deliverables_config(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    operations: List[JSONPatchOperation],
+    current_user: User = Depends(get_current_user)
+) -> JSONPatchResponse:
+    """
+    Partially update the deliverables configuration with a JSON Patch.
+
+    The patch (RFC 6902) is applied inside PostgreSQL with jsonb_set, so
+    autosave only sends the edited fields. Either every operation applies
+    or none do.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        operations: JSON Patch operations
+        current_user: Current authenticated user
+
+    Returns:
+        New values at the changed paths
+    """
+    return await _apply_json_patch(project_crud.patch_deliverables_config, db, project_id, operations)
+
+
+@router.patch("/{project_id}/equipment-list", response_model=JSONPatchResponse)
+async def patch_equipment_list(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    operations: List[JSONPatchOperation],
+    current_user: User = Depends(get_current_user)
+) -> JSONPatchResponse:
+    """
+    Partially update the equipment list with a JSON Patch.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        operations: JSON Patch operations
+        current_user: Current authenticated user
+
+    Returns:
+        New values at the changed paths
+    """
+    return await _apply_json_patch(project_crud.patch_equipment_list, db, project_id, operations)
+
+
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     *,
@@ -243,14 +532,18 @@ async def delete_project(
     await project_crud.delete(db, id=project_id)
 
 
-@router.get("/user/my-projects", response_model=List[Project])
+@router.get("/user/my-projects", response_model=Union[List[ProjectSummary], List[Project]])
 async def get_my_projects(
     *,
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    full: bool = FULL_QUERY,
+    complexity_factor: Optional[List[str]] = COMPLEXITY_FACTOR_QUERY,
+    selected_discipline: Optional[List[str]] = SELECTED_DISCIPLINE_QUERY,
+    deliverable: Optional[str] = DELIVERABLE_QUERY,
     current_user: User = Depends(get_current_user)
-) -> List[Project]:
+) -> Union[List[ProjectSummary], List[Project]]:
     """
     Get projects created by current user.
 
@@ -258,38 +551,48 @@ async def get_my_projects(
         db: Database session
         skip: Number of records to skip
         limit: Maximum number of records
+        full: Return full objects instead of summaries
+        complexity_factor: Required complexity factors
+        selected_discipline: Required selected disciplines
+        deliverable: Required deliverable name
         current_user: Current authenticated user
 
     Returns:
-        List of user's projects
+        List of user's project summaries (or full projects if requested)
     """
     projects = await project_crud.get_by_user(
         db,
         user_id=current_user.id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        full=full,
+        complexity_factors=complexity_factor,
+        selected_disciplines=selected_discipline,
+        deliverable_name=deliverable
     )
 
-    return projects
+    return serialize_project_list(projects, full)
 
 
-@router.get("/{project_id}/modules", response_model=List[Project])
+@router.get("/{project_id}/modules", response_model=Union[List[ProjectSummary], List[Project]])
 async def get_project_modules(
     *,
     db: AsyncSession = Depends(get_db),
     project_id: UUID,
+    full: bool = FULL_QUERY,
     current_user: User = Depends(get_current_user)
-) -> List[Project]:
+) -> Union[List[ProjectSummary], List[Project]]:
     """
     Get all child modules of a facility project.
 
     Args:
         db: Database session
         project_id: Parent project ID
+        full: Return full objects instead of summaries
         current_user: Current authenticated user
 
     Returns:
-        List of child module projects
+        List of child module summaries (or full projects if requested)
     """
     # Verify parent project exists
     parent_project = await project_crud.get(db, id=project_id)
@@ -300,13 +603,193 @@ async def get_project_modules(
         )
 
     # Get child modules
-    from app.models.project import Project as ProjectModel
-    result = await db.execute(
-        select(ProjectModel).where(ProjectModel.parent_project_id == project_id)
+    modules = await project_crud.get_modules(db, parent_project_id=project_id, full=full)
+
+    return serialize_project_list(modules, full)
+
+
+@router.post("/{project_id}/clone", response_model=Project, status_code=status.HTTP_201_CREATED)
+async def clone_project_endpoint(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    clone_data: ProjectClone,
+    current_user: User = Depends(get_current_user)
+) -> Project:
+    """
+    Deep-clone a project with its modules, deliverables, resources and risk data.
+
+    Args:
+        db: Database session
+        project_id: Project to clone
+        clone_data: Name and code of the clone
+        current_user: Current authenticated user
+
+    Returns:
+        Cloned project
+    """
+    if clone_data.new_code:
+        existing = await project_crud.get_by_code(db, project_code=clone_data.new_code)
+        if existing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Project code already exists"
+            )
+
+    result = await clone_project(
+        db,
+        project_id,
+        new_name=clone_data.new_name,
+        new_code=clone_data.new_code,
+        created_by=current_user.id,
+        include_modules=clone_data.include_modules
     )
-    modules = result.scalars().all()
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    await db.commit()
+
+    return await project_crud.get(db, id=result.id)
+
+
+@router.get("/{project_id}/analogs", response_model=ProjectAnalogsResponse)
+async def get_project_analogs(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    k: int = Query(10, ge=1, le=100, description="Number of analogs to return"),
+    current_user: User = Depends(get_current_user)
+) -> ProjectAnalogsResponse:
+    """
+    Find the completed projects most similar to a project.
+
+    Similarity is computed over size, discipline, selected disciplines,
+    complexity factors, client complexity, total hours and work type,
+    using the in-memory analog index.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        k: Number of analogs to return
+        current_user: Current authenticated user
+
+    Returns:
+        Analog projects with their actual outcomes, most similar first
+    """
+    analogs = await analog_service.find_analogs(db, project_id, k=k)
+
+    if analogs is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    return ProjectAnalogsResponse(project_id=project_id, analogs=analogs)
+
+
+@router.get("/{project_id}/evm", response_model=EVMResponse)
+async def get_project_evm_metrics(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> EVMResponse:
+    """
+    Earned value metrics of a project.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        current_user: Current authenticated user
+
+    Returns:
+        BAC, PV, EV, AC, CPI, SPI and EAC (hours)
+    """
+    project = await project_crud.get(db, id=project_id)
+
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    metrics = await get_project_evm(db, project_id)
+    return EVMResponse(**metrics.to_dict())
+
+
+@router.get("/{project_id}/export.xlsx", response_class=StreamingResponse)
+async def export_project_xlsx(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> Response:
+    """
+    Export a project's estimate, deliverables and cost breakdown to Excel.
+
+    Args:
+        request: HTTP request
+        db: Database session
+        project_id: Project ID
+        current_user: Current authenticated user
+
+    Returns:
+        Streamed .xlsx file
+    """
+    project = await project_crud.get(db, id=project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    path = await export_project(db, project)
+
+    return stream_export(request, path, f"{project.project_code or project.id}.xlsx", XLSX_MEDIA_TYPE)
+
+
+@router.get("/{project_id}/report.pdf", response_class=StreamingResponse)
+async def export_project_report(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> Response:
+    """
+    Get the PDF estimate report for a project.
+
+    Covers the summary, cost by role, deliverables by phase and schedule.
+    Supports Range requests for resumable downloads of large reports.
+
+    Args:
+        request: HTTP request
+        db: Database session
+        project_id: Project ID
+        current_user: Current authenticated user
+
+    Returns:
+        Streamed .pdf file
+    """
+    if not settings.ENABLE_EXPORT_PDF:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="PDF export is disabled"
+        )
+
+    project = await project_crud.get(db, id=project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    path = await export_estimate_report(db, project)
 
-    return modules
+    return stream_export(request, path, f"{project.project_code or project.id}-estimate.pdf", PDF_MEDIA_TYPE)
 
 
 @router.get("/{project_id}/cost-summary")
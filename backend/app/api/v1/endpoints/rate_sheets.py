@@ -1,11 +1,14 @@
 """Rate sheet API endpoints."""
 
+import logging
 from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache, company_tag, rate_sheet_tag
 from app.core.database import get_db
 from app.crud.rate_sheet import rate_sheet as rate_sheet_crud
 from app.crud.company import company as company_crud
@@ -16,6 +19,7 @@ from app.schemas.rate_sheet import (
     RateSheetClone,
 )
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
@@ -39,8 +43,7 @@ async def get_rate_sheets(
     result = []
     for rs in rate_sheets:
         validated = RateSheetResponse.model_validate(rs)
-        print(f"Validated model has rate_entries: {hasattr(validated, 'rate_entries')}")
-        print(f"Rate entries length: {len(validated.rate_entries) if validated.rate_entries else 0}")
+        logger.debug(f"Rate sheet {rs.id}: {len(validated.rate_entries) if validated.rate_entries else 0} rate entries")
         result.append(validated)
     return result
 
@@ -51,7 +54,17 @@ async def get_rate_sheet(
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific rate sheet."""
-    rate_sheet = await rate_sheet_crud.get(db, rate_sheet_id)
+    async def load_rate_sheet():
+        rate_sheet = await rate_sheet_crud.get(db, rate_sheet_id)
+        if not rate_sheet:
+            return None
+        return jsonable_encoder(RateSheetResponse.model_validate(rate_sheet))
+
+    rate_sheet = await cache.get_or_set(
+        f"rate_sheets:{rate_sheet_id}",
+        load_rate_sheet,
+        tags=lambda rs: [rate_sheet_tag(rate_sheet_id), company_tag(rs["company_id"])]
+    )
     if not rate_sheet:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -66,7 +79,15 @@ async def get_default_rate_sheet(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the default rate sheet for a company."""
-    rate_sheet = await rate_sheet_crud.get_default(db, company_id)
+    async def load_default():
+        rate_sheet = await rate_sheet_crud.get_default(db, company_id)
+        if not rate_sheet:
+            return None
+        return jsonable_encoder(RateSheetResponse.model_validate(rate_sheet))
+
+    rate_sheet = await cache.get_or_set(
+        f"companies:{company_id}:default_rate_sheet", load_default, tags=[company_tag(company_id)]
+    )
     if not rate_sheet:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -96,6 +117,7 @@ async def create_rate_sheet(
         await rate_sheet_crud.set_default(db, rate_sheet_id=rate_sheet.id)
 
     await db.commit()
+    await cache.invalidate_tags(company_tag(rate_sheet.company_id))
     return rate_sheet
 
 
@@ -120,6 +142,7 @@ async def update_rate_sheet(
         await rate_sheet_crud.set_default(db, rate_sheet_id=rate_sheet.id)
 
     await db.commit()
+    await cache.invalidate_tags(rate_sheet_tag(rate_sheet_id), company_tag(rate_sheet.company_id))
     return rate_sheet
 
 
@@ -136,6 +159,7 @@ async def set_default_rate_sheet(
             detail="Rate sheet not found"
         )
     await db.commit()
+    await cache.invalidate_tags(company_tag(rate_sheet.company_id))
     return rate_sheet
 
 
@@ -165,6 +189,7 @@ async def clone_rate_sheet(
 
     rate_sheet = await rate_sheet_crud.clone(db, source_id=rate_sheet_id, clone_data=clone_data)
     await db.commit()
+    await cache.invalidate_tags(company_tag(rate_sheet.company_id))
     return rate_sheet
 
 
@@ -181,3 +206,4 @@ async def delete_rate_sheet(
             detail="Rate sheet not found"
         )
     await db.commit()
+    await cache.invalidate_tags(rate_sheet_tag(rate_sheet_id), company_tag(rate_sheet.company_id))
@@ -3,11 +3,28 @@
 from typing import List
 from fastapi import APIRouter, HTTPException
 
+from app.core.offload import offloader
 from app.services.resource_planning import ResourcePlanner
 
 router = APIRouter()
 
 
+def run_reality_checks(deliverables: List[dict], duration_weeks: int, total_hours: int) -> List[dict]:
+    """Compute requirements, team and warnings in one call (runs in the worker pool)."""
+    planner = ResourcePlanner(duration_weeks=duration_weeks)
+
+    # Calculate requirements
+    requirements = planner.calculate_fte_requirements(deliverables, duration_weeks)
+
+    # Get team recommendations
+    team_recommendations, _ = planner.get_team_structure_recommendation(
+        total_hours, duration_weeks
+    )
+
+    # Get warnings
+    return planner.get_reality_checks(requirements, team_recommendations)
+
+
 @router.post("/calculate-fte")
 async def calculate_fte_requirements(
     deliverables: List[dict],
@@ -21,7 +38,9 @@ async def calculate_fte_requirements(
         duration_weeks: Project duration in weeks
     """
     planner = ResourcePlanner(duration_weeks=duration_weeks)
-    requirements = planner.calculate_fte_requirements(deliverables, duration_weeks)
+    requirements = await offloader.run(
+        planner.calculate_fte_requirements, deliverables, duration_weeks, size=len(deliverables)
+    )
 
     return {
         "requirements": [
@@ -82,17 +101,8 @@ async def get_reality_checks(
         duration_weeks: Project duration in weeks
         total_hours: Total project hours
     """
-    planner = ResourcePlanner(duration_weeks=duration_weeks)
-
-    # Calculate requirements
-    requirements = planner.calculate_fte_requirements(deliverables, duration_weeks)
-
-    # Get team recommendations
-    team_recommendations, _ = planner.get_team_structure_recommendation(
-        total_hours, duration_weeks
+    warnings = await offloader.run(
+        run_reality_checks, deliverables, duration_weeks, total_hours, size=len(deliverables)
     )
 
-    # Get warnings
-    warnings = planner.get_reality_checks(requirements, team_recommendations)
-
     return {"warnings": warnings}
@@ -0,0 +1,203 @@
+"""Estimate scenario endpoints."""
+
+import logging
+from uuid import UUID
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.exceptions import ValidationException
+from app.dependencies import get_current_user
+from app.models.user import User
+from app.crud.project import project_crud
+from app.crud.deliverable import deliverable_crud
+from app.crud.scenario import estimate_scenario_crud
+from app.schemas.scenario import (
+    EstimateScenario,
+    EstimateScenarioCreate,
+    EstimateScenarioUpdate,
+    ScenarioComparisonResponse,
+)
+from app.services.estimation.scenarios import ScenarioEvaluator, get_base_inputs
+from app.api.v1.endpoints.estimation import estimation_engine, sync_complexity_coefficients
+
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+scenario_evaluator = ScenarioEvaluator(estimation_engine)
+
+
+async def get_project_or_404(db: AsyncSession, project_id: UUID):
+    project = await project_crud.get(db, id=project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    return project
+
+
+@router.get("/{project_id}/scenarios", response_model=List[EstimateScenario])
+async def list_scenarios(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> List[EstimateScenario]:
+    """
+    List a project's scenarios.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        current_user: Current authenticated user
+
+    Returns:
+        Scenarios in creation order
+    """
+    await get_project_or_404(db, project_id)
+    return await estimate_scenario_crud.get_by_project(db, project_id=project_id)
+
+
+@router.post("/{project_id}/scenarios", response_model=EstimateScenario, status_code=status.HTTP_201_CREATED)
+async def create_scenario(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    scenario_in: EstimateScenarioCreate,
+    current_user: User = Depends(get_current_user)
+) -> EstimateScenario:
+    """
+    Create a scenario from overrides of the project's base inputs.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        scenario_in: Name, description and overrides
+        current_user: Current authenticated user
+
+    Returns:
+        Created scenario
+    """
+    await get_project_or_404(db, project_id)
+    try:
+        return await estimate_scenario_crud.create_for_project(
+            db, project_id=project_id, obj_in=scenario_in, created_by=current_user.id
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Scenario '{scenario_in.name}' already exists"
+        )
+
+
+@router.patch("/{project_id}/scenarios/{scenario_id}", response_model=EstimateScenario)
+async def update_scenario(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    scenario_id: UUID,
+    scenario_in: EstimateScenarioUpdate,
+    current_user: User = Depends(get_current_user)
+) -> EstimateScenario:
+    """
+    Update a scenario.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        scenario_id: Scenario ID
+        scenario_in: Fields to change (overrides are replaced as a whole)
+        current_user: Current authenticated user
+
+    Returns:
+        Updated scenario
+    """
+    scenario = await estimate_scenario_crud.get_for_project(db, project_id=project_id, scenario_id=scenario_id)
+    if not scenario:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Scenario not found"
+        )
+    try:
+        return await estimate_scenario_crud.update_scenario(db, db_obj=scenario, obj_in=scenario_in)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Scenario '{scenario_in.name}' already exists"
+        )
+
+
+@router.delete("/{project_id}/scenarios/{scenario_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_scenario(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    scenario_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> None:
+    """
+    Delete a scenario.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        scenario_id: Scenario ID
+        current_user: Current authenticated user
+    """
+    scenario = await estimate_scenario_crud.get_for_project(db, project_id=project_id, scenario_id=scenario_id)
+    if not scenario:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Scenario not found"
+        )
+    await estimate_scenario_crud.delete(db, id=scenario.id)
+
+
+@router.post("/{project_id}/scenarios/evaluate", response_model=ScenarioComparisonResponse)
+async def evaluate_scenarios(
+    *,
+    db: AsyncSession = Depends(get_db),
+    project_id: UUID,
+    current_user: User = Depends(get_current_user)
+) -> ScenarioComparisonResponse:
+    """
+    Estimate the baseline and every scenario side by side.
+
+    The base inputs are those of the project's latest recorded estimate
+    (or stored on the project); scenarios are evaluated in one batch.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        current_user: Current authenticated user
+
+    Returns:
+        Base inputs and one comparison row per scenario, baseline first
+    """
+    project = await get_project_or_404(db, project_id)
+    base = await get_base_inputs(db, project)
+    if base is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Project has no estimate inputs to build scenarios on"
+        )
+
+    await sync_complexity_coefficients(db)
+    historical_stats = await deliverable_crud.get_historical_stats(db, discipline=project.discipline)
+    scenarios = await estimate_scenario_crud.get_by_project(db, project_id=project_id)
+
+    try:
+        rows = scenario_evaluator.evaluate(
+            base, [(s.name, s.overrides or {}) for s in scenarios], historical_stats=historical_stats
+        )
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+    ids = {s.name: s.id for s in scenarios}
+    return ScenarioComparisonResponse(
+        base_inputs=base,
+        scenarios=[{**row, "scenario_id": ids.get(row["name"])} for row in rows]
+    )
@@ -15,6 +15,8 @@ from app.api.v1.endpoints import (
     deliverable_templates,
     project_size_settings,
     resource_planning,
+    jobs,
+    scenarios,
 )
 
 # Force reload
@@ -25,6 +27,7 @@ api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(projects.router, prefix="/projects", tags=["Projects"])
 api_router.include_router(estimation.router, prefix="/estimation", tags=["Estimation"])
+api_router.include_router(scenarios.router, prefix="/projects", tags=["Scenarios"])
 api_router.include_router(deliverables.router, prefix="/deliverables", tags=["Deliverables"])
 
 # Legacy client endpoints (keep for backward compatibility)
@@ -37,4 +40,5 @@ api_router.include_router(companies.router, prefix="/companies", tags=["Companie
 api_router.include_router(rate_sheets.router, prefix="/rate-sheets", tags=["Rate Sheets"])
 api_router.include_router(deliverable_templates.router, prefix="/deliverable-templates", tags=["Deliverable Templates"])
 api_router.include_router(project_size_settings.router, prefix="/project-size-settings", tags=["Project Size Settings"])
-api_router.include_router(resource_planning.router, prefix="/resource-planning", tags=["Resource Planning"])
\ No newline at end of file
+api_router.include_router(resource_planning.router, prefix="/resource-planning", tags=["Resource Planning"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
\ No newline at end of file
@@ -25,6 +25,20 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_TTL: int = 3600
 
+    # Cache
+    CACHE_LOCAL_MAX_ENTRIES: int = 2048
+    CACHE_LOCAL_TTL: int = 60
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"
+    CACHE_LOCK_TIMEOUT_MS: int = 5000
+
+    # Compressed JSON columns
+    JSON_COMPRESSION_THRESHOLD: int = 4096  # bytes
+    JSON_COMPRESSION_LEVEL: int = 3
+
+    # Analog project index
+    ANALOG_INDEX_SYNC_SECONDS: int = 30  # Delta sync of changes from other workers
+    ANALOG_INDEX_REBUILD_SECONDS: int = 3600
+
     # Authentication
     JWT_SECRET_KEY: str = "your-jwt-secret-change-in-production"
     JWT_ALGORITHM: str = "HS256"
@@ -48,6 +62,9 @@ class Settings(BaseSettings):
     # Monitoring
     SENTRY_DSN: Optional[str] = None
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"  # json or text
+    LOG_QUEUE_SIZE: int = 10000  # records beyond this are dropped, never blocking the request
+    LOG_SAMPLING: dict[str, float] = {}  # logger name -> fraction of records below WARNING kept
     ENABLE_METRICS: bool = True
     METRICS_PORT: int = 9090
 
@@ -61,6 +78,36 @@ class Settings(BaseSettings):
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
     CELERY_TASK_TIME_LIMIT: int = 300
 
+    # Background jobs
+    JOB_BACKEND: str = "local"  # "local" (in-process executor) or "celery"
+    JOB_LOCAL_CONCURRENCY: int = 2
+    JOB_RESULT_TTL: int = 86400  # seconds job records and results are kept
+
+    # CPU-bound work offloading
+    OFFLOAD_PROCESS_WORKERS: int = 0  # 0 = one per CPU
+    OFFLOAD_THREAD_WORKERS: int = 0  # 0 = one per CPU
+    OFFLOAD_SIZE_THRESHOLD: int = 500  # inputs smaller than this run inline
+    OFFLOAD_MAX_PENDING: int = 32  # calls in flight per pool before callers wait
+    OFFLOAD_QUEUE_TIMEOUT: float = 5.0  # seconds to wait for a slot before 503
+    OFFLOAD_SLOW_QUEUE_SECONDS: float = 1.0  # log offloaded calls queued longer than this
+
+    # Live estimate sessions (WebSocket)
+    LIVE_ESTIMATE_DEBOUNCE_MS: int = 50  # quiet period before coalesced deltas are recomputed
+    LIVE_ESTIMATE_MAX_DELAY_MS: int = 250  # longest a delta waits while typing continues
+
+    # Audit log
+    AUDIT_ENABLED: bool = True
+    AUDIT_QUEUE_SIZE: int = 10000  # records held in memory before new ones are dropped
+    AUDIT_BATCH_SIZE: int = 500  # records per INSERT; a full batch is flushed immediately
+    AUDIT_FLUSH_INTERVAL: float = 2.0  # seconds between flushes of partial batches
+
+    # Exports
+    EXPORT_CACHE_DIR: str = ""  # empty = <system temp>/estimator-exports
+    EXPORT_CHUNK_SIZE: int = 1000  # rows fetched and written per chunk
+
+    # Imports
+    CATALOG_IMPORT_DIR: str = ""  # directory import jobs may read from; empty = repository root
+
     # External Services
     CURRENCY_API_KEY: Optional[str] = None
     GEOCODING_API_KEY: Optional[str] = None
@@ -1,63 +1,471 @@
-"""Redis cache configuration."""
+"""Two-tier cache: in-process LRU in front of Redis.
 
-from typing import Optional, Any
+Reads are served from a small per-worker LRU first and fall back to Redis.
+Entries can be tagged (e.g. ``company:{id}``, ``rate_sheet:{id}``) so that all
+entries derived from one record are dropped together. Tag invalidations are
+broadcast over Redis pub/sub so every worker clears its local tier too.
+
+If Redis is unavailable the manager keeps working with the local tier only.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, Union
+from collections import OrderedDict
+import asyncio
 import json
+import logging
+import time
+import uuid
+
 import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 
 from app.config import settings
 
 
+logger = logging.getLogger(__name__)
+
+
+TAG_KEY_PREFIX = "tag:"
+LOCK_KEY_PREFIX = "lock:"
+
+TagsSpec = Union[Iterable[str], Callable[[Any], Iterable[str]]]
+
+# Tag for the active complexity coefficient set
+COMPLEXITY_COEFFICIENTS_TAG = "complexity_coefficients"
+
+
+def company_tag(company_id: Any) -> str:
+    """Cache tag for entries derived from a company."""
+    return f"company:{company_id}"
+
+
+def rate_sheet_tag(rate_sheet_id: Any) -> str:
+    """Cache tag for entries derived from a rate sheet."""
+    return f"rate_sheet:{rate_sheet_id}"
+
+
+def project_tag(project_id: Any) -> str:
+    """Cache tag for entries derived from a project."""
+    return f"project:{project_id}"
+
+
+class LRUCache:
+    """
+    Bounded in-process LRU cache with per-entry expiry and tag index.
+
+    Not thread-safe; intended to be used from a single event loop.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: int = 60):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, Tuple[Any, float, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self._lookup(key) is not None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value and mark it as most recently used."""
+        entry = self._lookup(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = ()
+    ) -> None:
+        """Store value, evicting the least recently used entry when full."""
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = time.monotonic() + (ttl or self.default_ttl)
+        tags = tuple(tags)
+        self._entries[key] = (value, expires_at, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def delete(self, key: str) -> bool:
+        """Delete a single key."""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Drop every entry carrying any of the given tags."""
+        removed = 0
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                if self.delete(key):
+                    removed += 1
+            self._tags.pop(tag, None)
+        return removed
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._tags.clear()
+
+    def _lookup(self, key: str) -> Optional[Tuple[Any, float, Tuple[str, ...]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            self._remove(key)
+            return None
+        return entry
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
 class CacheManager:
-    """Redis cache manager."""
+    """
+    Redis cache manager with an in-process LRU tier.
 
-    def __init__(self):
-        self.redis: Optional[aioredis.Redis] = None
+    Features:
+    - Local LRU in front of Redis (``CACHE_LOCAL_*`` settings)
+    - Tag-based invalidation, propagated to other workers via pub/sub
+    - Single-flight loading in ``get_or_set`` to prevent cache stampedes
+    - Graceful degradation to local-only caching when Redis is down
+    """
 
-    async def connect(self):
-        """Connect to Redis."""
-        self.redis = await aioredis.from_url(
-            settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self.redis: Optional[aioredis.Redis] = redis_client
+        self.local = LRUCache(
+            max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+            default_ttl=settings.CACHE_LOCAL_TTL
         )
+        self.channel = settings.CACHE_INVALIDATION_CHANNEL
+        self.instance_id = uuid.uuid4().hex
+        self.stats: Dict[str, int] = {
+            "local_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "redis_errors": 0,
+            "invalidations_received": 0,
+        }
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the Redis tier is available."""
+        return self.redis is not None
+
+    async def connect(self):
+        """Connect to Redis and start listening for invalidations."""
+        if self.redis is None:
+            try:
+                client = aioredis.from_url(
+                    settings.REDIS_URL,
+                    encoding="utf-8",
+                    decode_responses=True
+                )
+                await client.ping()
+                self.redis = client
+            except (RedisError, OSError) as e:
+                logger.warning(f"Redis unavailable, using in-process cache only: {e}")
+                self.redis = None
+                return
+
+        await self._start_listener()
+        logger.info("Cache connected to Redis")
 
     async def disconnect(self):
-        """Disconnect from Redis."""
+        """Stop the invalidation listener and disconnect from Redis."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+
+        if self._pubsub:
+            try:
+                await self._pubsub.unsubscribe(self.channel)
+                await self._pubsub.aclose()
+            except (RedisError, OSError):
+                pass
+            self._pubsub = None
+
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
+            self.redis = None
+
+        self.local.clear()
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        if not self.redis:
-            return None
+        value = self.local.get(key)
+        if value is not None:
+            self.stats["local_hits"] += 1
+            return value
+
+        if self.redis:
+            try:
+                raw = await self.redis.get(key)
+            except (RedisError, OSError) as e:
+                self._on_redis_error("get", e)
+                raw = None
+            if raw:
+                # Entries carry their tags so the local copy can be invalidated too
+                envelope = json.loads(raw)
+                value = envelope["v"]
+                self.local.set(key, value, tags=envelope.get("t", ()))
+                self.stats["redis_hits"] += 1
+                return value
 
-        value = await self.redis.get(key)
-        if value:
-            return json.loads(value)
+        self.stats["misses"] += 1
         return None
 
-    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set value in cache."""
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = ()
+    ) -> bool:
+        """Set value in cache, optionally tagging it for group invalidation."""
+        ttl = ttl or settings.REDIS_CACHE_TTL
+        tags = tuple(tags)
+        self.local.set(key, value, ttl=min(ttl, settings.CACHE_LOCAL_TTL), tags=tags)
+
         if not self.redis:
             return False
 
-        ttl = ttl or settings.REDIS_CACHE_TTL
-        serialized = json.dumps(value)
-        return await self.redis.setex(key, ttl, serialized)
+        serialized = json.dumps({"v": value, "t": list(tags)})
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.setex(key, ttl, serialized)
+                for tag in tags:
+                    pipe.sadd(TAG_KEY_PREFIX + tag, key)
+                    pipe.expire(TAG_KEY_PREFIX + tag, ttl)
+                await pipe.execute()
+            return True
+        except (RedisError, OSError) as e:
+            self._on_redis_error("set", e)
+            return False
 
     async def delete(self, key: str) -> bool:
         """Delete value from cache."""
+        deleted = self.local.delete(key)
+
         if not self.redis:
-            return False
+            return deleted
 
-        return await self.redis.delete(key) > 0
+        try:
+            return await self.redis.delete(key) > 0 or deleted
+        except (RedisError, OSError) as e:
+            self._on_redis_error("delete", e)
+            return deleted
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
+        if key in self.local:
+            return True
+
         if not self.redis:
             return False
 
-        return await self.redis.exists(key) > 0
+        try:
+            return await self.redis.exists(key) > 0
+        except (RedisError, OSError) as e:
+            self._on_redis_error("exists", e)
+            return False
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Drop every entry tagged with any of ``tags`` in all workers.
+
+        Returns:
+            int: Number of Redis keys deleted (local count when Redis is down)
+        """
+        removed = self.local.invalidate_tags(tags)
+
+        if not self.redis or not tags:
+            return removed
+
+        try:
+            tag_keys = [TAG_KEY_PREFIX + tag for tag in tags]
+            keys: Set[str] = set()
+            for tag_key in tag_keys:
+                keys.update(await self.redis.smembers(tag_key))
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                if keys:
+                    pipe.delete(*keys)
+                pipe.delete(*tag_keys)
+                pipe.publish(
+                    self.channel,
+                    json.dumps({"origin": self.instance_id, "tags": list(tags)})
+                )
+                await pipe.execute()
+            return len(keys)
+        except (RedisError, OSError) as e:
+            self._on_redis_error("invalidate_tags", e)
+            return removed
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        tags: TagsSpec = ()
+    ) -> Any:
+        """
+        Return cached value or compute it with ``loader``.
+
+        Concurrent callers for the same key in this worker share a single
+        ``loader`` call. Across workers a short Redis lock ensures only one
+        worker recomputes while the others wait for its result.
+
+        ``tags`` may be a callable taking the loaded value, for entries whose
+        tags depend on the loaded data (e.g. the owning company).
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load_once(key, loader, ttl, tags)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so un-awaited futures don't log warnings
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load_once(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        tags: TagsSpec
+    ) -> Any:
+        """Load value while holding the cross-worker lock when possible."""
+        lock_key = LOCK_KEY_PREFIX + key
+        token = None
+
+        if self.redis:
+            token = uuid.uuid4().hex
+            try:
+                acquired = await self.redis.set(
+                    lock_key, token, nx=True, px=settings.CACHE_LOCK_TIMEOUT_MS
+                )
+            except (RedisError, OSError) as e:
+                self._on_redis_error("lock", e)
+                acquired = True
+                token = None
+
+            if not acquired:
+                # Another worker is loading; wait for its result
+                value = await self._wait_for_value(key)
+                if value is not None:
+                    return value
+                token = None
+
+        try:
+            value = await loader()
+            if value is not None:
+                if callable(tags):
+                    tags = tags(value)
+                await self.set(key, value, ttl=ttl, tags=tags)
+            return value
+        finally:
+            if token and self.redis:
+                try:
+                    if await self.redis.get(lock_key) == token:
+                        await self.redis.delete(lock_key)
+                except (RedisError, OSError) as e:
+                    self._on_redis_error("unlock", e)
+
+    async def _wait_for_value(self, key: str) -> Optional[Any]:
+        """Poll Redis for a value another worker is computing."""
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT_MS / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            value = await self.get(key)
+            if value is not None:
+                return value
+        return None
+
+    async def _start_listener(self):
+        """Subscribe to the invalidation channel."""
+        try:
+            self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(self.channel)
+        except (RedisError, OSError) as e:
+            self._on_redis_error("subscribe", e)
+            self._pubsub = None
+            return
+
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        """Apply invalidations published by other workers."""
+        while self._pubsub is not None:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError) as e:
+                self._on_redis_error("listen", e)
+                await asyncio.sleep(1.0)
+                continue
+
+            if not message or message.get("type") != "message":
+                continue
+
+            self.handle_invalidation_message(message["data"])
+
+    def handle_invalidation_message(self, data: str) -> None:
+        """Drop local entries for tags invalidated by another worker."""
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring malformed cache invalidation message: {data!r}")
+            return
+
+        if payload.get("origin") == self.instance_id:
+            return
+
+        self.local.invalidate_tags(payload.get("tags", []))
+        self.stats["invalidations_received"] += 1
+
+    def _on_redis_error(self, operation: str, error: Exception) -> None:
+        self.stats["redis_errors"] += 1
+        logger.warning(f"Redis cache {operation} failed, falling back to local cache: {error}")
 
 
-cache = CacheManager()
\ No newline at end of file
+cache = CacheManager()
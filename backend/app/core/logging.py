@@ -1,23 +1,188 @@
-"""Logging configuration."""
+"""
+Logging configuration.
 
+Records are put on a bounded in-memory queue by the thread that logs them
+and written to stdout by a QueueListener thread, so formatting and I/O
+never run on the request path; when the queue is full, records are
+dropped and counted rather than blocking. The request thread only
+captures what is bound to it: the request id (set by
+RequestLoggingMiddleware) and the formatted message and traceback.
+
+``LOG_SAMPLING`` keeps a fraction of the records below WARNING from the
+given loggers (and their children), e.g. ``{"app.services.estimation": 0.01}``
+for hot debug lines; warnings and errors are always kept.
+"""
+
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Mapping, Optional
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
+import threading
+
 from app.config import settings
 
 
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+
+# Attributes every LogRecord has; anything else was passed in ``extra``
+RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "request_id"}
+
+request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+_listener: Optional[QueueListener] = None
+_handler: Optional["LogQueueHandler"] = None
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fixed fraction of the records below WARNING from selected loggers."""
+
+    def __init__(self, rates: Mapping[str, float]):
+        """
+        Initialize the filter.
+
+        Args:
+            rates: Fraction of records to keep (0-1) by logger name prefix
+        """
+        super().__init__()
+        self.rates = {name: min(max(float(rate), 0.0), 1.0) for name, rate in rates.items()}
+        self._resolved: Dict[str, Optional[float]] = {}
+        self._credit: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.sampled_out = 0
+
+    def rate_for(self, name: str) -> Optional[float]:
+        """Rate of the most specific configured logger covering name."""
+        if name not in self._resolved:
+            rate = None
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return self._resolved[name]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate_for(record.name)
+        if rate is None:
+            return True
+        # Deterministic: the first record, then every 1/rate-th one per logger, is kept
+        with self._lock:
+            credit = self._credit.get(record.name, 1.0 - rate) + rate
+            keep = credit >= 1.0
+            self._credit[record.name] = credit - 1.0 if keep else credit
+            if not keep:
+                self.sampled_out += 1
+        return keep
+
+
+class LogQueueHandler(QueueHandler):
+    """Queue handler that never blocks and carries the request id across threads."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render what depends on the calling thread; the listener does the rest
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.request_id = request_id.get()
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in RECORD_ATTRIBUTES})
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Plain-text format for local development."""
+
+    def __init__(self):
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        if not hasattr(record, "request_id"):
+            record.request_id = None
+        return super().format(record)
+
+
 def setup_logging():
     """Setup application logging."""
+    global _listener, _handler
+
     log_level = getattr(logging, settings.LOG_LEVEL.upper())
 
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter() if settings.LOG_FORMAT.lower() == "json" else TextFormatter())
+
+    if _listener is not None:
+        _listener.stop()
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    _handler = LogQueueHandler(log_queue)
+    if settings.LOG_SAMPLING:
+        _handler.addFilter(SamplingFilter(settings.LOG_SAMPLING))
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
     # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    logging.basicConfig(level=log_level, handlers=[_handler], force=True)
 
     # Set third-party loggers to WARNING
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
-    logging.getLogger("fastapi").setLevel(logging.WARNING)
\ No newline at end of file
+    logging.getLogger("fastapi").setLevel(logging.WARNING)
+
+
+def stop_logging():
+    """Write the queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_metrics() -> Dict[str, int]:
+    """Queue depth and records dropped or sampled out."""
+    if _handler is None:
+        return {}
+    sampling = next((f for f in _handler.filters if isinstance(f, SamplingFilter)), None)
+    return {
+        "depth": _handler.queue.qsize(),
+        "dropped": _handler.dropped,
+        "sampled_out": sampling.sampled_out if sampling else 0,
+    }
+
+
+atexit.register(stop_logging)
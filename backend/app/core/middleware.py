@@ -2,32 +2,49 @@
 
 import time
 import logging
+import uuid
 from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.logging import request_id
+
 
 logger = logging.getLogger(__name__)
 
 
+REQUEST_ID_HEADER = "X-Request-ID"
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging requests."""
+    """Middleware for logging requests and correlating their log records."""
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Log request details."""
+        """Log request details under the request's id (taken from X-Request-ID or generated)."""
+        token = request_id.set(request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex)
         start_time = time.time()
 
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration = time.time() - start_time
-
-        # Log request
-        logger.info(
-            f"{request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Duration: {duration:.3f}s"
-        )
-
-        return response
\ No newline at end of file
+        try:
+            # Process request
+            response = await call_next(request)
+
+            # Calculate duration
+            duration = time.time() - start_time
+
+            # Log request
+            logger.info(
+                f"{request.method} {request.url.path} - "
+                f"Status: {response.status_code} - "
+                f"Duration: {duration:.3f}s",
+                extra={
+                    "method": request.method,
+                    "path": request.url.path,
+                    "status_code": response.status_code,
+                    "duration_ms": round(duration * 1000, 1),
+                }
+            )
+
+            response.headers[REQUEST_ID_HEADER] = request_id.get()
+            return response
+        finally:
+            request_id.reset(token)
\ No newline at end of file
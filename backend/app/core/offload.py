@@ -0,0 +1,216 @@
+"""
+CPU-bound work offloading.
+
+Pure-Python calculations run on the event loop block every other request
+on the worker. ``offloader.run`` executes small inputs inline (shipping
+them to another process costs more than computing them) and sends larger
+ones to a process pool, or to a thread pool for code that releases the
+GIL (NumPy). A bounded number of calls may be pending at once; callers
+beyond that wait up to ``OFFLOAD_QUEUE_TIMEOUT`` and are then rejected
+with ``OffloadRejected`` (served as 503) instead of piling up unbounded.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+
+from app.config import settings
+from app.core.exceptions import CalculationException, EstimationSystemException
+
+
+logger = logging.getLogger(__name__)
+
+PROCESS = "process"
+THREAD = "thread"
+
+# Recent queue times kept for percentile reporting
+QUEUE_TIME_WINDOW = 512
+
+
+class OffloadRejected(EstimationSystemException):
+    """Raised when the worker pool is saturated."""
+    pass
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict) -> Tuple[float, Any]:
+    """Run fn in the worker, returning the wall-clock start time with the result."""
+    started = time.time()
+    return started, fn(*args, **kwargs)
+
+
+class OffloadStats:
+    """Counters and queue-time samples for one pool kind."""
+
+    def __init__(self):
+        self.inline = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.queue_times: Deque[float] = deque(maxlen=QUEUE_TIME_WINDOW)
+        self.max_queue_time = 0.0
+
+    def record_queue_time(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        self.queue_times.append(seconds)
+        self.max_queue_time = max(self.max_queue_time, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        samples = sorted(self.queue_times)
+
+        def percentile(p: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(int(p * len(samples)), len(samples) - 1)] * 1000, 2)
+
+        return {
+            "inline": self.inline,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "queue_time_ms": {
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "max": round(self.max_queue_time * 1000, 2),
+            },
+        }
+
+
+class CPUOffloader:
+    """Runs CPU-bound callables off the event loop with backpressure."""
+
+    def __init__(
+        self,
+        process_workers: Optional[int] = None,
+        thread_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        size_threshold: Optional[int] = None
+    ):
+        self.process_workers = process_workers or settings.OFFLOAD_PROCESS_WORKERS or os.cpu_count() or 1
+        self.thread_workers = thread_workers or settings.OFFLOAD_THREAD_WORKERS or os.cpu_count() or 1
+        self.max_pending = max_pending or settings.OFFLOAD_MAX_PENDING
+        self.queue_timeout = queue_timeout if queue_timeout is not None else settings.OFFLOAD_QUEUE_TIMEOUT
+        self.size_threshold = size_threshold if size_threshold is not None else settings.OFFLOAD_SIZE_THRESHOLD
+
+        self._executors: Dict[str, Executor] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats: Dict[str, OffloadStats] = {PROCESS: OffloadStats(), THREAD: OffloadStats()}
+
+    def _executor(self, kind: str) -> Executor:
+        """Create pools lazily so importing the app never forks."""
+        executor = self._executors.get(kind)
+        if executor is None:
+            if kind == PROCESS:
+                # spawn: forking a process that runs an event loop and
+                # connection pools is not safe
+                executor = ProcessPoolExecutor(
+                    max_workers=self.process_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                executor = ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="offload")
+            self._executors[kind] = executor
+        return executor
+
+    def _semaphore(self, kind: str) -> asyncio.Semaphore:
+        if kind not in self._semaphores:
+            self._semaphores[kind] = asyncio.Semaphore(self.max_pending)
+        return self._semaphores[kind]
+
+    async def run(
+        self,
+        fn: Callable,
+        *args: Any,
+        size: int = 0,
+        threshold: Optional[int] = None,
+        kind: str = PROCESS,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run fn(*args, **kwargs), off the event loop when the input is large.
+
+        Process-pool calls must use a module-level function with picklable
+        arguments and result. Exceptions raised by fn propagate unchanged.
+
+        Args:
+            fn: Function to call
+            size: Input size (e.g. number of deliverables)
+            threshold: Size from which to offload (default OFFLOAD_SIZE_THRESHOLD)
+            kind: "process" or "thread"
+
+        Returns:
+            fn's return value
+
+        Raises:
+            OffloadRejected: If the pool stayed saturated for queue_timeout
+        """
+        if kind not in self.stats:
+            raise ValueError(f"Unknown offload kind: {kind}")
+        stats = self.stats[kind]
+        if size < (self.size_threshold if threshold is None else threshold):
+            stats.inline += 1
+            return fn(*args, **kwargs)
+
+        semaphore = self._semaphore(kind)
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            stats.rejected += 1
+            logger.warning(f"Offload {kind} pool saturated ({self.max_pending} pending), rejecting {fn.__name__}")
+            raise OffloadRejected(
+                "Server is busy, retry shortly",
+                details={"retry_after": max(int(self.queue_timeout), 1)}
+            )
+
+        stats.submitted += 1
+        enqueued = time.time()
+        try:
+            loop = asyncio.get_running_loop()
+            started, result = await loop.run_in_executor(
+                self._executor(kind), partial(_timed_call, fn, args, kwargs)
+            )
+        except BrokenProcessPool as e:
+            stats.failed += 1
+            self._executors.pop(kind, None)
+            logger.error(f"Offload process pool broke while running {fn.__name__}: {e}")
+            raise CalculationException(f"Calculation worker crashed: {e}")
+        except BaseException:
+            stats.failed += 1
+            raise
+        finally:
+            semaphore.release()
+
+        stats.completed += 1
+        queue_time = started - enqueued
+        stats.record_queue_time(queue_time)
+        if queue_time > settings.OFFLOAD_SLOW_QUEUE_SECONDS:
+            logger.warning(f"Offloaded {fn.__name__} queued for {queue_time:.2f}s")
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool configuration, counters and queue-time percentiles."""
+        return {
+            "size_threshold": self.size_threshold,
+            "max_pending": self.max_pending,
+            PROCESS: {"workers": self.process_workers, **self.stats[PROCESS].to_dict()},
+            THREAD: {"workers": self.thread_workers, **self.stats[THREAD].to_dict()},
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the pools (waits for running calls)."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._executors.clear()
+        self._semaphores.clear()
+
+
+offloader = CPUOffloader()
@@ -11,6 +11,7 @@ from app.crud.base import CRUDBase
 from app.models.company import Company
 from app.models.rate_sheet import RateSheet
 from app.schemas.company import CompanyCreate, CompanyUpdate, CompanyClone
+from app.services.clone import copy_rows, new_salt
 
 
 class CRUDCompany(CRUDBase[Company, CompanyCreate, CompanyUpdate]):
@@ -90,8 +91,7 @@ class CRUDCompany(CRUDBase[Company, CompanyCreate, CompanyUpdate]):
         Returns:
             Cloned company instance
         """
-        # Get source company with rate sheets
-        source = await self.get_with_rate_sheets(db, source_id)
+        source = await self.get(db, source_id)
         if not source:
             return None
 
@@ -113,21 +113,13 @@ class CRUDCompany(CRUDBase[Company, CompanyCreate, CompanyUpdate]):
         await db.flush()
         await db.refresh(new_company)
 
-        # Clone rate sheets if requested
-        if clone_data.clone_rate_sheets and source.rate_sheets:
-            for rate_sheet in source.rate_sheets:
-                new_rate_sheet = RateSheet(
-                    id=uuid.uuid4(),
-                    company_id=new_company.id,
-                    name=rate_sheet.name,
-                    description=rate_sheet.description,
-                    rates=rate_sheet.rates.copy() if rate_sheet.rates else {},
-                    is_default=rate_sheet.is_default,
-                    is_active=rate_sheet.is_active,
-                )
-                db.add(new_rate_sheet)
-
-            await db.flush()
+        # Copy rate sheets in one INSERT ... SELECT
+        if clone_data.clone_rate_sheets:
+            await copy_rows(
+                db, RateSheet, new_salt(),
+                where=RateSheet.company_id == source_id,
+                values={"company_id": new_company.id}
+            )
 
         return new_company
 
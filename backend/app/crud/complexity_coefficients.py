@@ -0,0 +1,64 @@
+"""CRUD operations for complexity coefficient sets."""
+
+from typing import List, Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.models.complexity_coefficients import ComplexityCoefficientSet
+from app.schemas.complexity_coefficients import (
+    ComplexityCoefficientSetCreate,
+    ComplexityCoefficientSetUpdate,
+)
+
+
+class CRUDComplexityCoefficientSet(
+    CRUDBase[ComplexityCoefficientSet, ComplexityCoefficientSetCreate, ComplexityCoefficientSetUpdate]
+):
+    """CRUD operations for ComplexityCoefficientSet."""
+
+    async def get_by_version(self, db: AsyncSession, *, version: int) -> Optional[ComplexityCoefficientSet]:
+        """Get a coefficient set by version."""
+        result = await db.execute(select(self.model).where(self.model.version == version))
+        return result.scalar_one_or_none()
+
+    async def get_active(self, db: AsyncSession) -> Optional[ComplexityCoefficientSet]:
+        """Get the active coefficient set, if any."""
+        result = await db.execute(select(self.model).where(self.model.is_active == True))
+        return result.scalar_one_or_none()
+
+    async def get_multi(self, db: AsyncSession, *, skip: int = 0, limit: int = 100) -> List[ComplexityCoefficientSet]:
+        """Get coefficient sets, newest first."""
+        result = await db.execute(
+            select(self.model).order_by(self.model.version.desc()).offset(skip).limit(limit)
+        )
+        return result.scalars().all()
+
+    async def create(self, db: AsyncSession, *, obj_in: ComplexityCoefficientSetCreate) -> ComplexityCoefficientSet:
+        """Create a coefficient set with the next version number."""
+        next_version = await db.scalar(select(func.coalesce(func.max(self.model.version), 0) + 1))
+        db_obj = self.model(**obj_in.model_dump(), version=next_version, is_active=False)
+        db.add(db_obj)
+        await db.flush()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def activate(self, db: AsyncSession, *, db_obj: Optional[ComplexityCoefficientSet]) -> None:
+        """Make db_obj the only active set (None reverts to built-in defaults)."""
+        await db.execute(
+            update(self.model)
+            .where(self.model.is_active == True)
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        if db_obj is not None:
+            await db.execute(
+                update(self.model)
+                .where(self.model.id == db_obj.id)
+                .values(is_active=True)
+                .execution_options(synchronize_session=False)
+            )
+            await db.refresh(db_obj)
+
+
+complexity_coefficient_set = CRUDComplexityCoefficientSet(ComplexityCoefficientSet)
@@ -1,13 +1,17 @@
 """Deliverable CRUD operations."""
 
-from typing import List
+from typing import Any, List, Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import case, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
+from app.domain.stats import RunningStats
 from app.models.deliverable import Deliverable
+from app.models.deliverable_catalog import CATALOG_PHASES, CatalogDeliverable
+from app.models.deliverable_stats import ANY, DeliverableActualStats
 from app.schemas.deliverable import DeliverableCreate, DeliverableUpdate
+from app.services.estimation.historical_stats import normalize_discipline
 
 
 class CRUDDeliverable(CRUDBase[Deliverable, DeliverableCreate, DeliverableUpdate]):
@@ -27,5 +31,46 @@ class CRUDDeliverable(CRUDBase[Deliverable, DeliverableCreate, DeliverableUpdate
         )
         return result.scalars().all()
 
+    async def get_historical_stats(
+        self,
+        db: AsyncSession,
+        *,
+        discipline: Any,
+        deliverable_name: str = ANY,
+        deliverable_type: str = ANY
+    ) -> Optional[RunningStats]:
+        """
+        Get actual / estimated hours statistics for a deliverable key.
+
+        Defaults to the discipline roll-up. This is a single unique-key
+        lookup on the incrementally maintained stats table.
+        """
+        result = await db.execute(
+            select(DeliverableActualStats).where(
+                DeliverableActualStats.deliverable_name == deliverable_name,
+                DeliverableActualStats.deliverable_type == deliverable_type,
+                DeliverableActualStats.discipline == normalize_discipline(discipline)
+            )
+        )
+        row = result.scalar_one_or_none()
+        return RunningStats.from_row(row) if row else None
+
+    async def get_catalog(
+        self,
+        db: AsyncSession,
+        *,
+        phase: Optional[str] = None,
+        discipline: Optional[str] = None
+    ) -> List[CatalogDeliverable]:
+        """Get master deliverables list entries, in list order."""
+        phase_order = case({p: i for i, p in enumerate(CATALOG_PHASES)}, value=CatalogDeliverable.phase)
+        query = select(CatalogDeliverable).order_by(phase_order, CatalogDeliverable.item_no)
+        if phase:
+            query = query.where(CatalogDeliverable.phase == phase.lower())
+        if discipline:
+            query = query.where(CatalogDeliverable.discipline == discipline.lower())
+        result = await db.execute(query)
+        return result.scalars().all()
+
 
 deliverable_crud = CRUDDeliverable(Deliverable)
\ No newline at end of file
@@ -19,16 +19,26 @@ class CRUDDeliverableTemplate(CRUDBase[DeliverableTemplate, DeliverableTemplateC
         *,
         company_id: Optional[UUID] = None,
         project_size: Optional[str] = None,
+        deliverable_name: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
     ) -> List[DeliverableTemplate]:
-        """Get deliverable templates with optional filters."""
+        """
+        Get deliverable templates with optional filters.
+
+        ``deliverable_name`` is matched with JSONB containment (@>) against
+        deliverables_config, served by its GIN index.
+        """
         query = select(self.model)
 
         if company_id:
             query = query.where(self.model.company_id == company_id)
         if project_size:
             query = query.where(self.model.project_size == project_size)
+        if deliverable_name:
+            query = query.where(
+                self.model.deliverables_config.contains([{"name": deliverable_name}])
+            )
 
         query = query.offset(skip).limit(limit)
         result = await db.execute(query)
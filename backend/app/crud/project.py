@@ -1,18 +1,119 @@
 """Project CRUD operations."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
 
 from app.crud.base import CRUDBase
+from app.models.financial import FinancialBreakdown
 from app.models.project import Project, ProjectStatus
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectSummary
+from app.services.json_patch import (
+    JSONPatchError,
+    apply_patch,
+    changed_paths,
+    compile_jsonb_patch,
+    get_fragment,
+    jsonb_fragment,
+)
+
+
+# Columns loaded for list views; everything else (the JSON blobs) stays deferred
+SUMMARY_COLUMNS = tuple(getattr(Project, field) for field in ProjectSummary.model_fields)
 
 
 class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
     """CRUD operations for Project model."""
 
+    def _list_query(self, full: bool = False) -> Select:
+        """Base list query, restricted to summary columns unless full."""
+        query = select(Project)
+        if not full:
+            query = query.options(load_only(*SUMMARY_COLUMNS))
+        return query
+
+    def apply_config_filters(
+        self,
+        query: Select,
+        *,
+        complexity_factors: Optional[Sequence[str]] = None,
+        selected_disciplines: Optional[Sequence[str]] = None,
+        deliverable_name: Optional[str] = None
+    ) -> Select:
+        """
+        Filter on JSONB configuration columns using containment (@>).
+
+        These predicates are served by the jsonb_path_ops GIN indexes.
+
+        Args:
+            query: Query to filter
+            complexity_factors: Factors that must all be enabled
+            selected_disciplines: Disciplines that must all be selected
+            deliverable_name: Name of a deliverable that must be configured
+        """
+        if complexity_factors:
+            query = query.where(
+                Project.complexity_factors.contains({f: True for f in complexity_factors})
+            )
+        if selected_disciplines:
+            query = query.where(
+                Project.selected_disciplines.contains(list(selected_disciplines))
+            )
+        if deliverable_name:
+            query = query.where(
+                Project.deliverables_config.contains([{"name": deliverable_name}])
+            )
+        return query
+
+    def id_query(
+        self,
+        *,
+        status: Optional[ProjectStatus] = None,
+        complexity_factors: Optional[Sequence[str]] = None,
+        selected_disciplines: Optional[Sequence[str]] = None,
+        deliverable_name: Optional[str] = None
+    ) -> Select:
+        """Select of project IDs matching the list filters (for exports and reports)."""
+        query = select(Project.id)
+        if status:
+            query = query.where(Project.status == status)
+        return self.apply_config_filters(
+            query,
+            complexity_factors=complexity_factors,
+            selected_disciplines=selected_disciplines,
+            deliverable_name=deliverable_name
+        )
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        full: bool = False,
+        complexity_factors: Optional[Sequence[str]] = None,
+        selected_disciplines: Optional[Sequence[str]] = None,
+        deliverable_name: Optional[str] = None
+    ) -> List[Project]:
+        """
+        Get multiple projects, optionally filtered on configuration.
+
+        Only summary columns are loaded unless ``full`` is set; accessing
+        a deferred JSON column on the returned objects is not supported.
+        """
+        query = self.apply_config_filters(
+            self._list_query(full),
+            complexity_factors=complexity_factors,
+            selected_disciplines=selected_disciplines,
+            deliverable_name=deliverable_name
+        )
+        result = await db.execute(query.offset(skip).limit(limit))
+        return result.scalars().all()
+
     async def get_by_code(
         self,
         db: AsyncSession,
@@ -31,11 +132,21 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         *,
         user_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        full: bool = False,
+        complexity_factors: Optional[Sequence[str]] = None,
+        selected_disciplines: Optional[Sequence[str]] = None,
+        deliverable_name: Optional[str] = None
     ) -> List[Project]:
         """Get projects created by user."""
+        query = self.apply_config_filters(
+            self._list_query(full),
+            complexity_factors=complexity_factors,
+            selected_disciplines=selected_disciplines,
+            deliverable_name=deliverable_name
+        )
         result = await db.execute(
-            select(Project)
+            query
             .where(Project.created_by == user_id)
             .offset(skip)
             .limit(limit)
@@ -59,5 +170,153 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         )
         return result.scalars().all()
 
+    async def get_modules(
+        self,
+        db: AsyncSession,
+        *,
+        parent_project_id: UUID,
+        full: bool = False
+    ) -> List[Project]:
+        """Get child modules of a facility project."""
+        result = await db.execute(
+            self._list_query(full)
+            .where(Project.parent_project_id == parent_project_id)
+        )
+        return result.scalars().all()
+
+    async def get_cost_by_phase(self, db: AsyncSession, project_id: UUID) -> Dict[str, Any]:
+        """Stored phase-gate estimate (FinancialBreakdown.cost_by_phase), or {}."""
+        result = await db.execute(
+            select(FinancialBreakdown.cost_by_phase).where(FinancialBreakdown.project_id == project_id)
+        )
+        return result.scalar_one_or_none() or {}
+
+    async def get_financial_breakdown(self, db: AsyncSession, project_id: UUID) -> Optional[FinancialBreakdown]:
+        """Get a project's financial breakdown."""
+        result = await db.execute(select(FinancialBreakdown).where(FinancialBreakdown.project_id == project_id))
+        return result.scalar_one_or_none()
+
+    async def get_or_create_financial_breakdown(
+        self,
+        db: AsyncSession,
+        project: Project,
+        *,
+        labor_cost: float
+    ) -> FinancialBreakdown:
+        """
+        Get a project's financial breakdown, adding one if it has none.
+
+        A new breakdown is seeded with labor_cost as its direct and total
+        cost; the caller commits.
+        """
+        breakdown = await self.get_financial_breakdown(db, project.id)
+        if breakdown is None:
+            breakdown = FinancialBreakdown(
+                project_id=project.id,
+                labor_cost=labor_cost,
+                direct_cost=labor_cost,
+                indirect_cost=0,
+                total_cost=labor_cost,
+                total_price=labor_cost,
+                contingency_percent=project.contingency_percent,
+            )
+            db.add(breakdown)
+        return breakdown
+
+    async def patch_deliverables_config(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: UUID,
+        operations: Sequence[dict]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Apply a JSON Patch to deliverables_config inside PostgreSQL.
+
+        The patch is compiled to jsonb_set / jsonb_insert / #- and executed
+        as a single UPDATE; only the fragments at the changed paths are
+        returned, so the full document never leaves the database.
+
+        Args:
+            db: Database session
+            project_id: Project ID
+            operations: RFC 6902 operations
+
+        Returns:
+            Mapping of changed path to its new value (None if removed),
+            or None if the project does not exist
+
+        Raises:
+            JSONPatchError: If the patch does not apply to the current document
+        """
+        source = (
+            select(
+                Project.id.label("id"),
+                func.coalesce(Project.deliverables_config, literal([], JSONB)).label("doc")
+            )
+            .where(Project.id == project_id)
+            .with_for_update()
+        )
+        patched = compile_jsonb_patch(source, operations)
+        paths = changed_paths(operations)
+
+        result = await db.execute(
+            update(Project)
+            .where(Project.id == patched.c.id, patched.c.ok)
+            .values(deliverables_config=patched.c.doc)
+            .returning(
+                Project.id,
+                *[jsonb_fragment(Project.deliverables_config, path) for path in paths]
+            )
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+
+        if row is None:
+            exists = await db.scalar(select(Project.id).where(Project.id == project_id))
+            if exists is None:
+                return None
+            raise JSONPatchError("Patch does not apply to the current deliverables configuration")
+
+        await db.flush()
+        return dict(zip(paths, row[1:]))
+
+    async def patch_equipment_list(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: UUID,
+        operations: Sequence[dict]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Apply a JSON Patch to equipment_list.
+
+        equipment_list is compressed bytea, so the patch is applied in
+        Python on a row locked with SELECT ... FOR UPDATE.
+
+        Returns:
+            Mapping of changed path to its new value (None if removed),
+            or None if the project does not exist
+        """
+        result = await db.execute(
+            select(Project.equipment_list)
+            .where(Project.id == project_id)
+            .with_for_update()
+        )
+        row = result.first()
+        if row is None:
+            return None
+
+        document = apply_patch(row.equipment_list or [], operations)
+        await db.execute(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(equipment_list=document)
+            .execution_options(synchronize_session=False)
+        )
+        await db.flush()
+
+        return {path: get_fragment(document, path) for path in changed_paths(operations)}
+
 
 project_crud = CRUDProject(Project)
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""CRUD operations for estimate scenarios."""
+
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.models.scenario import EstimateScenario
+from app.schemas.scenario import EstimateScenarioCreate, EstimateScenarioUpdate
+
+
+class CRUDEstimateScenario(CRUDBase[EstimateScenario, EstimateScenarioCreate, EstimateScenarioUpdate]):
+    """CRUD operations for EstimateScenario."""
+
+    async def get_by_project(self, db: AsyncSession, *, project_id: UUID) -> List[EstimateScenario]:
+        """Get a project's scenarios in creation order."""
+        result = await db.execute(
+            select(EstimateScenario)
+            .where(EstimateScenario.project_id == project_id)
+            .order_by(EstimateScenario.created_at)
+        )
+        return result.scalars().all()
+
+    async def get_for_project(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: UUID,
+        scenario_id: UUID
+    ) -> Optional[EstimateScenario]:
+        """Get a scenario if it belongs to the project."""
+        result = await db.execute(
+            select(EstimateScenario).where(
+                EstimateScenario.id == scenario_id,
+                EstimateScenario.project_id == project_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def create_for_project(
+        self,
+        db: AsyncSession,
+        *,
+        project_id: UUID,
+        obj_in: EstimateScenarioCreate,
+        created_by: Optional[UUID] = None
+    ) -> EstimateScenario:
+        """Create a scenario storing only the overrides that are set."""
+        db_obj = EstimateScenario(
+            project_id=project_id,
+            name=obj_in.name,
+            description=obj_in.description,
+            overrides=obj_in.overrides.model_dump(mode="json", exclude_none=True),
+            created_by=created_by,
+        )
+        db.add(db_obj)
+        await db.flush()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update_scenario(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: EstimateScenario,
+        obj_in: EstimateScenarioUpdate
+    ) -> EstimateScenario:
+        """Update a scenario; new overrides replace the stored ones."""
+        update_data = obj_in.model_dump(exclude_unset=True, exclude={"overrides"})
+        if obj_in.overrides is not None:
+            update_data["overrides"] = obj_in.overrides.model_dump(mode="json", exclude_none=True)
+        return await self.update(db, db_obj=db_obj, obj_in=update_data)
+
+
+estimate_scenario_crud = CRUDEstimateScenario(EstimateScenario)
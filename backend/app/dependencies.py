@@ -1,7 +1,7 @@
 """Shared dependencies for FastAPI endpoints."""
 
-from typing import AsyncGenerator
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Optional
+from fastapi import Depends, HTTPException, Query, Request, WebSocket, WebSocketException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,12 +9,14 @@ from app.core.database import get_db
 from app.core.auth import decode_token
 from app.models.user import User
 from app.crud.user import user_crud
+from app.services.audit import set_actor
 
 
 security = HTTPBearer()
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
 ) -> User:
@@ -48,6 +50,28 @@ async def get_current_user(
             detail="Inactive user"
         )
 
+    # Attribute this request's writes in the audit log
+    set_actor(
+        user.id,
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent")
+    )
+    return user
+
+
+async def get_websocket_user(
+    websocket: WebSocket,
+    token: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get the user of a WebSocket from its ?token= (browsers cannot set headers)."""
+    payload = decode_token(token) if token else None
+    user_id = payload.get("sub") if payload else None
+    user = await user_crud.get(db, id=user_id) if user_id else None
+
+    if user is None or not user.is_active:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Not authenticated")
+
     return user
 
 
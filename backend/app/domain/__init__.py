@@ -0,0 +1,36 @@
+"""
+Import-light domain core.
+
+Enums and value types shared by the calculators and the models. Modules
+here (and the calculators built on them in app.services.estimation and
+app.services.cost.cost_calculator) must not import the database, cache,
+settings or web stack, so they load in milliseconds in scripts, workers
+and unit tests; scripts/benchmark_import_time.py checks this.
+"""
+
+from app.domain.enums import (
+    ClientProfile,
+    ConfidenceLevel,
+    EngineeringDiscipline,
+    ProcessType,
+    ProjectPhase,
+    ProjectSize,
+    ProjectStatus,
+    ProjectType,
+    WorkType,
+)
+from app.domain.stats import RunningStats
+
+
+__all__ = [
+    "ClientProfile",
+    "ConfidenceLevel",
+    "EngineeringDiscipline",
+    "ProcessType",
+    "ProjectPhase",
+    "ProjectSize",
+    "ProjectStatus",
+    "ProjectType",
+    "WorkType",
+    "RunningStats",
+]
@@ -0,0 +1,84 @@
+"""Project classification enums (no database dependencies)."""
+
+import enum
+
+
+class WorkType(str, enum.Enum):
+    """Top-level work type classification."""
+
+    CONVENTIONAL = "CONVENTIONAL"  # Standard single-phase project
+    PHASE_GATE = "PHASE_GATE"  # Multi-phase project with stage gates
+    CAMPAIGN = "CAMPAIGN"  # Ongoing engineering support/retainer
+
+
+class ProjectSize(str, enum.Enum):
+    """Project size classification (for discrete projects only)."""
+
+    SMALL = "SMALL"      # < 500 hours (configurable)
+    MEDIUM = "MEDIUM"    # 500-2000 hours (configurable)
+    LARGE = "LARGE"      # > 2000 hours (configurable)
+
+
+class ProcessType(str, enum.Enum):
+    """Project governance/process methodology."""
+
+    CONVENTIONAL = "CONVENTIONAL"  # Standard workflow with continuous progression
+    PHASE_GATE = "PHASE_GATE"  # Formal stage-gate reviews with approval milestones
+
+
+class EngineeringDiscipline(str, enum.Enum):
+    """Engineering discipline."""
+
+    CIVIL = "CIVIL"
+    MECHANICAL = "MECHANICAL"
+    ELECTRICAL = "ELECTRICAL"
+    STRUCTURAL = "STRUCTURAL"
+    CHEMICAL = "CHEMICAL"
+    ENVIRONMENTAL = "ENVIRONMENTAL"
+    MULTIDISCIPLINE = "MULTIDISCIPLINE"
+
+
+class ClientProfile(str, enum.Enum):
+    """Client profile type."""
+
+    TYPE_A = "TYPE_A"        # Heavy oversight (+40%)
+    TYPE_B = "TYPE_B"        # Standard process (baseline)
+    TYPE_C = "TYPE_C"        # Minimal oversight (-15%)
+    NEW_CLIENT = "NEW_CLIENT"  # Unknown, conservative (+25%)
+
+
+class ProjectStatus(str, enum.Enum):
+    """Project status."""
+
+    DRAFT = "DRAFT"
+    ESTIMATION = "ESTIMATION"
+    REVIEW = "REVIEW"
+    APPROVED = "APPROVED"
+    ACTIVE = "ACTIVE"
+    ON_HOLD = "ON_HOLD"
+    COMPLETED = "COMPLETED"
+    CANCELLED = "CANCELLED"
+
+
+class ConfidenceLevel(str, enum.Enum):
+    """Estimation confidence level."""
+
+    LOW = "LOW"          # 50-70% confidence
+    MEDIUM = "MEDIUM"    # 70-85% confidence
+    HIGH = "HIGH"        # 85-95% confidence
+    VERY_HIGH = "VERY_HIGH"  # > 95% confidence
+
+
+class ProjectType(str, enum.Enum):
+    """Project type."""
+
+    STANDARD = "STANDARD"  # Standard project (default)
+
+
+class ProjectPhase(str, enum.Enum):
+    """Project phase for phase-gate projects."""
+
+    FRAME = "FRAME"        # Conceptual (±50%)
+    SCREEN = "SCREEN"      # Feasibility (±30%)
+    REFINE = "REFINE"      # FEED/Define (±10-15%)
+    IMPLEMENT = "IMPLEMENT"  # Detail Design
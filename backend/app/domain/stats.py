@@ -0,0 +1,63 @@
+"""Running sample statistics (no database dependencies)."""
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+import math
+
+
+@dataclass
+class RunningStats:
+    """Count, mean and M2 (sum of squared deviations) of a sample."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def of(cls, values: Iterable[float]) -> "RunningStats":
+        """Build statistics from values."""
+        stats = cls()
+        for value in values:
+            stats.add(value)
+        return stats
+
+    @classmethod
+    def from_row(cls, row: Any) -> "RunningStats":
+        """Build statistics from a stored DeliverableActualStats row."""
+        return cls(count=row.sample_count, mean=row.mean_ratio, m2=row.m2)
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.merge(RunningStats(1, value, 0.0))
+
+    def merge(self, other: "RunningStats") -> None:
+        """
+        Combine with another sample (Chan et al. parallel update).
+
+        A negative count removes a previously merged sample.
+        """
+        count = self.count + other.count
+        if count <= 0:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 = max(self.m2 + other.m2 + delta * delta * self.count * other.count / count, 0.0)
+        self.count = count
+
+    def subtract(self, other: "RunningStats") -> None:
+        """Remove a previously merged sample."""
+        self.merge(RunningStats(-other.count, other.mean, -other.m2))
+
+    @property
+    def variance(self) -> float:
+        """Sample variance."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
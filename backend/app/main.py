@@ -1,13 +1,19 @@
 """FastAPI application entry point."""
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
 from app.config import settings
-from app.core.logging import setup_logging
+from app.core.cache import cache
+from app.core.logging import logging_metrics, setup_logging
 from app.core.middleware import RequestLoggingMiddleware
+from app.core.offload import OffloadRejected, offloader
 from app.api.v1.router import api_router
+from app.services.audit import audit_writer
+from app.services.listeners import register_listeners
+from app.workers.jobs import job_manager
 
 
 # Setup logging
@@ -41,6 +47,16 @@ app.add_middleware(RequestLoggingMiddleware)
 app.include_router(api_router, prefix=f"/api/{settings.API_VERSION}")
 
 
+@app.exception_handler(OffloadRejected)
+async def offload_rejected_handler(request: Request, exc: OffloadRejected):
+    """Shed load when the calculation pool is saturated."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exc.message},
+        headers={"Retry-After": str(exc.details.get("retry_after", 1))}
+    )
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint."""
@@ -56,23 +72,33 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "environment": settings.APP_ENV
+        "environment": settings.APP_ENV,
+        "offload": offloader.metrics(),
+        "audit": audit_writer.metrics(),
+        "logging": logging_metrics()
     }
 
 
 @app.on_event("startup")
 async def startup_event():
     """Run on application startup."""
-    # Initialize database connection pool
-    # Initialize Redis connection
-    # Start background tasks
-    pass
+    # Audit, analog index, EVM counter and statistics session listeners
+    register_listeners()
+    # Initialize Redis connection (degrades to in-process cache if unavailable)
+    await cache.connect()
+    # Job store and executor (falls back to in-process without Redis)
+    await job_manager.connect()
+    # Batched audit log writer
+    audit_writer.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on application shutdown."""
-    # Close database connections
-    # Close Redis connections
-    # Cleanup resources
-    pass
+    # Cancel local jobs and close Redis connections
+    await job_manager.disconnect()
+    # Write queued audit records
+    await audit_writer.stop()
+    await cache.disconnect()
+    # Wait for in-flight calculations
+    offloader.shutdown()
@@ -17,6 +17,12 @@ from app.models.industry import Industry
 from app.models.company import Company
 from app.models.rate_sheet import RateSheet
 from app.models.deliverable_template import DeliverableTemplate
+from app.models.deliverable_stats import DeliverableActualStats
+from app.models.complexity_coefficients import ComplexityCoefficientSet
+from app.models.deliverable_catalog import CatalogDeliverable
+from app.models.evm import ProjectEVMCounters
+from app.models.estimate_version import EstimateBlob, EstimateVersion
+from app.models.scenario import EstimateScenario
 
 
 __all__ = [
@@ -53,4 +59,11 @@ __all__ = [
     "Company",
     "RateSheet",
     "DeliverableTemplate",
+    "DeliverableActualStats",
+    "ComplexityCoefficientSet",
+    "CatalogDeliverable",
+    "ProjectEVMCounters",
+    "EstimateBlob",
+    "EstimateVersion",
+    "EstimateScenario",
 ]
\ No newline at end of file
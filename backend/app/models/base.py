@@ -1,10 +1,12 @@
 """Base model class."""
 
 from datetime import datetime
+from typing import Any
 from uuid import uuid4
 from sqlalchemy import Column, DateTime
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.orm import attributes
 
 from app.core.database import Base as SQLAlchemyBase
 
@@ -21,4 +23,14 @@ class Base(SQLAlchemyBase):
     @declared_attr
     def __tablename__(cls) -> str:
         """Generate __tablename__ automatically."""
-        return cls.__name__.lower() + "s"
\ No newline at end of file
+        return cls.__name__.lower() + "s"
+
+
+def committed_value(obj: Any, attr: str) -> Any:
+    """Value of attr before the pending flush (for flush listeners)."""
+    history = attributes.get_history(obj, attr)
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return None
@@ -0,0 +1,38 @@
+"""Complexity coefficient set model."""
+
+from sqlalchemy import Boolean, Column, Float, Index, Integer, JSON, String, text
+
+from app.models.base import Base
+
+
+class ComplexityCoefficientSet(Base):
+    """
+    Versioned set of complexity-factor coefficients.
+
+    Sets are produced by the calibration job (or entered manually); at most
+    one set is active and the estimation engine hot-swaps to it. With no
+    active set the built-in ComplexityCalculator defaults apply.
+    """
+
+    __tablename__ = "complexity_coefficient_sets"
+
+    version = Column(Integer, nullable=False, unique=True, index=True)
+    coefficients = Column(JSON, nullable=False)  # {factor_name: coefficient}
+    method = Column(String(50), nullable=False, default="ridge")  # ridge, least_squares, manual
+    ridge_alpha = Column(Float, default=0.0)
+    sample_count = Column(Integer, default=0)  # Completed projects used for the fit
+    r_squared = Column(Float)
+    rmse = Column(Float)
+    is_active = Column(Boolean, default=False, nullable=False, index=True)
+    notes = Column(String(1000))
+
+    __table_args__ = (
+        # At most one active set
+        Index(
+            "uq_complexity_coefficient_sets_active", "is_active",
+            unique=True, postgresql_where=text("is_active")
+        ),
+    )
+
+    def __repr__(self):
+        return f"<ComplexityCoefficientSet v{self.version} active={self.is_active}>"
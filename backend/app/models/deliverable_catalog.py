@@ -0,0 +1,40 @@
+"""Deliverable catalog model (Engineering Master Deliverables List)."""
+
+from sqlalchemy import Column, Float, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.models.base import Base
+
+
+# Phase-gate phases in gate order
+CATALOG_PHASES = ("frame", "screen", "refine", "implement")
+
+
+class CatalogDeliverable(Base):
+    """
+    One line of the master deliverables list.
+
+    Rows are keyed by (phase, discipline, name) and bulk-upserted by the
+    catalog importer; ``item_no`` keeps the list's own ordering.
+    """
+
+    __tablename__ = "deliverable_catalog"
+
+    phase = Column(String(20), nullable=False)  # frame, screen, refine, implement
+    discipline = Column(String(50), nullable=False)  # Normalized (process, civil, ...)
+    name = Column(String(255), nullable=False)
+    item_no = Column(Float, nullable=False)  # Source item number (may be fractional, e.g. 10.5)
+
+    statuses = Column(JSONB, default=[])  # Issue states in order, e.g. ["Prelim", "IFR"]
+    milestone = Column(String(10))  # Final issue state as a Milestone value, if it maps to one
+    notes = Column(Text)
+    base_hours = Column(Integer)  # Known base hours, if any
+    source = Column(String(255))  # File the row was imported from
+
+    __table_args__ = (
+        UniqueConstraint("phase", "discipline", "name", name="uq_deliverable_catalog_key"),
+        Index("idx_deliverable_catalog_phase_item", "phase", "item_no"),
+    )
+
+    def __repr__(self):
+        return f"<CatalogDeliverable {self.phase}/{self.discipline}: {self.name}>"
@@ -0,0 +1,56 @@
+"""Historical deliverable actuals statistics model."""
+
+import math
+from sqlalchemy import Column, Float, Integer, String, UniqueConstraint
+
+from app.models.base import Base
+
+
+# Wildcard used for roll-up rows (all deliverables of a type / discipline)
+ANY = "*"
+
+
+class DeliverableActualStats(Base):
+    """
+    Running statistics of actual / estimated hours per deliverable.
+
+    One row per (deliverable name, deliverable type, discipline), plus
+    roll-up rows with name and/or type set to ANY. Rows are maintained
+    incrementally when deliverables are written (count, mean and M2 of the
+    Welford / Chan algorithm), so reads never scan deliverables.
+    """
+
+    __tablename__ = "deliverable_actual_stats"
+
+    deliverable_name = Column(String(255), nullable=False)
+    deliverable_type = Column(String(50), nullable=False)
+    discipline = Column(String(100), nullable=False)
+
+    sample_count = Column(Integer, nullable=False, default=0)
+    mean_ratio = Column(Float, nullable=False, default=0.0)  # Mean of actual / estimated hours
+    m2 = Column(Float, nullable=False, default=0.0)  # Sum of squared deviations from the mean
+
+    __table_args__ = (
+        UniqueConstraint(
+            "deliverable_name", "deliverable_type", "discipline",
+            name="uq_deliverable_actual_stats_key"
+        ),
+    )
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the ratio."""
+        if self.sample_count < 2:
+            return 0.0
+        return max(self.m2, 0.0) / (self.sample_count - 1)
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation of the ratio."""
+        return math.sqrt(self.variance)
+
+    def __repr__(self):
+        return (
+            f"<DeliverableActualStats {self.deliverable_name}/{self.deliverable_type}/"
+            f"{self.discipline} n={self.sample_count}>"
+        )
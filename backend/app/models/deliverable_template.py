@@ -1,7 +1,7 @@
 """Deliverable template model for client profiles."""
 
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import uuid
@@ -24,9 +24,9 @@ class DeliverableTemplate(Base):
 
     description = Column(Text)
 
-    # Deliverables configuration (JSON array of deliverable definitions)
+    # Deliverables configuration (JSONB array of deliverable definitions)
     # Each item contains: name, milestone, duration_days, hours breakdown, dependencies, etc.
-    deliverables_config = Column(JSON, default=[])
+    deliverables_config = Column(JSONB, default=[])
 
     # Risk factors specific to this client/size
     risk_factors = Column(JSON, default=[])  # Array of {name, probability, impact, mitigation}
@@ -40,5 +40,13 @@ class DeliverableTemplate(Base):
     # Relationships
     company = relationship("Company", back_populates="deliverable_templates")
 
+    # Indexes
+    __table_args__ = (
+        Index(
+            "idx_deliverable_template_config_gin", "deliverables_config",
+            postgresql_using="gin", postgresql_ops={"deliverables_config": "jsonb_path_ops"}
+        ),
+    )
+
     def __repr__(self):
         return f"<DeliverableTemplate {self.name} ({self.project_size})>"
@@ -0,0 +1,60 @@
+"""Estimate version models."""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, JSON, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+from app.models.base import Base
+
+
+class EstimateBlob(Base):
+    """
+    Content-addressed estimate document (inputs or outputs of a run).
+
+    Keyed by the SHA-256 of its canonical JSON, so a document shared by
+    many versions, or by many projects, is stored once.
+    """
+
+    __tablename__ = "estimate_blobs"
+
+    hash = Column(String(64), nullable=False, unique=True)
+    content = Column(JSONB, nullable=False)
+    size_bytes = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<EstimateBlob {self.hash[:12]}>"
+
+
+class EstimateVersion(Base):
+    """
+    One estimate run of a project.
+
+    Inputs and outputs are referenced by blob hash; the headline results
+    are copied onto the row for listing, and ``changes`` holds the JSON
+    Patch from the previous version so history reads without loading blobs.
+    """
+
+    __tablename__ = "estimate_versions"
+
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    version = Column(Integer, nullable=False)
+    inputs_hash = Column(String(64), ForeignKey("estimate_blobs.hash"), nullable=False)
+    outputs_hash = Column(String(64), ForeignKey("estimate_blobs.hash"), nullable=False)
+    changes = Column(JSON, default=[])  # JSON Patch of {inputs, outputs} from the previous version
+    label = Column(String(255))
+
+    # Headline results
+    total_hours = Column(Integer)
+    duration_weeks = Column(Integer)
+    confidence_level = Column(String(20))
+
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+
+    __table_args__ = (
+        UniqueConstraint("project_id", "version", name="uq_estimate_versions_project_version"),
+        Index("idx_estimate_versions_project_inputs", "project_id", "inputs_hash"),
+    )
+
+    def __repr__(self):
+        return f"<EstimateVersion {self.project_id} v{self.version}>"
@@ -0,0 +1,32 @@
+"""Earned value counters model."""
+
+from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class ProjectEVMCounters(Base):
+    """
+    Running earned value totals of a project, in hours.
+
+    Maintained incrementally when deliverables are written (see
+    app.services.evm), so EVM reads are one row per project instead of a
+    scan of its deliverables. Planned value depends on the date and is
+    aggregated at read time.
+    """
+
+    __tablename__ = "project_evm_counters"
+
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+
+    deliverable_count = Column(Integer, nullable=False, default=0)
+    completed_count = Column(Integer, nullable=False, default=0)
+    budget_hours = Column(Float, nullable=False, default=0.0)  # BAC: sum of estimated hours
+    earned_hours = Column(Float, nullable=False, default=0.0)  # EV: estimated hours x progress
+    actual_hours = Column(Float, nullable=False, default=0.0)  # AC: sum of actual hours
+
+    def __repr__(self):
+        return f"<ProjectEVMCounters {self.project_id} n={self.deliverable_count}>"
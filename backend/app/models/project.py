@@ -1,92 +1,22 @@
 """Project model."""
 
-import enum
 from sqlalchemy import Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, JSON, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from app.domain.enums import (
+    ClientProfile,
+    ConfidenceLevel,
+    EngineeringDiscipline,
+    ProcessType,
+    ProjectPhase,
+    ProjectSize,
+    ProjectStatus,
+    ProjectType,
+    WorkType,
+)
 from app.models.base import Base
-
-
-class WorkType(str, enum.Enum):
-    """Top-level work type classification."""
-
-    CONVENTIONAL = "CONVENTIONAL"  # Standard single-phase project
-    PHASE_GATE = "PHASE_GATE"  # Multi-phase project with stage gates
-    CAMPAIGN = "CAMPAIGN"  # Ongoing engineering support/retainer
-
-
-class ProjectSize(str, enum.Enum):
-    """Project size classification (for discrete projects only)."""
-
-    SMALL = "SMALL"      # < 500 hours (configurable)
-    MEDIUM = "MEDIUM"    # 500-2000 hours (configurable)
-    LARGE = "LARGE"      # > 2000 hours (configurable)
-
-
-class ProcessType(str, enum.Enum):
-    """Project governance/process methodology."""
-
-    CONVENTIONAL = "CONVENTIONAL"  # Standard workflow with continuous progression
-    PHASE_GATE = "PHASE_GATE"  # Formal stage-gate reviews with approval milestones
-
-
-class EngineeringDiscipline(str, enum.Enum):
-    """Engineering discipline."""
-
-    CIVIL = "CIVIL"
-    MECHANICAL = "MECHANICAL"
-    ELECTRICAL = "ELECTRICAL"
-    STRUCTURAL = "STRUCTURAL"
-    CHEMICAL = "CHEMICAL"
-    ENVIRONMENTAL = "ENVIRONMENTAL"
-    MULTIDISCIPLINE = "MULTIDISCIPLINE"
-
-
-class ClientProfile(str, enum.Enum):
-    """Client profile type."""
-
-    TYPE_A = "TYPE_A"        # Heavy oversight (+40%)
-    TYPE_B = "TYPE_B"        # Standard process (baseline)
-    TYPE_C = "TYPE_C"        # Minimal oversight (-15%)
-    NEW_CLIENT = "NEW_CLIENT"  # Unknown, conservative (+25%)
-
-
-class ProjectStatus(str, enum.Enum):
-    """Project status."""
-
-    DRAFT = "DRAFT"
-    ESTIMATION = "ESTIMATION"
-    REVIEW = "REVIEW"
-    APPROVED = "APPROVED"
-    ACTIVE = "ACTIVE"
-    ON_HOLD = "ON_HOLD"
-    COMPLETED = "COMPLETED"
-    CANCELLED = "CANCELLED"
-
-
-class ConfidenceLevel(str, enum.Enum):
-    """Estimation confidence level."""
-
-    LOW = "LOW"          # 50-70% confidence
-    MEDIUM = "MEDIUM"    # 70-85% confidence
-    HIGH = "HIGH"        # 85-95% confidence
-    VERY_HIGH = "VERY_HIGH"  # > 95% confidence
-
-
-class ProjectType(str, enum.Enum):
-    """Project type."""
-
-    STANDARD = "STANDARD"  # Standard project (default)
-
-
-class ProjectPhase(str, enum.Enum):
-    """Project phase for phase-gate projects."""
-
-    FRAME = "FRAME"        # Conceptual (±50%)
-    SCREEN = "SCREEN"      # Feasibility (±30%)
-    REFINE = "REFINE"      # FEED/Define (±10-15%)
-    IMPLEMENT = "IMPLEMENT"  # Detail Design
+from app.models.types import CompressedJSON
 
 
 class Project(Base):
@@ -137,15 +67,16 @@ class Project(Base):
     campaign_scheduled_deliverables = Column(JSON, default=[])  # [{name, frequency}]
     campaign_pricing_model = Column(String(50), nullable=True)  # fixedRetainer, timeAndMaterials
 
-    # Selected disciplines for multi-discipline projects (stored as JSON array)
-    selected_disciplines = Column(JSON, default=[])
+    # Selected disciplines for multi-discipline projects (stored as JSONB array)
+    selected_disciplines = Column(JSONB, default=[])
 
     # Equipment-driven estimation (stored as JSON arrays)
-    equipment_list = Column(JSON, default=[])  # List of equipment with size/complexity
-    deliverables_config = Column(JSON, default=[])  # Deliverables with dependencies/issue states
+    # equipment_list is never filtered server-side, so it is stored zlib-compressed
+    equipment_list = Column(CompressedJSON(), default=[])  # List of equipment with size/complexity
+    deliverables_config = Column(JSONB, default=[])  # Deliverables with dependencies/issue states
 
-    # Complexity factors (stored as JSON)
-    complexity_factors = Column(JSON, default={})
+    # Complexity factors (stored as JSONB, GIN-indexed for filtering)
+    complexity_factors = Column(JSONB, default={})
 
     # Resource availability (stored as JSON)
     resource_availability = Column(JSON, default={})
@@ -187,4 +118,18 @@ class Project(Base):
     __table_args__ = (
         Index("idx_project_status_created", "status", "created_at"),
         Index("idx_project_company", "company_id"),
+        Index("idx_project_updated_at", "updated_at"),  # Analog index delta sync
+        # GIN indexes for server-side containment (@>) filters on configuration
+        Index(
+            "idx_project_complexity_factors_gin", "complexity_factors",
+            postgresql_using="gin", postgresql_ops={"complexity_factors": "jsonb_path_ops"}
+        ),
+        Index(
+            "idx_project_selected_disciplines_gin", "selected_disciplines",
+            postgresql_using="gin", postgresql_ops={"selected_disciplines": "jsonb_path_ops"}
+        ),
+        Index(
+            "idx_project_deliverables_config_gin", "deliverables_config",
+            postgresql_using="gin", postgresql_ops={"deliverables_config": "jsonb_path_ops"}
+        ),
     )
\ No newline at end of file
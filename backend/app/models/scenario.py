@@ -0,0 +1,33 @@
+"""Estimate scenario model."""
+
+from sqlalchemy import Column, ForeignKey, JSON, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class EstimateScenario(Base):
+    """
+    Named variant of a project's estimate ("fast-track", "add brownfield").
+
+    Only the overridden inputs are stored; everything else comes from the
+    project's base inputs when the scenarios are evaluated.
+    """
+
+    __tablename__ = "estimate_scenarios"
+
+    project_id = Column(
+        UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    name = Column(String(100), nullable=False)
+    description = Column(String(500))
+    overrides = Column(JSON, nullable=False, default={})  # Subset of EstimationRequest fields
+
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
+
+    __table_args__ = (
+        UniqueConstraint("project_id", "name", name="uq_estimate_scenarios_project_name"),
+    )
+
+    def __repr__(self):
+        return f"<EstimateScenario {self.name}>"
@@ -0,0 +1,75 @@
+"""Custom column types."""
+
+from typing import Any, Optional
+import json
+import zlib
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from app.config import settings
+
+
+# Payload markers (first byte of the stored value)
+RAW_MARKER = b"j"   # Uncompressed UTF-8 JSON
+ZLIB_MARKER = b"z"  # zlib-compressed UTF-8 JSON
+
+
+def encode_json(value: Any, threshold: int, level: int) -> bytes:
+    """
+    Serialize value to JSON, compressing it when larger than threshold.
+
+    Args:
+        value: JSON-serializable value
+        threshold: Minimum serialized size in bytes before compressing
+        level: zlib compression level (1-9)
+
+    Returns:
+        bytes: Marker byte followed by the (possibly compressed) JSON
+    """
+    raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    if len(raw) >= threshold:
+        compressed = zlib.compress(raw, level)
+        if len(compressed) < len(raw):
+            return ZLIB_MARKER + compressed
+    return RAW_MARKER + raw
+
+
+def decode_json(payload: Optional[bytes]) -> Any:
+    """Decode a payload produced by encode_json."""
+    if payload is None:
+        return None
+
+    payload = bytes(payload)
+    marker, body = payload[:1], payload[1:]
+
+    if marker == ZLIB_MARKER:
+        body = zlib.decompress(body)
+    elif marker != RAW_MARKER:
+        raise ValueError(f"Unknown compressed JSON marker: {marker!r}")
+
+    return json.loads(body)
+
+
+class CompressedJSON(TypeDecorator):
+    """
+    JSON stored as bytea, zlib-compressed above a size threshold.
+
+    Small values are stored uncompressed so they stay cheap to read.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, threshold: Optional[int] = None, level: Optional[int] = None):
+        super().__init__()
+        self.threshold = threshold if threshold is not None else settings.JSON_COMPRESSION_THRESHOLD
+        self.level = level if level is not None else settings.JSON_COMPRESSION_LEVEL
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return encode_json(value, self.threshold, self.level)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Any:
+        return decode_json(value)
@@ -0,0 +1,43 @@
+"""Complexity coefficient set schemas."""
+
+from typing import Dict, Optional
+from pydantic import Field
+
+from app.schemas.base import BaseSchema, BaseDBSchema
+
+
+class ComplexityCoefficientSetCreate(BaseSchema):
+    """Schema for creating a coefficient set."""
+
+    coefficients: Dict[str, float]
+    method: str = "manual"
+    ridge_alpha: float = 0.0
+    sample_count: int = 0
+    r_squared: Optional[float] = None
+    rmse: Optional[float] = None
+    notes: Optional[str] = Field(None, max_length=1000)
+
+
+class ComplexityCoefficientSetUpdate(BaseSchema):
+    """Schema for updating a coefficient set."""
+
+    notes: Optional[str] = Field(None, max_length=1000)
+
+
+class ComplexityCoefficientSetResponse(BaseDBSchema, ComplexityCoefficientSetCreate):
+    """Schema for coefficient set response."""
+
+    version: int
+    is_active: bool
+
+
+class CalibrationRequest(BaseSchema):
+    """Schema for a calibration run."""
+
+    ridge_alpha: float = Field(
+        default=1.0, ge=0,
+        description="Ridge strength towards the current coefficients (0 = ordinary least squares)"
+    )
+    min_samples: int = Field(default=30, ge=1, description="Minimum completed projects required")
+    activate: bool = Field(default=False, description="Activate the new set immediately")
+    notes: Optional[str] = Field(None, max_length=1000)
@@ -1,7 +1,7 @@
 """Deliverable schemas."""
 
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from pydantic import Field
 
@@ -81,4 +81,17 @@ class Deliverable(BaseDBSchema, DeliverableBase):
     actual_sheets: int = 0
     is_critical_path: bool
     float_days: int
-    progress_percent: int
\ No newline at end of file
+    progress_percent: int
+
+
+class CatalogDeliverableResponse(BaseSchema):
+    """Schema for a master deliverables list entry."""
+
+    phase: str
+    discipline: str
+    name: str
+    item_no: float
+    statuses: List[str] = []
+    milestone: Optional[str] = None
+    notes: Optional[str] = None
+    base_hours: Optional[int] = None
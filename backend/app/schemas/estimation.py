@@ -1,10 +1,18 @@
 """Estimation schemas."""
 
+from datetime import datetime
 from typing import Dict, Optional, List, Any
-from pydantic import Field
+from uuid import UUID
+from pydantic import Field, model_validator
 
 from app.schemas.base import BaseSchema
-from app.models.project import ProjectSize, ClientProfile
+from app.domain.enums import ProjectSize, ClientProfile
+
+
+# Campaign estimates are months x disciplines x sites arrays; bound the
+# free-form dimensions so one request cannot allocate gigabytes
+MAX_CAMPAIGN_DISCIPLINES = 50
+MAX_SCHEDULED_DELIVERABLES = 500
 
 
 class EstimationRequest(BaseSchema):
@@ -103,4 +111,178 @@ class CostCalculationResponse(BaseSchema):
 
     summary: CostSummary
     by_role: List[RoleSummary]
-    by_deliverable: List[DeliverableCostBreakdown]
\ No newline at end of file
+    by_deliverable: List[DeliverableCostBreakdown]
+
+
+class PhaseDisciplineEstimate(BaseSchema):
+    """Schema for one phase x discipline cell."""
+
+    hours: float
+    cost: float
+
+
+class PhaseEstimate(BaseSchema):
+    """Schema for one phase of a phase-gate estimate."""
+
+    hours: float
+    low_hours: float
+    high_hours: float
+    cost: float
+    low_cost: float
+    high_cost: float
+    accuracy: List[float]
+    deliverable_count: int
+    completion_percent: Optional[float] = None
+    by_discipline: Dict[str, PhaseDisciplineEstimate]
+
+
+class PhaseGateEstimateResponse(BaseSchema):
+    """Schema for phase-gate estimate response."""
+
+    phases: Dict[str, PhaseEstimate]
+    totals: Dict[str, float]
+    recomputed: List[str]
+
+
+class ScheduledDeliverableInput(BaseSchema):
+    """Schema for a scheduled campaign deliverable."""
+
+    name: str
+    discipline: Optional[str] = None
+    hours: float = Field(..., ge=0)
+    frequency: Optional[str] = Field(None, description="one-time, weekly, monthly, quarterly, semi-annual or annual")
+    month: Optional[int] = Field(None, ge=1, description="First (or only) month, 1-based")
+    per_site: bool = Field(default=True, description="False for campaign-level items shared across sites")
+
+
+class CampaignEstimateRequest(BaseSchema):
+    """Schema for campaign estimation request."""
+
+    duration_months: int = Field(..., ge=1, le=240)
+    site_count: int = Field(default=1, ge=1, le=1000)
+    monthly_hours: Dict[str, float] = Field(
+        default_factory=dict, max_length=MAX_CAMPAIGN_DISCIPLINES,
+        description="Hours per site per month by discipline"
+    )
+    scheduled_deliverables: List[ScheduledDeliverableInput] = Field(
+        default_factory=list, max_length=MAX_SCHEDULED_DELIVERABLES
+    )
+    discipline_rates: Dict[str, float] = Field(default_factory=dict, max_length=MAX_CAMPAIGN_DISCIPLINES)
+    hourly_rate: Optional[float] = Field(None, gt=0, description="Rate for disciplines without one")
+    site_stagger_months: int = Field(default=0, ge=0, le=240, description="Months between site onboardings")
+    annual_escalation_percent: float = Field(default=0.0, ge=0, le=50)
+    pricing_model: str = Field(default="MONTHLY_RETAINER")
+
+    @model_validator(mode="after")
+    def check_discipline_count(self) -> "CampaignEstimateRequest":
+        """Limit the disciplines (the array's middle axis) across hours and scheduled items."""
+        disciplines = set(self.monthly_hours) | {d.discipline for d in self.scheduled_deliverables}
+        if len(disciplines) > MAX_CAMPAIGN_DISCIPLINES:
+            raise ValueError(f"At most {MAX_CAMPAIGN_DISCIPLINES} distinct disciplines are allowed")
+        return self
+
+
+class CampaignSummary(BaseSchema):
+    """Schema for campaign estimate summary."""
+
+    duration_months: int
+    site_count: int
+    total_hours: float
+    total_cost: float
+    average_monthly_hours: float
+    average_monthly_cost: float
+    peak_month: Optional[int] = None
+    peak_month_hours: float
+    pricing_model: str
+    monthly_fee: float
+
+
+class CampaignMonth(BaseSchema):
+    """Schema for one campaign month."""
+
+    month: int
+    hours: float
+    cost: float
+    billed: float
+
+
+class CampaignSite(BaseSchema):
+    """Schema for one campaign site."""
+
+    site: int
+    hours: float
+    cost: float
+
+
+class CampaignEstimateResponse(BaseSchema):
+    """Schema for campaign estimation response."""
+
+    summary: CampaignSummary
+    by_month: List[CampaignMonth]
+    by_discipline: Dict[str, PhaseDisciplineEstimate]
+    by_site: List[CampaignSite]
+
+
+class CashFlowWeek(BaseSchema):
+    """Schema for one week of the S-curve."""
+
+    week: int
+    start: str
+    hours: float
+    cost: float
+    cumulative_cost: float
+    cumulative_percent: float
+
+
+class CashFlowInvoice(BaseSchema):
+    """Schema for one monthly invoicing bucket."""
+
+    month: str
+    amount: float
+    cumulative: float
+
+
+class CashFlowResponse(BaseSchema):
+    """Schema for project cash flow response."""
+
+    start: str
+    total_hours: float
+    total_cost: float
+    weeks: List[CashFlowWeek]
+    invoices: List[CashFlowInvoice]
+    signature: Optional[str] = None
+    regenerated: bool
+
+
+class EstimateVersionSummary(BaseSchema):
+    """Schema for one estimate version in a project's history."""
+
+    version: int
+    created_at: datetime
+    created_by: Optional[UUID] = None
+    label: Optional[str] = None
+    inputs_hash: str
+    outputs_hash: str
+    total_hours: Optional[int] = None
+    duration_weeks: Optional[int] = None
+    confidence_level: Optional[str] = None
+    changes: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class EstimateVersionResponse(EstimateVersionSummary):
+    """Schema for an estimate version with its inputs and outputs."""
+
+    inputs: Dict[str, Any]
+    outputs: Dict[str, Any]
+
+
+class EstimateVersionComparison(BaseSchema):
+    """Schema for the differences between two estimate versions."""
+
+    a: int
+    b: int
+    inputs_changed: bool
+    outputs_changed: bool
+    inputs_diff: List[Dict[str, Any]]
+    outputs_diff: List[Dict[str, Any]]
+    deltas: Dict[str, float]
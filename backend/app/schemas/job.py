@@ -0,0 +1,36 @@
+"""Background job schemas."""
+
+from typing import Any, Dict, Optional
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class JobSubmit(BaseSchema):
+    """Schema for submitting a job."""
+
+    name: str = Field(..., description="Registered job name")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Job keyword arguments")
+
+
+class JobResponse(BaseSchema):
+    """Schema for job status and progress."""
+
+    id: str
+    name: str
+    status: str
+    progress: float
+    message: Optional[str] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+class JobResultResponse(BaseSchema):
+    """Schema for a finished job's result."""
+
+    id: str
+    status: str
+    result: Any = None
@@ -2,12 +2,12 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Literal, Optional, Union
 from uuid import UUID
-from pydantic import Field
+from pydantic import ConfigDict, Field, model_validator
 
 from app.schemas.base import BaseSchema, BaseDBSchema
-from app.models.project import (
+from app.domain.enums import (
     WorkType,
     ProjectSize,
     ProcessType,
@@ -103,6 +103,14 @@ class ProjectUpdate(BaseSchema):
     deliverables_config: Optional[list] = None
 
 
+class ProjectClone(BaseSchema):
+    """Schema for deep-cloning a project."""
+
+    new_name: str = Field(..., min_length=1, max_length=255)
+    new_code: Optional[str] = Field(None, max_length=50)
+    include_modules: bool = Field(default=True, description="Also clone the project's modules")
+
+
 class Project(BaseDBSchema, ProjectBase):
     """Project schema with database fields."""
 
@@ -120,10 +128,122 @@ class Project(BaseDBSchema, ProjectBase):
     approved_at: Optional[datetime] = None
 
 
+class ProjectSummary(BaseDBSchema):
+    """
+    Lean project projection for list views.
+
+    Only scalar list columns; the large JSON columns (equipment_list,
+    deliverables_config, campaign_monthly_hours, ...) are not loaded.
+    Extra fields are forbidden so full projects never validate as summaries.
+    """
+
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True, extra="forbid")
+
+    work_type: WorkType
+    name: str
+    project_code: Optional[str] = None
+    description: Optional[str] = None
+    size: Optional[ProjectSize] = None
+    process_type: Optional[ProcessType] = None
+    discipline: EngineeringDiscipline
+    project_type: ProjectType
+    parent_project_id: Optional[UUID] = None
+    company_id: Optional[UUID] = None
+    rate_sheet_id: Optional[UUID] = None
+    client_profile: ClientProfile
+    client_name: Optional[str] = None
+    status: ProjectStatus
+    current_phase: Optional[ProjectPhase] = None
+    campaign_duration_months: Optional[int] = None
+    campaign_site_count: Optional[int] = None
+    confidence_level: Optional[ConfidenceLevel] = None
+    total_hours: Optional[int] = None
+    duration_weeks: Optional[int] = None
+    total_cost: Optional[Decimal] = None
+    created_by: Optional[UUID] = None
+
+
 class ProjectListResponse(BaseSchema):
-    """Response schema for project list."""
+    """Response schema for project list (summaries unless full=true)."""
 
-    items: list[Project]
+    items: Union[list[ProjectSummary], list[Project]]
     total: int
     skip: int
-    limit: int
\ No newline at end of file
+    limit: int
+
+
+class JSONPatchOperation(BaseSchema):
+    """Single RFC 6902 JSON Patch operation."""
+
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True, populate_by_name=True)
+
+    op: Literal["add", "remove", "replace", "move", "copy", "test"]
+    path: str
+    value: Any = None
+    from_: Optional[str] = Field(None, alias="from")
+
+    @model_validator(mode="after")
+    def check_operands(self) -> "JSONPatchOperation":
+        """Require value / from for the operations that use them."""
+        if self.op in ("add", "replace", "test") and "value" not in self.model_fields_set:
+            raise ValueError(f"'{self.op}' operation requires 'value'")
+        if self.op in ("move", "copy") and self.from_ is None:
+            raise ValueError(f"'{self.op}' operation requires 'from'")
+        return self
+
+    def to_operation(self) -> dict:
+        """Plain dict form used by the patch service."""
+        return self.model_dump(by_alias=True, exclude_unset=True)
+
+
+class JSONPatchResponse(BaseSchema):
+    """Changed fragments after applying a JSON Patch."""
+
+    project_id: UUID
+    changes: dict[str, Any] = Field(
+        ...,
+        description="New value at each changed JSON Pointer (null if removed)"
+    )
+
+
+class ProjectAnalog(BaseSchema):
+    """A completed project similar to the query project, with its outcome."""
+
+    project_id: UUID
+    name: Optional[str] = None
+    project_code: Optional[str] = None
+    size: Optional[str] = None
+    discipline: Optional[str] = None
+    work_type: Optional[str] = None
+    estimated_hours: Optional[int] = None
+    actual_hours: Optional[int] = None
+    total_cost: Optional[Decimal] = None
+    similarity: float = Field(..., description="Cosine similarity of the feature vectors (1.0 = identical)")
+
+
+class ProjectAnalogsResponse(BaseSchema):
+    """Response schema for analog project search."""
+
+    project_id: UUID
+    analogs: list[ProjectAnalog]
+
+
+class EVMResponse(BaseSchema):
+    """Earned value metrics, in hours."""
+
+    bac: float
+    pv: float
+    ev: float
+    ac: float
+    deliverable_count: int
+    completed_count: int
+    remaining_hours: Optional[float] = None
+    percent_complete: float
+    cv: float
+    sv: float
+    cpi: Optional[float] = None
+    spi: Optional[float] = None
+    eac: Optional[float] = None
+    etc: Optional[float] = None
+    vac: Optional[float] = None
+    eac_bottom_up: Optional[float] = None
@@ -0,0 +1,74 @@
+"""Estimate scenario schemas."""
+
+from typing import Dict, List, Optional
+from uuid import UUID
+from pydantic import Field
+
+from app.schemas.base import BaseSchema, BaseDBSchema
+from app.domain.enums import ProjectSize, ClientProfile
+
+
+class ScenarioOverrides(BaseSchema):
+    """Estimate inputs a scenario changes (unset fields keep the base value)."""
+
+    project_size: Optional[ProjectSize] = None
+    complexity_factors: Optional[Dict[str, bool]] = Field(None, description="Merged over the base factors")
+    client_profile: Optional[ClientProfile] = None
+    resource_availability: Optional[Dict[str, float]] = Field(None, description="Merged over the base availability")
+    contingency_percent: Optional[float] = Field(None, ge=0, le=100)
+    overhead_percent: Optional[float] = Field(None, ge=0, le=100)
+    base_hours_override: Optional[int] = Field(None, ge=0)
+    client_complexity: Optional[int] = Field(None, ge=1, le=10)
+
+
+class EstimateScenarioCreate(BaseSchema):
+    """Schema for creating a scenario."""
+
+    name: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = Field(None, max_length=500)
+    overrides: ScenarioOverrides = Field(default_factory=ScenarioOverrides)
+
+
+class EstimateScenarioUpdate(BaseSchema):
+    """Schema for updating a scenario (overrides are replaced as a whole)."""
+
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = Field(None, max_length=500)
+    overrides: Optional[ScenarioOverrides] = None
+
+
+class EstimateScenario(BaseDBSchema):
+    """Scenario schema with database fields."""
+
+    project_id: UUID
+    name: str
+    description: Optional[str] = None
+    overrides: Dict[str, object]
+
+
+class ScenarioResult(BaseSchema):
+    """Schema for one row of the scenario comparison."""
+
+    name: str
+    scenario_id: Optional[UUID] = None
+    overrides: Dict[str, object]
+    base_hours: int
+    complexity_multiplier: float
+    client_multiplier: float
+    adjusted_hours: int
+    contingency_hours: int
+    overhead_hours: int
+    total_hours: int
+    duration_weeks: int
+    confidence_level: str
+    confidence_score: float
+    delta_hours: int
+    delta_percent: float
+    delta_weeks: int
+
+
+class ScenarioComparisonResponse(BaseSchema):
+    """Schema for the side-by-side scenario comparison (baseline first)."""
+
+    base_inputs: Dict[str, object]
+    scenarios: List[ScenarioResult]
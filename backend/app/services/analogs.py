@@ -0,0 +1,410 @@
+"""
+Analog project finder.
+
+Projects are encoded as fixed-length feature vectors and kept in an
+in-process NumPy matrix. Vectors are L2-normalized, so similarity to a
+query project is one matrix-vector product followed by a partial sort.
+The matrix is updated row by row as projects change instead of being
+rebuilt.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+from uuid import UUID
+import asyncio
+import logging
+import math
+import time
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.company import Company
+from app.models.deliverable import Deliverable
+from app.models.project import (
+    EngineeringDiscipline,
+    Project,
+    ProjectSize,
+    ProjectStatus,
+    WorkType,
+)
+from app.services.estimation.complexity import ComplexityCalculator
+
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each feature block in the similarity
+FEATURE_WEIGHTS = {
+    "size": 1.0,
+    "discipline": 1.0,
+    "selected_disciplines": 0.7,
+    "complexity": 0.8,
+    "client_complexity": 0.5,
+    "hours": 1.5,
+    "work_type": 1.0,
+}
+
+# log1p(hours) is scaled by this so 100k hours maps to ~1.0
+HOURS_SCALE = math.log1p(100_000)
+
+
+def _enum_value(value: Any) -> Optional[str]:
+    value = getattr(value, "value", value)
+    return str(value).upper() if value else None
+
+
+class FeatureEncoder:
+    """Encode project rows as weighted, L2-normalized feature vectors."""
+
+    def __init__(self, complexity_factors: Optional[Iterable[str]] = None):
+        self.sizes = [s.value for s in ProjectSize]
+        self.disciplines = [d.value for d in EngineeringDiscipline]
+        self.work_types = [w.value for w in WorkType]
+        self.complexity_factors = list(complexity_factors or ComplexityCalculator.COMPLEXITY_FACTORS)
+
+        blocks = [
+            ("size", len(self.sizes)),
+            ("discipline", len(self.disciplines)),
+            ("selected_disciplines", len(self.disciplines)),
+            ("complexity", len(self.complexity_factors)),
+            ("client_complexity", 1),
+            ("hours", 1),
+            ("work_type", len(self.work_types)),
+        ]
+        self.offsets: Dict[str, int] = {}
+        offset = 0
+        for name, width in blocks:
+            self.offsets[name] = offset
+            offset += width
+        self.dim = offset
+
+    def _one_hot(self, vector: np.ndarray, block: str, vocabulary: List[str], value: Any) -> None:
+        value = _enum_value(value)
+        if value in vocabulary:
+            vector[self.offsets[block] + vocabulary.index(value)] = FEATURE_WEIGHTS[block]
+
+    def encode(self, row: Mapping[str, Any]) -> np.ndarray:
+        """
+        Encode one project.
+
+        Args:
+            row: Mapping with size, discipline, selected_disciplines,
+                complexity_factors, client_complexity, total_hours and work_type
+
+        Returns:
+            float32 vector of length dim with unit norm
+        """
+        vector = np.zeros(self.dim, dtype=np.float32)
+
+        self._one_hot(vector, "size", self.sizes, row.get("size"))
+        self._one_hot(vector, "discipline", self.disciplines, row.get("discipline"))
+        self._one_hot(vector, "work_type", self.work_types, row.get("work_type"))
+
+        selected = [_enum_value(d) for d in (row.get("selected_disciplines") or [])]
+        selected = [d for d in selected if d in self.disciplines]
+        for discipline in selected:
+            # Spread the block weight so many disciplines do not dominate
+            vector[self.offsets["selected_disciplines"] + self.disciplines.index(discipline)] = (
+                FEATURE_WEIGHTS["selected_disciplines"] / math.sqrt(len(selected))
+            )
+
+        factors = row.get("complexity_factors") or {}
+        for i, name in enumerate(self.complexity_factors):
+            if factors.get(name):
+                vector[self.offsets["complexity"] + i] = FEATURE_WEIGHTS["complexity"]
+
+        client_complexity = row.get("client_complexity") or 5
+        vector[self.offsets["client_complexity"]] = (
+            FEATURE_WEIGHTS["client_complexity"] * (client_complexity - 1) / 9
+        )
+        vector[self.offsets["hours"]] = (
+            FEATURE_WEIGHTS["hours"] * math.log1p(max(row.get("total_hours") or 0, 0)) / HOURS_SCALE
+        )
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+
+class AnalogIndex:
+    """
+    Feature matrix with O(1) row upserts and removals.
+
+    Rows live in a preallocated float32 matrix that doubles when full;
+    removal moves the last row into the freed slot. Only completed projects
+    are eligible as results, but every project is indexed so status changes
+    are a flag flip.
+    """
+
+    def __init__(self, encoder: Optional[FeatureEncoder] = None, capacity: int = 1024):
+        self.encoder = encoder or FeatureEncoder()
+        self._matrix = np.zeros((capacity, self.encoder.dim), dtype=np.float32)
+        self._eligible = np.zeros(capacity, dtype=bool)
+        self._ids: List[UUID] = []
+        self._outcomes: List[Dict[str, Any]] = []
+        self._rows: Dict[UUID, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, project_id: UUID) -> bool:
+        return project_id in self._rows
+
+    def _grow(self) -> None:
+        capacity = self._matrix.shape[0] * 2
+        matrix = np.zeros((capacity, self.encoder.dim), dtype=np.float32)
+        matrix[:len(self)] = self._matrix[:len(self)]
+        eligible = np.zeros(capacity, dtype=bool)
+        eligible[:len(self)] = self._eligible[:len(self)]
+        self._matrix, self._eligible = matrix, eligible
+
+    def upsert(self, row: Mapping[str, Any]) -> None:
+        """Insert or replace a project row."""
+        project_id = row["id"]
+        index = self._rows.get(project_id)
+        if index is None:
+            if len(self) == self._matrix.shape[0]:
+                self._grow()
+            index = len(self)
+            self._rows[project_id] = index
+            self._ids.append(project_id)
+            self._outcomes.append({})
+
+        self._matrix[index] = self.encoder.encode(row)
+        self._eligible[index] = _enum_value(row.get("status")) == ProjectStatus.COMPLETED.value
+        self._outcomes[index] = {
+            "project_id": project_id,
+            "name": row.get("name"),
+            "project_code": row.get("project_code"),
+            "size": _enum_value(row.get("size")),
+            "discipline": _enum_value(row.get("discipline")),
+            "work_type": _enum_value(row.get("work_type")),
+            "estimated_hours": row.get("total_hours"),
+            "actual_hours": row.get("actual_hours"),
+            "total_cost": row.get("total_cost"),
+        }
+
+    def remove(self, project_id: UUID) -> bool:
+        """Remove a project; returns False if it was not indexed."""
+        index = self._rows.pop(project_id, None)
+        if index is None:
+            return False
+
+        last = len(self) - 1
+        if index != last:
+            moved_id = self._ids[last]
+            self._matrix[index] = self._matrix[last]
+            self._eligible[index] = self._eligible[last]
+            self._ids[index] = moved_id
+            self._outcomes[index] = self._outcomes[last]
+            self._rows[moved_id] = index
+
+        self._eligible[last] = False
+        self._ids.pop()
+        self._outcomes.pop()
+        return True
+
+    def query(
+        self,
+        vector: np.ndarray,
+        k: int = 10,
+        exclude: Iterable[UUID] = ()
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Top-k most similar eligible projects.
+
+        Args:
+            vector: Encoded query project
+            k: Number of results
+            exclude: Project IDs never returned (e.g. the query project)
+
+        Returns:
+            (outcome, cosine similarity) pairs, most similar first
+        """
+        n = len(self)
+        if n == 0 or k <= 0:
+            return []
+
+        scores = self._matrix[:n] @ vector
+        scores[~self._eligible[:n]] = -np.inf
+        for project_id in exclude:
+            index = self._rows.get(project_id)
+            if index is not None:
+                scores[index] = -np.inf
+
+        k = min(k, n)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            (self._outcomes[i], float(scores[i]))
+            for i in top
+            if np.isfinite(scores[i])
+        ]
+
+
+def analog_rows_query():
+    """Columns needed to encode projects and report their outcomes."""
+    actual_hours = (
+        select(func.sum(Deliverable.actual_hours_total))
+        .where(Deliverable.project_id == Project.id)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            Project.id,
+            Project.name,
+            Project.project_code,
+            Project.status,
+            Project.size,
+            Project.discipline,
+            Project.selected_disciplines,
+            Project.complexity_factors,
+            Project.total_hours,
+            Project.total_cost,
+            Project.work_type,
+            Project.updated_at,
+            Company.client_complexity,
+            actual_hours.label("actual_hours"),
+        )
+        .outerjoin(Company, Company.id == Project.company_id)
+    )
+
+
+class AnalogService:
+    """
+    Process-wide analog index kept in step with the database.
+
+    The index is built lazily on first use. Projects written through this
+    process are refreshed before the next query (tracked by a commit
+    listener); changes from other processes are picked up by a periodic
+    delta sync on updated_at, and a full rebuild clears any drift.
+    """
+
+    def __init__(self):
+        self.index: Optional[AnalogIndex] = None
+        self._lock = asyncio.Lock()
+        self._built_at = 0.0
+        self._synced_at = 0.0
+        self._watermark = None
+        self._dirty: Set[UUID] = set()
+        self._removed: Set[UUID] = set()
+
+    def mark_dirty(self, project_ids: Iterable[UUID], removed: Iterable[UUID] = ()) -> None:
+        """Queue projects for refresh (or removal) before the next query."""
+        self._dirty.update(project_ids)
+        self._removed.update(removed)
+
+    async def _load(self, db: AsyncSession, query, index: AnalogIndex) -> int:
+        count = 0
+        result = await db.stream(query.execution_options(yield_per=5000))
+        async for row in result.mappings():
+            index.upsert(row)
+            if self._watermark is None or (row["updated_at"] and row["updated_at"] > self._watermark):
+                self._watermark = row["updated_at"]
+            count += 1
+        return count
+
+    async def _rebuild(self, db: AsyncSession) -> None:
+        started = time.perf_counter()
+        self._watermark = None
+        self._dirty.clear()
+        self._removed.clear()
+        index = AnalogIndex()
+        count = await self._load(db, analog_rows_query(), index)
+        self.index = index
+        self._built_at = self._synced_at = time.monotonic()
+        logger.info(f"Analog index built: {count} projects in {time.perf_counter() - started:.2f}s")
+
+    async def ensure_fresh(self, db: AsyncSession) -> AnalogIndex:
+        """Build, delta-sync or refresh dirty rows as needed."""
+        async with self._lock:
+            now = time.monotonic()
+            if self.index is None or now - self._built_at > settings.ANALOG_INDEX_REBUILD_SECONDS:
+                await self._rebuild(db)
+                return self.index
+
+            for project_id in self._removed:
+                self.index.remove(project_id)
+            self._dirty -= self._removed
+            self._removed.clear()
+
+            if self._dirty:
+                dirty, self._dirty = self._dirty, set()
+                await self._load(db, analog_rows_query().where(Project.id.in_(dirty)), self.index)
+
+            if now - self._synced_at > settings.ANALOG_INDEX_SYNC_SECONDS and self._watermark is not None:
+                changed = await self._load(
+                    db, analog_rows_query().where(Project.updated_at > self._watermark), self.index
+                )
+                self._synced_at = now
+                if changed:
+                    logger.debug(f"Analog index delta sync: {changed} projects")
+
+            return self.index
+
+    async def find_analogs(
+        self,
+        db: AsyncSession,
+        project_id: UUID,
+        k: int = 10
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find the k completed projects most similar to a project.
+
+        Returns:
+            Analog outcomes with similarity, or None if the project does not exist
+        """
+        index = await self.ensure_fresh(db)
+
+        result = await db.execute(analog_rows_query().where(Project.id == project_id))
+        row = result.mappings().first()
+        if row is None:
+            return None
+
+        matches = index.query(index.encoder.encode(row), k=k, exclude=[project_id])
+        return [{**outcome, "similarity": round(score, 4)} for outcome, score in matches]
+
+
+analog_service = AnalogService()
+
+
+def _collect_changed_projects(session: Session, flush_context) -> None:
+    """Remember which projects this transaction touched."""
+    changed = session.info.setdefault("analog_changed", set())
+    removed = session.info.setdefault("analog_removed", set())
+
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Project) and obj.id is not None:
+            changed.add(obj.id)
+        elif isinstance(obj, Deliverable) and obj.project_id is not None:
+            changed.add(obj.project_id)
+    for obj in session.deleted:
+        if isinstance(obj, Project):
+            removed.add(obj.id)
+        elif isinstance(obj, Deliverable) and obj.project_id is not None:
+            changed.add(obj.project_id)
+
+
+def _refresh_changed_projects(session: Session) -> None:
+    """Queue committed project changes for the analog index."""
+    changed = session.info.pop("analog_changed", None)
+    removed = session.info.pop("analog_removed", None)
+    if changed or removed:
+        analog_service.mark_dirty(changed or (), removed or ())
+
+
+def _discard_changed_projects(session: Session) -> None:
+    session.info.pop("analog_changed", None)
+    session.info.pop("analog_removed", None)
+
+
+# Registered by app.services.listeners.register_listeners()
+SESSION_LISTENERS = (
+    ("after_flush", _collect_changed_projects),
+    ("after_commit", _refresh_changed_projects),
+    ("after_rollback", _discard_changed_projects),
+)
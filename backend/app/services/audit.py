@@ -0,0 +1,377 @@
+"""
+Audit log pipeline.
+
+Writes to audited models are captured by flush listeners (old and new
+column values, the acting user and the project), held on the session
+until it commits, then handed to ``audit_writer``: an in-memory queue
+that a background task drains into ``audit_logs`` with multi-row inserts,
+every ``AUDIT_FLUSH_INTERVAL`` seconds or as soon as ``AUDIT_BATCH_SIZE``
+records are waiting. Saves never wait on the audit insert.
+
+The queue is bounded (``AUDIT_QUEUE_SIZE``). When the database cannot
+keep up, failed batches are retried and records beyond the bound are
+dropped and counted rather than growing memory without limit. A batch
+that keeps failing is written row by row so one bad record cannot hold
+up the queue; rows that still fail are dropped and counted. The counters
+are reported on ``/health``. Remaining records are flushed on shutdown.
+
+Only ORM unit-of-work changes are seen. Core statements bypass the flush
+listeners and are not audited: the SQL JSON Patch of
+``Project.deliverables_config`` (``CRUDProject._apply_json_patch``), the
+``INSERT ... SELECT`` copies of ``clone_project`` and the deliverable
+catalog / template upserts of ``catalog_import``.
+"""
+
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+from uuid import UUID
+import asyncio
+import enum
+import logging
+import time
+
+from sqlalchemy import inspect, insert
+from sqlalchemy.orm import Session, attributes
+
+from app.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.base import committed_value
+from app.models.audit import AuditAction, AuditLog
+from app.models.deliverable import Deliverable
+from app.models.financial import FinancialBreakdown
+from app.models.project import Project
+from app.models.raci import RACIMatrix
+from app.models.resource import Resource
+from app.models.risk import RiskFactor, RiskScenario
+from app.models.scenario import EstimateScenario
+
+
+logger = logging.getLogger(__name__)
+
+AUDITED_MODELS = (
+    Project, Deliverable, Resource, FinancialBreakdown, RiskScenario, RiskFactor, RACIMatrix, EstimateScenario
+)
+
+# Bookkeeping columns left out of old/new values
+IGNORED_COLUMNS = ("id", "created_at", "updated_at")
+
+# Session.info key holding records captured since the last commit
+PENDING_KEY = "audit_pending"
+
+# Seconds to wait before retrying a failed batch, doubling up to the maximum
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+# Failed attempts at the head batch before it is written row by row
+MAX_BATCH_ATTEMPTS = 3
+
+AuditRecord = Dict[str, Any]
+WriteBatch = Callable[[List[AuditRecord]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class AuditActor:
+    """Who is making the current request."""
+
+    user_id: UUID
+    ip_address: Optional[str] = None
+    user_agent: Optional[str] = None
+
+
+current_actor: ContextVar[Optional[AuditActor]] = ContextVar("audit_actor", default=None)
+
+
+def set_actor(user_id: UUID, ip_address: Optional[str] = None, user_agent: Optional[str] = None) -> None:
+    """Attribute writes made in the current request to a user."""
+    current_actor.set(AuditActor(user_id=user_id, ip_address=ip_address, user_agent=user_agent))
+
+
+def json_value(value: Any) -> Any:
+    """Column value as stored in the JSON old_values/new_values."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(k): json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_value(v) for v in value]
+    return value
+
+
+def _columns(obj: Any) -> List[str]:
+    return [attr.key for attr in inspect(obj).mapper.column_attrs if attr.key not in IGNORED_COLUMNS]
+
+
+def _record(obj: Any, action: AuditAction, old: Optional[dict], new: Optional[dict]) -> AuditRecord:
+    project_id = obj.id if isinstance(obj, Project) else getattr(obj, "project_id", None)
+    return {
+        "action": action,
+        "entity_type": type(obj).__name__,
+        "entity_id": obj.id,
+        "project_id": project_id,
+        "description": f"{action.value.capitalize()} {type(obj).__name__}",
+        "old_values": old,
+        "new_values": new,
+    }
+
+
+def collect_changes(session: Session) -> List[AuditRecord]:
+    """Audit records for the audited objects in a pending flush."""
+    records = []
+
+    for obj in session.new:
+        if isinstance(obj, AUDITED_MODELS):
+            new = {attr: json_value(getattr(obj, attr)) for attr in _columns(obj)}
+            records.append(_record(obj, AuditAction.CREATE, None, new))
+
+    deleted_projects = {obj.id for obj in session.deleted if isinstance(obj, Project)}
+    for obj in session.deleted:
+        if isinstance(obj, AUDITED_MODELS):
+            old = {attr: json_value(committed_value(obj, attr)) for attr in _columns(obj)}
+            record = _record(obj, AuditAction.DELETE, old, None)
+            if record["project_id"] in deleted_projects:
+                # audit_logs.project_id references the row being deleted
+                record["metadata"] = {"project_id": str(record["project_id"])}
+                record["project_id"] = None
+            records.append(record)
+
+    for obj in session.dirty:
+        if not isinstance(obj, AUDITED_MODELS):
+            continue
+        changed = [attr for attr in _columns(obj) if attributes.get_history(obj, attr).has_changes()]
+        if not changed:
+            continue
+        old = {attr: json_value(committed_value(obj, attr)) for attr in changed}
+        new = {attr: json_value(getattr(obj, attr)) for attr in changed}
+        if old != new:
+            records.append(_record(obj, AuditAction.UPDATE, old, new))
+
+    return records
+
+
+class AuditStats:
+    """Queue counters."""
+
+    def __init__(self):
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.unattributed = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.max_depth = 0
+        self.last_batch_size = 0
+        self.last_flush_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+
+class AuditWriter:
+    """Bounded in-memory audit queue drained in batches by a background task."""
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        write: Optional[WriteBatch] = None
+    ):
+        self.max_size = max_size or settings.AUDIT_QUEUE_SIZE
+        self.batch_size = batch_size or settings.AUDIT_BATCH_SIZE
+        self.flush_interval = flush_interval if flush_interval is not None else settings.AUDIT_FLUSH_INTERVAL
+        self.write = write or insert_audit_rows
+
+        self.queue: Deque[AuditRecord] = deque()
+        self.stats = AuditStats()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._attempts = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def enqueue(self, records: List[AuditRecord]) -> int:
+        """
+        Queue records without waiting (safe to call from flush listeners).
+
+        Records that do not fit in the queue are dropped and counted.
+
+        Returns:
+            Number of records accepted
+        """
+        accepted = max(min(len(records), self.max_size - len(self.queue)), 0)
+        self.queue.extend(records[:accepted])
+        dropped = len(records) - accepted
+        self.stats.enqueued += accepted
+        self.stats.max_depth = max(self.stats.max_depth, len(self.queue))
+        if dropped:
+            if not self.stats.dropped:
+                logger.warning(f"Audit queue full ({self.max_size}); dropping records")
+            self.stats.dropped += dropped
+        if len(self.queue) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return accepted
+
+    async def flush(self) -> int:
+        """
+        Write everything queued so far, one batch at a time.
+
+        A failed batch is put back at the head of the queue (records that
+        no longer fit are dropped) and the error re-raised. Once the head
+        batch has failed ``MAX_BATCH_ATTEMPTS`` times it is written row by
+        row instead, and the rows that fail are dropped and counted as
+        rejected.
+
+        Returns:
+            Number of records written
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        written = 0
+        async with self._lock:
+            while self.queue:
+                batch = [self.queue.popleft() for _ in range(min(self.batch_size, len(self.queue)))]
+                started = time.perf_counter()
+                try:
+                    await self.write(batch)
+                    count = len(batch)
+                except Exception:
+                    self.stats.failed_flushes += 1
+                    self._attempts += 1
+                    if self._attempts < MAX_BATCH_ATTEMPTS:
+                        room = max(self.max_size - len(self.queue), 0)
+                        self.stats.dropped += max(len(batch) - room, 0)
+                        self.queue.extendleft(reversed(batch[:room]))
+                        raise
+                    count = await self._write_each(batch)
+                self._attempts = 0
+                self.stats.flushes += 1
+                self.stats.written += count
+                self.stats.last_batch_size = len(batch)
+                self.stats.last_flush_ms = round((time.perf_counter() - started) * 1000, 2)
+                written += count
+        return written
+
+    async def _write_each(self, batch: List[AuditRecord]) -> int:
+        """Write a batch one row at a time, dropping the rows that fail."""
+        written = 0
+        for record in batch:
+            try:
+                await self.write([record])
+                written += 1
+            except Exception as e:
+                self.stats.rejected += 1
+                logger.error(
+                    f"Dropping audit record {record.get('action')} {record.get('entity_type')} "
+                    f"{record.get('entity_id')}: {e}"
+                )
+        return written
+
+    async def _run(self) -> None:
+        delay = RETRY_DELAY
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+                delay = RETRY_DELAY
+            except Exception as e:
+                logger.error(f"Audit flush failed ({len(self.queue)} queued), retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+
+    def start(self) -> None:
+        """Start the background flusher on the running loop."""
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and write what is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Audit flush on shutdown failed, {len(self.queue)} records lost: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue configuration, depth and counters."""
+        return {
+            "running": self.running,
+            "depth": len(self.queue),
+            "max_size": self.max_size,
+            "batch_size": self.batch_size,
+            **self.stats.to_dict(),
+        }
+
+
+async def insert_audit_rows(records: List[AuditRecord]) -> None:
+    """Write a batch with one multi-row INSERT in its own session."""
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            insert(AuditLog.__table__),
+            [{"created_at": now, "updated_at": now, "metadata": {}, **record} for record in records]
+        )
+        await db.commit()
+
+
+audit_writer = AuditWriter()
+
+
+def _capture_after_flush(session: Session, flush_context) -> None:
+    """Hold audit records for the flushed changes until the transaction commits."""
+    if not settings.AUDIT_ENABLED or not audit_writer.running:
+        return
+    records = collect_changes(session)
+    if not records:
+        return
+    actor = current_actor.get()
+    if actor is None:
+        # audit_logs.user_id is required; system writes are not audited
+        audit_writer.stats.unattributed += len(records)
+        return
+    for record in records:
+        record.update(user_id=actor.user_id, ip_address=actor.ip_address, user_agent=actor.user_agent)
+    session.info.setdefault(PENDING_KEY, []).extend(records)
+
+
+def _enqueue_after_commit(session: Session) -> None:
+    records = session.info.pop(PENDING_KEY, None)
+    if records:
+        audit_writer.enqueue(records)
+
+
+def _discard_after_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+# Registered by app.services.listeners.register_listeners()
+SESSION_LISTENERS = (
+    ("after_flush", _capture_after_flush),
+    ("after_commit", _enqueue_after_commit),
+    ("after_soft_rollback", _discard_after_rollback),
+)
@@ -0,0 +1,396 @@
+"""
+Deliverable catalog import.
+
+Loads the Engineering Master Deliverables List (the workbook, one sheet per
+phase, or the per-phase CSV exports) into the ``deliverable_catalog``
+table, then rebuilds one generic PHASE_GATE DeliverableTemplate per phase
+from it. Sources are read row by row (openpyxl read-only mode, csv
+reader), validated and upserted in batches, so memory stays constant
+however long the sheets are.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+import csv
+import logging
+import uuid
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.offload import offloader
+from app.data.phase_gate_deliverables import PHASE_GATE_DELIVERABLES
+from app.models.deliverable import Milestone
+from app.models.deliverable_catalog import CATALOG_PHASES, CatalogDeliverable
+from app.models.deliverable_template import DeliverableTemplate
+
+
+logger = logging.getLogger(__name__)
+
+PHASES = CATALOG_PHASES
+DEFAULT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+
+DISCIPLINE_ALIASES = {
+    "process": "process",
+    "c/s": "civil",
+    "civil": "civil",
+    "mech": "mechanical",
+    "mechanical": "mechanical",
+    "elec": "electrical",
+    "electrical": "electrical",
+    "i&c": "i&c",
+    "instrumentation": "i&c",
+    "piping": "piping",
+    "pm": "project",
+    "project": "project",
+    "procurement": "procurement",
+}
+
+MILESTONE_VALUES = {m.value for m in Milestone}
+
+# Base hours already maintained in code, matched by (phase, name)
+KNOWN_BASE_HOURS = {
+    (phase, d["name"].lower()): d.get("base_hours")
+    for phase, deliverables in PHASE_GATE_DELIVERABLES.items()
+    for d in deliverables
+}
+
+ProgressCallback = Callable[[float, Optional[str]], Awaitable[None]]
+
+
+class CatalogRowError(ValueError):
+    """Raised when a source row fails validation."""
+    pass
+
+
+@dataclass
+class SourceRow:
+    """A raw data row and where it came from."""
+
+    source: str
+    line: int
+    phase: Optional[str]
+    values: Dict[str, Any]
+
+
+@dataclass
+class CatalogImportResult:
+    """Outcome of an import."""
+
+    rows_read: int = 0
+    upserted: int = 0
+    skipped: int = 0
+    errors: List[str] = field(default_factory=list)
+    templates: List[str] = field(default_factory=list)
+
+    def add_error(self, message: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+
+def _clean(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    return text or None
+
+
+def _phase_name(value: Any) -> Optional[str]:
+    text = (_clean(value) or "").lower()
+    if text.endswith(" stage"):
+        text = text[:-len(" stage")]
+    return text if text in PHASES else None
+
+
+def _is_number(value: Any) -> bool:
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def iter_source_rows(rows: Iterable[Sequence[Any]], source: str, phase: Optional[str]) -> Iterator[SourceRow]:
+    """
+    Turn raw sheet rows into SourceRows.
+
+    The layout is a title row, an optional "<Phase> Stage" row, then a
+    header row starting with "Item No."; every "Status" column is collected
+    in order. Blank rows and footnotes (no item number or description) are
+    skipped.
+    """
+    columns: Optional[List[Optional[str]]] = None
+
+    for line, row in enumerate(rows, start=1):
+        cells = [_clean(v) for v in row]
+        if not any(cells):
+            continue
+
+        if columns is None:
+            first = (cells[0] or "").lower()
+            if first.startswith("item no"):
+                columns = [(c or "").lower() or None for c in cells]
+            elif _phase_name(cells[0]):
+                phase = _phase_name(cells[0])
+            continue
+
+        values: Dict[str, Any] = {"statuses": []}
+        for column, raw, cell in zip(columns, row, cells):
+            if column is None:
+                continue
+            if column.startswith("item no"):
+                values["item_no"] = raw
+            elif column == "deliverable description":
+                values["name"] = cell
+            elif column == "status":
+                if cell:
+                    values["statuses"].append(cell)
+            elif column in ("discipline", "notes"):
+                values[column] = cell
+        if not values.get("name") and not _is_number(values.get("item_no")):
+            continue  # Legend / footnote line
+        yield SourceRow(source=source, line=line, phase=phase, values=values)
+
+
+def read_workbook(path: Path) -> Iterator[SourceRow]:
+    """Stream rows from every sheet of a workbook (sheet title = phase)."""
+    from openpyxl import load_workbook  # Deferred: only needed for workbook imports
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            yield from iter_source_rows(sheet.iter_rows(values_only=True), path.name, _phase_name(sheet.title))
+    finally:
+        workbook.close()
+
+
+def read_csv(path: Path) -> Iterator[SourceRow]:
+    """Stream rows from a phase CSV (file name = phase unless a Stage row says otherwise)."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        yield from iter_source_rows(csv.reader(f), path.name, _phase_name(path.stem))
+
+
+def read_source(path: Path) -> Iterator[SourceRow]:
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        return read_workbook(path)
+    if path.suffix.lower() == ".csv":
+        return read_csv(path)
+    raise ValueError(f"Unsupported import file type: {path.name}")
+
+
+def count_rows(path: Path) -> int:
+    """Cheap row count for progress reporting."""
+    if path.suffix.lower() == ".csv":
+        with open(path, "rb") as f:
+            return sum(1 for _ in f)
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True)
+    try:
+        return sum(sheet.max_row or 0 for sheet in workbook.worksheets)
+    finally:
+        workbook.close()
+
+
+def validate_row(row: SourceRow) -> Dict[str, Any]:
+    """
+    Validate a source row and convert it to catalog column values.
+
+    Raises:
+        CatalogRowError: If the row is not a usable deliverable line
+    """
+    values = row.values
+    where = f"{row.source}:{row.line}"
+
+    if row.phase not in PHASES:
+        raise CatalogRowError(f"{where}: unknown phase {row.phase!r}")
+    try:
+        item_no = float(values.get("item_no"))
+    except (TypeError, ValueError):
+        raise CatalogRowError(f"{where}: missing or invalid item number {values.get('item_no')!r}")
+    name = values.get("name")
+    if not name:
+        raise CatalogRowError(f"{where}: missing deliverable description")
+    discipline = DISCIPLINE_ALIASES.get((values.get("discipline") or "").lower())
+    if discipline is None:
+        raise CatalogRowError(f"{where}: unknown discipline {values.get('discipline')!r}")
+
+    statuses = [s.capitalize() if s.lower() in ("final", "prelim") else s for s in values.get("statuses", [])]
+    final_state = statuses[-1].lower() if statuses else None
+
+    return {
+        "phase": row.phase,
+        "discipline": discipline,
+        "name": name[:255],
+        "item_no": item_no,
+        "statuses": statuses,
+        "milestone": final_state if final_state in MILESTONE_VALUES else None,
+        "notes": values.get("notes"),
+        "base_hours": KNOWN_BASE_HOURS.get((row.phase, name.lower())),
+        "source": row.source,
+    }
+
+
+def take(iterator: Iterator, n: int) -> list:
+    """Next n items of an iterator."""
+    return list(islice(iterator, n))
+
+
+async def upsert_catalog_rows(db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """Bulk-upsert validated rows (last row wins for duplicate keys)."""
+    unique = {(r["phase"], r["discipline"], r["name"]): r for r in rows}
+    if not unique:
+        return 0
+
+    now = datetime.utcnow()
+    stmt = pg_insert(CatalogDeliverable).values([
+        {"id": uuid.uuid4(), "created_at": now, "updated_at": now, **r} for r in unique.values()
+    ])
+    table = CatalogDeliverable.__table__
+    await db.execute(
+        stmt.on_conflict_do_update(
+            constraint="uq_deliverable_catalog_key",
+            set_={
+                "item_no": stmt.excluded.item_no,
+                "statuses": stmt.excluded.statuses,
+                "milestone": stmt.excluded.milestone,
+                "notes": stmt.excluded.notes,
+                "base_hours": func.coalesce(stmt.excluded.base_hours, table.c.base_hours),
+                "source": stmt.excluded.source,
+                "updated_at": now,
+            }
+        )
+    )
+    return len(unique)
+
+
+def template_name(phase: str) -> str:
+    return f"Master Deliverables List - {phase.title()}"
+
+
+async def sync_phase_template(db: AsyncSession, phase: str) -> None:
+    """
+    Rebuild the generic PHASE_GATE template of a phase from the catalog.
+
+    The deliverables_config array is aggregated in SQL, so it never passes
+    through the application.
+    """
+    catalog = CatalogDeliverable
+    config = (
+        select(func.coalesce(
+            func.jsonb_agg(aggregate_order_by(
+                func.jsonb_build_object(
+                    "name", catalog.name,
+                    "discipline", catalog.discipline,
+                    "phase", catalog.phase,
+                    "milestone", catalog.milestone,
+                    "issue_states", catalog.statuses,
+                    "description", catalog.notes,
+                    "base_hours", catalog.base_hours,
+                    "sequence", catalog.item_no,
+                ),
+                catalog.item_no
+            )),
+            func.jsonb_build_array()
+        ))
+        .where(catalog.phase == phase)
+        .scalar_subquery()
+    )
+
+    name = template_name(phase)
+    existing = await db.execute(
+        select(DeliverableTemplate.id).where(
+            DeliverableTemplate.name == name,
+            DeliverableTemplate.company_id.is_(None)
+        )
+    )
+    template_id = existing.scalars().first()
+    if template_id:
+        await db.execute(
+            update(DeliverableTemplate)
+            .where(DeliverableTemplate.id == template_id)
+            .values(deliverables_config=config, updated_at=datetime.utcnow())
+        )
+    else:
+        await db.execute(
+            pg_insert(DeliverableTemplate).values(
+                id=uuid.uuid4(),
+                name=name,
+                project_size="PHASE_GATE",
+                description=f"{phase.title()} stage deliverables from the Engineering Master Deliverables List",
+                deliverables_config=config,
+                risk_factors=[],
+                contingency_modifiers={},
+                # One per phase under the same project size; none of them is the PHASE_GATE default
+                is_default=False,
+                created_at=datetime.utcnow(),
+            )
+        )
+
+
+async def import_deliverable_catalog(
+    db: AsyncSession,
+    paths: Sequence[Path],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None
+) -> CatalogImportResult:
+    """
+    Import master deliverables list sources into the catalog.
+
+    Invalid rows are skipped and reported; the rest are committed together
+    with the rebuilt phase templates.
+
+    Args:
+        db: Database session
+        paths: .xlsx workbooks and/or phase .csv files
+        batch_size: Rows validated and upserted per batch
+        progress: Optional async callback(percent, message)
+
+    Returns:
+        CatalogImportResult
+    """
+    result = CatalogImportResult()
+    total = sum(count_rows(path) for path in paths) or 1
+    phases = set()
+
+    for path in paths:
+        rows = read_source(path)
+        while True:
+            # openpyxl parsing is CPU-bound; read each batch off the event loop
+            batch = await offloader.run(partial(take, rows, batch_size), size=batch_size, kind="thread")
+            if not batch:
+                break
+
+            valid = []
+            for row in batch:
+                try:
+                    valid.append(validate_row(row))
+                except CatalogRowError as e:
+                    result.add_error(str(e))
+            result.rows_read += len(batch)
+            result.upserted += await upsert_catalog_rows(db, valid)
+            phases.update(r["phase"] for r in valid)
+
+            if progress:
+                await progress(90 * min(result.rows_read / total, 1.0), f"{path.name}: {result.rows_read} rows")
+
+    for phase in sorted(phases, key=PHASES.index):
+        await sync_phase_template(db, phase)
+        result.templates.append(template_name(phase))
+    await db.commit()
+
+    if progress:
+        await progress(100, f"Imported {result.upserted} deliverables")
+    logger.info(
+        f"Deliverable catalog import: {result.rows_read} rows, {result.upserted} upserted, "
+        f"{result.skipped} skipped"
+    )
+    return result
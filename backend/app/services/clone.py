@@ -0,0 +1,262 @@
+"""
+Set-based deep clone.
+
+A clone copies whole row sets with one ``INSERT ... SELECT`` per table
+instead of loading, re-adding and flushing ORM objects one at a time, so
+its cost is a handful of statements whatever the number of rows.
+
+New primary keys are derived in SQL from the old ones and a per-clone
+salt (``md5(old_id || salt)::uuid``). Foreign keys between cloned rows
+(deliverable -> project, module -> parent, assignment -> resource and
+deliverable, deliverable dependencies) are remapped with the same
+expression, so no id map has to be fetched, held or sent back, and
+``remap_id`` gives the same ids in Python.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+from uuid import UUID, uuid4
+import hashlib
+import logging
+
+from sqlalchemy import JSON, String, and_, case, cast, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.financial import FinancialBreakdown
+from app.models.project import Project, ProjectStatus
+from app.models.raci import RACIMatrix
+from app.models.resource import Resource, ResourceAssignment
+from app.models.risk import RiskFactor, RiskScenario
+from app.models.scenario import EstimateScenario
+from app.services import evm
+
+
+logger = logging.getLogger(__name__)
+
+# Rows owned by a project through project_id, copied with it
+PROJECT_CHILD_MODELS = (
+    Deliverable, Resource, RiskScenario, RiskFactor, RACIMatrix, FinancialBreakdown, EstimateScenario
+)
+
+TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+# A clone is a fresh plan: progress and actuals are not copied. This also keeps
+# the copies out of the historical actuals statistics, which the bulk insert
+# does not update (a completed copy would later be subtracted without ever
+# having been added).
+RESET_DELIVERABLE_VALUES = {
+    "status": DeliverableStatus.NOT_STARTED,
+    "progress_percent": 0,
+    "actual_start": None,
+    "actual_end": None,
+    "actual_sheets": 0,
+    "actual_hours_create": None,
+    "actual_hours_review": None,
+    "actual_hours_qa": None,
+    "actual_hours_doc": None,
+    "actual_hours_revisions": None,
+    "actual_hours_pm": None,
+    "actual_hours_total": None,
+}
+
+
+@dataclass
+class CloneResult:
+    """Root id of a clone and the rows copied per table."""
+
+    id: UUID
+    rows: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+
+def new_salt() -> str:
+    return uuid4().hex
+
+
+def remap_id(old_id: UUID, salt: str) -> UUID:
+    """Id a cloned row gets (same as remapped() computes in SQL)."""
+    return UUID(hashlib.md5(f"{old_id}{salt}".encode()).hexdigest())
+
+
+def remapped(expression: ColumnElement, salt: str) -> ColumnElement:
+    """SQL: the cloned-row id for an id (or id text) expression."""
+    return cast(func.md5(cast(expression, String).concat(literal(salt))), PGUUID(as_uuid=True))
+
+
+def remapped_dependencies(column: ColumnElement, salt: str) -> ColumnElement:
+    """SQL: a dependency list ([{deliverable_id, ...}]) pointing at the cloned deliverables."""
+    elements = func.jsonb_array_elements(cast(column, JSONB)).table_valued("value").alias("dependency")
+    value = elements.c.value
+    remapped_value = case(
+        (
+            value.op("?")("deliverable_id"),
+            func.jsonb_set(
+                value,
+                literal("{deliverable_id}"),
+                func.to_jsonb(cast(remapped(value.op("->>")("deliverable_id"), salt), String))
+            )
+        ),
+        else_=value
+    )
+    aggregated = select(
+        func.coalesce(func.jsonb_agg(remapped_value), cast(literal("[]"), JSONB))
+    ).select_from(elements).scalar_subquery()
+    return case(
+        (func.json_typeof(column) == "array", cast(aggregated, JSON)),
+        else_=column
+    )
+
+
+async def copy_rows(
+    db: AsyncSession,
+    model: Any,
+    salt: str,
+    *,
+    where: ColumnElement,
+    remap: Sequence[str] = (),
+    values: Optional[Mapping[str, Any]] = None
+) -> int:
+    """
+    Copy a model's matching rows with one INSERT ... SELECT.
+
+    Args:
+        db: Database session
+        model: Model whose table is copied
+        salt: Per-clone salt for the new ids
+        where: Rows to copy
+        remap: Foreign key columns pointing at rows cloned in the same clone
+        values: Column overrides (SQL expressions or literals)
+
+    Returns:
+        Number of rows copied
+    """
+    table = model.__table__
+    values = dict(values or {})
+    now = func.timezone("utc", func.now())
+
+    columns, expressions = [], []
+    for column in table.columns:
+        if column.name in values:
+            expression = values[column.name]
+            if not isinstance(expression, ColumnElement):
+                expression = literal(expression, column.type)
+        elif column.name == "id" or column.name in remap:
+            expression = remapped(column, salt)
+        elif column.name in TIMESTAMP_COLUMNS:
+            expression = now
+        else:
+            expression = column
+        columns.append(column.name)
+        expressions.append(expression)
+
+    result = await db.execute(insert(table).from_select(columns, select(*expressions).where(where)))
+    return result.rowcount
+
+
+async def get_project_tree_ids(db: AsyncSession, root_id: UUID) -> List[UUID]:
+    """A project's id and the ids of its modules at any depth (one recursive query)."""
+    tree = select(Project.id).where(Project.id == root_id).cte("tree", recursive=True)
+    tree = tree.union_all(select(Project.id).where(Project.parent_project_id == tree.c.id))
+    result = await db.execute(select(tree.c.id))
+    return result.scalars().all()
+
+
+async def clone_project(
+    db: AsyncSession,
+    source_id: UUID,
+    *,
+    new_name: str,
+    new_code: Optional[str] = None,
+    created_by: Optional[UUID] = None,
+    include_modules: bool = True
+) -> Optional[CloneResult]:
+    """
+    Deep-clone a project.
+
+    Copies the project (and its modules), deliverables, resources and
+    their assignments, risk scenarios and factors, RACI entries,
+    financial breakdown and estimate scenarios. The clone starts as a
+    DRAFT with no approval, no estimate history and no progress or
+    actuals; modules keep their names and get no project code. Everything is written in the session's
+    transaction, which the caller commits, so a failed clone leaves
+    nothing behind.
+
+    Args:
+        db: Database session
+        source_id: Project to clone
+        new_name: Name of the cloned project
+        new_code: Project code of the cloned project
+        created_by: User creating the clone
+        include_modules: Also clone the project's modules
+
+    Returns:
+        Clone result, or None if the source project does not exist
+    """
+    if include_modules:
+        project_ids = await get_project_tree_ids(db, source_id)
+    else:
+        exists = await db.execute(select(Project.id).where(Project.id == source_id))
+        project_ids = exists.scalars().all()
+    if not project_ids:
+        return None
+
+    salt = new_salt()
+    root = Project.id == source_id
+    in_tree = Project.__table__.c.id.in_(project_ids)
+    result = CloneResult(id=remap_id(source_id, salt))
+
+    project_values = {
+        "name": case((root, literal(new_name)), else_=Project.name),
+        "project_code": case((root, literal(new_code)), else_=None),
+        # Modules hang off the cloned parent; the root keeps its own parent
+        "parent_project_id": case(
+            (root, Project.parent_project_id),
+            else_=remapped(Project.parent_project_id, salt)
+        ),
+        "status": ProjectStatus.DRAFT,
+        "approved_by": None,
+        "approved_at": None,
+    }
+    if created_by is not None:
+        project_values["created_by"] = created_by
+    result.rows[Project.__tablename__] = await copy_rows(db, Project, salt, where=in_tree, values=project_values)
+
+    for model in PROJECT_CHILD_MODELS:
+        overrides = {}
+        if model is Deliverable:
+            overrides.update(RESET_DELIVERABLE_VALUES)
+            overrides["dependencies"] = remapped_dependencies(Deliverable.dependencies, salt)
+        elif model is Resource:
+            overrides.update(actual_hours=0, remaining_hours=Resource.__table__.c.allocated_hours)
+        result.rows[model.__tablename__] = await copy_rows(
+            db, model, salt,
+            where=model.__table__.c.project_id.in_(project_ids),
+            remap=("project_id",),
+            values=overrides
+        )
+
+    result.rows[ResourceAssignment.__tablename__] = await copy_rows(
+        db, ResourceAssignment, salt,
+        where=and_(
+            ResourceAssignment.resource_id.in_(select(Resource.id).where(Resource.project_id.in_(project_ids))),
+            ResourceAssignment.deliverable_id.in_(
+                select(Deliverable.id).where(Deliverable.project_id.in_(project_ids))
+            )
+        ),
+        remap=("resource_id", "deliverable_id"),
+        values={"actual_hours": 0}
+    )
+
+    # Bulk inserts bypass the deliverable flush listeners
+    await evm.rebuild_counters(db, [remap_id(project_id, salt) for project_id in project_ids])
+
+    logger.info(
+        f"Cloned project {source_id} to {result.id}: {len(project_ids)} projects, {result.total_rows} rows"
+    )
+    return result
@@ -0,0 +1,230 @@
+"""
+Time-phased cash flow.
+
+Spreads every deliverable's hours over the weeks it is scheduled in (or
+over the project duration, shaped by the resource planner's weekly
+loading, when it is not scheduled), splits them by role and prices them
+into a week x role cost matrix. From that come the cumulative S-curve,
+monthly invoicing buckets and cost by role. The result is stored on the
+project's FinancialBreakdown with a signature of its inputs, so it is
+only regenerated when deliverables, the project or the rates change.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import logging
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.offload import offloader
+from app.crud.project import project_crud
+from app.data.deliverable_metadata import get_deliverable_metadata
+from app.data.role_rates import DEFAULT_RATES, ROLE_DISTRIBUTIONS, Role
+from app.models.deliverable import Deliverable
+from app.models.project import Project
+from app.services.export.versions import project_version
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cash_flow layout or spreading rules change
+CASH_FLOW_VERSION = 1
+
+DEFAULT_DURATION_WEEKS = 12
+
+# Weekly loading of unscheduled work, as in ResourcePlanner: ramp-up in the
+# first weeks and a review overhead every fourth week
+RAMP_UP_WEEKS = 3
+RAMP_UP_FACTOR = 1.3
+REVIEW_INTERVAL_WEEKS = 4
+REVIEW_FACTOR = 1.2
+
+ROLES = list(DEFAULT_RATES)
+TYPE_INDEX = {deliverable_type: i for i, deliverable_type in enumerate(ROLE_DISTRIBUTIONS)}
+
+# ROLE_SHARES[type, role]: share of a deliverable type's hours worked by each role
+ROLE_SHARES = np.array([
+    [distribution.get(role, 0.0) for role in ROLES] for distribution in ROLE_DISTRIBUTIONS.values()
+])
+
+
+def week_start(day: date) -> date:
+    """Monday of the week containing day."""
+    return day - timedelta(days=day.weekday())
+
+
+def loading_profile(weeks: int) -> np.ndarray:
+    """Share of unscheduled hours worked in each week (sums to 1)."""
+    week = np.arange(1, weeks + 1)
+    weights = np.where(week <= RAMP_UP_WEEKS, RAMP_UP_FACTOR, 1.0)
+    weights = weights * np.where(week % REVIEW_INTERVAL_WEEKS == 0, REVIEW_FACTOR, 1.0)
+    return weights / weights.sum()
+
+
+def _role_name(role: Any) -> str:
+    return getattr(role, "value", role)
+
+
+@dataclass
+class CashFlow:
+    """Week x role hours and cost of a project."""
+
+    start: date
+    hours: np.ndarray
+    cost: np.ndarray
+
+    @property
+    def weeks(self) -> List[date]:
+        return [self.start + timedelta(weeks=w) for w in range(self.hours.shape[0])]
+
+    def s_curve(self) -> List[Dict[str, Any]]:
+        weekly_hours = self.hours.sum(axis=1)
+        weekly_cost = self.cost.sum(axis=1)
+        cumulative = np.cumsum(weekly_cost)
+        total = cumulative[-1] if len(cumulative) else 0.0
+        return [
+            {
+                "week": w + 1,
+                "start": day.isoformat(),
+                "hours": round(float(weekly_hours[w]), 1),
+                "cost": round(float(weekly_cost[w]), 2),
+                "cumulative_cost": round(float(cumulative[w]), 2),
+                "cumulative_percent": round(float(cumulative[w] / total * 100), 1) if total else 0.0,
+            }
+            for w, day in enumerate(self.weeks)
+        ]
+
+    def invoices(self) -> List[Dict[str, Any]]:
+        """Cost billed per calendar month (each week billed in the month it starts)."""
+        months = [f"{day.year}-{day.month:02d}" for day in self.weeks]
+        labels = sorted(set(months))
+        index = np.array([labels.index(m) for m in months], dtype=np.int64)
+        amounts = np.bincount(index, weights=self.cost.sum(axis=1), minlength=len(labels))
+        cumulative = np.cumsum(amounts)
+        return [
+            {"month": label, "amount": round(float(amounts[i]), 2), "cumulative": round(float(cumulative[i]), 2)}
+            for i, label in enumerate(labels)
+        ]
+
+    def by_role(self) -> Dict[str, Dict[str, float]]:
+        return {
+            _role_name(role): {"hours": round(float(hours), 1), "cost": round(float(cost), 2)}
+            for role, hours, cost in zip(ROLES, self.hours.sum(axis=0), self.cost.sum(axis=0))
+            if hours > 0
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "start": self.start.isoformat(),
+            "total_hours": round(float(self.hours.sum()), 1),
+            "total_cost": round(float(self.cost.sum()), 2),
+            "weeks": self.s_curve(),
+            "invoices": self.invoices(),
+        }
+
+
+def build_cash_flow(
+    deliverables: Sequence[Mapping[str, Any]],
+    *,
+    start: Optional[date] = None,
+    duration_weeks: Optional[int] = None,
+    rates: Optional[Mapping[str, float]] = None
+) -> CashFlow:
+    """
+    Build the week x role hours and cost matrices.
+
+    Args:
+        deliverables: Items with name, hours and optional start_date/end_date
+        start: Project start if no deliverable is scheduled (default today)
+        duration_weeks: Planned duration over which unscheduled work is spread
+        rates: Hourly rates by role (defaults to DEFAULT_RATES)
+
+    Returns:
+        CashFlow
+    """
+    rates = rates or DEFAULT_RATES
+    duration_weeks = duration_weeks or DEFAULT_DURATION_WEEKS
+    n = len(deliverables)
+    starts = [d.get("start_date") for d in deliverables]
+    origin = week_start(min((s for s in starts if s), default=None) or start or date.today())
+
+    hours = np.fromiter((d.get("hours") or 0 for d in deliverables), dtype=float, count=n)
+    scheduled = np.array([s is not None for s in starts], dtype=bool)
+    begin = np.array([(s - origin).days // 7 if s else 0 for s in starts], dtype=np.int64)
+    end = np.array(
+        [((d.get("end_date") or s) - origin).days // 7 if s else 0 for d, s in zip(deliverables, starts)],
+        dtype=np.int64
+    )
+    end = np.maximum(end, begin)
+    weeks = max(int(end.max()) + 1 if n else 0, duration_weeks)
+
+    # spread[n, w]: share of deliverable n's hours worked in week w
+    week = np.arange(weeks)[None, :]
+    in_window = (week >= begin[:, None]) & (week <= end[:, None])
+    profile = np.zeros(weeks)
+    profile[:duration_weeks] = loading_profile(duration_weeks)
+    spread = np.where(scheduled[:, None], in_window / (end - begin + 1)[:, None], profile[None, :])
+
+    type_index = np.array([
+        TYPE_INDEX.get(get_deliverable_metadata(d.get("name") or "").get("type"), TYPE_INDEX["document"])
+        for d in deliverables
+    ], dtype=np.int64)
+    week_role_hours = (spread * hours[:, None]).T @ ROLE_SHARES[type_index]
+
+    fallback = rates.get(Role.ENGINEER, 100.0)
+    role_rates = np.array([rates.get(role, fallback) for role in ROLES])
+    return CashFlow(start=origin, hours=week_role_hours, cost=week_role_hours * role_rates[None, :])
+
+
+async def generate_cash_flow(db: AsyncSession, project: Project, *, force: bool = False) -> Dict[str, Any]:
+    """
+    Get a project's stored cash flow, regenerating it if its inputs changed.
+
+    A regenerated cash flow is flushed to the financial breakdown; the
+    caller commits.
+
+    Args:
+        db: Database session
+        project: Project
+        force: Regenerate even if the inputs are unchanged
+
+    Returns:
+        The cash_flow document (with "signature" and "regenerated")
+    """
+    signature = await project_version(db, project.id, ("cash_flow", CASH_FLOW_VERSION))
+    breakdown = await project_crud.get_financial_breakdown(db, project.id)
+    stored = breakdown.cash_flow if breakdown is not None else None
+    if not force and isinstance(stored, dict) and stored.get("signature") == signature:
+        return {**stored, "regenerated": False}
+
+    result = await db.execute(
+        select(Deliverable.name, Deliverable.hours_total, Deliverable.start_date, Deliverable.end_date)
+        .where(Deliverable.project_id == project.id)
+    )
+    deliverables = [
+        {"name": name, "hours": hours, "start_date": start, "end_date": end}
+        for name, hours, start, end in result.all()
+    ]
+    cash_flow = await offloader.run(
+        build_cash_flow, deliverables,
+        start=project.created_at.date() if project.created_at else None,
+        duration_weeks=project.duration_weeks,
+        size=len(deliverables), kind="thread"
+    )
+
+    document = {**cash_flow.to_dict(), "signature": signature}
+    breakdown = await project_crud.get_or_create_financial_breakdown(
+        db, project, labor_cost=document["total_cost"]
+    )
+    breakdown.cash_flow = document
+    breakdown.cost_by_role = cash_flow.by_role()
+    await db.flush()
+
+    logger.info(
+        f"Generated cash flow for project {project.id}: {len(document['weeks'])} weeks, "
+        f"${document['total_cost']:,.2f}"
+    )
+    return {**document, "regenerated": True}
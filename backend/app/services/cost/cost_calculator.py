@@ -182,4 +182,152 @@ class CostCalculator:
             new_rate: New hourly rate
         """
         self.rates[role] = new_rate
-        logger.info(f"Updated rate for {role}: ${new_rate}/hr")
\ No newline at end of file
+        logger.info(f"Updated rate for {role}: ${new_rate}/hr")
+
+
+class IncrementalCostModel:
+    """
+    Project cost kept up to date deliverable by deliverable.
+
+    Holds each deliverable's CostBreakdown and running totals by role, so
+    adding, removing or changing one deliverable costs O(roles) instead of
+    a full calculate_project_cost pass. to_dict() has the same layout as
+    calculate_project_cost; verify() compares against a full recompute.
+    """
+
+    def __init__(self, calculator: Optional[CostCalculator] = None):
+        """
+        Initialize an empty model.
+
+        Args:
+            calculator: Calculator with the rates to apply (default rates if not provided)
+        """
+        self.calculator = calculator or CostCalculator()
+        self.breakdowns: Dict[Any, CostBreakdown] = {}
+        self.total_hours = 0
+        self.total_cost = 0.0
+        self.role_hours: Dict[str, int] = {}
+        self.role_costs: Dict[str, float] = {}
+        # Deliverables contributing to each role, so emptied roles can be dropped
+        self.role_counts: Dict[str, int] = {}
+
+    def _apply(self, breakdown: CostBreakdown, sign: int) -> None:
+        self.total_hours += sign * breakdown.total_hours
+        self.total_cost += sign * breakdown.total_cost
+        for role, hours in breakdown.role_hours.items():
+            self.role_hours[role] = self.role_hours.get(role, 0) + sign * hours
+            self.role_costs[role] = self.role_costs.get(role, 0.0) + sign * breakdown.role_costs.get(role, 0.0)
+            self.role_counts[role] = self.role_counts.get(role, 0) + sign
+            if not self.role_counts[role]:
+                del self.role_hours[role], self.role_costs[role], self.role_counts[role]
+
+    def add(self, key: Any, name: str, hours: int) -> CostBreakdown:
+        """Add a deliverable (replacing any deliverable with the same key)."""
+        if key in self.breakdowns:
+            self.remove(key)
+        breakdown = self.calculator.calculate_deliverable_cost(name, hours)
+        self.breakdowns[key] = breakdown
+        self._apply(breakdown, 1)
+        return breakdown
+
+    def remove(self, key: Any) -> None:
+        """Remove a deliverable."""
+        self._apply(self.breakdowns.pop(key), -1)
+
+    def update(self, key: Any, name: str, hours: int) -> CostBreakdown:
+        """Change a deliverable's name or hours, keeping its position."""
+        old = self.breakdowns[key]
+        if old.deliverable_name == name and old.total_hours == hours:
+            return old
+        new = self.calculator.calculate_deliverable_cost(name, hours)
+        self._apply(old, -1)
+        self._apply(new, 1)
+        self.breakdowns[key] = new
+        return new
+
+    def sync(self, deliverables: List[Dict[str, Any]]) -> int:
+        """
+        Bring the model in line with a deliverables list keyed by position.
+
+        Only positions whose name or hours differ are recomputed.
+
+        Returns:
+            Number of deliverables recomputed
+        """
+        changed = 0
+        for i, deliverable in enumerate(deliverables):
+            name = deliverable.get("name", "Unknown")
+            hours = deliverable.get("adjusted_hours", deliverable.get("hours", 0)) or 0
+            current = self.breakdowns.get(i)
+            if current is None:
+                self.add(i, name, hours)
+                changed += 1
+            elif current.deliverable_name != name or current.total_hours != hours:
+                self.update(i, name, hours)
+                changed += 1
+        for i in range(len(deliverables), len(self.breakdowns)):
+            self.remove(i)
+            changed += 1
+        return changed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Project totals and per-deliverable breakdowns, as calculate_project_cost."""
+        total_hours = self.total_hours
+        total_cost = self.total_cost
+        return {
+            "summary": {
+                "total_hours": total_hours,
+                "total_cost": round(total_cost, 2),
+                "deliverable_count": len(self.breakdowns),
+                "average_cost_per_hour": round(total_cost / total_hours, 2) if total_hours > 0 else 0
+            },
+            "by_role": [
+                {
+                    "role": role,
+                    "hours": hours,
+                    "cost": round(self.role_costs[role], 2),
+                    "percentage": round((hours / total_hours * 100) if total_hours > 0 else 0, 1)
+                }
+                for role, hours in sorted(self.role_hours.items(), key=lambda x: x[1], reverse=True)
+            ],
+            "by_deliverable": [breakdown.to_dict() for breakdown in self.breakdowns.values()]
+        }
+
+    def verify(self, tolerance: float = 0.01) -> List[str]:
+        """
+        Compare the running totals with a full recompute.
+
+        Args:
+            tolerance: Largest acceptable cost difference
+
+        Returns:
+            Descriptions of mismatches (empty when consistent)
+        """
+        full = self.calculator.calculate_project_cost([
+            {"name": b.deliverable_name, "hours": b.total_hours} for b in self.breakdowns.values()
+        ])
+        incremental = self.to_dict()
+        mismatches = []
+
+        if full["summary"]["total_hours"] != incremental["summary"]["total_hours"]:
+            mismatches.append(
+                f"total_hours: {incremental['summary']['total_hours']} != {full['summary']['total_hours']}"
+            )
+        if abs(full["summary"]["total_cost"] - incremental["summary"]["total_cost"]) > tolerance:
+            mismatches.append(
+                f"total_cost: {incremental['summary']['total_cost']} != {full['summary']['total_cost']}"
+            )
+        full_roles = {r["role"]: r for r in full["by_role"]}
+        incremental_roles = {r["role"]: r for r in incremental["by_role"]}
+        for role in full_roles.keys() | incremental_roles.keys():
+            expected, actual = full_roles.get(role), incremental_roles.get(role)
+            if expected is None or actual is None:
+                mismatches.append(f"role {role}: present in only one result")
+            elif expected["hours"] != actual["hours"] or abs(expected["cost"] - actual["cost"]) > tolerance:
+                mismatches.append(
+                    f"role {role}: {actual['hours']}h ${actual['cost']} != {expected['hours']}h ${expected['cost']}"
+                )
+
+        if mismatches:
+            logger.warning(f"Incremental cost model drifted from full recompute: {mismatches}")
+        return mismatches
@@ -0,0 +1,250 @@
+"""
+Complexity-factor coefficient calibration.
+
+Fits the additive complexity model
+
+    actual_hours / (base_hours * client_multiplier) = 1 + sum(c_i * x_i)
+
+against completed projects by ridge regression. Rows are streamed in
+chunks and reduced into the normal equations (X'X, X'y), so memory stays
+O(factors^2) regardless of how many projects are scanned.
+``store_calibration`` saves a fit as a new coefficient set version; the
+calibrate endpoint, the calibration job and the CLI script all go through it.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import cache, COMPLEXITY_COEFFICIENTS_TAG
+from app.crud.complexity_coefficients import complexity_coefficient_set as coefficient_set_crud
+from app.models.complexity_coefficients import ComplexityCoefficientSet
+from app.models.deliverable import Deliverable
+from app.models.project import Project, ProjectStatus
+from app.schemas.complexity_coefficients import ComplexityCoefficientSetCreate
+from app.services.estimation.complexity import ComplexityCalculator
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+@dataclass
+class CalibrationResult:
+    """Fitted coefficients and fit quality."""
+
+    coefficients: Dict[str, float]
+    sample_count: int
+    ridge_alpha: float
+    r_squared: Optional[float] = None
+    rmse: Optional[float] = None
+    raw_coefficients: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def method(self) -> str:
+        return "ridge" if self.ridge_alpha > 0 else "least_squares"
+
+
+class NormalEquations:
+    """Streaming accumulator for a linear least-squares problem."""
+
+    def __init__(self, factors: Sequence[str]):
+        self.factors = list(factors)
+        k = len(self.factors)
+        self.xtx = np.zeros((k, k))
+        self.xty = np.zeros(k)
+        self.yty = 0.0
+        self.y_sum = 0.0
+        self.count = 0
+
+    def design_matrix(self, complexity_factors: Iterable[Optional[Mapping[str, bool]]]) -> np.ndarray:
+        """Indicator matrix (rows x factors) from complexity_factors dicts."""
+        rows = [
+            [1.0 if (cf or {}).get(name) else 0.0 for name in self.factors]
+            for cf in complexity_factors
+        ]
+        return np.asarray(rows, dtype=float).reshape(len(rows), len(self.factors))
+
+    def add_batch(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Fold a chunk of observations into the accumulators."""
+        if len(y) == 0:
+            return
+        self.xtx += x.T @ x
+        self.xty += x.T @ y
+        self.yty += float(y @ y)
+        self.y_sum += float(y.sum())
+        self.count += len(y)
+
+    def solve(
+        self,
+        ridge_alpha: float = 1.0,
+        prior: Optional[Mapping[str, float]] = None
+    ) -> CalibrationResult:
+        """
+        Solve for coefficients.
+
+        Ridge shrinks towards the prior (the current coefficients) rather
+        than towards zero, so factors that rarely occur in history keep
+        their existing values. Negative coefficients are clipped to zero
+        since a complexity factor never reduces effort.
+
+        Args:
+            ridge_alpha: Regularization strength (0 = ordinary least squares)
+            prior: Coefficients to shrink towards (default: zeros)
+
+        Returns:
+            CalibrationResult
+        """
+        from scipy import linalg  # Deferred: scipy is only needed when calibrating
+
+        k = len(self.factors)
+        c0 = np.array([(prior or {}).get(name, 0.0) for name in self.factors])
+
+        a = self.xtx + ridge_alpha * np.eye(k)
+        b = self.xty + ridge_alpha * c0
+        if ridge_alpha > 0:
+            raw = linalg.solve(a, b, assume_a="pos")
+        else:
+            raw = linalg.lstsq(a, b)[0]
+        fitted = np.clip(raw, 0.0, None)
+
+        sse = float(self.yty - 2 * fitted @ self.xty + fitted @ self.xtx @ fitted)
+        sst = self.yty - self.y_sum ** 2 / self.count if self.count else 0.0
+
+        return CalibrationResult(
+            coefficients={name: round(float(v), 4) for name, v in zip(self.factors, fitted)},
+            raw_coefficients={name: float(v) for name, v in zip(self.factors, raw)},
+            sample_count=self.count,
+            ridge_alpha=ridge_alpha,
+            r_squared=1 - sse / sst if sst > 0 else None,
+            rmse=float(np.sqrt(max(sse, 0.0) / self.count)) if self.count else None
+        )
+
+
+def calibration_targets(rows: Sequence[Tuple]) -> Tuple[List[Optional[dict]], np.ndarray]:
+    """
+    Convert project rows into regression targets.
+
+    Args:
+        rows: (complexity_factors, base_hours, complexity_multiplier,
+            adjusted_hours, actual_hours) tuples
+
+    Returns:
+        complexity_factors list and y = actual / (base * client) - 1
+    """
+    factors = []
+    targets = []
+    for complexity_factors, base_hours, complexity_multiplier, adjusted_hours, actual_hours in rows:
+        client_multiplier = 1.0
+        if adjusted_hours and complexity_multiplier:
+            client_multiplier = adjusted_hours / (base_hours * complexity_multiplier)
+        factors.append(complexity_factors)
+        targets.append(actual_hours / (base_hours * client_multiplier) - 1.0)
+    return factors, np.asarray(targets, dtype=float)
+
+
+def calibration_query():
+    """Completed projects with base hours and their total actual hours."""
+    actual_hours = func.sum(Deliverable.actual_hours_total)
+    return (
+        select(
+            Project.complexity_factors,
+            Project.base_hours,
+            Project.complexity_multiplier,
+            Project.adjusted_hours,
+            actual_hours
+        )
+        .join(Deliverable, Deliverable.project_id == Project.id)
+        .where(Project.status == ProjectStatus.COMPLETED, Project.base_hours > 0)
+        .group_by(Project.id)
+        .having(actual_hours > 0)
+    )
+
+
+async def calibrate_complexity_factors(
+    db: AsyncSession,
+    *,
+    ridge_alpha: float = 1.0,
+    prior: Optional[Mapping[str, float]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> CalibrationResult:
+    """
+    Fit complexity coefficients from completed projects.
+
+    Args:
+        db: Database session
+        ridge_alpha: Regularization strength (0 = ordinary least squares)
+        prior: Coefficients to shrink towards (default: built-in values)
+        chunk_size: Rows fetched and reduced per chunk
+
+    Returns:
+        CalibrationResult
+    """
+    prior = prior if prior is not None else ComplexityCalculator.COMPLEXITY_FACTORS
+    equations = NormalEquations(list(prior))
+
+    result = await db.stream(calibration_query().execution_options(yield_per=chunk_size))
+    async for chunk in result.partitions(chunk_size):
+        factors, y = calibration_targets(chunk)
+        equations.add_batch(equations.design_matrix(factors), y)
+        logger.debug(f"Calibration: {equations.count} projects reduced")
+
+    calibration = equations.solve(ridge_alpha=ridge_alpha, prior=prior)
+    logger.info(
+        f"Calibrated complexity factors on {calibration.sample_count} projects "
+        f"(alpha={ridge_alpha}, r2={calibration.r_squared})"
+    )
+    return calibration
+
+
+async def store_calibration(
+    db: AsyncSession,
+    result: CalibrationResult,
+    *,
+    notes: Optional[str] = None,
+    activate: bool = False
+) -> ComplexityCoefficientSet:
+    """
+    Store a calibration result as a new coefficient set version and commit.
+
+    Unlike most services this commits itself: when the set is activated,
+    workers reload coefficients once the cache is invalidated, which must
+    happen after the new active set is visible to them.
+
+    Args:
+        db: Database session
+        result: Fitted coefficients
+        notes: Free-text notes stored with the set
+        activate: Also make the new set the active one
+
+    Returns:
+        The new coefficient set
+    """
+    coefficient_set = await coefficient_set_crud.create(
+        db,
+        obj_in=ComplexityCoefficientSetCreate(
+            coefficients=result.coefficients,
+            method=result.method,
+            ridge_alpha=result.ridge_alpha,
+            sample_count=result.sample_count,
+            r_squared=result.r_squared,
+            rmse=result.rmse,
+            notes=notes
+        )
+    )
+    if activate:
+        await coefficient_set_crud.activate(db, db_obj=coefficient_set)
+    await db.commit()
+
+    if activate:
+        await cache.invalidate_tags(COMPLEXITY_COEFFICIENTS_TAG)
+    logger.info(
+        f"Stored complexity coefficient set version {coefficient_set.version}"
+        f"{' (active)' if activate else ''} from {result.sample_count} projects"
+    )
+    return coefficient_set
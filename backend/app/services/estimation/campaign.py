@@ -0,0 +1,229 @@
+"""
+Campaign (retainer) estimation.
+
+A campaign is modelled as a month x discipline x site array of hours:
+the recurring monthly hours of every active site plus the occurrences of
+scheduled deliverables, built with broadcasting rather than loops so a
+ten-year, several-hundred-site campaign is a few array operations. Costs
+apply discipline rates with annual escalation; the pricing model only
+changes how the cost is billed month to month.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import logging
+
+import numpy as np
+
+from app.data.role_rates import DEFAULT_RATES, Role
+
+
+logger = logging.getLogger(__name__)
+
+# Months between occurrences of a recurring deliverable (weekly and one-time handled separately)
+FREQUENCY_PERIOD_MONTHS = {
+    "monthly": 1,
+    "quarterly": 3,
+    "semi-annual": 6,
+    "annual": 12,
+}
+WEEKS_PER_MONTH = 52 / 12
+ONE_TIME = "one-time"
+WEEKLY = "weekly"
+FREQUENCIES = (ONE_TIME, WEEKLY, *FREQUENCY_PERIOD_MONTHS)
+
+PRICING_MODELS = ("MONTHLY_RETAINER", "HOURLY_BUCKET", "TIME_AND_MATERIALS", "HYBRID")
+DEFAULT_HOURLY_RATE = DEFAULT_RATES[Role.ENGINEER]
+DEFAULT_DISCIPLINE = "project"
+
+
+def normalize_frequency(value: Optional[str]) -> str:
+    """Map free-form frequency labels ("Quarterly", "semi_annual", None) to FREQUENCIES."""
+    text = (value or ONE_TIME).strip().lower().replace("_", "-").replace(" ", "-")
+    aliases = {"once": ONE_TIME, "onetime": ONE_TIME, "semiannual": "semi-annual", "yearly": "annual"}
+    text = aliases.get(text, text)
+    if text not in FREQUENCIES:
+        raise ValueError(f"Unknown deliverable frequency: {value}")
+    return text
+
+
+def occurrence_matrix(deliverables: Sequence[Mapping[str, Any]], months: int) -> np.ndarray:
+    """
+    Occurrences of each scheduled deliverable per month.
+
+    Args:
+        deliverables: Items with frequency and optional 1-based start month
+        months: Campaign duration
+
+    Returns:
+        Array of shape (deliverables, months)
+    """
+    frequencies = [normalize_frequency(d.get("frequency")) for d in deliverables]
+    start = np.array([max(int(d.get("month") or 1), 1) - 1 for d in deliverables])[:, None]
+    period = np.array([FREQUENCY_PERIOD_MONTHS.get(f, 1) for f in frequencies])[:, None]
+    weekly = np.array([f == WEEKLY for f in frequencies])[:, None]
+    one_time = np.array([f == ONE_TIME for f in frequencies])[:, None]
+
+    month = np.arange(months)[None, :]
+    started = month >= start
+    periodic = started & ((month - start) % period == 0)
+    return np.where(weekly, started * WEEKS_PER_MONTH, np.where(one_time, month == start, periodic)).astype(float)
+
+
+@dataclass
+class CampaignEstimate:
+    """Hours and cost arrays of a campaign, indexed [month, discipline, site]."""
+
+    disciplines: List[str]
+    hours: np.ndarray
+    cost: np.ndarray
+    pricing_model: str
+
+    def billing(self) -> np.ndarray:
+        """Amount billed per month under the pricing model."""
+        monthly_cost = self.cost.sum(axis=(1, 2))
+        if self.pricing_model in ("MONTHLY_RETAINER", "HOURLY_BUCKET"):
+            # Flat fee sized to cover the campaign
+            return np.full_like(monthly_cost, monthly_cost.mean())
+        if self.pricing_model == "HYBRID":
+            # Base retainer at the median month, overage billed as incurred
+            return np.maximum(monthly_cost, np.median(monthly_cost))
+        return monthly_cost
+
+    def to_dict(self) -> Dict[str, Any]:
+        monthly_hours = self.hours.sum(axis=(1, 2))
+        monthly_cost = self.cost.sum(axis=(1, 2))
+        billing = self.billing()
+        total_hours = float(monthly_hours.sum())
+        total_cost = float(monthly_cost.sum())
+        months = len(monthly_hours)
+
+        return {
+            "summary": {
+                "duration_months": months,
+                "site_count": self.hours.shape[2],
+                "total_hours": round(total_hours, 1),
+                "total_cost": round(total_cost, 2),
+                "average_monthly_hours": round(total_hours / months, 1) if months else 0,
+                "average_monthly_cost": round(total_cost / months, 2) if months else 0,
+                "peak_month": int(monthly_hours.argmax()) + 1 if months else None,
+                "peak_month_hours": round(float(monthly_hours.max()), 1) if months else 0,
+                "pricing_model": self.pricing_model,
+                "monthly_fee": round(float(billing.mean()), 2) if months else 0,
+            },
+            "by_month": [
+                {
+                    "month": m + 1,
+                    "hours": round(float(monthly_hours[m]), 1),
+                    "cost": round(float(monthly_cost[m]), 2),
+                    "billed": round(float(billing[m]), 2),
+                }
+                for m in range(months)
+            ],
+            "by_discipline": {
+                discipline: {
+                    "hours": round(float(hours), 1),
+                    "cost": round(float(cost), 2),
+                }
+                for discipline, hours, cost in zip(
+                    self.disciplines, self.hours.sum(axis=(0, 2)), self.cost.sum(axis=(0, 2))
+                )
+            },
+            "by_site": [
+                {
+                    "site": s + 1,
+                    "hours": round(float(hours), 1),
+                    "cost": round(float(cost), 2),
+                }
+                for s, (hours, cost) in enumerate(zip(self.hours.sum(axis=(0, 1)), self.cost.sum(axis=(0, 1))))
+            ],
+        }
+
+
+class CampaignEstimator:
+    """Vectorized campaign hours and cost projection."""
+
+    def estimate(
+        self,
+        *,
+        duration_months: int,
+        site_count: int,
+        monthly_hours: Mapping[str, float],
+        scheduled_deliverables: Sequence[Mapping[str, Any]] = (),
+        discipline_rates: Optional[Mapping[str, float]] = None,
+        hourly_rate: float = DEFAULT_HOURLY_RATE,
+        site_stagger_months: int = 0,
+        annual_escalation_percent: float = 0.0,
+        pricing_model: str = "MONTHLY_RETAINER"
+    ) -> CampaignEstimate:
+        """
+        Project a campaign's hours and cost.
+
+        Args:
+            duration_months: Campaign length
+            site_count: Number of sites
+            monthly_hours: Recurring hours per site per month, by discipline
+            scheduled_deliverables: Items with name, discipline, hours,
+                frequency, optional 1-based month and per_site (default True;
+                per-site months count from the site's onboarding,
+                campaign-level items are shared across the active sites)
+            discipline_rates: Hourly rate by discipline
+            hourly_rate: Rate for disciplines without one
+            site_stagger_months: Months between consecutive site onboardings
+            annual_escalation_percent: Rate increase applied each campaign year
+            pricing_model: One of PRICING_MODELS
+
+        Returns:
+            CampaignEstimate
+        """
+        if pricing_model not in PRICING_MODELS:
+            raise ValueError(f"Unknown pricing model: {pricing_model}")
+        discipline_rates = discipline_rates or {}
+        disciplines = sorted(
+            set(monthly_hours)
+            | {d.get("discipline") or DEFAULT_DISCIPLINE for d in scheduled_deliverables}
+        )
+        index = {discipline: i for i, discipline in enumerate(disciplines)}
+        months = np.arange(duration_months)
+
+        # active[m, s]: site s is onboarded in month m
+        site_start = np.arange(site_count) * site_stagger_months
+        active = (months[:, None] >= site_start[None, :]).astype(float)
+
+        recurring = np.array([monthly_hours.get(d, 0.0) for d in disciplines], dtype=float)
+        hours = active[:, None, :] * recurring[None, :, None]
+
+        if len(scheduled_deliverables):
+            occurrences = occurrence_matrix(scheduled_deliverables, duration_months)
+            item_hours = np.array([float(d.get("hours") or 0) for d in scheduled_deliverables])
+            one_hot = np.zeros((len(scheduled_deliverables), len(disciplines)))
+            one_hot[np.arange(len(scheduled_deliverables)),
+                    [index[d.get("discipline") or DEFAULT_DISCIPLINE] for d in scheduled_deliverables]] = 1
+            per_site = np.array([d.get("per_site", True) for d in scheduled_deliverables], dtype=bool)
+
+            # [month, discipline] hours of site-level items (in months since the
+            # site onboarded) and of campaign-level items (in campaign months)
+            site_level = (occurrences[per_site] * item_hours[per_site, None]).T @ one_hot[per_site]
+            shared = (occurrences[~per_site] * item_hours[~per_site, None]).T @ one_hot[~per_site]
+            active_count = active.sum(axis=1, keepdims=True)
+            share = np.divide(active, active_count, out=np.zeros_like(active), where=active_count > 0)
+
+            # Shift each site's schedule to its onboarding month: [month, site, discipline]
+            local_month = np.clip(months[:, None] - site_start[None, :], 0, None)
+            hours += site_level[local_month].transpose(0, 2, 1) * active[:, None, :]
+            hours += shared[:, :, None] * share[:, None, :]
+
+        rates = np.array([discipline_rates.get(d, hourly_rate) for d in disciplines], dtype=float)
+        escalation = (1 + annual_escalation_percent / 100) ** (months // 12)
+        cost = hours * rates[None, :, None] * escalation[:, None, None]
+
+        logger.debug(f"Campaign estimate: {hours.shape} array, {hours.sum():.0f}h")
+        return CampaignEstimate(disciplines=disciplines, hours=hours, cost=cost, pricing_model=pricing_model)
+
+
+def estimate_campaign(**kwargs: Any) -> Dict[str, Any]:
+    """Estimate a campaign and return the API summary (picklable entry point)."""
+    return campaign_estimator.estimate(**kwargs).to_dict()
+
+
+campaign_estimator = CampaignEstimator()
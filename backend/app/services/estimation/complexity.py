@@ -1,6 +1,6 @@
 """Complexity calculation service."""
 
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
 
@@ -13,6 +13,9 @@ class ComplexityCalculator:
 
     Complexity factors are additive:
     Total Multiplier = 1.0 + sum(selected_factors)
+
+    Coefficients default to COMPLEXITY_FACTORS; a calibrated set can be
+    passed in to override them (factors missing from it keep the default).
     """
 
     # Complexity factor values
@@ -25,6 +28,17 @@ class ComplexityCalculator:
         'incomplete_requirements': 0.35  # Requirements not fully defined
     }
 
+    def __init__(self, coefficients: Optional[Dict[str, float]] = None, version: Optional[int] = None):
+        """
+        Initialize calculator.
+
+        Args:
+            coefficients: Calibrated coefficients overriding the defaults
+            version: Coefficient set version (None = built-in defaults)
+        """
+        self.factors = {**self.COMPLEXITY_FACTORS, **(coefficients or {})}
+        self.version = version
+
     def calculate_multiplier(self, complexity_factors: Dict[str, bool]) -> float:
         """
         Calculate total complexity multiplier.
@@ -44,8 +58,8 @@ class ComplexityCalculator:
         multiplier = 1.0
 
         for factor_name, is_active in complexity_factors.items():
-            if is_active and factor_name in self.COMPLEXITY_FACTORS:
-                factor_value = self.COMPLEXITY_FACTORS[factor_name]
+            if is_active and factor_name in self.factors:
+                factor_value = self.factors[factor_name]
                 multiplier += factor_value
                 logger.debug(
                     f"Applied complexity factor '{factor_name}': +{factor_value} "
@@ -80,5 +94,5 @@ class ComplexityCalculator:
                 'description': self.get_factor_description(factor),
                 'impact_percent': int(value * 100)
             }
-            for factor, value in self.COMPLEXITY_FACTORS.items()
+            for factor, value in self.factors.items()
         }
\ No newline at end of file
@@ -1,13 +1,18 @@
 """Confidence scoring service."""
 
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
-from app.models.project import ProjectSize
+from app.domain.enums import ProjectSize
+from app.domain.stats import RunningStats
 
 
 logger = logging.getLogger(__name__)
 
+# Minimum completed deliverables before history counts as evidence
+MIN_HISTORICAL_SAMPLES = 5
+NO_HISTORY_PENALTY = 15
+
 
 class ConfidenceScorer:
     """
@@ -16,16 +21,24 @@ class ConfidenceScorer:
     Confidence is based on:
     - Complexity factors (more complexity = lower confidence)
     - Resource availability (low availability = lower confidence)
-    - Historical data availability (no data = lower confidence)
+    - Historical actuals (no data or poor past accuracy = lower confidence)
     - Project size (larger = lower confidence)
     """
 
+    # Score penalty by project size
+    SIZE_PENALTY = {
+        ProjectSize.SMALL: 0,
+        ProjectSize.MEDIUM: 5,
+        ProjectSize.LARGE: 10
+    }
+
     def calculate_confidence(
         self,
         complexity_factors: Dict[str, bool],
         resource_availability: Dict[str, float],
         project_size: ProjectSize,
-        has_historical_data: bool = False
+        has_historical_data: bool = False,
+        historical_stats: Optional[RunningStats] = None
     ) -> Dict[str, any]:
         """
         Calculate confidence score and level.
@@ -35,6 +48,8 @@ class ConfidenceScorer:
             resource_availability: Resource availability data
             project_size: Project size classification
             has_historical_data: Whether historical data exists
+                (ignored when historical_stats is given)
+            historical_stats: Actual / estimated hours ratio statistics
 
         Returns:
             Dictionary with confidence score and level
@@ -47,27 +62,23 @@ class ConfidenceScorer:
         confidence_score -= (active_factors * 8)  # -8% per factor
 
         # Reduce confidence for low resource availability
-        avg_availability = self._get_average_availability(resource_availability)
+        avg_availability = self.get_average_availability(resource_availability)
         if avg_availability < 80:
             confidence_score -= (80 - avg_availability) * 0.5
 
         # Reduce confidence for larger projects
-        size_penalty = {
-            ProjectSize.SMALL: 0,
-            ProjectSize.MEDIUM: 5,
-            ProjectSize.LARGE: 10
-        }
-        confidence_score -= size_penalty.get(project_size, 5)
+        confidence_score -= self.SIZE_PENALTY.get(project_size, 5)
 
-        # Reduce confidence if no historical data
-        if not has_historical_data:
-            confidence_score -= 15
+        # Reduce confidence if no historical data, or by past estimating error
+        if historical_stats is not None:
+            has_historical_data = historical_stats.count >= MIN_HISTORICAL_SAMPLES
+        confidence_score -= self.get_history_penalty(historical_stats, has_historical_data)
 
         # Ensure score is in valid range
         confidence_score = max(0, min(100, confidence_score))
 
         # Determine confidence level
-        confidence_level = self._get_confidence_level(confidence_score)
+        confidence_level = self.get_confidence_level(confidence_score)
 
         logger.info(
             f"Confidence calculation: score={confidence_score:.1f}%, "
@@ -83,11 +94,37 @@ class ConfidenceScorer:
                 "complexity_factors": active_factors,
                 "resource_availability": avg_availability,
                 "project_size": project_size,
-                "has_historical_data": has_historical_data
+                "has_historical_data": has_historical_data,
+                "historical_samples": historical_stats.count if historical_stats else 0
             }
         }
 
-    def _get_average_availability(self, resource_availability: Dict[str, float]) -> float:
+    def get_history_penalty(
+        self,
+        historical_stats: Optional[RunningStats] = None,
+        has_historical_data: bool = False
+    ) -> float:
+        """Penalty for missing history, or by past estimating error."""
+        if historical_stats is not None:
+            has_historical_data = historical_stats.count >= MIN_HISTORICAL_SAMPLES
+        if not has_historical_data:
+            return NO_HISTORY_PENALTY
+        if historical_stats is not None:
+            return self._get_historical_penalty(historical_stats)
+        return 0.0
+
+    def _get_historical_penalty(self, stats: RunningStats) -> float:
+        """
+        Penalty from past estimating error.
+
+        Combines bias (mean ratio away from 1.0) and spread (standard
+        deviation of the ratio); an error of 0.5 or more costs as much as
+        having no history at all.
+        """
+        error = abs(stats.mean - 1.0) + stats.std_dev
+        return min(NO_HISTORY_PENALTY, error * NO_HISTORY_PENALTY * 2)
+
+    def get_average_availability(self, resource_availability: Dict[str, float]) -> float:
         """Calculate average resource availability."""
         if not resource_availability:
             return 80.0
@@ -102,7 +139,7 @@ class ConfidenceScorer:
 
         return sum(availabilities) / len(availabilities)
 
-    def _get_confidence_level(self, score: float) -> str:
+    def get_confidence_level(self, score: float) -> str:
         """
         Determine confidence level from score.
 
@@ -4,7 +4,7 @@ from typing import Dict
 import math
 import logging
 
-from app.models.project import ProjectSize
+from app.domain.enums import ProjectSize
 
 
 logger = logging.getLogger(__name__)
@@ -43,10 +43,10 @@ class DurationOptimizer:
             int: Duration in weeks
         """
         # Get base duration for project size
-        base_duration_weeks = self._get_base_duration(project_size)
+        base_duration_weeks = self.get_base_duration(project_size)
 
         # Calculate average resource availability
-        avg_availability = self._calculate_average_availability(resource_availability)
+        avg_availability = self.calculate_average_availability(resource_availability)
 
         # Adjust for availability
         if avg_availability > 0:
@@ -73,7 +73,7 @@ class DurationOptimizer:
 
         return duration_weeks
 
-    def _get_base_duration(self, project_size: ProjectSize) -> int:
+    def get_base_duration(self, project_size: ProjectSize) -> int:
         """Get base duration in weeks for project size."""
         BASE_DURATION = {
             ProjectSize.SMALL: 8,
@@ -82,7 +82,7 @@ class DurationOptimizer:
         }
         return BASE_DURATION.get(project_size, 16)
 
-    def _calculate_average_availability(
+    def calculate_average_availability(
         self,
         resource_availability: Dict[str, float]
     ) -> float:
@@ -1,13 +1,14 @@
 """Main estimation engine."""
 
-from typing import Dict
+from typing import Dict, Optional
 import logging
 
-from app.models.project import ProjectSize, ClientProfile
+from app.domain.enums import ProjectSize, ClientProfile
 from app.services.estimation.complexity import ComplexityCalculator
 from app.services.estimation.hours_calculator import HoursCalculator
 from app.services.estimation.duration_optimizer import DurationOptimizer
 from app.services.estimation.confidence_scorer import ConfidenceScorer
+from app.domain.stats import RunningStats
 from app.core.exceptions import CalculationException
 
 
@@ -76,6 +77,25 @@ class EstimationEngine:
         self.duration_optimizer = DurationOptimizer()
         self.confidence_scorer = ConfidenceScorer()
 
+    @property
+    def coefficient_version(self) -> Optional[int]:
+        """Version of the complexity coefficient set in use (None = defaults)."""
+        return self.complexity_calculator.version
+
+    def use_coefficients(self, coefficients: Optional[Dict[str, float]], version: Optional[int] = None) -> None:
+        """
+        Hot-swap the complexity coefficients.
+
+        The calculator is replaced in a single assignment, so estimates
+        already running keep a consistent set.
+
+        Args:
+            coefficients: Calibrated coefficients (None = built-in defaults)
+            version: Coefficient set version
+        """
+        self.complexity_calculator = ComplexityCalculator(coefficients, version)
+        logger.info(f"Complexity coefficients switched to version {version or 'default'}")
+
     def calculate_estimate(
         self,
         project_size: ProjectSize,
@@ -85,7 +105,8 @@ class EstimationEngine:
         contingency_percent: float = 15.0,
         overhead_percent: float = 10.0,
         base_hours_override: int = None,
-        client_complexity: int = 5
+        client_complexity: int = 5,
+        historical_stats: Optional[RunningStats] = None
     ) -> EstimationResult:
         """
         Main estimation calculation.
@@ -103,6 +124,7 @@ class EstimationEngine:
             overhead_percent: Overhead/indirect costs percentage (default 10%)
             base_hours_override: Optional override for base hours from deliverables matrix
             client_complexity: Client complexity rating 1-10 (default 5, neutral)
+            historical_stats: Actual / estimated ratio statistics for the discipline
 
         Returns:
             EstimationResult: Complete estimation results
@@ -128,7 +150,7 @@ class EstimationEngine:
             logger.debug(f"Complexity multiplier: {complexity_multiplier}")
 
             # Step 3: Get client complexity multiplier (replaces old client profile multiplier)
-            client_complexity_multiplier = self._get_client_complexity_multiplier(client_complexity)
+            client_complexity_multiplier = self.get_client_complexity_multiplier(client_complexity)
             logger.debug(f"Client complexity multiplier (complexity={client_complexity}): {client_complexity_multiplier}")
 
             # Step 4: Calculate adjusted hours
@@ -162,7 +184,7 @@ class EstimationEngine:
                 complexity_factors=complexity_factors,
                 resource_availability=resource_availability,
                 project_size=project_size,
-                has_historical_data=False  # TODO: Check for historical data
+                historical_stats=historical_stats
             )
             logger.debug(f"Confidence: {confidence_result['level']} ({confidence_result['score']:.2f})")
 
@@ -209,7 +231,7 @@ class EstimationEngine:
 
         return CLIENT_MULTIPLIERS.get(client_profile, 1.00)
 
-    def _get_client_complexity_multiplier(self, client_complexity: int) -> float:
+    def get_client_complexity_multiplier(self, client_complexity: int) -> float:
         """
         Get client complexity multiplier based on 1-10 scale.
 
@@ -0,0 +1,183 @@
+"""
+Historical actuals statistics.
+
+Maintains running count / mean / variance of the actual-to-estimated hours
+ratio of completed deliverables per deliverable name, type and discipline. Statistics are updated in
+the same transaction as the deliverable write (via a flush listener), so
+the confidence scorer reads one pre-aggregated row instead of scanning
+completed projects.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from sqlalchemy import Float, and_, case, cast, func, literal, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, attributes
+
+from app.data.deliverable_metadata import get_deliverable_metadata
+from app.domain.stats import RunningStats
+from app.models.base import committed_value
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.deliverable_stats import ANY, DeliverableActualStats
+
+
+logger = logging.getLogger(__name__)
+
+StatsKey = Tuple[str, str, str]  # (deliverable name, deliverable type, discipline)
+
+# Attributes that change a deliverable's observation (completing or reopening
+# a deliverable adds or removes its sample)
+TRACKED_ATTRIBUTES = ("name", "discipline", "status", "hours_total", "actual_hours_total")
+
+
+def normalize_discipline(discipline: Any) -> str:
+    """Normalize a discipline (enum or free text) to a stats key component."""
+    value = getattr(discipline, "value", discipline)
+    return str(value).strip().upper() if value else ""
+
+
+def stats_keys(deliverable_name: str, discipline: Any) -> List[StatsKey]:
+    """Keys updated by one observation: exact, per type and per discipline."""
+    deliverable_type = get_deliverable_metadata(deliverable_name).get("type", "document")
+    discipline = normalize_discipline(discipline)
+    return [
+        (deliverable_name, deliverable_type, discipline),
+        (ANY, deliverable_type, discipline),
+        (ANY, ANY, discipline),
+    ]
+
+
+def observation_ratio(estimated_hours: Optional[int], actual_hours: Optional[int]) -> Optional[float]:
+    """Actual / estimated hours, or None if the deliverable has no usable actuals."""
+    if not estimated_hours or estimated_hours <= 0 or actual_hours is None or actual_hours <= 0:
+        return None
+    return actual_hours / estimated_hours
+
+
+def _observation(values: Dict[str, Any]) -> Optional[Tuple[List[StatsKey], float]]:
+    # Actuals of unfinished deliverables are partial and would pull the ratio down
+    if values["status"] != DeliverableStatus.COMPLETED:
+        return None
+    ratio = observation_ratio(values["hours_total"], values["actual_hours_total"])
+    if ratio is None or not values["name"]:
+        return None
+    return stats_keys(values["name"], values["discipline"]), ratio
+
+
+def collect_changes(session: Session) -> Dict[StatsKey, Tuple[RunningStats, RunningStats]]:
+    """
+    Collect statistics deltas for the deliverables in a pending flush.
+
+    Returns:
+        Mapping of stats key to (added sample, removed sample)
+    """
+    changes: Dict[StatsKey, Tuple[RunningStats, RunningStats]] = {}
+
+    def record(observation, removed: bool) -> None:
+        if observation is None:
+            return
+        keys, ratio = observation
+        for key in keys:
+            added_stats, removed_stats = changes.setdefault(key, (RunningStats(), RunningStats()))
+            (removed_stats if removed else added_stats).add(ratio)
+
+    for obj in session.new:
+        if isinstance(obj, Deliverable):
+            record(_observation({a: getattr(obj, a) for a in TRACKED_ATTRIBUTES}), removed=False)
+
+    for obj in session.deleted:
+        if isinstance(obj, Deliverable):
+            record(_observation({a: committed_value(obj, a) for a in TRACKED_ATTRIBUTES}), removed=True)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Deliverable):
+            continue
+        if not any(attributes.get_history(obj, a).has_changes() for a in TRACKED_ATTRIBUTES):
+            continue
+        record(_observation({a: committed_value(obj, a) for a in TRACKED_ATTRIBUTES}), removed=True)
+        record(_observation({a: getattr(obj, a) for a in TRACKED_ATTRIBUTES}), removed=False)
+
+    return changes
+
+
+def _merged_values(current, count, mean, m2) -> Dict[str, Any]:
+    """SQL SET clause merging (count, mean, m2) into the current row."""
+    new_count = current.sample_count + count
+    delta = mean - current.mean_ratio
+    return {
+        "sample_count": new_count,
+        "mean_ratio": case(
+            (new_count > 0, current.mean_ratio + delta * count / cast(new_count, Float)),
+            else_=0.0
+        ),
+        "m2": case(
+            (
+                new_count > 1,
+                func.greatest(
+                    current.m2 + m2 + delta * delta * current.sample_count * count / cast(new_count, Float),
+                    0.0
+                )
+            ),
+            else_=0.0
+        ),
+        "updated_at": datetime.utcnow(),
+    }
+
+
+def apply_changes(connection, changes: Dict[StatsKey, Tuple[RunningStats, RunningStats]]) -> None:
+    """Apply statistics deltas with atomic upserts / updates."""
+    table = DeliverableActualStats.__table__
+
+    for (name, deliverable_type, discipline), (added, removed) in changes.items():
+        key_clause = and_(
+            table.c.deliverable_name == name,
+            table.c.deliverable_type == deliverable_type,
+            table.c.discipline == discipline,
+        )
+
+        if removed.count:
+            connection.execute(
+                update(table)
+                .where(key_clause)
+                .values(**_merged_values(
+                    table.c,
+                    literal(-removed.count),
+                    literal(removed.mean, Float),
+                    literal(-removed.m2, Float)
+                ))
+            )
+
+        if added.count:
+            stmt = pg_insert(table).values(
+                deliverable_name=name,
+                deliverable_type=deliverable_type,
+                discipline=discipline,
+                sample_count=added.count,
+                mean_ratio=added.mean,
+                m2=added.m2,
+            )
+            connection.execute(
+                stmt.on_conflict_do_update(
+                    constraint="uq_deliverable_actual_stats_key",
+                    set_=_merged_values(
+                        table.c,
+                        stmt.excluded.sample_count,
+                        stmt.excluded.mean_ratio,
+                        stmt.excluded.m2
+                    )
+                )
+            )
+
+
+def _update_stats_after_flush(session: Session, flush_context) -> None:
+    """Keep deliverable statistics in step with deliverable writes."""
+    changes = collect_changes(session)
+    if changes:
+        logger.debug(f"Updating historical stats for {len(changes)} keys")
+        apply_changes(session.connection(), changes)
+
+
+# Registered by app.services.listeners.register_listeners()
+SESSION_LISTENERS = (("after_flush", _update_stats_after_flush),)
@@ -2,7 +2,7 @@
 
 from typing import Dict
 
-from app.models.project import ProjectSize
+from app.domain.enums import ProjectSize
 from app.core.exceptions import ValidationException
 import logging
 
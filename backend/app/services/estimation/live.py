@@ -0,0 +1,228 @@
+"""
+Live estimate recomputation.
+
+A LiveEstimateSession holds the inputs of one project editing session
+(estimate parameters, deliverable hours, custom rates) and their results.
+The client sends JSON Patch deltas against the inputs as the user types;
+deltas arriving within ``LIVE_ESTIMATE_DEBOUNCE_MS`` of each other are
+coalesced into one recompute (at most ``LIVE_ESTIMATE_MAX_DELAY_MS``
+after the first), only the result sections whose inputs changed are
+recomputed (costs through an IncrementalCostModel, so editing one
+deliverable only reprices that deliverable), and only the changed result
+fields are sent back, as a JSON Patch against the previous result.
+
+Input document::
+
+    {"estimate": {EstimationRequest fields} | null,
+     "deliverables": [{"name": ..., "hours": ...}],
+     "custom_rates": {role: rate} | null}
+
+Messages:
+
+    client -> {"seq": 12, "patch": [...]}
+    server -> {"type": "snapshot", "inputs": ..., "result": ...}
+              {"type": "patch", "seq": 12, "ops": [...], "elapsed_ms": 3.1}
+              {"type": "error", "seq": 12, "detail": "..."}
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+import asyncio
+import logging
+import time
+
+from pydantic import ValidationError
+
+from app.config import settings
+from app.core.exceptions import EstimationSystemException, ValidationException
+from app.schemas.estimation import EstimationRequest
+from app.services.cost.cost_calculator import CostCalculator, IncrementalCostModel
+from app.services.estimation.engine import EstimationEngine
+from app.domain.stats import RunningStats
+from app.services.json_patch import JSONPatchError, apply_patch, changed_paths, diff, parse_pointer
+
+
+logger = logging.getLogger(__name__)
+
+ESTIMATE = "estimate"
+COSTS = "costs"
+
+# Result sections that depend on each top-level input
+DEPENDENCIES = {
+    "estimate": {ESTIMATE},
+    "deliverables": {COSTS},
+    "custom_rates": {COSTS},
+}
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def affected_sections(paths: List[str]) -> Set[str]:
+    """Result sections to recompute after the given input paths changed."""
+    sections: Set[str] = set()
+    for path in paths:
+        tokens = parse_pointer(path)
+        if not tokens:
+            return {ESTIMATE, COSTS}
+        sections |= DEPENDENCIES.get(tokens[0], set())
+    return sections
+
+
+class LiveEstimateSession:
+    """Inputs and results of one live editing session."""
+
+    def __init__(
+        self,
+        inputs: Dict[str, Any],
+        *,
+        engine: EstimationEngine,
+        historical_stats: Optional[RunningStats] = None,
+        debounce: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        """
+        Initialize the session and compute the first result.
+
+        Args:
+            inputs: Initial input document
+            engine: Estimation engine (with the active coefficients)
+            historical_stats: Actual / estimated ratio statistics for the discipline
+            debounce: Quiet period in seconds before recomputing
+            max_delay: Longest a delta waits while others keep arriving
+        """
+        self.engine = engine
+        self.historical_stats = historical_stats
+        self.debounce = debounce if debounce is not None else settings.LIVE_ESTIMATE_DEBOUNCE_MS / 1000
+        self.max_delay = max_delay if max_delay is not None else settings.LIVE_ESTIMATE_MAX_DELAY_MS / 1000
+
+        self.inputs = {"estimate": None, "deliverables": [], "custom_rates": None, **inputs}
+        self.pending: List[dict] = []
+        self.seq: Optional[int] = None
+        self.recomputes = 0
+        self.cost_model: Optional[IncrementalCostModel] = None
+        self.cost_rates: Optional[Dict[str, float]] = None
+        self.result: Dict[str, Any] = {ESTIMATE: None, COSTS: None}
+        try:
+            self.result = self.compute(self.inputs, {ESTIMATE, COSTS})
+        except EstimationSystemException as e:
+            logger.warning(f"Live estimate inputs not computable yet: {e.message}")
+
+    def compute_estimate(self, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if not inputs.get("estimate"):
+            return None
+        try:
+            request = EstimationRequest(**inputs["estimate"])
+        except (TypeError, ValidationError) as e:
+            raise ValidationException(f"Invalid estimate inputs: {e}")
+        return self.engine.calculate_estimate(
+            project_size=request.project_size,
+            complexity_factors=request.complexity_factors,
+            client_profile=request.client_profile,
+            resource_availability=request.resource_availability,
+            contingency_percent=request.contingency_percent,
+            overhead_percent=request.overhead_percent,
+            base_hours_override=request.base_hours_override,
+            client_complexity=request.client_complexity,
+            historical_stats=self.historical_stats
+        ).to_dict()
+
+    def compute_costs(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        deliverables = inputs.get("deliverables") or []
+        if not isinstance(deliverables, list) or not all(isinstance(d, dict) for d in deliverables):
+            raise ValidationException("deliverables must be a list of objects")
+        if not all(isinstance(d.get("hours") or 0, (int, float)) for d in deliverables):
+            raise ValidationException("deliverable hours must be numbers")
+
+        rates = inputs.get("custom_rates") or None
+        if rates is not None and not isinstance(rates, dict):
+            raise ValidationException("custom_rates must be an object")
+        if self.cost_model is None or rates != self.cost_rates:
+            # New rates reprice every deliverable
+            self.cost_model = IncrementalCostModel(CostCalculator(rates))
+            self.cost_rates = rates
+        self.cost_model.sync(
+            [{"name": d.get("name", "Unknown"), "hours": d.get("hours") or 0} for d in deliverables]
+        )
+        return self.cost_model.to_dict()
+
+    def compute(self, inputs: Dict[str, Any], sections: Set[str]) -> Dict[str, Any]:
+        """Result with the given sections recomputed from inputs."""
+        result = dict(self.result)
+        if ESTIMATE in sections:
+            result[ESTIMATE] = self.compute_estimate(inputs)
+        if COSTS in sections:
+            result[COSTS] = self.compute_costs(inputs)
+        return result
+
+    def submit(self, message: Dict[str, Any]) -> None:
+        """Queue a client delta for the next recompute."""
+        patch = message.get("patch") if isinstance(message, dict) else None
+        if not isinstance(patch, list):
+            raise ValidationException("Message must carry a JSON Patch list")
+        self.pending.extend(patch)
+        if message.get("seq") is not None:
+            self.seq = message["seq"]
+
+    def step(self) -> Dict[str, Any]:
+        """
+        Apply the queued deltas as one patch and recompute what they affect.
+
+        Invalid deltas are discarded as a whole and reported; the session
+        keeps its last valid inputs.
+
+        Returns:
+            A "patch" message with the changed result fields, or an "error" message
+        """
+        started = time.perf_counter()
+        patch, self.pending = self.pending, []
+        try:
+            inputs = apply_patch(self.inputs, patch)
+            if not isinstance(inputs, dict):
+                raise ValidationException("Inputs must be an object")
+            result = self.compute(inputs, affected_sections(changed_paths(patch)))
+        except (JSONPatchError, EstimationSystemException) as e:
+            return {"type": "error", "seq": self.seq, "detail": e.message}
+        except (KeyError, TypeError, ValueError) as e:
+            return {"type": "error", "seq": self.seq, "detail": f"Invalid patch: {e!r}"}
+
+        operations = diff(self.result, result)
+        self.inputs, self.result = inputs, result
+        self.recomputes += 1
+        return {
+            "type": "patch",
+            "seq": self.seq,
+            "ops": operations,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"type": "snapshot", "inputs": self.inputs, "result": self.result}
+
+    async def run(self, receive: Receive, send: Send) -> None:
+        """
+        Serve the session until receive raises (client disconnect).
+
+        Blocks for a delta, then keeps collecting deltas until the
+        debounce period passes without one (or max_delay is reached) and
+        sends one recompute for all of them.
+        """
+        loop = asyncio.get_running_loop()
+        await send(self.snapshot())
+
+        while True:
+            message = await receive()
+            deadline = loop.time() + self.max_delay
+            while True:
+                try:
+                    self.submit(message)
+                except ValidationException as e:
+                    await send({"type": "error", "seq": self.seq, "detail": e.message})
+                timeout = min(self.debounce, deadline - loop.time())
+                if timeout <= 0:
+                    break
+                try:
+                    message = await asyncio.wait_for(receive(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if self.pending:
+                await send(self.step())
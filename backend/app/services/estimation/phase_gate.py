@@ -0,0 +1,267 @@
+"""
+Phase-gate estimation with per-phase accuracy bands.
+
+A phase-gate project's deliverables (``deliverables_config`` items tagged
+with a phase) are reduced into a phase x discipline matrix of hours and
+cost in one vectorized pass; each phase total is then widened by the
+accuracy band of its gate. Every phase carries a signature of its inputs,
+so re-estimating after an edit to one phase only recomputes that phase.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.project import project_crud
+from app.data.deliverable_metadata import get_deliverable_metadata
+from app.data.phase_gate_deliverables import PHASE_GATE_DELIVERABLES
+from app.data.role_rates import DEFAULT_RATES, ROLE_DISTRIBUTIONS, Role
+from app.models.project import Project, ProjectPhase
+
+
+logger = logging.getLogger(__name__)
+
+PHASES = tuple(phase.value.lower() for phase in ProjectPhase)
+
+# Estimate accuracy (low, high) per gate, as documented on ProjectPhase
+ACCURACY_BANDS: Dict[str, Tuple[float, float]] = {
+    "frame": (-0.50, 0.50),
+    "screen": (-0.30, 0.30),
+    "refine": (-0.10, 0.15),
+    "implement": (-0.05, 0.10),
+}
+
+HOUR_FIELDS = ("hours_create", "hours_review", "hours_qa", "hours_doc", "hours_revisions", "hours_pm")
+DEFAULT_DISCIPLINE = "project"
+
+
+def deliverable_hours(item: Mapping[str, Any]) -> float:
+    """Hours of a configured deliverable (explicit total, phase hours, then base hours)."""
+    for key in ("adjusted_hours", "hours"):
+        if item.get(key) is not None:
+            return float(item[key])
+    split = sum(item.get(key) or 0 for key in HOUR_FIELDS)
+    return float(split or item.get("base_hours") or 0)
+
+
+def blended_rates(rates: Mapping[str, float]) -> Dict[str, float]:
+    """Hourly rate of each deliverable type, weighted by its role distribution."""
+    fallback = rates.get(Role.ENGINEER, 100.0)
+    return {
+        deliverable_type: sum(share * rates.get(role, fallback) for role, share in distribution.items())
+        for deliverable_type, distribution in ROLE_DISTRIBUTIONS.items()
+    }
+
+
+def _signature(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+@dataclass
+class PhaseGateEstimate:
+    """Per-phase results in the ``cost_by_phase`` layout."""
+
+    phases: Dict[str, Dict[str, Any]]
+    recomputed: List[str] = field(default_factory=list)
+
+    @property
+    def totals(self) -> Dict[str, float]:
+        keys = ("hours", "low_hours", "high_hours", "cost", "low_cost", "high_cost")
+        return {key: round(sum(p[key] for p in self.phases.values()), 2) for key in keys}
+
+    def completion(self) -> Dict[str, float]:
+        """Hours-weighted completion % per phase (only phases with progress data)."""
+        return {
+            phase: result["completion_percent"]
+            for phase, result in self.phases.items()
+            if result.get("completion_percent") is not None
+        }
+
+
+class PhaseGateEstimator:
+    """Vectorized phase x discipline estimator."""
+
+    def __init__(self, rates: Optional[Mapping[str, float]] = None):
+        """
+        Initialize the estimator.
+
+        Args:
+            rates: Hourly rates by role (defaults to DEFAULT_RATES)
+        """
+        self.rates = dict(rates or DEFAULT_RATES)
+        self.type_rates = blended_rates(self.rates)
+        self.rates_signature = _signature({str(getattr(r, "value", r)): v for r, v in self.rates.items()})
+
+    def _rate(self, name: str) -> float:
+        deliverable_type = get_deliverable_metadata(name).get("type", "document")
+        return self.type_rates.get(deliverable_type, self.type_rates["document"])
+
+    def phase_signature(self, items: Sequence[Mapping[str, Any]], multiplier: float) -> str:
+        return _signature(
+            self.rates_signature,
+            multiplier,
+            [
+                (item.get("name"), item.get("discipline"), deliverable_hours(item), item.get("progress_percent"))
+                for item in items
+            ]
+        )
+
+    def compute(
+        self,
+        items: Sequence[Mapping[str, Any]],
+        phases: Sequence[str],
+        multiplier: float = 1.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Reduce deliverables of the given phases into per-phase results.
+
+        Args:
+            items: Deliverables, each with a phase in phases
+            phases: Phases to compute
+            multiplier: Hours multiplier (e.g. project complexity)
+
+        Returns:
+            Results keyed by phase
+        """
+        phase_index = {phase: i for i, phase in enumerate(phases)}
+        disciplines = sorted({item.get("discipline") or DEFAULT_DISCIPLINE for item in items})
+        discipline_index = {discipline: i for i, discipline in enumerate(disciplines)}
+        shape = (len(phases), len(disciplines))
+        n = len(items)
+
+        cell = np.fromiter(
+            (phase_index[item["phase"]] * len(disciplines)
+             + discipline_index[item.get("discipline") or DEFAULT_DISCIPLINE] for item in items),
+            dtype=np.int64, count=n
+        )
+        hours = np.fromiter((deliverable_hours(item) for item in items), dtype=float, count=n) * multiplier
+        rates = np.fromiter((self._rate(item.get("name", "")) for item in items), dtype=float, count=n)
+        progress = np.fromiter((item.get("progress_percent") or 0 for item in items), dtype=float, count=n)
+        has_progress = np.fromiter((item.get("progress_percent") is not None for item in items), dtype=bool, count=n)
+
+        def reduce(weights=None) -> np.ndarray:
+            return np.bincount(cell, weights=weights, minlength=shape[0] * shape[1]).reshape(shape)
+
+        hours_matrix = reduce(hours)
+        cost_matrix = reduce(hours * rates)
+        count_matrix = reduce()
+        earned = reduce(hours * progress).sum(axis=1)
+        tracked = reduce(has_progress.astype(float)).sum(axis=1)
+
+        bands = np.array([ACCURACY_BANDS[phase] for phase in phases]).reshape(-1, 2)
+        phase_hours = hours_matrix.sum(axis=1)
+        phase_cost = cost_matrix.sum(axis=1)
+        low_hours, high_hours = (phase_hours[:, None] * (1 + bands)).T
+        low_cost, high_cost = (phase_cost[:, None] * (1 + bands)).T
+        completion = np.divide(earned, phase_hours, out=np.zeros_like(earned), where=phase_hours > 0)
+
+        return {
+            phase: {
+                "hours": round(float(phase_hours[i]), 1),
+                "low_hours": round(float(low_hours[i]), 1),
+                "high_hours": round(float(high_hours[i]), 1),
+                "cost": round(float(phase_cost[i]), 2),
+                "low_cost": round(float(low_cost[i]), 2),
+                "high_cost": round(float(high_cost[i]), 2),
+                "accuracy": list(ACCURACY_BANDS[phase]),
+                "deliverable_count": int(count_matrix[i].sum()),
+                "completion_percent": round(float(completion[i]), 1) if tracked[i] else None,
+                "by_discipline": {
+                    discipline: {
+                        "hours": round(float(hours_matrix[i, j]), 1),
+                        "cost": round(float(cost_matrix[i, j]), 2),
+                    }
+                    for j, discipline in enumerate(disciplines)
+                    if count_matrix[i, j]
+                },
+            }
+            for phase, i in phase_index.items()
+        }
+
+    def estimate(
+        self,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        multiplier: float = 1.0,
+        previous: Optional[Mapping[str, Mapping[str, Any]]] = None
+    ) -> PhaseGateEstimate:
+        """
+        Estimate every phase, reusing unchanged phases from a previous run.
+
+        Args:
+            items: Deliverables tagged with a phase (others are ignored)
+            multiplier: Hours multiplier (e.g. project complexity)
+            previous: Earlier PhaseGateEstimate.phases (e.g. stored cost_by_phase)
+
+        Returns:
+            PhaseGateEstimate
+        """
+        by_phase: Dict[str, List[Mapping[str, Any]]] = {}
+        for item in items:
+            phase = str(item.get("phase") or "").lower()
+            if phase in ACCURACY_BANDS:
+                by_phase.setdefault(phase, []).append({**item, "phase": phase})
+
+        previous = previous or {}
+        phases: Dict[str, Dict[str, Any]] = {}
+        changed = []
+        for phase in PHASES:
+            if phase not in by_phase:
+                continue
+            signature = self.phase_signature(by_phase[phase], multiplier)
+            if previous.get(phase, {}).get("signature") == signature:
+                phases[phase] = dict(previous[phase])
+            else:
+                changed.append((phase, signature))
+
+        if changed:
+            computed = self.compute(
+                [item for phase, _ in changed for item in by_phase[phase]],
+                [phase for phase, _ in changed],
+                multiplier
+            )
+            for phase, signature in changed:
+                phases[phase] = {**computed[phase], "signature": signature}
+
+        logger.debug(f"Phase-gate estimate: recomputed {[p for p, _ in changed]} of {list(by_phase)}")
+        return PhaseGateEstimate(
+            phases={phase: phases[phase] for phase in PHASES if phase in phases},
+            recomputed=[phase for phase, _ in changed]
+        )
+
+
+def project_phase_deliverables(project: Project) -> List[Dict[str, Any]]:
+    """Phase-tagged deliverables of a project, or the standard catalog if it has none."""
+    items = [item for item in (project.deliverables_config or []) if isinstance(item, dict) and item.get("phase")]
+    if items:
+        return items
+    return [item for deliverables in PHASE_GATE_DELIVERABLES.values() for item in deliverables]
+
+
+async def save_phase_gate_estimate(db: AsyncSession, project: Project, estimate: PhaseGateEstimate) -> None:
+    """
+    Persist an estimate to FinancialBreakdown.cost_by_phase and phase_completion.
+
+    Completion is only overwritten for phases whose deliverables carry
+    progress; a breakdown is created from the phase totals if missing.
+    Changes are flushed; the caller commits.
+
+    Args:
+        db: Database session
+        project: Estimated project
+        estimate: Result of PhaseGateEstimator.estimate
+    """
+    project.phase_completion = {**(project.phase_completion or {}), **estimate.completion()}
+
+    breakdown = await project_crud.get_or_create_financial_breakdown(db, project, labor_cost=estimate.totals["cost"])
+    breakdown.cost_by_phase = estimate.phases
+    await db.flush()
+
+
+phase_gate_estimator = PhaseGateEstimator()
@@ -0,0 +1,188 @@
+"""
+Scenario evaluation.
+
+A scenario is a named set of overrides of a project's base estimate
+inputs. Evaluating a project's scenarios validates every variant once,
+computes what they share once (base hours and durations per size, the
+historical-accuracy penalty) and then runs the estimate formulas of
+EstimationEngine.calculate_estimate over all variants at once as arrays,
+returning one comparison row per scenario with its deltas from the
+baseline. Per-variant inputs come from the engine's own calculators
+(complexity multiplier, availability averages) so the rows match a
+one-off estimate to the hour.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import ValidationException
+from app.models.project import Project
+from app.schemas.estimation import EstimationRequest
+from app.services.estimation.engine import EstimationEngine
+from app.domain.stats import RunningStats
+from app.services.estimation.snapshots import get_latest_version, load_blobs
+
+
+logger = logging.getLogger(__name__)
+
+BASELINE = "baseline"
+
+# Overrides merged key by key into the base value instead of replacing it
+MERGED_FIELDS = ("complexity_factors", "resource_availability")
+
+
+def project_base_inputs(project: Project) -> Optional[Dict[str, Any]]:
+    """Estimate inputs stored on a project (None for projects without a size, e.g. campaigns)."""
+    if not project.size:
+        return None
+    return {
+        "project_size": project.size.value,
+        "complexity_factors": project.complexity_factors or {},
+        "client_profile": project.client_profile.value,
+        "resource_availability": project.resource_availability or {},
+        "contingency_percent": project.contingency_percent if project.contingency_percent is not None else 15.0,
+        "overhead_percent": project.overhead_percent if project.overhead_percent is not None else 10.0,
+    }
+
+
+async def get_base_inputs(db: AsyncSession, project: Project) -> Optional[Dict[str, Any]]:
+    """Inputs of the project's latest recorded estimate, else the inputs stored on the project."""
+    latest = await get_latest_version(db, project.id)
+    if latest is not None:
+        inputs = (await load_blobs(db, [latest.inputs_hash])).get(latest.inputs_hash)
+        if inputs:
+            return inputs
+    return project_base_inputs(project)
+
+
+def apply_overrides(base: Mapping[str, Any], overrides: Mapping[str, Any]) -> Dict[str, Any]:
+    """Base inputs with a scenario's overrides applied."""
+    inputs = dict(base)
+    for field, value in overrides.items():
+        if value is None:
+            continue
+        if field in MERGED_FIELDS:
+            inputs[field] = {**(base.get(field) or {}), **value}
+        else:
+            inputs[field] = value
+    return inputs
+
+
+class ScenarioEvaluator:
+    """Batch estimator for scenario comparisons."""
+
+    def __init__(self, engine: EstimationEngine):
+        """
+        Initialize the evaluator.
+
+        Args:
+            engine: Estimation engine whose coefficients and tables are used
+        """
+        self.engine = engine
+
+    def evaluate(
+        self,
+        base: Mapping[str, Any],
+        scenarios: Sequence[Tuple[str, Mapping[str, Any]]],
+        *,
+        historical_stats: Optional[RunningStats] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Estimate the baseline and every scenario in one batch.
+
+        Args:
+            base: Base estimate inputs (EstimationRequest fields)
+            scenarios: (name, overrides) pairs
+            historical_stats: Actual / estimated ratio statistics for the discipline
+
+        Returns:
+            Comparison rows, baseline first, with deltas from the baseline
+
+        Raises:
+            ValidationException: If the base or a scenario gives invalid inputs
+        """
+        names = [BASELINE] + [name for name, _ in scenarios]
+        overrides = [{}] + [dict(o) for _, o in scenarios]
+        requests = []
+        for name, override in zip(names, overrides):
+            try:
+                requests.append(EstimationRequest(**apply_overrides(base, override)))
+            except ValidationError as e:
+                raise ValidationException(f"Invalid inputs for scenario {name!r}: {e}")
+
+        engine = self.engine
+        hours_calculator, optimizer, scorer = engine.hours_calculator, engine.duration_optimizer, engine.confidence_scorer
+
+        # Shared by every scenario: lookups per distinct size and the history penalty
+        sizes = {r.project_size for r in requests}
+        size_base_hours = {size: hours_calculator.get_base_hours(size) for size in sizes}
+        size_base_weeks = {size: optimizer.get_base_duration(size) for size in sizes}
+        size_penalty = {size: scorer.SIZE_PENALTY.get(size, 5) for size in sizes}
+        history_penalty = scorer.get_history_penalty(historical_stats)
+
+        # Per-scenario inputs as arrays
+        # The engine sums factors in request order; a matrix product rounds
+        # differently and floor() can then land on another whole hour
+        complexity_multiplier = np.array(
+            [engine.complexity_calculator.calculate_multiplier(r.complexity_factors) for r in requests]
+        )
+        active_count = np.array([sum(1 for v in r.complexity_factors.values() if v) for r in requests])
+        base_hours = np.array(
+            [r.base_hours_override or size_base_hours[r.project_size] for r in requests], dtype=np.int64
+        )
+        client_multiplier = np.array(
+            [engine.get_client_complexity_multiplier(r.client_complexity) for r in requests]
+        )
+        contingency = np.array([r.contingency_percent for r in requests])
+        overhead = np.array([r.overhead_percent for r in requests])
+        base_weeks = np.array([size_base_weeks[r.project_size] for r in requests], dtype=float)
+        availability = np.array([optimizer.calculate_average_availability(r.resource_availability) for r in requests])
+        scored_availability = np.array([scorer.get_average_availability(r.resource_availability) for r in requests])
+        penalty = np.array([size_penalty[r.project_size] for r in requests], dtype=float)
+
+        # Hours
+        adjusted = np.floor(base_hours * complexity_multiplier * client_multiplier).astype(np.int64)
+        contingency_hours = np.floor(adjusted * (contingency / 100)).astype(np.int64)
+        overhead_hours = np.floor(adjusted * (overhead / 100)).astype(np.int64)
+        total = adjusted + contingency_hours + overhead_hours
+
+        # Duration
+        availability_factor = np.divide(
+            100.0, availability, out=np.full_like(availability, 2.0), where=availability > 0
+        )
+        weeks = np.ceil(base_weeks * availability_factor * (1.0 + (complexity_multiplier - 1.0) * 0.3)).astype(np.int64)
+
+        # Confidence
+        score = (
+            100.0 - active_count * 8
+            - np.where(scored_availability < 80, (80 - scored_availability) * 0.5, 0.0)
+            - penalty - history_penalty
+        )
+        score = np.clip(score, 0, 100)
+
+        rows = []
+        for i, (name, override) in enumerate(zip(names, overrides)):
+            rows.append({
+                "name": name,
+                "overrides": override,
+                "base_hours": int(base_hours[i]),
+                "complexity_multiplier": float(complexity_multiplier[i]),
+                "client_multiplier": float(client_multiplier[i]),
+                "adjusted_hours": int(adjusted[i]),
+                "contingency_hours": int(contingency_hours[i]),
+                "overhead_hours": int(overhead_hours[i]),
+                "total_hours": int(total[i]),
+                "duration_weeks": int(weeks[i]),
+                "confidence_level": scorer.get_confidence_level(score[i]),
+                "confidence_score": float(score[i]),
+                "delta_hours": int(total[i] - total[0]),
+                "delta_percent": round(float((total[i] - total[0]) / total[0] * 100), 1) if total[0] else 0.0,
+                "delta_weeks": int(weeks[i] - weeks[0]),
+            })
+
+        logger.info(f"Evaluated {len(scenarios)} scenarios against the baseline ({int(total[0])}h)")
+        return rows
@@ -0,0 +1,236 @@
+"""
+Versioned estimate snapshots.
+
+Every estimate run is recorded as an EstimateVersion whose inputs and
+outputs are content-addressed EstimateBlobs (SHA-256 of canonical JSON):
+identical documents are stored once however many versions or projects
+share them, and a re-run with unchanged inputs and outputs does not add
+a version at all. Each version also keeps the JSON Patch from its
+predecessor, and comparisons short-circuit on equal hashes, so a bid
+with hundreds of revisions stays cheap to store and to diff.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+import hashlib
+import json
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.estimate_version import EstimateBlob, EstimateVersion
+from app.models.project import Project
+from app.services.json_patch import diff
+
+
+logger = logging.getLogger(__name__)
+
+# Headline result fields copied onto EstimateVersion and compared numerically
+HEADLINE_FIELDS = ("total_hours", "duration_weeks")
+
+
+def canonical_json(document: Any) -> bytes:
+    """Byte-stable JSON encoding (sorted keys, no whitespace)."""
+    return json.dumps(document, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def content_hash(document: Any) -> str:
+    """Content address of a document."""
+    return hashlib.sha256(canonical_json(document)).hexdigest()
+
+
+async def store_blobs(db: AsyncSession, documents: Sequence[Any]) -> List[str]:
+    """
+    Store documents that are not stored yet.
+
+    Args:
+        db: Database session
+        documents: JSON documents
+
+    Returns:
+        Their hashes, in order
+    """
+    hashes = [content_hash(document) for document in documents]
+    rows = {
+        h: {"hash": h, "content": document, "size_bytes": len(canonical_json(document))}
+        for h, document in zip(hashes, documents)
+    }
+    await db.execute(
+        pg_insert(EstimateBlob).values(list(rows.values())).on_conflict_do_nothing(index_elements=["hash"])
+    )
+    return hashes
+
+
+async def load_blobs(db: AsyncSession, hashes: Sequence[str]) -> Dict[str, Any]:
+    """Blob contents by hash (one query)."""
+    if not hashes:
+        return {}
+    result = await db.execute(
+        select(EstimateBlob.hash, EstimateBlob.content).where(EstimateBlob.hash.in_(set(hashes)))
+    )
+    return dict(result.all())
+
+
+async def get_latest_version(db: AsyncSession, project_id: UUID) -> Optional[EstimateVersion]:
+    result = await db.execute(
+        select(EstimateVersion)
+        .where(EstimateVersion.project_id == project_id)
+        .order_by(EstimateVersion.version.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def record_estimate_version(
+    db: AsyncSession,
+    project_id: UUID,
+    inputs: Dict[str, Any],
+    outputs: Dict[str, Any],
+    *,
+    user_id: Optional[UUID] = None,
+    label: Optional[str] = None
+) -> Tuple[EstimateVersion, bool]:
+    """
+    Record an estimate run (the caller commits).
+
+    The project row is locked (SELECT ... FOR UPDATE) before the latest
+    version is read, so concurrent runs for a project take consecutive
+    version numbers instead of colliding on the unique constraint.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        inputs: Estimate inputs (JSON)
+        outputs: Estimate results (JSON)
+        user_id: User who ran the estimate
+        label: Optional version label
+
+    Returns:
+        (version, created); created is False when the run repeats the latest version
+    """
+    inputs_hash, outputs_hash = content_hash(inputs), content_hash(outputs)
+    await db.execute(select(Project.id).where(Project.id == project_id).with_for_update())
+    latest = await get_latest_version(db, project_id)
+    if latest and latest.inputs_hash == inputs_hash and latest.outputs_hash == outputs_hash:
+        return latest, False
+
+    await store_blobs(db, [inputs, outputs])
+
+    changes: List[dict] = []
+    if latest is not None:
+        previous = await load_blobs(db, [latest.inputs_hash, latest.outputs_hash])
+        changes = diff(
+            {"inputs": previous.get(latest.inputs_hash), "outputs": previous.get(latest.outputs_hash)},
+            {"inputs": inputs, "outputs": outputs}
+        )
+
+    version = EstimateVersion(
+        project_id=project_id,
+        version=(latest.version if latest else 0) + 1,
+        inputs_hash=inputs_hash,
+        outputs_hash=outputs_hash,
+        changes=changes,
+        label=label,
+        total_hours=outputs.get("total_hours"),
+        duration_weeks=outputs.get("duration_weeks"),
+        confidence_level=outputs.get("confidence_level"),
+        created_by=user_id,
+    )
+    db.add(version)
+    await db.flush()
+
+    logger.info(f"Recorded estimate version {version.version} for project {project_id} ({len(changes)} changes)")
+    return version, True
+
+
+async def get_versions(
+    db: AsyncSession,
+    project_id: UUID,
+    *,
+    skip: int = 0,
+    limit: int = 100
+) -> List[EstimateVersion]:
+    """Versions of a project, newest first (no blob contents)."""
+    result = await db.execute(
+        select(EstimateVersion)
+        .where(EstimateVersion.project_id == project_id)
+        .order_by(EstimateVersion.version.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def _get_versions_by_number(
+    db: AsyncSession,
+    project_id: UUID,
+    numbers: Sequence[int]
+) -> Dict[int, EstimateVersion]:
+    result = await db.execute(
+        select(EstimateVersion).where(
+            EstimateVersion.project_id == project_id,
+            EstimateVersion.version.in_(set(numbers))
+        )
+    )
+    return {v.version: v for v in result.scalars().all()}
+
+
+async def get_version(db: AsyncSession, project_id: UUID, number: int) -> Optional[Dict[str, Any]]:
+    """A version with its inputs and outputs, or None if it does not exist."""
+    version = (await _get_versions_by_number(db, project_id, [number])).get(number)
+    if version is None:
+        return None
+    blobs = await load_blobs(db, [version.inputs_hash, version.outputs_hash])
+    return {
+        "version": version,
+        "inputs": blobs.get(version.inputs_hash),
+        "outputs": blobs.get(version.outputs_hash),
+    }
+
+
+def compare(
+    a: EstimateVersion,
+    b: EstimateVersion,
+    blobs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Differences from version a to version b.
+
+    Blob contents are only needed (and only diffed) for the parts whose
+    hashes differ.
+    """
+    inputs_changed = a.inputs_hash != b.inputs_hash
+    outputs_changed = a.outputs_hash != b.outputs_hash
+    return {
+        "a": a.version,
+        "b": b.version,
+        "inputs_changed": inputs_changed,
+        "outputs_changed": outputs_changed,
+        "inputs_diff": diff(blobs[a.inputs_hash], blobs[b.inputs_hash]) if inputs_changed else [],
+        "outputs_diff": diff(blobs[a.outputs_hash], blobs[b.outputs_hash]) if outputs_changed else [],
+        "deltas": {
+            field: (getattr(b, field) or 0) - (getattr(a, field) or 0) for field in HEADLINE_FIELDS
+        },
+    }
+
+
+async def compare_versions(db: AsyncSession, project_id: UUID, a: int, b: int) -> Optional[Dict[str, Any]]:
+    """
+    Compare two versions of a project (two queries at most).
+
+    Returns:
+        Comparison, or None if either version does not exist
+    """
+    versions = await _get_versions_by_number(db, project_id, [a, b])
+    if a not in versions or b not in versions:
+        return None
+    first, second = versions[a], versions[b]
+
+    needed = []
+    if first.inputs_hash != second.inputs_hash:
+        needed += [first.inputs_hash, second.inputs_hash]
+    if first.outputs_hash != second.outputs_hash:
+        needed += [first.outputs_hash, second.outputs_hash]
+    return compare(first, second, await load_blobs(db, needed))
@@ -0,0 +1,311 @@
+"""
+Earned value management.
+
+Hours-based EVM per project and for the portfolio:
+
+    BAC  budget at completion   sum of estimated hours
+    PV   planned value          estimated hours x scheduled fraction elapsed
+    EV   earned value           estimated hours x progress
+    AC   actual cost            actual hours
+
+with CPI = EV / AC, SPI = EV / PV and EAC = BAC / CPI. BAC, EV and AC
+are kept in ProjectEVMCounters, updated in the same transaction as the
+deliverable write (via a flush listener, like the historical actuals
+statistics), so they are read in O(1). PV depends on today's date and is
+a single SQL aggregate over the scheduled deliverables.
+"""
+
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+import logging
+
+from sqlalchemy import Float, case, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.sql import Select
+
+from app.models.base import committed_value
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.evm import ProjectEVMCounters
+from app.models.project import Project
+from app.models.resource import Resource
+
+
+logger = logging.getLogger(__name__)
+
+# Attributes that change a deliverable's contribution
+TRACKED_ATTRIBUTES = ("project_id", "hours_total", "actual_hours_total", "progress_percent", "status")
+
+COUNTER_FIELDS = ("deliverable_count", "completed_count", "budget_hours", "earned_hours", "actual_hours")
+
+Counters = Tuple[int, int, float, float, float]
+
+
+def _status(value: Any) -> Any:
+    try:
+        return DeliverableStatus(getattr(value, "value", value))
+    except ValueError:
+        return value
+
+
+def contribution(values: Dict[str, Any]) -> Counters:
+    """A deliverable's share of its project's counters."""
+    completed = _status(values.get("status")) == DeliverableStatus.COMPLETED
+    hours = float(values.get("hours_total") or 0)
+    progress = 100 if completed else min(max(values.get("progress_percent") or 0, 0), 100)
+    return 1, int(completed), hours, hours * progress / 100, float(values.get("actual_hours_total") or 0)
+
+
+def collect_changes(session: Session) -> Dict[UUID, List[float]]:
+    """Counter deltas per project for the deliverables in a pending flush."""
+    changes: Dict[UUID, List[float]] = {}
+
+    def record(values: Dict[str, Any], sign: int) -> None:
+        project_id = values.get("project_id")
+        if project_id is None:
+            return
+        delta = changes.setdefault(project_id, [0] * len(COUNTER_FIELDS))
+        for i, value in enumerate(contribution(values)):
+            delta[i] += sign * value
+
+    for obj in session.new:
+        if isinstance(obj, Deliverable):
+            record({a: getattr(obj, a) for a in TRACKED_ATTRIBUTES}, 1)
+
+    for obj in session.deleted:
+        if isinstance(obj, Deliverable):
+            record({a: committed_value(obj, a) for a in TRACKED_ATTRIBUTES}, -1)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Deliverable):
+            continue
+        if not any(attributes.get_history(obj, a).has_changes() for a in TRACKED_ATTRIBUTES):
+            continue
+        record({a: committed_value(obj, a) for a in TRACKED_ATTRIBUTES}, -1)
+        record({a: getattr(obj, a) for a in TRACKED_ATTRIBUTES}, 1)
+
+    # A deleted project's counter row goes with it (ON DELETE CASCADE); an upsert
+    # for it would reference a project that no longer exists
+    deleted_projects = {obj.id for obj in session.deleted if isinstance(obj, Project)}
+    return {
+        project_id: delta for project_id, delta in changes.items()
+        if any(delta) and project_id not in deleted_projects
+    }
+
+
+def apply_changes(connection, changes: Dict[UUID, List[float]]) -> None:
+    """Add counter deltas with atomic upserts."""
+    table = ProjectEVMCounters.__table__
+    for project_id, delta in changes.items():
+        values = dict(zip(COUNTER_FIELDS, delta))
+        stmt = pg_insert(table).values(project_id=project_id, created_at=datetime.utcnow(), **values)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.c.project_id],
+                set_={
+                    **{field: table.c[field] + stmt.excluded[field] for field in COUNTER_FIELDS},
+                    "updated_at": datetime.utcnow(),
+                }
+            )
+        )
+
+
+def _update_counters_after_flush(session: Session, flush_context) -> None:
+    """Keep EVM counters in step with deliverable writes."""
+    changes = collect_changes(session)
+    if changes:
+        logger.debug(f"Updating EVM counters for {len(changes)} projects")
+        apply_changes(session.connection(), changes)
+
+
+# Registered by app.services.listeners.register_listeners()
+SESSION_LISTENERS = (("after_flush", _update_counters_after_flush),)
+
+
+def earned_hours_expr():
+    """SQL: estimated hours x progress (completed counts as 100%)."""
+    progress = case(
+        (Deliverable.status == DeliverableStatus.COMPLETED, 100),
+        else_=func.least(func.greatest(func.coalesce(Deliverable.progress_percent, 0), 0), 100)
+    )
+    return func.coalesce(Deliverable.hours_total, 0) * progress / 100.0
+
+
+def planned_hours_expr(today: date):
+    """SQL: estimated hours x fraction of the scheduled window elapsed by today."""
+    today = literal(today)
+    end = func.coalesce(Deliverable.end_date, Deliverable.start_date)
+    elapsed = cast(today - Deliverable.start_date + 1, Float) / cast(end - Deliverable.start_date + 1, Float)
+    fraction = case(
+        (Deliverable.start_date.is_(None), 0.0),
+        (Deliverable.start_date > today, 0.0),
+        (end <= today, 1.0),
+        else_=elapsed
+    )
+    return func.coalesce(Deliverable.hours_total, 0) * fraction
+
+
+def counters_query() -> Select:
+    """Counters recomputed from scratch per project (for rebuilds and checks)."""
+    return (
+        select(
+            Deliverable.project_id,
+            func.count(),
+            func.count().filter(Deliverable.status == DeliverableStatus.COMPLETED),
+            func.coalesce(func.sum(Deliverable.hours_total), 0),
+            func.coalesce(func.sum(earned_hours_expr()), 0),
+            func.coalesce(func.sum(Deliverable.actual_hours_total), 0),
+        )
+        .group_by(Deliverable.project_id)
+    )
+
+
+@dataclass
+class EVMMetrics:
+    """Earned value metrics (hours)."""
+
+    bac: float
+    pv: float
+    ev: float
+    ac: float
+    deliverable_count: int = 0
+    completed_count: int = 0
+    remaining_hours: Optional[float] = None
+
+    @property
+    def cpi(self) -> Optional[float]:
+        return self.ev / self.ac if self.ac else None
+
+    @property
+    def spi(self) -> Optional[float]:
+        return self.ev / self.pv if self.pv else None
+
+    @property
+    def eac(self) -> Optional[float]:
+        """Estimate at completion at the current cost performance."""
+        if self.cpi:
+            return self.bac / self.cpi
+        return self.bac if not self.ac else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        eac = self.eac
+        data = {field: round(value, 2) if isinstance(value, float) else value for field, value in asdict(self).items()}
+        return {
+            **data,
+            "percent_complete": round(self.ev / self.bac * 100, 1) if self.bac else 0.0,
+            "cv": round(self.ev - self.ac, 2),
+            "sv": round(self.ev - self.pv, 2),
+            "cpi": round(self.cpi, 3) if self.cpi is not None else None,
+            "spi": round(self.spi, 3) if self.spi is not None else None,
+            "eac": round(eac, 2) if eac is not None else None,
+            "etc": round(eac - self.ac, 2) if eac is not None else None,
+            "vac": round(self.bac - eac, 2) if eac is not None else None,
+            # Bottom-up EAC from the resources' own remaining-hours estimates
+            "eac_bottom_up": round(self.ac + self.remaining_hours, 2) if self.remaining_hours is not None else None,
+        }
+
+
+async def get_project_evm(db: AsyncSession, project_id: UUID, *, today: Optional[date] = None) -> EVMMetrics:
+    """
+    EVM of one project: its counter row plus the planned value aggregate.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        today: Status date (default today)
+
+    Returns:
+        EVMMetrics
+    """
+    counters = (await db.execute(
+        select(ProjectEVMCounters).where(ProjectEVMCounters.project_id == project_id)
+    )).scalar_one_or_none()
+    planned = await db.scalar(
+        select(func.coalesce(func.sum(planned_hours_expr(today or date.today())), 0))
+        .where(Deliverable.project_id == project_id, Deliverable.start_date.isnot(None))
+    )
+    remaining = await db.scalar(
+        select(func.sum(Resource.remaining_hours)).where(Resource.project_id == project_id)
+    )
+    return EVMMetrics(
+        bac=counters.budget_hours if counters else 0.0,
+        pv=float(planned or 0),
+        ev=counters.earned_hours if counters else 0.0,
+        ac=counters.actual_hours if counters else 0.0,
+        deliverable_count=counters.deliverable_count if counters else 0,
+        completed_count=counters.completed_count if counters else 0,
+        remaining_hours=float(remaining) if remaining is not None else None,
+    )
+
+
+async def get_portfolio_evm(
+    db: AsyncSession,
+    projects: Optional[Select] = None,
+    *,
+    today: Optional[date] = None
+) -> EVMMetrics:
+    """
+    EVM summed over a portfolio.
+
+    Args:
+        db: Database session
+        projects: Select of Project.id to include (default all projects)
+        today: Status date (default today)
+
+    Returns:
+        EVMMetrics
+    """
+    projects = projects if projects is not None else select(Project.id)
+    ids = projects.subquery()
+
+    totals = (await db.execute(
+        select(*(func.coalesce(func.sum(getattr(ProjectEVMCounters, field)), 0) for field in COUNTER_FIELDS))
+        .where(ProjectEVMCounters.project_id.in_(select(ids.c.id)))
+    )).one()
+    planned = await db.scalar(
+        select(func.coalesce(func.sum(planned_hours_expr(today or date.today())), 0))
+        .where(Deliverable.project_id.in_(select(ids.c.id)), Deliverable.start_date.isnot(None))
+    )
+    count, completed, budget, earned, actual = totals
+    return EVMMetrics(
+        bac=float(budget), pv=float(planned or 0), ev=float(earned), ac=float(actual),
+        deliverable_count=int(count), completed_count=int(completed)
+    )
+
+
+async def rebuild_counters(db: AsyncSession, project_ids: Optional[Sequence[UUID]] = None) -> int:
+    """
+    Recompute counters from the deliverables (after bulk SQL writes, which bypass the listener).
+
+    Args:
+        db: Database session
+        project_ids: Projects to rebuild (default all)
+
+    Returns:
+        Number of counter rows written
+    """
+    query = counters_query()
+    if project_ids is not None:
+        query = query.where(Deliverable.project_id.in_(project_ids))
+
+    table = ProjectEVMCounters.__table__
+    delete = table.delete()
+    if project_ids is not None:
+        delete = delete.where(table.c.project_id.in_(project_ids))
+    await db.execute(delete)
+
+    rows = (await db.execute(query)).all()
+    if rows:
+        now = datetime.utcnow()
+        await db.execute(
+            pg_insert(table),
+            [
+                {"project_id": row[0], "created_at": now, **dict(zip(COUNTER_FIELDS, row[1:]))}
+                for row in rows
+            ]
+        )
+    await db.flush()
+    return len(rows)
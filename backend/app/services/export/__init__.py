@@ -0,0 +1,16 @@
+"""Project export services."""
+
+from app.services.export.excel import XLSX_MEDIA_TYPE, export_portfolio, export_project
+from app.services.export.file_cache import ExportFileCache, export_cache
+from app.services.export.pdf import PDF_MEDIA_TYPE, export_estimate_report
+
+
+__all__ = [
+    "XLSX_MEDIA_TYPE",
+    "export_portfolio",
+    "export_project",
+    "PDF_MEDIA_TYPE",
+    "export_estimate_report",
+    "ExportFileCache",
+    "export_cache",
+]
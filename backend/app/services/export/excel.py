@@ -0,0 +1,366 @@
+"""
+Excel export of projects and portfolios.
+
+Workbooks are written with openpyxl's write-only mode: rows are streamed
+from the database in chunks and appended straight to the sheet files, so
+memory stays flat regardless of the number of deliverable lines. Cost and
+role sheets come from CostCalculator. Generated files are cached on disk
+by a version hash of the underlying rows.
+
+Generation is shared by concurrent requests and can outlive the request
+that started it, so it streams through its own session rather than the
+request's.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+import enum
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.offload import offloader
+from app.models.deliverable import Deliverable
+from app.models.project import Project
+from app.services.cost.cost_calculator import CostCalculator
+from app.services.export.file_cache import ExportFileCache, export_cache, version_hash
+from app.services.export.versions import portfolio_version, project_version
+
+
+logger = logging.getLogger(__name__)
+
+XLSX_SUFFIX = ".xlsx"
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Bump when the workbook layout changes so cached files are regenerated
+EXPORT_FORMAT_VERSION = 1
+
+PROJECT_FIELDS: Sequence[Tuple[str, str]] = (
+    ("Project Code", "project_code"),
+    ("Name", "name"),
+    ("Status", "status"),
+    ("Work Type", "work_type"),
+    ("Size", "size"),
+    ("Discipline", "discipline"),
+    ("Client", "client_name"),
+    ("Base Hours", "base_hours"),
+    ("Complexity Multiplier", "complexity_multiplier"),
+    ("Adjusted Hours", "adjusted_hours"),
+    ("Total Hours", "total_hours"),
+    ("Duration (weeks)", "duration_weeks"),
+    ("Contingency %", "contingency_percent"),
+    ("Overhead %", "overhead_percent"),
+    ("Total Cost", "total_cost"),
+    ("Confidence", "confidence_level"),
+)
+
+DELIVERABLE_COLUMNS: Sequence[Tuple[str, Any]] = (
+    ("#", Deliverable.sequence_number),
+    ("Deliverable", Deliverable.name),
+    ("Discipline", Deliverable.discipline),
+    ("Milestone", Deliverable.milestone),
+    ("Status", Deliverable.status),
+    ("Progress %", Deliverable.progress_percent),
+    ("Start", Deliverable.start_date),
+    ("End", Deliverable.end_date),
+    ("Base Hours", Deliverable.base_hours),
+    ("Create", Deliverable.hours_create),
+    ("Review", Deliverable.hours_review),
+    ("QA", Deliverable.hours_qa),
+    ("Documentation", Deliverable.hours_doc),
+    ("Revisions", Deliverable.hours_revisions),
+    ("PM", Deliverable.hours_pm),
+    ("Total Hours", Deliverable.hours_total),
+    ("Actual Hours", Deliverable.actual_hours_total),
+)
+TOTAL_HOURS_INDEX = 15
+
+
+def cell_value(value: Any) -> Any:
+    """Convert a database value into something openpyxl can write."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+class RoleTotals:
+    """Running hours and cost per role."""
+
+    def __init__(self):
+        self.hours: Dict[str, int] = {}
+        self.cost: Dict[str, float] = {}
+
+    def add(self, role_hours: Dict[Any, int], role_costs: Dict[Any, float]) -> None:
+        for role, hours in role_hours.items():
+            key = cell_value(role)
+            self.hours[key] = self.hours.get(key, 0) + hours
+            self.cost[key] = self.cost.get(key, 0.0) + role_costs.get(role, 0.0)
+
+    def rows(self) -> List[list]:
+        """(role, hours, cost, percentage) rows, largest first."""
+        total_hours = sum(self.hours.values())
+        return [
+            [
+                role,
+                hours,
+                round(self.cost[role], 2),
+                round((hours / total_hours * 100) if total_hours > 0 else 0, 1)
+            ]
+            for role, hours in sorted(self.hours.items(), key=lambda x: x[1], reverse=True)
+        ]
+
+
+class WorkbookWriter:
+    """Thin wrapper around a write-only workbook with bold header rows."""
+
+    def __init__(self):
+        # Deferred: openpyxl is only needed when an export is rendered
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        self.workbook = Workbook(write_only=True)
+        self.sheets: Dict[str, Any] = {}
+        self._bold = Font(bold=True)
+
+    def add_sheet(self, title: str, headers: Optional[Sequence[str]] = None):
+        sheet = self.workbook.create_sheet(title)
+        self.sheets[title] = sheet
+        if headers:
+            sheet.append([self._header(h, sheet) for h in headers])
+        return sheet
+
+    def _header(self, value: str, sheet):
+        from openpyxl.cell import WriteOnlyCell
+
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = self._bold
+        return cell
+
+    def append(self, title: str, row: Iterable[Any]) -> None:
+        self.sheets[title].append([cell_value(v) for v in row])
+
+    def save(self, path: Path) -> None:
+        self.workbook.save(path)
+
+
+class ProjectWorkbook(WorkbookWriter):
+    """Summary, deliverables, per-deliverable role costs and role totals."""
+
+    def __init__(self, calculator: Optional[CostCalculator] = None):
+        super().__init__()
+        self.calculator = calculator or CostCalculator()
+        self.role_totals = RoleTotals()
+        self.total_hours = 0
+        self.total_cost = 0.0
+        self.deliverable_count = 0
+
+        self.add_sheet("Summary", ["Field", "Value"])
+        self.add_sheet("Deliverables", [h for h, _ in DELIVERABLE_COLUMNS] + ["Cost"])
+        self.add_sheet("Cost Breakdown", ["#", "Deliverable", "Role", "Hours", "Cost"])
+        self.add_sheet("Roles", ["Role", "Hours", "Cost", "% of Hours"])
+
+    def write_project(self, project: Project) -> None:
+        for label, attr in PROJECT_FIELDS:
+            self.append("Summary", [label, getattr(project, attr)])
+
+    def add_deliverables(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Append a chunk of deliverable rows (DELIVERABLE_COLUMNS order)."""
+        for row in rows:
+            sequence, name, hours = row[0], row[1], row[TOTAL_HOURS_INDEX] or 0
+            breakdown = self.calculator.calculate_deliverable_cost(name, hours)
+            self.append("Deliverables", list(row) + [breakdown.total_cost])
+            for role, role_hours in breakdown.role_hours.items():
+                self.append("Cost Breakdown", [sequence, name, role, role_hours, breakdown.role_costs.get(role, 0.0)])
+            self.role_totals.add(breakdown.role_hours, breakdown.role_costs)
+            self.total_hours += hours
+            self.total_cost += breakdown.total_cost
+            self.deliverable_count += 1
+
+    def finish(self, path: Path) -> None:
+        for row in self.role_totals.rows():
+            self.append("Roles", row)
+        self.append("Summary", ["Deliverable Count", self.deliverable_count])
+        self.append("Summary", ["Deliverable Hours", self.total_hours])
+        self.append("Summary", ["Deliverable Cost (role rates)", round(self.total_cost, 2)])
+        self.save(path)
+
+
+PORTFOLIO_PROJECT_FIELDS = (
+    ("Project Code", Project.project_code),
+    ("Name", Project.name),
+    ("Status", Project.status),
+    ("Work Type", Project.work_type),
+    ("Discipline", Project.discipline),
+    ("Client", Project.client_name),
+    ("Total Hours", Project.total_hours),
+    ("Total Cost", Project.total_cost),
+    ("Created", Project.created_at),
+)
+
+
+class PortfolioWorkbook(WorkbookWriter):
+    """Project list, role costs per project and portfolio role totals."""
+
+    def __init__(self, calculator: Optional[CostCalculator] = None):
+        super().__init__()
+        self.calculator = calculator or CostCalculator()
+        self.role_totals = RoleTotals()
+        self._project_id: Optional[UUID] = None
+        self._project_label: Tuple[Any, Any] = (None, None)
+        self._project_totals = RoleTotals()
+
+        self.add_sheet(
+            "Projects",
+            [h for h, _ in PORTFOLIO_PROJECT_FIELDS] + ["Deliverables", "Deliverable Hours", "Actual Hours"]
+        )
+        self.add_sheet("Project Roles", ["Project Code", "Project", "Role", "Hours", "Cost"])
+        self.add_sheet("Roles", ["Role", "Hours", "Cost", "% of Hours"])
+
+    def add_projects(self, rows: Sequence[Sequence[Any]]) -> None:
+        for row in rows:
+            self.append("Projects", row)
+
+    def add_deliverables(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Add (project_id, project_code, project_name, deliverable, hours) rows ordered by project."""
+        for project_id, project_code, project_name, name, hours in rows:
+            if project_id != self._project_id:
+                self._flush_project()
+                self._project_id = project_id
+                self._project_label = (project_code, project_name)
+            breakdown = self.calculator.calculate_deliverable_cost(name, hours or 0)
+            self._project_totals.add(breakdown.role_hours, breakdown.role_costs)
+            self.role_totals.add(breakdown.role_hours, breakdown.role_costs)
+
+    def _flush_project(self) -> None:
+        if self._project_id is not None:
+            for role, hours, cost, _ in self._project_totals.rows():
+                self.append("Project Roles", [*self._project_label, role, hours, cost])
+        self._project_totals = RoleTotals()
+
+    def finish(self, path: Path) -> None:
+        self._flush_project()
+        for row in self.role_totals.rows():
+            self.append("Roles", row)
+        self.save(path)
+
+
+async def _stream_into(db: AsyncSession, query: Select, write, chunk_size: int) -> None:
+    """Stream query results and hand each chunk to write off the event loop."""
+    result = await db.stream(query.execution_options(yield_per=chunk_size))
+    async for chunk in result.partitions(chunk_size):
+        await offloader.run(write, chunk, size=len(chunk), kind="thread")
+
+
+async def export_project(
+    db: AsyncSession,
+    project: Project,
+    *,
+    cache: ExportFileCache = export_cache,
+    chunk_size: Optional[int] = None
+) -> Path:
+    """
+    Get the Excel export of a project, generating it if not cached.
+
+    Args:
+        db: Database session
+        project: Project to export
+        cache: File cache
+        chunk_size: Deliverable rows per chunk
+
+    Returns:
+        Path of the cached workbook
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    project_id = project.id
+    version = await project_version(db, project_id, EXPORT_FORMAT_VERSION)
+    cached = cache.get("project", str(project_id), version, XLSX_SUFFIX)
+    if cached:
+        return cached
+
+    workbook = ProjectWorkbook()
+    workbook.write_project(project)
+
+    async def generate(path: Path) -> None:
+        query = (
+            select(*(column for _, column in DELIVERABLE_COLUMNS))
+            .where(Deliverable.project_id == project_id)
+            .order_by(Deliverable.sequence_number)
+        )
+        async with AsyncSessionLocal() as session:
+            await _stream_into(session, query, workbook.add_deliverables, chunk_size)
+        await offloader.run(workbook.finish, path, size=workbook.deliverable_count, kind="thread")
+        logger.info(f"Exported project {project_id}: {workbook.deliverable_count} deliverables")
+
+    return await cache.get_or_create("project", str(project_id), version, XLSX_SUFFIX, generate)
+
+
+async def export_portfolio(
+    db: AsyncSession,
+    projects: Select,
+    *,
+    filters: Optional[Dict[str, Any]] = None,
+    cache: ExportFileCache = export_cache,
+    chunk_size: Optional[int] = None
+) -> Path:
+    """
+    Get the Excel export of a set of projects, generating it if not cached.
+
+    Args:
+        db: Database session
+        projects: Select of Project.id for the projects to include
+        filters: Filter values identifying this portfolio in the cache
+        cache: File cache
+        chunk_size: Rows per chunk
+
+    Returns:
+        Path of the cached workbook
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    key = version_hash(filters or {})
+    version = await portfolio_version(db, projects, EXPORT_FORMAT_VERSION)
+    ids = projects.subquery()
+
+    async def generate(path: Path) -> None:
+        deliverable_totals = (
+            select(
+                Deliverable.project_id,
+                func.count(Deliverable.id).label("count"),
+                func.sum(Deliverable.hours_total).label("hours"),
+                func.sum(Deliverable.actual_hours_total).label("actual_hours"),
+            )
+            .group_by(Deliverable.project_id)
+            .subquery()
+        )
+
+        workbook = PortfolioWorkbook()
+        project_rows = (
+            select(
+                *(column for _, column in PORTFOLIO_PROJECT_FIELDS),
+                func.coalesce(deliverable_totals.c.count, 0),
+                func.coalesce(deliverable_totals.c.hours, 0),
+                deliverable_totals.c.actual_hours,
+            )
+            .outerjoin(deliverable_totals, deliverable_totals.c.project_id == Project.id)
+            .where(Project.id.in_(select(ids.c.id)))
+            .order_by(Project.created_at, Project.id)
+        )
+        deliverable_rows = (
+            select(Project.id, Project.project_code, Project.name, Deliverable.name, Deliverable.hours_total)
+            .join(Project, Project.id == Deliverable.project_id)
+            .where(Deliverable.project_id.in_(select(ids.c.id)))
+            .order_by(Project.created_at, Project.id)
+        )
+        async with AsyncSessionLocal() as session:
+            await _stream_into(session, project_rows, workbook.add_projects, chunk_size)
+            await _stream_into(session, deliverable_rows, workbook.add_deliverables, chunk_size)
+        await offloader.run(workbook.finish, path, kind="thread")
+        logger.info(f"Exported portfolio {key}")
+
+    return await cache.get_or_create("portfolio", key, version, XLSX_SUFFIX, generate)
@@ -0,0 +1,123 @@
+"""On-disk cache for generated export files."""
+
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterator, Optional, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def version_hash(*parts) -> str:
+    """Stable short hash of JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+class ExportFileCache:
+    """
+    Generated files keyed by (kind, key, version).
+
+    Files are named ``{kind}-{key}-{version}{suffix}``; storing a new
+    version removes older versions of the same key, so the cache holds at
+    most one file per exported entity.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(
+            directory or settings.EXPORT_CACHE_DIR or os.path.join(tempfile.gettempdir(), "estimator-exports")
+        )
+        self._inflight: Dict[Tuple[str, str, str, str], asyncio.Task] = {}
+
+    def path(self, kind: str, key: str, version: str, suffix: str) -> Path:
+        return self.directory / f"{kind}-{key}-{version}{suffix}"
+
+    def get(self, kind: str, key: str, version: str, suffix: str) -> Optional[Path]:
+        """Cached file path, or None on a miss."""
+        path = self.path(kind, key, version, suffix)
+        return path if path.exists() else None
+
+    def temp_path(self, suffix: str) -> Path:
+        """Path for a file being generated (moved into place by store)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(suffix=suffix, prefix=".partial-", dir=self.directory)
+        os.close(fd)
+        return Path(name)
+
+    def store(self, temp_path: Path, kind: str, key: str, version: str, suffix: str) -> Path:
+        """Atomically move a generated file into the cache."""
+        path = self.path(kind, key, version, suffix)
+        os.replace(temp_path, path)
+        for stale in self.directory.glob(f"{kind}-{key}-*{suffix}"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        logger.debug(f"Cached export {path.name} ({path.stat().st_size} bytes)")
+        return path
+
+    async def get_or_create(
+        self,
+        kind: str,
+        key: str,
+        version: str,
+        suffix: str,
+        generate: Callable[[Path], Awaitable[None]]
+    ) -> Path:
+        """
+        Get a cached file, generating it on a miss.
+
+        Concurrent requests for the same version share one generation.
+
+        Args:
+            kind: File kind (e.g. "project")
+            key: Entity key
+            version: Content version
+            suffix: File suffix
+            generate: Coroutine function writing the file to the given path
+
+        Returns:
+            Path of the cached file
+        """
+        cached = self.get(kind, key, version, suffix)
+        if cached:
+            return cached
+
+        inflight_key = (kind, key, version, suffix)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.create_task(self._generate(kind, key, version, suffix, generate))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        return await asyncio.shield(task)
+
+    async def _generate(self, kind, key, version, suffix, generate) -> Path:
+        temp_path = self.temp_path(suffix)
+        try:
+            await generate(temp_path)
+            return self.store(temp_path, kind, key, version, suffix)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def iter_file(path: Path, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """Yield a file (or the inclusive byte range start-end) in chunks."""
+        remaining = (end if end is not None else path.stat().st_size - 1) - start + 1
+        with open(path, "rb") as f:
+            f.seek(start)
+            while remaining > 0:
+                chunk = f.read(min(STREAM_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+
+export_cache = ExportFileCache()
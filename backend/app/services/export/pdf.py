@@ -0,0 +1,277 @@
+"""
+PDF estimate report.
+
+The report data is gathered on the request's session (one query) and rendered
+with reportlab in the offload process pool. Rendered files are cached by a
+content version of the project, the rates and REPORT_TEMPLATE_VERSION.
+reportlab is imported by the renderer only, so it is never loaded by the
+API process itself.
+"""
+
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List
+from xml.sax.saxutils import escape
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.offload import offloader
+from app.models.deliverable import Deliverable
+from app.models.project import Project
+from app.services.cost.cost_calculator import CostCalculator
+from app.services.export.file_cache import ExportFileCache, export_cache
+from app.services.export.versions import project_version
+
+
+logger = logging.getLogger(__name__)
+
+PDF_SUFFIX = ".pdf"
+PDF_MEDIA_TYPE = "application/pdf"
+
+# Bump when the report layout changes so cached reports are regenerated
+REPORT_TEMPLATE_VERSION = 1
+
+SUMMARY_FIELDS = (
+    ("Project Code", "project_code"),
+    ("Client", "client_name"),
+    ("Status", "status"),
+    ("Work Type", "work_type"),
+    ("Size", "size"),
+    ("Discipline", "discipline"),
+    ("Base Hours", "base_hours"),
+    ("Complexity Multiplier", "complexity_multiplier"),
+    ("Total Hours", "total_hours"),
+    ("Duration (weeks)", "duration_weeks"),
+    ("Contingency %", "contingency_percent"),
+    ("Total Cost", "total_cost"),
+    ("Confidence", "confidence_level"),
+)
+
+
+@lru_cache(maxsize=1)
+def _table_style():
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ("FONT", (0, 0), (-1, -1), "Helvetica", 8),
+        ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 8),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e8edf3")),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#b0b8c4")),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ])
+
+
+def _text(value: Any) -> str:
+    value = getattr(value, "value", value)
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+def _money(value: float) -> str:
+    return f"${value:,.2f}"
+
+
+def _table(rows: List[list], col_widths=None, long: bool = False):
+    from reportlab.platypus import LongTable, Table
+
+    table_class = LongTable if long else Table
+    table = table_class(rows, colWidths=col_widths, repeatRows=1)
+    table.setStyle(_table_style())
+    return table
+
+
+async def build_report_data(db: AsyncSession, project: Project) -> Dict[str, Any]:
+    """
+    Collect the plain data the report is rendered from.
+
+    Args:
+        db: Database session
+        project: Project to report on
+
+    Returns:
+        Picklable dict of project fields and deliverable rows
+    """
+    result = await db.execute(
+        select(
+            Deliverable.sequence_number,
+            Deliverable.name,
+            Deliverable.discipline,
+            Deliverable.milestone,
+            Deliverable.hours_total,
+            Deliverable.start_date,
+            Deliverable.end_date,
+            Deliverable.duration_days,
+            Deliverable.is_critical_path,
+        )
+        .where(Deliverable.project_id == project.id)
+        .order_by(Deliverable.sequence_number)
+    )
+    return {
+        "name": project.name,
+        "fields": [(label, _text(getattr(project, attr))) for label, attr in SUMMARY_FIELDS],
+        "deliverables": [
+            {
+                "sequence": row[0],
+                "name": row[1],
+                "discipline": row[2],
+                "phase": _text(row[3]).upper(),
+                "hours": row[4] or 0,
+                "start": row[5],
+                "end": row[6],
+                "duration_days": row[7],
+                "critical": bool(row[8]),
+            }
+            for row in result.all()
+        ],
+    }
+
+
+def render_estimate_report(data: Dict[str, Any], path: str) -> int:
+    """
+    Render the estimate report to path (runs in a worker process).
+
+    Args:
+        data: Output of build_report_data
+        path: Destination file
+
+    Returns:
+        Number of pages
+    """
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
+
+    styles = getSampleStyleSheet()
+    calculator = CostCalculator()
+    deliverables = data["deliverables"]
+
+    role_hours: Dict[str, int] = {}
+    role_cost: Dict[str, float] = {}
+    for deliverable in deliverables:
+        breakdown = calculator.calculate_deliverable_cost(deliverable["name"], deliverable["hours"])
+        deliverable["cost"] = breakdown.total_cost
+        for role, hours in breakdown.role_hours.items():
+            key = getattr(role, "value", role)
+            role_hours[key] = role_hours.get(key, 0) + hours
+            role_cost[key] = role_cost.get(key, 0.0) + breakdown.role_costs.get(role, 0.0)
+    total_hours = sum(role_hours.values())
+    total_cost = sum(role_cost.values())
+
+    story = [
+        Paragraph(f"Estimate Report: {escape(data['name'])}", styles["Title"]),
+        Paragraph(f"Generated {date.today().isoformat()}", styles["Normal"]),
+        Spacer(1, 6 * mm),
+        Paragraph("Summary", styles["Heading2"]),
+        _table(
+            [["Field", "Value"]] + [list(f) for f in data["fields"]]
+            + [["Deliverables", _text(len(deliverables))], ["Deliverable Cost (role rates)", _money(total_cost)]],
+            col_widths=[60 * mm, 100 * mm]
+        ),
+        Spacer(1, 6 * mm),
+        Paragraph("Cost by Role", styles["Heading2"]),
+        _table(
+            [["Role", "Hours", "Cost", "% of Hours"]] + [
+                [role, _text(hours), _money(role_cost[role]), f"{hours / total_hours * 100:.1f}%" if total_hours else "-"]
+                for role, hours in sorted(role_hours.items(), key=lambda x: x[1], reverse=True)
+            ] + [["Total", _text(total_hours), _money(total_cost), ""]],
+            col_widths=[60 * mm, 30 * mm, 40 * mm, 30 * mm]
+        ),
+        PageBreak(),
+        Paragraph("Deliverables by Phase", styles["Heading2"]),
+    ]
+
+    phases: Dict[str, List[dict]] = OrderedDict()
+    for deliverable in deliverables:
+        phases.setdefault(deliverable["phase"], []).append(deliverable)
+    for phase, items in phases.items():
+        story.append(Paragraph(
+            f"{phase}: {len(items)} deliverables, {sum(d['hours'] for d in items):,} hours, "
+            f"{_money(sum(d['cost'] for d in items))}",
+            styles["Heading3"]
+        ))
+        story.append(_table(
+            [["#", "Deliverable", "Discipline", "Hours", "Cost"]] + [
+                [_text(d["sequence"]), d["name"], _text(d["discipline"]), _text(d["hours"]), _money(d["cost"])]
+                for d in items
+            ],
+            col_widths=[12 * mm, 95 * mm, 35 * mm, 20 * mm, 28 * mm],
+            long=True
+        ))
+
+    scheduled = sorted((d for d in deliverables if d["start"]), key=lambda d: (d["start"], d["sequence"]))
+    story += [PageBreak(), Paragraph("Schedule", styles["Heading2"])]
+    if scheduled:
+        start = min(d["start"] for d in scheduled)
+        end = max(d["end"] or d["start"] for d in scheduled)
+        story.append(Paragraph(
+            f"{start.isoformat()} to {end.isoformat()} ({(end - start).days + 1} days); "
+            f"{sum(d['critical'] for d in scheduled)} deliverables on the critical path",
+            styles["Normal"]
+        ))
+        story.append(Spacer(1, 3 * mm))
+        story.append(_table(
+            [["#", "Deliverable", "Start", "End", "Days", "Critical"]] + [
+                [_text(d["sequence"]), d["name"], d["start"].isoformat(),
+                 d["end"].isoformat() if d["end"] else "-", _text(d["duration_days"]), "Yes" if d["critical"] else ""]
+                for d in scheduled
+            ],
+            col_widths=[12 * mm, 100 * mm, 25 * mm, 25 * mm, 15 * mm, 18 * mm],
+            long=True
+        ))
+    unscheduled = len(deliverables) - len(scheduled)
+    if unscheduled:
+        story.append(Paragraph(f"{unscheduled} deliverables are not scheduled yet.", styles["Normal"]))
+
+    doc = SimpleDocTemplate(
+        str(path), pagesize=landscape(A4), title=f"Estimate Report: {data['name']}",
+        leftMargin=15 * mm, rightMargin=15 * mm, topMargin=15 * mm, bottomMargin=15 * mm
+    )
+    doc.build(story)
+    return doc.page
+
+
+async def export_estimate_report(
+    db: AsyncSession,
+    project: Project,
+    *,
+    cache: ExportFileCache = export_cache
+) -> Path:
+    """
+    Get the PDF estimate report of a project, rendering it if not cached.
+
+    Args:
+        db: Database session
+        project: Project to report on
+        cache: File cache
+
+    Returns:
+        Path of the cached report
+    """
+    version = await project_version(db, project.id, ("pdf", REPORT_TEMPLATE_VERSION))
+    cached = cache.get("report", str(project.id), version, PDF_SUFFIX)
+    if cached:
+        return cached
+
+    # Loaded here, not in generate: the shared render task can outlive this
+    # request, and with it the session
+    data = await build_report_data(db, project)
+
+    async def generate(path: Path) -> None:
+        # threshold=0: always render in the process pool, never on the loop
+        pages = await offloader.run(
+            render_estimate_report, data, str(path), size=len(data["deliverables"]), threshold=0
+        )
+        logger.info(f"Rendered estimate report for project {project.id}: {pages} pages")
+
+    return await cache.get_or_create("report", str(project.id), version, PDF_SUFFIX, generate)
@@ -0,0 +1,62 @@
+"""Content versions for cached exports and reports."""
+
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.data.role_rates import DEFAULT_RATES
+from app.models.deliverable import Deliverable
+from app.models.project import Project
+from app.services.export.file_cache import version_hash
+
+
+def rates_version() -> str:
+    """Hash of the rates used for cost figures."""
+    return version_hash({str(getattr(role, "value", role)): rate for role, rate in DEFAULT_RATES.items()})
+
+
+async def project_version(db: AsyncSession, project_id: UUID, template_version: Any) -> Optional[str]:
+    """
+    Version hash of a project's exportable content.
+
+    Computed from the project and deliverable update timestamps, counts
+    and hours in one aggregate query, plus the rates and the version of
+    the output template; None if the project does not exist.
+    """
+    result = await db.execute(
+        select(
+            Project.updated_at,
+            func.count(Deliverable.id),
+            func.max(Deliverable.updated_at),
+            func.coalesce(func.sum(Deliverable.hours_total), 0),
+        )
+        .select_from(Project)
+        .outerjoin(Deliverable, Deliverable.project_id == Project.id)
+        .where(Project.id == project_id)
+        .group_by(Project.id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return version_hash(template_version, rates_version(), *row)
+
+
+async def portfolio_version(db: AsyncSession, projects: Select, template_version: Any) -> str:
+    """Version hash of a filtered portfolio (projects is a select of Project.id)."""
+    ids = projects.subquery()
+    project_stats = await db.execute(
+        select(func.count(), func.max(Project.updated_at)).where(Project.id.in_(select(ids.c.id)))
+    )
+    deliverable_stats = await db.execute(
+        select(
+            func.count(Deliverable.id),
+            func.max(Deliverable.updated_at),
+            func.coalesce(func.sum(Deliverable.hours_total), 0),
+        ).where(Deliverable.project_id.in_(select(ids.c.id)))
+    )
+    return version_hash(
+        template_version, rates_version(), *project_stats.one(), *deliverable_stats.one()
+    )
@@ -0,0 +1,315 @@
+"""
+RFC 6902 JSON Patch support.
+
+Patches can be applied in Python (apply_patch) or compiled into SQL over a
+JSONB column (compile_jsonb_patch) so a partial update never round-trips
+the whole document through the application.
+"""
+
+from copy import deepcopy
+from typing import Any, List, Sequence
+
+from sqlalchemy import Integer, Text, and_, case, func, literal, select, true
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.sql import Select, Subquery
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.exceptions import ValidationException
+
+
+class JSONPatchError(ValidationException):
+    """Raised when a patch cannot be applied to the target document."""
+    pass
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """
+    Split an RFC 6901 JSON Pointer into unescaped reference tokens.
+
+    Args:
+        pointer: JSON Pointer ("" is the whole document)
+
+    Returns:
+        List of reference tokens
+    """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JSONPatchError(f"Invalid JSON pointer: {pointer!r}")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def _array_index(token: str, length: int, allow_end: bool) -> int:
+    """Resolve an array reference token to an index."""
+    if token == "-" and allow_end:
+        return length
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise JSONPatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > length or (index == length and not allow_end):
+        raise JSONPatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _resolve(document: Any, tokens: Sequence[str]) -> Any:
+    """Return the value referenced by tokens."""
+    current = document
+    for token in tokens:
+        if isinstance(current, dict):
+            if token not in current:
+                raise JSONPatchError(f"Path not found: /{'/'.join(tokens)}")
+            current = current[token]
+        elif isinstance(current, list):
+            current = current[_array_index(token, len(current), allow_end=False)]
+        else:
+            raise JSONPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return current
+
+
+def _add(document: Any, tokens: List[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent, dict):
+        parent[key] = value
+    elif isinstance(parent, list):
+        parent.insert(_array_index(key, len(parent), allow_end=True), value)
+    else:
+        raise JSONPatchError(f"Cannot add to a scalar at /{'/'.join(tokens[:-1])}")
+    return document
+
+
+def _remove(document: Any, tokens: List[str]) -> Any:
+    if not tokens:
+        raise JSONPatchError("Cannot remove the document root")
+    parent = _resolve(document, tokens[:-1])
+    key = tokens[-1]
+    if isinstance(parent, dict):
+        if key not in parent:
+            raise JSONPatchError(f"Path not found: /{'/'.join(tokens)}")
+        del parent[key]
+    elif isinstance(parent, list):
+        del parent[_array_index(key, len(parent), allow_end=False)]
+    else:
+        raise JSONPatchError(f"Path not found: /{'/'.join(tokens)}")
+    return document
+
+
+def apply_patch(document: Any, operations: Sequence[dict]) -> Any:
+    """
+    Apply a JSON Patch to a document.
+
+    The patch is atomic: the input is never modified and any failing
+    operation aborts the whole patch.
+
+    Args:
+        document: Target JSON document
+        operations: Patch operations ({"op", "path", "value"/"from"})
+
+    Returns:
+        Patched copy of the document
+    """
+    result = deepcopy(document)
+
+    for operation in operations:
+        op = operation.get("op")
+        tokens = parse_pointer(operation.get("path", ""))
+
+        if op == "add":
+            result = _add(result, tokens, deepcopy(operation["value"]))
+        elif op == "remove":
+            result = _remove(result, tokens)
+        elif op == "replace":
+            _resolve(result, tokens)
+            if tokens:
+                result = _remove(result, tokens)
+            result = _add(result, tokens, deepcopy(operation["value"]))
+        elif op in ("move", "copy"):
+            source = parse_pointer(operation["from"])
+            value = deepcopy(_resolve(result, source))
+            if op == "move":
+                if tokens[:len(source)] == source and tokens != source:
+                    raise JSONPatchError("Cannot move a value into one of its children")
+                result = _remove(result, source)
+            result = _add(result, tokens, value)
+        elif op == "test":
+            if _resolve(result, tokens) != operation["value"]:
+                raise JSONPatchError(f"Test failed at {operation['path']!r}")
+        else:
+            raise JSONPatchError(f"Unsupported patch operation: {op!r}")
+
+    return result
+
+
+def _path(tokens: Sequence[str]) -> ColumnElement:
+    return literal(list(tokens), ARRAY(Text))
+
+
+def _get(doc: ColumnElement, tokens: Sequence[str]) -> ColumnElement:
+    """doc #> path (SQL NULL when the path does not exist)."""
+    if not tokens:
+        return doc
+    return doc.op("#>", return_type=JSONB)(_path(tokens))
+
+
+def _exists(doc: ColumnElement, tokens: Sequence[str]) -> ColumnElement:
+    return _get(doc, tokens).isnot(None)
+
+
+def _sql_add(doc: ColumnElement, tokens: List[str], value: ColumnElement, conditions: list) -> ColumnElement:
+    """Compile an add; arrays insert, objects set (decided per row)."""
+    if not tokens:
+        return value
+
+    parent_tokens, key = tokens[:-1], tokens[-1]
+    parent = _get(doc, parent_tokens)
+    parent_type = func.jsonb_typeof(parent)
+
+    if key == "-":
+        conditions.append(parent_type == "array")
+        appended = parent.op("||", return_type=JSONB)(func.jsonb_build_array(value))
+        if not parent_tokens:
+            return appended
+        return func.jsonb_set(doc, _path(parent_tokens), appended, False, type_=JSONB)
+
+    set_member = func.jsonb_set(doc, _path(tokens), value, True, type_=JSONB)
+    if key.isdigit() and (len(key) == 1 or key[0] != "0"):
+        conditions.append(case(
+            (parent_type == "array", func.jsonb_array_length(parent) >= literal(int(key), Integer)),
+            else_=parent_type == "object"
+        ))
+        return case(
+            (parent_type == "array", func.jsonb_insert(doc, _path(tokens), value, type_=JSONB)),
+            else_=set_member
+        )
+
+    conditions.append(parent_type == "object")
+    return set_member
+
+
+def _compile_operation(doc: ColumnElement, operation: dict, conditions: list) -> ColumnElement:
+    """Compile one operation into a new document expression."""
+    op = operation.get("op")
+    tokens = parse_pointer(operation.get("path", ""))
+
+    if op == "add":
+        return _sql_add(doc, tokens, literal(operation["value"], JSONB), conditions)
+    if op == "remove":
+        if not tokens:
+            raise JSONPatchError("Cannot remove the document root")
+        conditions.append(_exists(doc, tokens))
+        return doc.op("#-", return_type=JSONB)(_path(tokens))
+    if op == "replace":
+        conditions.append(_exists(doc, tokens))
+        if not tokens:
+            return literal(operation["value"], JSONB)
+        return func.jsonb_set(doc, _path(tokens), literal(operation["value"], JSONB), False, type_=JSONB)
+    if op in ("move", "copy"):
+        source = parse_pointer(operation["from"])
+        conditions.append(_exists(doc, source))
+        value = _get(doc, source)
+        if op == "move":
+            if tokens[:len(source)] == source and tokens != source:
+                raise JSONPatchError("Cannot move a value into one of its children")
+            doc = doc.op("#-", return_type=JSONB)(_path(source))
+        return _sql_add(doc, tokens, value, conditions)
+    if op == "test":
+        conditions.append(_get(doc, tokens) == literal(operation["value"], JSONB))
+        return doc
+    raise JSONPatchError(f"Unsupported patch operation: {op!r}")
+
+
+def compile_jsonb_patch(source: Select, operations: Sequence[dict]) -> Subquery:
+    """
+    Compile a JSON Patch into SQL over a JSONB document.
+
+    Each operation becomes one derived table applying jsonb_set /
+    jsonb_insert / #- to the previous stage's ``doc`` column, so the SQL
+    grows linearly with the patch. RFC 6902 preconditions (path exists,
+    test values match, array bounds) are folded into an ``ok`` column;
+    callers filter on it so a patch that does not apply changes nothing.
+
+    Args:
+        source: Select producing the document labelled ``doc`` plus any
+            key columns, which are carried through every stage
+        operations: Patch operations ({"op", "path", "value"/"from"})
+
+    Returns:
+        Subquery with the key columns, the patched ``doc`` and ``ok``
+    """
+    stage = source.add_columns(true().label("ok")).subquery()
+
+    for operation in operations:
+        conditions: List[ColumnElement] = []
+        doc = _compile_operation(stage.c.doc, operation, conditions)
+        keys = [c for c in stage.c if c.key not in ("doc", "ok")]
+        stage = select(
+            *keys,
+            doc.label("doc"),
+            and_(stage.c.ok, *conditions).label("ok")
+        ).subquery()
+
+    return stage
+
+
+def jsonb_fragment(doc: ColumnElement, pointer: str) -> ColumnElement:
+    """SQL expression for the value at pointer (NULL when missing)."""
+    return _get(doc, parse_pointer(pointer))
+
+
+def changed_paths(operations: Sequence[dict]) -> List[str]:
+    """Paths written by a patch, in order and without duplicates."""
+    paths: List[str] = []
+    for operation in operations:
+        if operation.get("op") == "test":
+            continue
+        for path in (operation.get("from") if operation.get("op") == "move" else None, operation.get("path")):
+            if path is not None and path not in paths:
+                paths.append(path)
+    return paths
+
+
+def get_fragment(document: Any, pointer: str) -> Any:
+    """Value at pointer, or None when it does not exist."""
+    try:
+        return _resolve(document, parse_pointer(pointer))
+    except JSONPatchError:
+        return None
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def diff(old: Any, new: Any, path: str = "") -> List[dict]:
+    """
+    Patch that turns old into new.
+
+    Objects are compared key by key and equal-length arrays element by
+    element; anything else that differs is replaced whole.
+
+    Args:
+        old: Source document
+        new: Target document
+        path: Pointer of the documents (for recursion)
+
+    Returns:
+        Patch operations (empty when the documents are equal)
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations: List[dict] = []
+        for key in old:
+            if key not in new:
+                operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            if key not in old:
+                operations.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": value})
+            else:
+                operations.extend(diff(old[key], value, f"{path}/{_escape(key)}"))
+        return operations
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        return [op for i, (a, b) in enumerate(zip(old, new)) for op in diff(a, b, f"{path}/{i}")]
+    return [{"op": "replace", "path": path, "value": new}]
@@ -0,0 +1,33 @@
+"""
+Session event listeners.
+
+Audit records, the analog index, EVM counters and deliverable statistics
+follow ORM writes through Session events. Each module lists its handlers
+in SESSION_LISTENERS; they are registered here, once, at application and
+worker startup rather than as a side effect of importing the modules.
+"""
+
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.services import analogs, audit, evm
+from app.services.estimation import historical_stats
+
+
+logger = logging.getLogger(__name__)
+
+LISTENER_MODULES = (audit, analogs, evm, historical_stats)
+
+
+def register_listeners() -> None:
+    """Register every module's Session listeners (safe to call more than once)."""
+    count = 0
+    for module in LISTENER_MODULES:
+        for identifier, fn in module.SESSION_LISTENERS:
+            if not event.contains(Session, identifier, fn):
+                event.listen(Session, identifier, fn)
+                count += 1
+    if count:
+        logger.info(f"Registered {count} session listeners")
@@ -0,0 +1,31 @@
+"""
+Celery application.
+
+Run a worker with:
+    celery -A app.workers.celery_app worker --loglevel=info
+"""
+
+from celery import Celery
+
+from app.config import settings
+
+
+celery_app = Celery(
+    "estimation",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+    include=["app.workers.tasks"]
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    task_time_limit=settings.CELERY_TASK_TIME_LIMIT,
+    task_soft_time_limit=max(settings.CELERY_TASK_TIME_LIMIT - 30, 1),
+    # Long jobs: take one at a time and acknowledge only when done
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_track_started=True,
+    timezone="UTC",
+)
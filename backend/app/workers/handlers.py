@@ -0,0 +1,80 @@
+"""Job handlers, registered by name with the job framework."""
+
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+import logging
+
+from app.config import settings
+from app.core.database import AsyncSessionLocal
+from app.crud.complexity_coefficients import complexity_coefficient_set as coefficient_set_crud
+from app.services.catalog_import import DEFAULT_BATCH_SIZE, import_deliverable_catalog
+from app.services.estimation.calibration import calibrate_complexity_factors, store_calibration
+from app.services.estimation.complexity import ComplexityCalculator
+from app.workers.jobs import JobContext, register_job
+
+
+logger = logging.getLogger(__name__)
+
+
+@register_job("complexity_calibration", superuser=True)
+async def complexity_calibration(
+    ctx: JobContext,
+    ridge_alpha: float = 1.0,
+    min_samples: int = 30,
+    activate: bool = False,
+    notes: str = None
+) -> dict:
+    """Fit complexity coefficients and store them as a new version."""
+    async with AsyncSessionLocal() as db:
+        active = await coefficient_set_crud.get_active(db)
+        prior = ComplexityCalculator(active.coefficients if active else None).factors
+
+        await ctx.progress(5, "Streaming completed projects")
+        result = await calibrate_complexity_factors(db, ridge_alpha=ridge_alpha, prior=prior)
+        await ctx.progress(90, f"Fitted on {result.sample_count} projects")
+
+        if result.sample_count < min_samples:
+            return {"stored": False, "sample_count": result.sample_count}
+
+        coefficient_set = await store_calibration(db, result, notes=notes, activate=activate)
+
+    return {
+        "stored": True,
+        "version": coefficient_set.version,
+        "active": activate,
+        "sample_count": result.sample_count,
+        "coefficients": result.coefficients,
+        "r_squared": result.r_squared,
+    }
+
+
+DEFAULT_CATALOG_FILES = ["Engineering Master Deliverables List.xlsx"]
+
+
+def resolve_import_files(files: List[str]) -> List[Path]:
+    """Resolve file names inside CATALOG_IMPORT_DIR, rejecting anything outside it."""
+    base = Path(settings.CATALOG_IMPORT_DIR or Path(__file__).resolve().parents[3]).resolve()
+    paths = []
+    for name in files:
+        path = (base / name).resolve()
+        if base not in path.parents or not path.is_file():
+            raise ValueError(f"Import file not found: {name}")
+        paths.append(path)
+    return paths
+
+
+@register_job("deliverable_catalog_import", superuser=True)
+async def deliverable_catalog_import(
+    ctx: JobContext,
+    files: Optional[List[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict:
+    """Import the master deliverables list (xlsx and/or phase CSVs) into the catalog."""
+    paths = resolve_import_files(files or DEFAULT_CATALOG_FILES)
+    await ctx.progress(0, f"Importing {len(paths)} file(s)")
+
+    async with AsyncSessionLocal() as db:
+        result = await import_deliverable_catalog(db, paths, batch_size=batch_size, progress=ctx.progress)
+
+    return asdict(result)
@@ -0,0 +1,358 @@
+"""
+Background job framework.
+
+Jobs are async functions registered by name. A submitted
+job gets a record in the job store (Redis, or in-process when Redis is
+unavailable) and is executed either by a Celery worker or by the
+in-process executor, depending on ``JOB_BACKEND``. Both paths run the same
+``execute_job``, so progress, cancellation and results behave identically.
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set
+import asyncio
+import inspect
+import json
+import logging
+import time
+import uuid
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY_PREFIX = "job:"
+
+
+class JobStatus:
+    """Job lifecycle states."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested."""
+    pass
+
+
+@dataclass
+class JobRecord:
+    """Persisted state of a job."""
+
+    id: str
+    name: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    status: str = JobStatus.PENDING
+    progress: float = 0.0
+    message: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    user_id: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in JobStatus.FINISHED
+
+
+class JobStore:
+    """
+    Job records in Redis hashes, or in a local dict without Redis.
+
+    Each field is stored JSON-encoded so partial updates (progress, cancel
+    flag) are a single HSET and never overwrite concurrent writes to other
+    fields.
+    """
+
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        self.redis: Optional[aioredis.Redis] = redis_client
+        self._local: Dict[str, Dict[str, Any]] = {}
+        self._local_expiry: Dict[str, float] = {}
+
+    @property
+    def is_shared(self) -> bool:
+        """Whether records are visible to other processes."""
+        return self.redis is not None
+
+    async def connect(self) -> None:
+        """Connect to Redis, falling back to in-process storage."""
+        if self.redis is not None:
+            return
+        try:
+            client = aioredis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=True)
+            await client.ping()
+            self.redis = client
+        except (RedisError, OSError) as e:
+            logger.warning(f"Redis unavailable, job records kept in-process only: {e}")
+
+    async def disconnect(self) -> None:
+        if self.redis is not None:
+            await self.redis.aclose()
+            self.redis = None
+
+    async def save(self, record: JobRecord) -> None:
+        self._prune_local()
+        await self.update(record.id, **asdict(record))
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        if self.redis is None:
+            self._local.setdefault(job_id, {}).update(fields)
+            self._local_expiry[job_id] = time.monotonic() + settings.JOB_RESULT_TTL
+            return
+        key = f"{JOB_KEY_PREFIX}{job_id}"
+        await self.redis.hset(key, mapping={k: json.dumps(v, default=str) for k, v in fields.items()})
+        await self.redis.expire(key, settings.JOB_RESULT_TTL)
+
+    def _prune_local(self) -> None:
+        now = time.monotonic()
+        for job_id in [j for j, expires in self._local_expiry.items() if expires < now]:
+            self._local.pop(job_id, None)
+            self._local_expiry.pop(job_id, None)
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        if self.redis is None:
+            data = self._local.get(job_id)
+        else:
+            raw = await self.redis.hgetall(f"{JOB_KEY_PREFIX}{job_id}")
+            data = {k: json.loads(v) for k, v in raw.items()} if raw else None
+        return JobRecord(**data) if data else None
+
+
+class JobContext:
+    """Handle passed to running jobs for progress reporting and cancellation."""
+
+    def __init__(self, job_id: str, store: JobStore):
+        self.job_id = job_id
+        self.store = store
+
+    async def progress(self, percent: float, message: Optional[str] = None) -> None:
+        """Report progress (0-100) and check for cancellation."""
+        await self.store.update(self.job_id, progress=round(max(0.0, min(100.0, percent)), 1), message=message)
+        await self.check_cancelled()
+
+    async def check_cancelled(self) -> None:
+        """Raise JobCancelled if cancellation was requested."""
+        record = await self.store.get(self.job_id)
+        if record and record.cancel_requested:
+            raise JobCancelled(self.job_id)
+
+
+JobFunction = Callable[..., Any]
+_registry: Dict[str, JobFunction] = {}
+_superuser_jobs: Set[str] = set()
+
+
+def register_job(name: str, *, superuser: bool = False) -> Callable[[JobFunction], JobFunction]:
+    """
+    Register a job function under a name.
+
+    The function must be async; it receives a JobContext followed by the
+    submitted params as keyword arguments and returns a JSON-serializable
+    result. CPU-heavy steps should be offloaded from the event loop.
+    Jobs that change global state (coefficients, templates) are registered
+    with ``superuser=True`` and can only be submitted by superusers.
+    """
+    def decorator(fn: JobFunction) -> JobFunction:
+        if not inspect.iscoroutinefunction(fn):
+            raise TypeError(f"Job '{name}' must be an async function")
+        _registry[name] = fn
+        if superuser:
+            _superuser_jobs.add(name)
+        else:
+            _superuser_jobs.discard(name)
+        return fn
+    return decorator
+
+
+def registered_jobs(*, include_superuser: bool = True) -> List[str]:
+    """Names of registered jobs, optionally without the superuser-only ones."""
+    _load_handlers()
+    return sorted(name for name in _registry if include_superuser or name not in _superuser_jobs)
+
+
+def requires_superuser(name: str) -> bool:
+    """Whether only superusers may submit a job."""
+    _load_handlers()
+    return name in _superuser_jobs
+
+
+def _load_handlers() -> None:
+    # Job handlers register themselves on import
+    import app.workers.handlers  # noqa: F401
+
+
+async def execute_job(job_id: str, store: JobStore) -> None:
+    """Run a stored job to completion, recording its outcome."""
+    _load_handlers()
+    record = await store.get(job_id)
+    if record is None:
+        logger.error(f"Job {job_id} not found")
+        return
+    if record.cancel_requested:
+        await store.update(job_id, status=JobStatus.CANCELLED, finished_at=datetime.utcnow().isoformat())
+        return
+
+    fn = _registry.get(record.name)
+    await store.update(job_id, status=JobStatus.RUNNING, started_at=datetime.utcnow().isoformat())
+    ctx = JobContext(job_id, store)
+
+    try:
+        if fn is None:
+            raise ValueError(f"Unknown job type: {record.name}")
+        result = await fn(ctx, **record.params)
+    except (JobCancelled, asyncio.CancelledError):
+        logger.info(f"Job {job_id} ({record.name}) cancelled")
+        await store.update(job_id, status=JobStatus.CANCELLED, finished_at=datetime.utcnow().isoformat())
+        return
+    except Exception as e:
+        logger.exception(f"Job {job_id} ({record.name}) failed")
+        await store.update(
+            job_id, status=JobStatus.FAILED, error=str(e), finished_at=datetime.utcnow().isoformat()
+        )
+        return
+
+    await store.update(
+        job_id,
+        status=JobStatus.SUCCEEDED,
+        progress=100.0,
+        result=result,
+        finished_at=datetime.utcnow().isoformat()
+    )
+    logger.info(f"Job {job_id} ({record.name}) succeeded")
+
+
+class JobManager:
+    """
+    Submit, inspect and cancel jobs.
+
+    With ``JOB_BACKEND=celery`` jobs are sent to the Celery worker;
+    otherwise (or when Redis is unavailable, since the worker could not
+    report back) they run on this process's event loop, at most
+    ``JOB_LOCAL_CONCURRENCY`` at a time.
+    """
+
+    def __init__(self, store: Optional[JobStore] = None, backend: Optional[str] = None):
+        self.store = store or JobStore()
+        self.backend = backend or settings.JOB_BACKEND
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def uses_celery(self) -> bool:
+        return self.backend == "celery" and self.store.is_shared
+
+    async def connect(self) -> None:
+        await self.store.connect()
+        if self.backend == "celery" and not self.store.is_shared:
+            logger.warning("JOB_BACKEND=celery but Redis is unavailable; running jobs in-process")
+
+    async def disconnect(self) -> None:
+        for task in list(self._tasks.values()):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        await self.store.disconnect()
+
+    async def submit(
+        self,
+        name: str,
+        params: Optional[Dict[str, Any]] = None,
+        user_id: Optional[Any] = None
+    ) -> JobRecord:
+        """
+        Submit a job.
+
+        Args:
+            name: Registered job name
+            params: JSON-serializable keyword arguments for the job
+            user_id: Submitting user
+
+        Returns:
+            The pending job record
+
+        Raises:
+            ValueError: If no job is registered under name
+        """
+        if name not in registered_jobs():
+            raise ValueError(f"Unknown job type: {name}")
+
+        record = JobRecord(
+            id=uuid.uuid4().hex,
+            name=name,
+            params=params or {},
+            user_id=str(user_id) if user_id else None
+        )
+        await self.store.save(record)
+
+        if self.uses_celery:
+            from app.workers.tasks import run_job
+            run_job.apply_async(args=[record.id], task_id=record.id)
+        else:
+            self._tasks[record.id] = asyncio.create_task(self._run_local(record.id))
+
+        logger.info(f"Job {record.id} ({name}) submitted via {'celery' if self.uses_celery else 'local'}")
+        return record
+
+    async def _run_local(self, job_id: str) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.JOB_LOCAL_CONCURRENCY)
+        try:
+            async with self._semaphore:
+                await execute_job(job_id, self.store)
+        finally:
+            self._tasks.pop(job_id, None)
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        return await self.store.get(job_id)
+
+    async def cancel(self, job_id: str) -> Optional[JobRecord]:
+        """
+        Request cancellation.
+
+        Running jobs stop at their next progress / check_cancelled call;
+        pending jobs never start. Finished jobs are left unchanged.
+        """
+        record = await self.store.get(job_id)
+        if record is None or record.is_finished:
+            return record
+
+        await self.store.update(job_id, cancel_requested=True)
+        if self.uses_celery:
+            from app.workers.celery_app import celery_app
+            celery_app.control.revoke(job_id)
+            # A revoked task never runs, so nothing else would finish its record
+            stopped = record.status == JobStatus.PENDING
+        else:
+            stopped = record.status == JobStatus.PENDING and job_id in self._tasks
+            if stopped:
+                self._tasks[job_id].cancel()
+        if stopped:
+            await self.store.update(
+                job_id, status=JobStatus.CANCELLED, finished_at=datetime.utcnow().isoformat()
+            )
+
+        return await self.store.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float = 30.0) -> Optional[JobRecord]:
+        """Wait for a local job to finish (used by tests and scripts)."""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        return await self.store.get(job_id)
+
+
+job_manager = JobManager()
@@ -0,0 +1,42 @@
+"""Celery tasks."""
+
+import asyncio
+import logging
+
+from celery.signals import worker_init
+
+from app.core.cache import cache
+from app.core.database import engine
+from app.services.listeners import register_listeners
+from app.workers.celery_app import celery_app
+from app.workers.jobs import JobStore, execute_job
+
+
+logger = logging.getLogger(__name__)
+
+
+@worker_init.connect
+def _register_listeners(**kwargs) -> None:
+    # Before the pool forks, so every worker process keeps derived tables current
+    register_listeners()
+
+
+async def _run(job_id: str) -> None:
+    # Each task gets its own event loop, so it needs its own Redis and database
+    # connections; pooled ones would be bound to a closed loop in the next task
+    store = JobStore()
+    await store.connect()
+    await cache.connect()
+    try:
+        await execute_job(job_id, store)
+    finally:
+        await cache.disconnect()
+        await store.disconnect()
+        await engine.dispose()
+
+
+@celery_app.task(name="jobs.run")
+def run_job(job_id: str) -> None:
+    """Execute a job submitted through the JobManager."""
+    logger.info(f"Worker running job {job_id}")
+    asyncio.run(_run(job_id))
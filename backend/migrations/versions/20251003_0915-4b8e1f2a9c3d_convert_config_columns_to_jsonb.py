@@ -0,0 +1,64 @@
+"""convert project and template config columns to jsonb with gin indexes
+
+Revision ID: 4b8e1f2a9c3d
+Revises: 3d1e25d308a1
+Create Date: 2025-10-03 09:15:42.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8e1f2a9c3d'
+down_revision: Union[str, None] = '3d1e25d308a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, index name, server default)
+JSONB_COLUMNS = [
+    ('projects', 'complexity_factors', 'idx_project_complexity_factors_gin', None),
+    ('projects', 'selected_disciplines', 'idx_project_selected_disciplines_gin', None),
+    ('projects', 'deliverables_config', 'idx_project_deliverables_config_gin', '[]'),
+    ('deliverable_templates', 'deliverables_config', 'idx_deliverable_template_config_gin', None),
+]
+
+
+def upgrade() -> None:
+    for table, column, index_name, server_default in JSONB_COLUMNS:
+        # Defaults are not rewritten by USING, so drop and restore them around the cast
+        if server_default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb',
+        )
+        if server_default is not None:
+            op.alter_column(table, column, server_default=server_default)
+        op.create_index(
+            index_name, table, [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    for table, column, index_name, server_default in reversed(JSONB_COLUMNS):
+        op.drop_index(index_name, table_name=table)
+        if server_default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::json',
+        )
+        if server_default is not None:
+            op.alter_column(table, column, server_default=server_default)
@@ -0,0 +1,80 @@
+"""compress large json columns
+
+equipment_list moves to a zlib-compressed bytea payload (see
+app.models.types.CompressedJSON). Existing rows are converted to the
+uncompressed payload format in SQL; run scripts/compress_json_columns.py
+afterwards to compress rows above the size threshold.
+
+deliverables_config stays JSONB so its GIN index and jsonb operators keep
+working; it switches to lz4 TOAST compression instead.
+
+Revision ID: 7c2d5e8f1a6b
+Revises: 4b8e1f2a9c3d
+Create Date: 2025-10-03 14:20:07.551930
+
+"""
+from typing import Sequence, Union
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d5e8f1a6b'
+down_revision: Union[str, None] = '4b8e1f2a9c3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LZ4_COLUMNS = [
+    ('projects', 'deliverables_config'),
+    ('deliverable_templates', 'deliverables_config'),
+]
+
+
+def upgrade() -> None:
+    # equipment_list: json -> bytea with the uncompressed 'j' marker
+    op.alter_column('projects', 'equipment_list', server_default=None)
+    op.alter_column(
+        'projects', 'equipment_list',
+        type_=sa.LargeBinary(),
+        existing_type=sa.JSON(),
+        postgresql_using="convert_to('j' || equipment_list::text, 'UTF8')",
+    )
+    op.alter_column(
+        'projects', 'equipment_list',
+        server_default=sa.text("convert_to('j[]', 'UTF8')"),
+    )
+    # Payloads are compressed by the application; don't let TOAST try again
+    op.execute("ALTER TABLE projects ALTER COLUMN equipment_list SET STORAGE EXTERNAL")
+
+    for table, column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    for table, column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION pglz")
+
+    # Inflate compressed rows in Python; Postgres has no zlib
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, equipment_list FROM projects WHERE get_byte(equipment_list, 0) = 122")
+    )
+    for row_id, payload in rows.fetchall():
+        raw = zlib.decompress(bytes(payload)[1:])
+        bind.execute(
+            sa.text("UPDATE projects SET equipment_list = :payload WHERE id = :id"),
+            {"payload": b'j' + raw, "id": row_id},
+        )
+
+    op.execute("ALTER TABLE projects ALTER COLUMN equipment_list SET STORAGE EXTENDED")
+    op.alter_column('projects', 'equipment_list', server_default=None)
+    op.alter_column(
+        'projects', 'equipment_list',
+        type_=sa.JSON(),
+        existing_type=sa.LargeBinary(),
+        postgresql_using="convert_from(substring(equipment_list from 2), 'UTF8')::json",
+    )
+    op.alter_column('projects', 'equipment_list', server_default='[]')
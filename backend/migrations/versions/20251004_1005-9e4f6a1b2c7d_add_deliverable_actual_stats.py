@@ -0,0 +1,48 @@
+"""add deliverable actual stats
+
+Running actual / estimated hours statistics per deliverable name, type and
+discipline. Maintained on write by app.services.estimation.historical_stats;
+run scripts/rebuild_deliverable_stats.py once to seed from existing data.
+
+Revision ID: 9e4f6a1b2c7d
+Revises: 7c2d5e8f1a6b
+Create Date: 2025-10-04 10:05:31.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4f6a1b2c7d'
+down_revision: Union[str, None] = '7c2d5e8f1a6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'deliverable_actual_stats',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('deliverable_name', sa.String(length=255), nullable=False),
+        sa.Column('deliverable_type', sa.String(length=50), nullable=False),
+        sa.Column('discipline', sa.String(length=100), nullable=False),
+        sa.Column('sample_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('mean_ratio', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('m2', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'deliverable_name', 'deliverable_type', 'discipline',
+            name='uq_deliverable_actual_stats_key'
+        )
+    )
+    op.create_index(op.f('ix_deliverable_actual_stats_id'), 'deliverable_actual_stats', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_deliverable_actual_stats_id'), table_name='deliverable_actual_stats')
+    op.drop_table('deliverable_actual_stats')
@@ -0,0 +1,53 @@
+"""add complexity coefficient sets
+
+Revision ID: 2b7c9d4e6f10
+Revises: 9e4f6a1b2c7d
+Create Date: 2025-10-04 13:40:12.876502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b7c9d4e6f10'
+down_revision: Union[str, None] = '9e4f6a1b2c7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'complexity_coefficient_sets',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('coefficients', sa.JSON(), nullable=False),
+        sa.Column('method', sa.String(length=50), nullable=False),
+        sa.Column('ridge_alpha', sa.Float(), nullable=True),
+        sa.Column('sample_count', sa.Integer(), nullable=True),
+        sa.Column('r_squared', sa.Float(), nullable=True),
+        sa.Column('rmse', sa.Float(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=False, server_default='false'),
+        sa.Column('notes', sa.String(length=1000), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_complexity_coefficient_sets_id'), 'complexity_coefficient_sets', ['id'], unique=False)
+    op.create_index(op.f('ix_complexity_coefficient_sets_version'), 'complexity_coefficient_sets', ['version'], unique=True)
+    op.create_index(op.f('ix_complexity_coefficient_sets_is_active'), 'complexity_coefficient_sets', ['is_active'], unique=False)
+    # At most one active set
+    op.create_index(
+        'uq_complexity_coefficient_sets_active', 'complexity_coefficient_sets', ['is_active'],
+        unique=True, postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_complexity_coefficient_sets_active', table_name='complexity_coefficient_sets')
+    op.drop_index(op.f('ix_complexity_coefficient_sets_is_active'), table_name='complexity_coefficient_sets')
+    op.drop_index(op.f('ix_complexity_coefficient_sets_version'), table_name='complexity_coefficient_sets')
+    op.drop_index(op.f('ix_complexity_coefficient_sets_id'), table_name='complexity_coefficient_sets')
+    op.drop_table('complexity_coefficient_sets')
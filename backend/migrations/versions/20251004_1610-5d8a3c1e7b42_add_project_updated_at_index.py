@@ -0,0 +1,27 @@
+"""add project updated_at index
+
+Supports the analog index delta sync (updated_at > watermark).
+
+Revision ID: 5d8a3c1e7b42
+Revises: 2b7c9d4e6f10
+Create Date: 2025-10-04 16:10:44.092318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8a3c1e7b42'
+down_revision: Union[str, None] = '2b7c9d4e6f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_project_updated_at', 'projects', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_project_updated_at', table_name='projects')
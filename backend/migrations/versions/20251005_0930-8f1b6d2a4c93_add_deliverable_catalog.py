@@ -0,0 +1,50 @@
+"""add deliverable catalog
+
+Master deliverables list by phase, loaded by the deliverable_catalog_import
+job (or scripts/import_deliverable_catalog.py).
+
+Revision ID: 8f1b6d2a4c93
+Revises: 5d8a3c1e7b42
+Create Date: 2025-10-05 09:30:12.517904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f1b6d2a4c93'
+down_revision: Union[str, None] = '5d8a3c1e7b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'deliverable_catalog',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('phase', sa.String(length=20), nullable=False),
+        sa.Column('discipline', sa.String(length=50), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('item_no', sa.Float(), nullable=False),
+        sa.Column('statuses', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('milestone', sa.String(length=10), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('base_hours', sa.Integer(), nullable=True),
+        sa.Column('source', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('phase', 'discipline', 'name', name='uq_deliverable_catalog_key')
+    )
+    op.create_index(op.f('ix_deliverable_catalog_id'), 'deliverable_catalog', ['id'], unique=False)
+    op.create_index('idx_deliverable_catalog_phase_item', 'deliverable_catalog', ['phase', 'item_no'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_deliverable_catalog_phase_item', table_name='deliverable_catalog')
+    op.drop_index(op.f('ix_deliverable_catalog_id'), table_name='deliverable_catalog')
+    op.drop_table('deliverable_catalog')
@@ -0,0 +1,63 @@
+"""add project evm counters
+
+Per-project running earned value totals, maintained on deliverable writes
+by app.services.evm. Seeded here from existing deliverables in one
+INSERT ... SELECT; scripts/rebuild_evm_counters.py repairs them later.
+
+Revision ID: 3c6e9a2d5f81
+Revises: 8f1b6d2a4c93
+Create Date: 2025-10-05 14:20:47.663150
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c6e9a2d5f81'
+down_revision: Union[str, None] = '8f1b6d2a4c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'project_evm_counters',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column('deliverable_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('budget_hours', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('earned_hours', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('actual_hours', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('project_id')
+    )
+    op.create_index(op.f('ix_project_evm_counters_id'), 'project_evm_counters', ['id'], unique=False)
+
+    op.execute("""
+        INSERT INTO project_evm_counters
+            (id, project_id, deliverable_count, completed_count, budget_hours, earned_hours, actual_hours, created_at)
+        SELECT
+            gen_random_uuid(),
+            project_id,
+            count(*),
+            count(*) FILTER (WHERE status = 'COMPLETED'),
+            coalesce(sum(hours_total), 0),
+            coalesce(sum(hours_total * CASE WHEN status = 'COMPLETED' THEN 100
+                                            ELSE least(greatest(coalesce(progress_percent, 0), 0), 100) END / 100.0), 0),
+            coalesce(sum(actual_hours_total), 0),
+            now()
+        FROM deliverables
+        GROUP BY project_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_project_evm_counters_id'), table_name='project_evm_counters')
+    op.drop_table('project_evm_counters')
@@ -0,0 +1,70 @@
+"""add estimate versions
+
+Content-addressed estimate blobs and per-project estimate versions that
+reference them (see app.services.estimation.snapshots).
+
+Revision ID: a71d4c2e9b35
+Revises: 3c6e9a2d5f81
+Create Date: 2025-10-06 09:15:12.408317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a71d4c2e9b35'
+down_revision: Union[str, None] = '3c6e9a2d5f81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'estimate_blobs',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('content', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('hash')
+    )
+    op.create_index(op.f('ix_estimate_blobs_id'), 'estimate_blobs', ['id'], unique=False)
+
+    op.create_table(
+        'estimate_versions',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('inputs_hash', sa.String(length=64), nullable=False),
+        sa.Column('outputs_hash', sa.String(length=64), nullable=False),
+        sa.Column('changes', sa.JSON(), nullable=True),
+        sa.Column('label', sa.String(length=255), nullable=True),
+        sa.Column('total_hours', sa.Integer(), nullable=True),
+        sa.Column('duration_weeks', sa.Integer(), nullable=True),
+        sa.Column('confidence_level', sa.String(length=20), nullable=True),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['inputs_hash'], ['estimate_blobs.hash']),
+        sa.ForeignKeyConstraint(['outputs_hash'], ['estimate_blobs.hash']),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('project_id', 'version', name='uq_estimate_versions_project_version')
+    )
+    op.create_index(op.f('ix_estimate_versions_id'), 'estimate_versions', ['id'], unique=False)
+    op.create_index('idx_estimate_versions_project_inputs', 'estimate_versions', ['project_id', 'inputs_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_estimate_versions_project_inputs', table_name='estimate_versions')
+    op.drop_index(op.f('ix_estimate_versions_id'), table_name='estimate_versions')
+    op.drop_table('estimate_versions')
+    op.drop_index(op.f('ix_estimate_blobs_id'), table_name='estimate_blobs')
+    op.drop_table('estimate_blobs')
@@ -0,0 +1,47 @@
+"""add estimate scenarios
+
+Named per-project estimate variants storing only their input overrides
+(see app.services.estimation.scenarios).
+
+Revision ID: c4f2e8a1d796
+Revises: a71d4c2e9b35
+Create Date: 2025-10-06 13:40:28.915604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f2e8a1d796'
+down_revision: Union[str, None] = 'a71d4c2e9b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'estimate_scenarios',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('project_id', sa.UUID(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('description', sa.String(length=500), nullable=True),
+        sa.Column('overrides', sa.JSON(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('project_id', 'name', name='uq_estimate_scenarios_project_name')
+    )
+    op.create_index(op.f('ix_estimate_scenarios_id'), 'estimate_scenarios', ['id'], unique=False)
+    op.create_index(op.f('ix_estimate_scenarios_project_id'), 'estimate_scenarios', ['project_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_estimate_scenarios_project_id'), table_name='estimate_scenarios')
+    op.drop_index(op.f('ix_estimate_scenarios_id'), table_name='estimate_scenarios')
+    op.drop_table('estimate_scenarios')
@@ -0,0 +1,67 @@
+"""Benchmark analog index queries.
+
+Builds an in-memory index of synthetic projects (no database) and reports
+build time and query latency percentiles.
+
+Usage:
+    python scripts/benchmark_analogs.py [project_count]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from uuid import uuid4
+
+from app.models.project import EngineeringDiscipline, ProjectSize, ProjectStatus, WorkType
+from app.services.analogs import AnalogIndex
+
+QUERIES = 200
+K = 10
+
+
+def random_row(rng):
+    return {
+        "id": uuid4(),
+        "name": "Synthetic",
+        "status": ProjectStatus.COMPLETED if rng.random() < 0.6 else ProjectStatus.ACTIVE,
+        "size": rng.choice(list(ProjectSize)),
+        "discipline": rng.choice(list(EngineeringDiscipline)),
+        "selected_disciplines": rng.sample([d.value for d in EngineeringDiscipline], rng.randint(0, 3)),
+        "complexity_factors": {"fasttrack": rng.random() < 0.3, "brownfield": rng.random() < 0.4},
+        "client_complexity": rng.randint(1, 10),
+        "total_hours": rng.randint(100, 50000),
+        "work_type": rng.choice(list(WorkType)),
+        "actual_hours": rng.randint(100, 50000),
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    rows = [random_row(rng) for _ in range(count)]
+
+    started = time.perf_counter()
+    index = AnalogIndex()
+    for row in rows:
+        index.upsert(row)
+    build = time.perf_counter() - started
+
+    timings = []
+    for _ in range(QUERIES):
+        row = rng.choice(rows)
+        started = time.perf_counter()
+        index.query(index.encoder.encode(row), k=K, exclude=[row["id"]])
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+
+    print(f"Projects:     {count:,} ({index.encoder.dim} features)")
+    print(f"Build:        {build:.2f} s")
+    print(f"Query p50:    {timings[len(timings) // 2]:.2f} ms")
+    print(f"Query p99:    {timings[int(len(timings) * 0.99)]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
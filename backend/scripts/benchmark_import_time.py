@@ -0,0 +1,78 @@
+"""Benchmark import time of the calculation core and the API app.
+
+Each target is imported in a fresh interpreter (median of several runs)
+and checked against a time budget and a list of modules it must not load:
+the core must not pull in the database, cache, settings or web stack, and
+the app must not load the report/import libraries before they are used.
+Exits non-zero if a budget is exceeded or a forbidden module is loaded.
+
+Usage:
+    python scripts/benchmark_import_time.py [repeats]
+"""
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+CORE_MODULES = (
+    "app.domain",
+    "app.services.estimation",
+    "app.services.cost.cost_calculator",
+)
+
+# (name, modules, budget in ms, modules that must not be loaded)
+TARGETS = (
+    (
+        "core", CORE_MODULES, 150,
+        ("sqlalchemy", "asyncpg", "redis", "fastapi", "starlette", "pydantic_settings", "app.config",
+         "app.core.database"),
+    ),
+    (
+        "app", ("app.main",), 4000,
+        ("scipy", "pandas", "reportlab", "openpyxl"),
+    ),
+)
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+for module in {modules!r}:
+    __import__(module)
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{"ms": elapsed, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure(modules, forbidden):
+    """Import modules in a fresh interpreter; returns (milliseconds, forbidden modules loaded)."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(modules=tuple(modules), forbidden=tuple(forbidden))],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["ms"], result["loaded"]
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    failed = False
+
+    for name, modules, budget, forbidden in TARGETS:
+        runs = [measure(modules, forbidden) for _ in range(repeats)]
+        median = statistics.median(ms for ms, _ in runs)
+        loaded = sorted({m for _, found in runs for m in found})
+        ok = median <= budget and not loaded
+        failed |= not ok
+
+        print(f"{name:6} {median:8.1f} ms  (budget {budget} ms, {repeats} runs)  {'OK' if ok else 'FAIL'}")
+        if loaded:
+            print(f"       loaded: {', '.join(loaded)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark CompressedJSON against plain JSON storage for equipment lists.
+
+Measures stored row size, save (serialize) latency and load (deserialize)
+latency for synthetic equipment lists of increasing size. No database is
+needed; the numbers cover the Python side of a save/load round trip.
+
+Usage:
+    python scripts/benchmark_json_compression.py
+"""
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.models.types import decode_json, encode_json
+
+SIZES = [10, 100, 1_000, 10_000]
+REPEAT = 20
+
+TEMPLATE_KEYS = ["vessel", "pump", "heat_exchanger", "compressor", "tank", "column"]
+SCOPES = ["basic", "typical", "complex"]
+PACKAGES = ["mechanical", "piping", "electrical", "instrumentation", "civil", "structural"]
+
+
+def make_equipment_list(count: int) -> list:
+    """Build a synthetic equipment list shaped like the frontend's Equipment type."""
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "tag": f"{TEMPLATE_KEYS[i % len(TEMPLATE_KEYS)][0].upper()}-{100 + i}",
+            "description": f"{TEMPLATE_KEYS[i % len(TEMPLATE_KEYS)].replace('_', ' ').title()} {i}",
+            "templateKey": TEMPLATE_KEYS[i % len(TEMPLATE_KEYS)],
+            "subtypeId": f"{TEMPLATE_KEYS[i % len(TEMPLATE_KEYS)]}_standard",
+            "scope": SCOPES[i % len(SCOPES)],
+            "selectedPackages": PACKAGES[: 2 + i % 4],
+        }
+        for i in range(count)
+    ]
+
+
+def timed(fn, repeat: int = REPEAT) -> float:
+    """Return mean latency of fn() in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    threshold = settings.JSON_COMPRESSION_THRESHOLD
+    level = settings.JSON_COMPRESSION_LEVEL
+
+    header = (
+        f"{'items':>7} | {'json bytes':>11} | {'stored bytes':>12} | {'ratio':>6} | "
+        f"{'save json':>9} | {'save comp':>9} | {'load json':>9} | {'load comp':>9}"
+    )
+    print(f"threshold={threshold} bytes, zlib level={level}, times in ms")
+    print(header)
+    print("-" * len(header))
+
+    for count in SIZES:
+        value = make_equipment_list(count)
+        plain = json.dumps(value)
+        payload = encode_json(value, threshold, level)
+
+        save_json = timed(lambda: json.dumps(value))
+        save_comp = timed(lambda: encode_json(value, threshold, level))
+        load_json = timed(lambda: json.loads(plain))
+        load_comp = timed(lambda: decode_json(payload))
+
+        print(
+            f"{count:>7} | {len(plain):>11,} | {len(payload):>12,} | "
+            f"{len(payload) / len(plain):>6.1%} | {save_json:>9.3f} | {save_comp:>9.3f} | "
+            f"{load_json:>9.3f} | {load_comp:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
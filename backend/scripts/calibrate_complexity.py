@@ -0,0 +1,57 @@
+"""Calibrate complexity-factor coefficients from completed projects.
+
+Streams completed projects in chunks, fits the coefficients by ridge
+regression and stores the result as a new coefficient set version.
+
+Usage:
+    python scripts/calibrate_complexity.py --alpha 1.0 [--activate]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.cache import cache
+from app.core.database import AsyncSessionLocal
+from app.crud.complexity_coefficients import complexity_coefficient_set as coefficient_set_crud
+from app.services.estimation.calibration import DEFAULT_CHUNK_SIZE, calibrate_complexity_factors, store_calibration
+from app.services.estimation.complexity import ComplexityCalculator
+
+
+async def main(args):
+    async with AsyncSessionLocal() as db:
+        active = await coefficient_set_crud.get_active(db)
+        prior = ComplexityCalculator(active.coefficients if active else None).factors
+
+        result = await calibrate_complexity_factors(
+            db, ridge_alpha=args.alpha, prior=prior, chunk_size=args.chunk_size
+        )
+        print(f"Projects used: {result.sample_count}")
+        if result.sample_count < args.min_samples:
+            print(f"Not enough completed projects (minimum {args.min_samples}); nothing stored")
+            return
+
+        print(f"R^2: {result.r_squared}  RMSE: {result.rmse}")
+        for name, value in result.coefficients.items():
+            print(f"  {name:<25} {prior.get(name, 0):.3f} -> {value:.3f}")
+
+        if args.activate:
+            await cache.connect()
+        try:
+            coefficient_set = await store_calibration(db, result, notes=args.notes, activate=args.activate)
+        finally:
+            if args.activate:
+                await cache.disconnect()
+        print(f"Stored coefficient set version {coefficient_set.version}"
+              f"{' (active)' if args.activate else ''}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alpha", type=float, default=1.0, help="Ridge strength (0 = least squares)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--min-samples", type=int, default=30)
+    parser.add_argument("--activate", action="store_true", help="Activate the new set")
+    parser.add_argument("--notes", default=None)
+    asyncio.run(main(parser.parse_args()))
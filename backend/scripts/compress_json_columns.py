@@ -0,0 +1,70 @@
+"""Compress existing equipment_list payloads above the size threshold.
+
+Run once after the compress_large_json_columns migration. Rows are processed
+in id order in small batches, so the script can be interrupted and re-run.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from app.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.types import decode_json, encode_json
+
+BATCH_SIZE = 200
+
+
+async def main():
+    threshold = settings.JSON_COMPRESSION_THRESHOLD
+    level = settings.JSON_COMPRESSION_LEVEL
+    last_id = None
+    scanned = 0
+    compressed = 0
+    bytes_before = 0
+    bytes_after = 0
+
+    async with AsyncSessionLocal() as db:
+        while True:
+            result = await db.execute(
+                text("""
+                    SELECT id, equipment_list
+                    FROM projects
+                    WHERE get_byte(equipment_list, 0) = 106
+                      AND octet_length(equipment_list) > :threshold
+                      AND (CAST(:last_id AS uuid) IS NULL OR id > CAST(:last_id AS uuid))
+                    ORDER BY id
+                    LIMIT :batch_size
+                """),
+                {"threshold": threshold, "last_id": last_id, "batch_size": BATCH_SIZE}
+            )
+            rows = result.fetchall()
+            if not rows:
+                break
+
+            for row_id, payload in rows:
+                payload = bytes(payload)
+                new_payload = encode_json(decode_json(payload), threshold, level)
+                scanned += 1
+                if len(new_payload) < len(payload):
+                    await db.execute(
+                        text("UPDATE projects SET equipment_list = :payload WHERE id = :id"),
+                        {"payload": new_payload, "id": row_id}
+                    )
+                    compressed += 1
+                    bytes_before += len(payload)
+                    bytes_after += len(new_payload)
+
+            await db.commit()
+            last_id = str(rows[-1][0])
+
+    print(f"Scanned {scanned} large equipment lists, compressed {compressed}")
+    if compressed:
+        print(f"Stored size: {bytes_before:,} -> {bytes_after:,} bytes "
+              f"({bytes_after / bytes_before:.1%})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
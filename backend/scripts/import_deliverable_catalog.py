@@ -0,0 +1,48 @@
+"""Import the Engineering Master Deliverables List into the deliverable catalog.
+
+Accepts the master workbook and/or the per-phase CSV exports. Rows are
+streamed and upserted in batches, then the per-phase PHASE_GATE templates
+are rebuilt. The same import is available as the deliverable_catalog_import
+background job.
+
+Usage:
+    python scripts/import_deliverable_catalog.py "../Engineering Master Deliverables List.xlsx"
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.services.catalog_import import DEFAULT_BATCH_SIZE, import_deliverable_catalog
+
+
+async def main(args):
+    paths = [Path(p) for p in args.paths]
+    missing = [str(p) for p in paths if not p.is_file()]
+    if missing:
+        print(f"File not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    async def progress(percent, message):
+        print(f"[{percent:5.1f}%] {message}")
+
+    async with AsyncSessionLocal() as db:
+        result = await import_deliverable_catalog(db, paths, batch_size=args.batch_size, progress=progress)
+
+    print(f"Rows read: {result.rows_read}")
+    print(f"Upserted:  {result.upserted}")
+    print(f"Skipped:   {result.skipped}")
+    for error in result.errors:
+        print(f"  {error}")
+    for name in result.templates:
+        print(f"Rebuilt template: {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import the master deliverables list")
+    parser.add_argument("paths", nargs="+", help=".xlsx workbook and/or phase .csv files")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per upsert batch")
+    asyncio.run(main(parser.parse_args()))
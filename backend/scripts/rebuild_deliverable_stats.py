@@ -0,0 +1,72 @@
+"""Rebuild deliverable actual / estimated statistics from scratch.
+
+The stats table is maintained incrementally on every deliverable write; this
+script seeds it after the add_deliverable_actual_stats migration (or repairs
+it) by streaming every completed deliverable with actuals once.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, insert, select
+from app.core.database import AsyncSessionLocal
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.deliverable_stats import DeliverableActualStats
+from app.domain.stats import RunningStats
+from app.services.estimation.historical_stats import observation_ratio, stats_keys
+
+BATCH_SIZE = 1000
+
+
+async def main():
+    stats = {}
+    scanned = 0
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            select(
+                Deliverable.name,
+                Deliverable.discipline,
+                Deliverable.hours_total,
+                Deliverable.actual_hours_total
+            )
+            .where(
+                Deliverable.status == DeliverableStatus.COMPLETED,
+                Deliverable.actual_hours_total.isnot(None)
+            )
+            .execution_options(yield_per=BATCH_SIZE)
+        )
+        async for name, discipline, hours_total, actual_hours_total in result:
+            scanned += 1
+            ratio = observation_ratio(hours_total, actual_hours_total)
+            if ratio is None or not name:
+                continue
+            for key in stats_keys(name, discipline):
+                stats.setdefault(key, RunningStats()).add(ratio)
+
+        await db.execute(delete(DeliverableActualStats))
+        if stats:
+            await db.execute(
+                insert(DeliverableActualStats),
+                [
+                    {
+                        "deliverable_name": name,
+                        "deliverable_type": deliverable_type,
+                        "discipline": discipline,
+                        "sample_count": s.count,
+                        "mean_ratio": s.mean,
+                        "m2": s.m2,
+                    }
+                    for (name, deliverable_type, discipline), s in stats.items()
+                ]
+            )
+        await db.commit()
+
+    print(f"Scanned {scanned} completed deliverables with actuals")
+    print(f"Wrote {len(stats)} statistics rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+"""Rebuild per-project earned value counters from scratch.
+
+The counters are maintained incrementally on every deliverable write made
+through the ORM; bulk SQL updates bypass that, so run this after them (the
+add_project_evm_counters migration seeds the table itself).
+
+Usage:
+    python scripts/rebuild_evm_counters.py [project_id ...]
+"""
+import asyncio
+import sys
+from pathlib import Path
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import AsyncSessionLocal
+from app.services.evm import rebuild_counters
+
+
+async def main(project_ids):
+    async with AsyncSessionLocal() as db:
+        written = await rebuild_counters(db, project_ids or None)
+        await db.commit()
+
+    print(f"Wrote {written} EVM counter rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main([UUID(arg) for arg in sys.argv[1:]]))
@@ -0,0 +1,106 @@
+"""Unit tests for the analog project index."""
+
+import random
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.models.project import EngineeringDiscipline, ProjectSize, ProjectStatus, WorkType
+from app.services.analogs import AnalogIndex, FeatureEncoder
+
+
+def make_row(**overrides):
+    """Project row as returned by the analog query."""
+    row = {
+        "id": uuid4(),
+        "name": "Project",
+        "status": ProjectStatus.COMPLETED,
+        "size": ProjectSize.MEDIUM,
+        "discipline": EngineeringDiscipline.MECHANICAL,
+        "selected_disciplines": [],
+        "complexity_factors": {},
+        "client_complexity": 5,
+        "total_hours": 1200,
+        "work_type": WorkType.CONVENTIONAL,
+        "actual_hours": 1300,
+    }
+    row.update(overrides)
+    return row
+
+
+def random_row(rng: random.Random):
+    return make_row(
+        status=rng.choice(list(ProjectStatus)),
+        size=rng.choice(list(ProjectSize)),
+        discipline=rng.choice(list(EngineeringDiscipline)),
+        selected_disciplines=rng.sample([d.value for d in EngineeringDiscipline], rng.randint(0, 3)),
+        complexity_factors={"fasttrack": rng.random() < 0.3, "brownfield": rng.random() < 0.4},
+        client_complexity=rng.randint(1, 10),
+        total_hours=rng.randint(100, 20000),
+        work_type=rng.choice(list(WorkType)),
+    )
+
+
+def test_encoder_produces_unit_vectors():
+    """Test that identical projects have similarity 1 and differences lower it."""
+    encoder = FeatureEncoder()
+    a = encoder.encode(make_row())
+    b = encoder.encode(make_row(size=ProjectSize.LARGE, total_hours=9000))
+
+    assert a.shape == (encoder.dim,)
+    assert np.linalg.norm(a) == pytest.approx(1.0, abs=1e-6)
+    assert float(a @ encoder.encode(make_row())) == pytest.approx(1.0, abs=1e-6)
+    assert float(a @ b) < 0.9
+
+
+def test_query_returns_most_similar_completed_projects():
+    """Test ranking, eligibility and exclusion."""
+    index = AnalogIndex(capacity=2)
+    query = make_row(status=ProjectStatus.DRAFT)
+    twin = make_row(name="Twin")
+    near = make_row(name="Near", total_hours=1500)
+    far = make_row(name="Far", discipline=EngineeringDiscipline.CIVIL, size=ProjectSize.SMALL, total_hours=150)
+    active = make_row(name="Active twin", status=ProjectStatus.ACTIVE)
+
+    for row in (query, far, near, active, twin):
+        index.upsert(row)
+
+    results = index.query(index.encoder.encode(query), k=3, exclude=[query["id"]])
+
+    assert [outcome["name"] for outcome, _ in results] == ["Twin", "Near", "Far"]
+    assert results[0][1] == pytest.approx(1.0, abs=1e-6)
+    assert results[0][0]["actual_hours"] == 1300
+
+
+def test_incremental_updates_match_rebuild():
+    """Test that upserts and swap-removals leave the same ranking as a fresh index."""
+    rng = random.Random(3)
+    rows = [random_row(rng) for _ in range(500)]
+
+    incremental = AnalogIndex(capacity=16)
+    for row in rows:
+        incremental.upsert(row)
+    removed = rows[::7]
+    for row in removed:
+        assert incremental.remove(row["id"])
+    for row in rows[1::5]:
+        if row in removed:
+            continue
+        row["status"] = ProjectStatus.COMPLETED
+        row["total_hours"] += 100
+        incremental.upsert(row)
+
+    kept = [row for row in rows if row not in removed]
+    rebuilt = AnalogIndex()
+    for row in kept:
+        rebuilt.upsert(row)
+
+    query = rebuilt.encoder.encode(random_row(rng))
+    a = incremental.query(query, k=20)
+    b = rebuilt.query(query, k=20)
+
+    assert len(incremental) == len(kept)
+    assert removed[0]["id"] not in incremental
+    assert [round(s, 5) for _, s in a] == [round(s, 5) for _, s in b]
+    assert all(o["project_id"] in rebuilt for o, _ in a)
@@ -0,0 +1,165 @@
+"""Unit tests for the batched audit log writer."""
+
+from uuid import uuid4
+import asyncio
+
+import pytest
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.audit import AuditAction
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.project import Project
+from app.models.user import User
+from app.services.audit import MAX_BATCH_ATTEMPTS, AuditWriter, collect_changes
+
+
+class RecordingWrite:
+    """Batch writer that records batches and can be told to fail."""
+
+    def __init__(self):
+        self.batches = []
+        self.fail = False
+        self.reject = set()
+
+    async def __call__(self, records):
+        if self.fail or any(r["entity_id"] in self.reject for r in records):
+            raise ConnectionError("database unavailable")
+        self.batches.append(list(records))
+
+
+def records(n):
+    return [{"entity_id": i} for i in range(n)]
+
+
+def test_collect_changes(fake_session):
+    """Test create, update and delete records with old and new values."""
+    project_id = uuid4()
+    created = Deliverable(id=uuid4(), project_id=project_id, name="P&ID", hours_total=40)
+
+    updated = Deliverable()
+    for attr, value in dict(id=uuid4(), project_id=project_id, name="PFD", hours_total=80,
+                            status=DeliverableStatus.IN_PROGRESS).items():
+        set_committed_value(updated, attr, value)
+    updated.hours_total = 100
+    updated.status = DeliverableStatus.COMPLETED
+
+    deleted = Deliverable()
+    for attr, value in dict(id=uuid4(), project_id=project_id, name="HAZOP").items():
+        set_committed_value(deleted, attr, value)
+
+    changes = {r["action"]: r for r in collect_changes(
+        fake_session(new=[created, User(email="x@example.com")], dirty=[updated], deleted=[deleted])
+    )}
+
+    assert set(changes) == {AuditAction.CREATE, AuditAction.UPDATE, AuditAction.DELETE}
+    assert changes[AuditAction.CREATE]["new_values"]["name"] == "P&ID"
+    assert changes[AuditAction.CREATE]["new_values"]["project_id"] == str(project_id)
+    assert changes[AuditAction.UPDATE]["old_values"] == {"hours_total": 80, "status": "in_progress"}
+    assert changes[AuditAction.UPDATE]["new_values"] == {"hours_total": 100, "status": "completed"}
+    assert changes[AuditAction.DELETE]["old_values"]["name"] == "HAZOP"
+    assert all(r["project_id"] == project_id and r["entity_type"] == "Deliverable" for r in changes.values())
+
+
+def test_project_delete_is_not_linked_to_the_deleted_project(fake_session):
+    """Test that deleting a project and its deliverables leaves project_id empty."""
+    project_id, other_id = uuid4(), uuid4()
+    project = Project()
+    for attr, value in dict(id=project_id, name="Plant").items():
+        set_committed_value(project, attr, value)
+    deliverables = []
+    for owner in (project_id, other_id):
+        deliverable = Deliverable()
+        for attr, value in dict(id=uuid4(), project_id=owner, name="P&ID").items():
+            set_committed_value(deliverable, attr, value)
+        deliverables.append(deliverable)
+
+    changes = collect_changes(fake_session(deleted=[project, *deliverables]))
+    by_entity = {r["entity_id"]: r for r in changes}
+
+    for entity in (project, deliverables[0]):
+        assert by_entity[entity.id]["project_id"] is None
+        assert by_entity[entity.id]["metadata"] == {"project_id": str(project_id)}
+    assert by_entity[project_id]["old_values"]["name"] == "Plant"
+    # Deleting a deliverable of a project that is kept still links it
+    assert by_entity[deliverables[1].id]["project_id"] == other_id
+    assert "metadata" not in by_entity[deliverables[1].id]
+
+
+async def test_flush_writes_in_batches():
+    """Test that a flush drains the queue in batch-sized inserts."""
+    write = RecordingWrite()
+    writer = AuditWriter(max_size=100, batch_size=4, flush_interval=60, write=write)
+    writer.enqueue(records(10))
+
+    assert await writer.flush() == 10
+    assert [len(b) for b in write.batches] == [4, 4, 2]
+    assert writer.metrics()["written"] == 10
+    assert writer.metrics()["depth"] == 0
+
+
+async def test_overflow_is_dropped_and_counted():
+    """Test that records beyond the queue bound are dropped."""
+    writer = AuditWriter(max_size=5, batch_size=100, flush_interval=60, write=RecordingWrite())
+
+    assert writer.enqueue(records(3)) == 3
+    assert writer.enqueue(records(4)) == 2
+    metrics = writer.metrics()
+    assert metrics["depth"] == 5
+    assert metrics["enqueued"] == 5
+    assert metrics["dropped"] == 2
+
+
+async def test_failed_batch_is_requeued():
+    """Test that a failed insert keeps the batch for the next flush."""
+    write = RecordingWrite()
+    writer = AuditWriter(max_size=10, batch_size=10, flush_interval=60, write=write)
+    writer.enqueue(records(3))
+
+    write.fail = True
+    with pytest.raises(ConnectionError):
+        await writer.flush()
+    assert writer.metrics()["failed_flushes"] == 1
+    assert writer.metrics()["depth"] == 3
+
+    write.fail = False
+    await writer.flush()
+    assert [r["entity_id"] for r in write.batches[0]] == [0, 1, 2]
+
+
+async def test_failing_batch_is_written_row_by_row():
+    """Test that a batch that keeps failing does not hold up the queue."""
+    write = RecordingWrite()
+    write.reject = {1}
+    writer = AuditWriter(max_size=10, batch_size=10, flush_interval=60, write=write)
+    writer.enqueue(records(3))
+
+    for _ in range(MAX_BATCH_ATTEMPTS - 1):
+        with pytest.raises(ConnectionError):
+            await writer.flush()
+        assert writer.metrics()["depth"] == 3
+
+    assert await writer.flush() == 2
+    metrics = writer.metrics()
+    assert [r["entity_id"] for b in write.batches for r in b] == [0, 2]
+    assert metrics["rejected"] == 1
+    assert metrics["depth"] == 0
+
+    writer.enqueue(records(2)[:1])
+    assert await writer.flush() == 1
+    assert write.batches[-1] == [{"entity_id": 0}]
+
+
+async def test_full_batch_flushes_before_interval_and_stop_flushes_rest():
+    """Test size-triggered flushes and the final flush on stop."""
+    write = RecordingWrite()
+    writer = AuditWriter(max_size=100, batch_size=5, flush_interval=60, write=write)
+    writer.start()
+
+    writer.enqueue(records(5))
+    await asyncio.sleep(0.05)
+    assert [len(b) for b in write.batches] == [5]
+
+    writer.enqueue(records(2))
+    await writer.stop()
+    assert [len(b) for b in write.batches] == [5, 2]
+    assert not writer.running
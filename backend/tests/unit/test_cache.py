@@ -0,0 +1,129 @@
+"""Unit tests for the two-tier cache."""
+
+import asyncio
+
+import pytest
+from app.core.cache import CacheManager, LRUCache, company_tag, rate_sheet_tag
+
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_server():
+    """Shared fake Redis server (one per test)."""
+    return fakeredis.FakeServer()
+
+
+def make_cache(server=None) -> CacheManager:
+    """Create a cache manager backed by fake Redis, or local-only."""
+    if server is None:
+        return CacheManager()
+    client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    return CacheManager(redis_client=client)
+
+
+def test_lru_evicts_least_recently_used():
+    """Test that the local tier evicts the oldest untouched entry."""
+    lru = LRUCache(max_entries=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+
+    assert lru.get("a") == 1
+    assert lru.get("b") is None
+    assert lru.get("c") == 3
+
+
+def test_lru_invalidate_tags():
+    """Test that tagged entries are dropped together."""
+    lru = LRUCache()
+    lru.set("company", 1, tags=[company_tag(1)])
+    lru.set("sheet", 2, tags=[company_tag(1), rate_sheet_tag(9)])
+    lru.set("other", 3, tags=[company_tag(2)])
+
+    assert lru.invalidate_tags([company_tag(1)]) == 2
+    assert lru.get("company") is None
+    assert lru.get("sheet") is None
+    assert lru.get("other") == 3
+
+
+async def test_local_only_when_redis_missing():
+    """Test graceful degradation without Redis."""
+    cache = make_cache()
+
+    assert await cache.set("key", {"a": 1}, tags=[company_tag(1)]) is False
+    assert await cache.get("key") == {"a": 1}
+
+    await cache.invalidate_tags(company_tag(1))
+    assert await cache.get("key") is None
+
+
+async def test_redis_tier_shared_between_workers(redis_server):
+    """Test that a second worker reads through to Redis."""
+    worker_a = make_cache(redis_server)
+    worker_b = make_cache(redis_server)
+
+    await worker_a.set("key", [1, 2, 3])
+
+    assert await worker_b.get("key") == [1, 2, 3]
+    assert worker_b.stats["redis_hits"] == 1
+
+
+async def test_tag_invalidation_propagates(redis_server):
+    """Test that invalidation clears Redis and other workers' local tier."""
+    worker_a = make_cache(redis_server)
+    worker_b = make_cache(redis_server)
+    await worker_a.connect()
+    await worker_b.connect()
+
+    try:
+        await worker_a.set("sheet", {"rate": 100}, tags=[rate_sheet_tag(1)])
+        assert await worker_b.get("sheet") == {"rate": 100}
+
+        await worker_a.invalidate_tags(rate_sheet_tag(1))
+
+        for _ in range(50):
+            if worker_b.stats["invalidations_received"]:
+                break
+            await asyncio.sleep(0.02)
+
+        assert worker_b.local.get("sheet") is None
+        assert await worker_b.get("sheet") is None
+    finally:
+        await worker_a.disconnect()
+        await worker_b.disconnect()
+
+
+async def test_get_or_set_single_flight(redis_server):
+    """Test that concurrent misses call the loader once."""
+    cache = make_cache(redis_server)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"value": 42}
+
+    results = await asyncio.gather(*[cache.get_or_set("key", loader) for _ in range(10)])
+
+    assert calls == 1
+    assert all(r == {"value": 42} for r in results)
+
+
+async def test_get_or_set_propagates_loader_errors():
+    """Test that loader errors reach every waiting caller."""
+    cache = make_cache()
+
+    async def loader():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *[cache.get_or_set("key", loader) for _ in range(3)],
+        return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
@@ -0,0 +1,86 @@
+"""Unit tests for complexity coefficient calibration."""
+
+import numpy as np
+import pytest
+
+from app.services.estimation.calibration import NormalEquations, calibration_targets
+from app.services.estimation.complexity import ComplexityCalculator
+from app.services.estimation.engine import EstimationEngine
+from app.models.project import ProjectSize, ClientProfile
+
+
+FACTORS = ["fasttrack", "brownfield", "regulatory"]
+TRUE_COEFFICIENTS = np.array([0.45, 0.10, 0.20])
+
+
+def synthetic_projects(n: int, seed: int = 7):
+    """Random factor combinations with actuals from known coefficients."""
+    rng = np.random.default_rng(seed)
+    x = rng.integers(0, 2, size=(n, len(FACTORS))).astype(float)
+    y = x @ TRUE_COEFFICIENTS + rng.normal(0, 0.02, size=n)
+    factors = [dict(zip(FACTORS, map(bool, row))) for row in x]
+    return factors, y
+
+
+def test_streamed_fit_matches_single_batch():
+    """Test that chunked accumulation gives the same fit as one batch."""
+    factors, y = synthetic_projects(5000)
+
+    streamed = NormalEquations(FACTORS)
+    for start in range(0, len(y), 700):
+        chunk = factors[start:start + 700]
+        streamed.add_batch(streamed.design_matrix(chunk), y[start:start + 700])
+
+    single = NormalEquations(FACTORS)
+    single.add_batch(single.design_matrix(factors), y)
+
+    a = streamed.solve(ridge_alpha=0)
+    b = single.solve(ridge_alpha=0)
+
+    assert a.sample_count == 5000
+    assert a.coefficients == b.coefficients
+    assert np.allclose(list(a.coefficients.values()), TRUE_COEFFICIENTS, atol=0.01)
+    assert a.r_squared > 0.9
+
+
+def test_ridge_shrinks_towards_prior():
+    """Test that sparse history stays close to the prior coefficients."""
+    factors, y = synthetic_projects(5)
+    prior = {"fasttrack": 0.30, "brownfield": 0.25, "regulatory": 0.15}
+
+    equations = NormalEquations(FACTORS)
+    equations.add_batch(equations.design_matrix(factors), y)
+    result = equations.solve(ridge_alpha=1000, prior=prior)
+
+    for name, value in prior.items():
+        assert result.coefficients[name] == pytest.approx(value, abs=0.01)
+
+
+def test_calibration_targets_remove_client_multiplier():
+    """Test that targets are relative to base hours times client multiplier."""
+    _, y = calibration_targets([
+        ({"fasttrack": True}, 100, 1.3, 143, 143),  # client multiplier 1.1
+        ({}, 200, 1.0, None, 250),
+    ])
+
+    assert y == pytest.approx([0.3, 0.25])
+
+
+def test_engine_hot_swaps_coefficients():
+    """Test that the engine uses the swapped coefficient set."""
+    engine = EstimationEngine()
+    args = dict(
+        project_size=ProjectSize.SMALL,
+        complexity_factors={"fasttrack": True},
+        client_profile=ClientProfile.TYPE_B,
+        resource_availability={},
+        base_hours_override=1000
+    )
+
+    default = engine.calculate_estimate(**args)
+    engine.use_coefficients({"fasttrack": 0.5}, version=3)
+    calibrated = engine.calculate_estimate(**args)
+
+    assert default.complexity_multiplier == pytest.approx(1.0 + ComplexityCalculator.COMPLEXITY_FACTORS["fasttrack"])
+    assert calibrated.complexity_multiplier == pytest.approx(1.5)
+    assert engine.coefficient_version == 3
@@ -0,0 +1,139 @@
+"""Unit tests for the campaign estimator."""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.estimation import MAX_CAMPAIGN_DISCIPLINES, MAX_SCHEDULED_DELIVERABLES, CampaignEstimateRequest
+from app.services.estimation.campaign import campaign_estimator, estimate_campaign, occurrence_matrix
+
+
+def test_occurrence_matrix_frequencies():
+    """Test occurrences per month for each frequency."""
+    occurrences = occurrence_matrix([
+        {"frequency": "Quarterly", "month": 2},
+        {"frequency": None, "month": 3},
+        {"frequency": "semi_annual"},
+        {"frequency": "weekly", "month": 5},
+    ], 8)
+
+    assert occurrences[0].tolist() == [0, 1, 0, 0, 1, 0, 0, 1]
+    assert occurrences[1].tolist() == [0, 0, 1, 0, 0, 0, 0, 0]
+    assert occurrences[2].tolist() == [1, 0, 0, 0, 0, 0, 1, 0]
+    assert occurrences[3][:4].sum() == 0
+    assert occurrences[3][4:] == pytest.approx([52 / 12] * 4)
+
+
+def test_unknown_frequency_and_pricing_model():
+    """Test that invalid inputs raise ValueError."""
+    with pytest.raises(ValueError):
+        occurrence_matrix([{"frequency": "fortnightly"}], 3)
+    with pytest.raises(ValueError):
+        campaign_estimator.estimate(duration_months=3, site_count=1, monthly_hours={}, pricing_model="BARTER")
+
+
+def test_campaign_array_matches_loop():
+    """Test the month x discipline x site array against a direct calculation."""
+    estimate = campaign_estimator.estimate(
+        duration_months=24,
+        site_count=3,
+        monthly_hours={"civil": 10, "mechanical": 20},
+        scheduled_deliverables=[
+            {"name": "Site Audit", "discipline": "mechanical", "hours": 16, "frequency": "annual"},
+            {"name": "Status Report", "hours": 6, "frequency": "monthly", "per_site": False},
+        ],
+        discipline_rates={"civil": 90},
+        hourly_rate=100,
+        site_stagger_months=2,
+        annual_escalation_percent=10,
+    )
+
+    assert estimate.disciplines == ["civil", "mechanical", "project"]
+    assert estimate.hours.shape == (24, 3, 3)
+    # Site 3 onboards in month 5, with its first annual audit
+    assert estimate.hours[3, :, 2].sum() == 0
+    assert estimate.hours[4, :, 2].tolist() == [10, 20 + 16, 2]
+    # Campaign-level report shared by the active sites only
+    assert estimate.hours[0, 2].tolist() == [6, 0, 0]
+    assert estimate.hours[:, 2].sum() == pytest.approx(6 * 24)
+    # Annual audit in each site's first and thirteenth month
+    assert estimate.hours[12, 1].tolist() == [36, 20, 20]
+    assert estimate.hours[14, 1].tolist() == [20, 36, 20]
+    assert estimate.hours[16, 1].tolist() == [20, 20, 36]
+
+    expected_cost = 0.0
+    for month in range(24):
+        for site in range(3):
+            if month < site * 2:
+                continue
+            escalation = 1.1 ** (month // 12)
+            audit = 16 if (month - site * 2) % 12 == 0 else 0
+            expected_cost += (10 * 90 + (20 + audit) * 100) * escalation
+        expected_cost += 6 * 100 * 1.1 ** (month // 12)
+    assert estimate.cost.sum() == pytest.approx(expected_cost)
+
+
+def test_staggered_sites_get_their_own_schedule():
+    """Test that per-site items are scheduled from each site's onboarding month."""
+    estimate = campaign_estimator.estimate(
+        duration_months=12,
+        site_count=3,
+        monthly_hours={},
+        scheduled_deliverables=[
+            {"name": "Commissioning", "discipline": "electrical", "hours": 40},
+            {"name": "Inspection", "discipline": "electrical", "hours": 5, "frequency": "quarterly", "month": 2},
+        ],
+        site_stagger_months=2,
+    )
+
+    commissioning = estimate.hours[:, 0]
+    assert commissioning.sum(axis=0).tolist() == [40 + 20, 40 + 15, 40 + 15]
+    # One-time item in each site's first month, inspections from its second
+    assert commissioning[:, 2].tolist() == [0, 0, 0, 0, 40, 5, 0, 0, 5, 0, 0, 5]
+    assert estimate.hours.sum() == pytest.approx(3 * 40 + 10 * 5)
+
+
+def test_campaign_request_limits():
+    """Test that the request bounds the array dimensions."""
+    CampaignEstimateRequest(duration_months=12, monthly_hours={f"d{i}": 1 for i in range(MAX_CAMPAIGN_DISCIPLINES)})
+    with pytest.raises(ValidationError):
+        CampaignEstimateRequest(
+            duration_months=12, monthly_hours={f"d{i}": 1 for i in range(MAX_CAMPAIGN_DISCIPLINES + 1)}
+        )
+    with pytest.raises(ValidationError):
+        CampaignEstimateRequest(
+            duration_months=12,
+            scheduled_deliverables=[{"name": "x", "hours": 1}] * (MAX_SCHEDULED_DELIVERABLES + 1),
+        )
+    with pytest.raises(ValidationError, match="distinct disciplines"):
+        CampaignEstimateRequest(
+            duration_months=12,
+            monthly_hours={f"d{i}": 1 for i in range(MAX_CAMPAIGN_DISCIPLINES)},
+            scheduled_deliverables=[{"name": "x", "discipline": "extra", "hours": 1}],
+        )
+
+
+@pytest.mark.parametrize("pricing_model", ["MONTHLY_RETAINER", "TIME_AND_MATERIALS", "HYBRID"])
+def test_pricing_models(pricing_model):
+    """Test how the pricing model spreads billing over the months."""
+    result = estimate_campaign(
+        duration_months=12,
+        site_count=4,
+        monthly_hours={"electrical": 5},
+        site_stagger_months=3,
+        pricing_model=pricing_model,
+    )
+
+    billed = np.array([m["billed"] for m in result["by_month"]])
+    cost = np.array([m["cost"] for m in result["by_month"]])
+    if pricing_model == "MONTHLY_RETAINER":
+        assert np.allclose(billed, billed[0])
+        assert billed.sum() == pytest.approx(cost.sum(), abs=0.05)
+    elif pricing_model == "TIME_AND_MATERIALS":
+        assert billed.tolist() == cost.tolist()
+    else:
+        assert (billed >= cost).all()
+        assert billed.min() == pytest.approx(np.median(cost))
+    assert len(result["by_site"]) == 4
+    assert result["by_site"][0]["hours"] == 60
+    assert result["summary"]["peak_month"] == 10
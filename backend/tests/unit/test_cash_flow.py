@@ -0,0 +1,72 @@
+"""Unit tests for the cash-flow generator."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from app.data.role_rates import DEFAULT_RATES
+from app.services.cost.cash_flow import build_cash_flow, loading_profile
+from app.services.cost.cost_calculator import CostCalculator
+
+
+def test_loading_profile():
+    """Test that unscheduled work ramps up and sums to one."""
+    profile = loading_profile(8)
+
+    assert profile.sum() == pytest.approx(1.0)
+    assert profile[0] > profile[4]
+    assert profile[3] > profile[4]
+
+
+def test_scheduled_deliverables_spread_over_their_weeks():
+    """Test the week x role matrix for scheduled deliverables."""
+    deliverables = [
+        # Wednesday start: week 1 is the week of Monday 6 January
+        {"name": "P&ID", "hours": 90, "start_date": date(2025, 1, 8), "end_date": date(2025, 1, 22)},
+        {"name": "Line List", "hours": 40, "start_date": date(2025, 2, 3), "end_date": date(2025, 2, 3)},
+    ]
+
+    cash_flow = build_cash_flow(deliverables, duration_weeks=4)
+
+    assert cash_flow.start == date(2025, 1, 6)
+    weekly = cash_flow.hours.sum(axis=1)
+    assert weekly.tolist() == pytest.approx([30, 30, 30, 0, 40])
+    assert cash_flow.hours.sum() == pytest.approx(130)
+
+    calculator = CostCalculator()
+    expected = sum(calculator.calculate_deliverable_cost(d["name"], d["hours"]).total_cost for d in deliverables)
+    assert cash_flow.cost.sum() == pytest.approx(expected, rel=0.01)
+
+
+def test_s_curve_invoices_and_roles():
+    """Test cumulative S-curve, monthly buckets and cost by role."""
+    deliverables = [
+        {"name": "Specification", "hours": 100, "start_date": date(2025, 1, 27), "end_date": date(2025, 2, 14)},
+        {"name": "Unscheduled Report", "hours": 60},
+    ]
+
+    cash_flow = build_cash_flow(deliverables, duration_weeks=6)
+    document = cash_flow.to_dict()
+
+    weeks = document["weeks"]
+    assert weeks[-1]["cumulative_percent"] == 100.0
+    assert all(a["cumulative_cost"] <= b["cumulative_cost"] for a, b in zip(weeks, weeks[1:]))
+    assert [i["month"] for i in document["invoices"]] == ["2025-01", "2025-02", "2025-03"]
+    assert document["invoices"][-1]["cumulative"] == pytest.approx(document["total_cost"], abs=0.05)
+    assert sum(i["amount"] for i in document["invoices"]) == pytest.approx(document["total_cost"], abs=0.05)
+
+    roles = cash_flow.by_role()
+    assert sum(r["hours"] for r in roles.values()) == pytest.approx(160)
+    assert roles["senior_engineer"]["cost"] == pytest.approx(
+        roles["senior_engineer"]["hours"] * DEFAULT_RATES["senior_engineer"], abs=0.05
+    )
+
+
+def test_empty_project():
+    """Test that a project without deliverables yields an empty curve."""
+    cash_flow = build_cash_flow([], start=date(2025, 3, 5), duration_weeks=2)
+
+    assert cash_flow.start == date(2025, 3, 3)
+    assert np.all(cash_flow.cost == 0)
+    assert cash_flow.to_dict()["weeks"][0]["cumulative_percent"] == 0.0
@@ -0,0 +1,99 @@
+"""Unit tests for the deliverable catalog importer."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from openpyxl import Workbook
+
+from app.services.catalog_import import CatalogRowError, SourceRow, read_source, sync_phase_template, validate_row
+
+
+CSV_ROWS = """Master Deliverables List,Unnamed: 1,Unnamed: 2,Unnamed: 3,Unnamed: 4,Unnamed: 5
+Screen Stage,,,,,
+Item No., Deliverable Description  , Status  , Status  , Discipline  , Notes  
+1,Process Description / PFD,Prelim,IFR, Process  ,
+2,General Arrangement,prelim,,C/S,Used for TIC basis
+,,,,,
+* Prelim = preliminary issue,,,,,
+3,Cost Estimate,Final,,PM,
+"""
+
+
+def test_read_csv_detects_phase_header_and_statuses(tmp_path):
+    """Test that the stage row sets the phase and every Status column is kept."""
+    path = tmp_path / "export.csv"
+    path.write_text(CSV_ROWS)
+
+    rows = list(read_source(path))
+
+    assert [r.values["item_no"] for r in rows] == ["1", "2", "3"]
+    assert {r.phase for r in rows} == {"screen"}
+    first = validate_row(rows[0])
+    assert first["name"] == "Process Description / PFD"
+    assert first["statuses"] == ["Prelim", "IFR"]
+    assert first["milestone"] == "ifr"
+    assert validate_row(rows[1])["discipline"] == "civil"
+    assert validate_row(rows[1])["notes"] == "Used for TIC basis"
+    assert validate_row(rows[2])["discipline"] == "project"
+
+
+def test_read_workbook_uses_sheet_title_as_phase(tmp_path):
+    """Test that each sheet of a workbook is imported under its own phase."""
+    workbook = Workbook()
+    frame = workbook.active
+    frame.title = "Frame"
+    frame.append(["Master Deliverables List"])
+    frame.append(["Item No.", "Deliverable Description", "Status", "Discipline", "Notes"])
+    frame.append([1, "Process Design Basis", "Prelim", "Process", None])
+    refine = workbook.create_sheet("Refine")
+    refine.append(["Item No.", "Deliverable Description", "Status", "Discipline", "Notes"])
+    refine.append([1.1, "Line List", "IFC", "Piping", None])
+    path = tmp_path / "master.xlsx"
+    workbook.save(path)
+
+    rows = [validate_row(r) for r in read_source(path)]
+
+    assert [(r["phase"], r["name"], r["item_no"]) for r in rows] == [
+        ("frame", "Process Design Basis", 1.0),
+        ("refine", "Line List", 1.1),
+    ]
+    assert rows[1]["milestone"] == "ifc"
+
+
+@pytest.mark.parametrize("phase, values, message", [
+    (None, {"item_no": 1, "name": "PFD", "discipline": "process"}, "unknown phase"),
+    ("frame", {"item_no": "x", "name": "PFD", "discipline": "process"}, "invalid item number"),
+    ("frame", {"item_no": 1, "name": None, "discipline": "process"}, "missing deliverable description"),
+    ("frame", {"item_no": 1, "name": "PFD", "discipline": "geology"}, "unknown discipline"),
+])
+def test_validate_row_errors(phase, values, message):
+    """Test that unusable rows are rejected with their location."""
+    row = SourceRow(source="Frame.csv", line=7, phase=phase, values={"statuses": [], **values})
+
+    with pytest.raises(CatalogRowError, match=message) as exc_info:
+        validate_row(row)
+
+    assert str(exc_info.value).startswith("Frame.csv:7")
+
+
+def test_read_source_rejects_unknown_type():
+    """Test that only workbooks and CSV files are accepted."""
+    with pytest.raises(ValueError):
+        read_source(Path("deliverables.txt"))
+
+
+async def test_new_phase_templates_are_not_defaults():
+    """Test that generic phase templates never compete for the PHASE_GATE default."""
+    statements = []
+
+    class RecordingSession:
+        async def execute(self, statement):
+            statements.append(statement)
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(first=lambda: None))
+
+    await sync_phase_template(RecordingSession(), "SCREEN")
+
+    insert = statements[-1].compile()
+    assert insert.params["project_size"] == "PHASE_GATE"
+    assert insert.params["is_default"] is False
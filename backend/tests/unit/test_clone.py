@@ -0,0 +1,119 @@
+"""Unit tests for set-based deep clone."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.rate_sheet import RateSheet
+from app.services import clone
+from app.services.clone import PROJECT_CHILD_MODELS, copy_rows, remap_id
+
+
+class Result:
+    """Execute result with a row count and scalar rows."""
+
+    def __init__(self, rows=(), rowcount=0):
+        self.rows, self.rowcount = list(rows), rowcount
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class RecordingSession:
+    """Session that compiles and records statements instead of running them."""
+
+    def __init__(self, tree=()):
+        self.tree = list(tree)
+        self.statements = []
+
+    async def execute(self, statement, *args):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if sql.startswith("WITH RECURSIVE") or sql.startswith("SELECT projects.id"):
+            return Result(self.tree)
+        return Result(rowcount=2)
+
+
+def test_remap_id_is_deterministic_per_salt():
+    """Test that remapped ids depend on the old id and the salt only."""
+    old = uuid4()
+    assert remap_id(old, "a") == remap_id(old, "a")
+    assert remap_id(old, "a") != remap_id(old, "b")
+    assert remap_id(old, "a") != remap_id(uuid4(), "a")
+
+
+async def test_copy_rows_is_one_insert_select():
+    """Test that copy_rows remaps ids, stamps timestamps and applies overrides in SQL."""
+    db = RecordingSession()
+    company_id = uuid4()
+
+    count = await copy_rows(db, RateSheet, "salt", where=RateSheet.company_id == uuid4(),
+                            values={"company_id": company_id})
+
+    assert count == 2
+    [sql] = db.statements
+    assert sql.startswith("INSERT INTO rate_sheets")
+    assert "SELECT" in sql and "FROM rate_sheets" in sql
+    assert "CAST(md5(CAST(rate_sheets.id AS VARCHAR)" in sql
+    assert "timezone(" in sql
+    assert "rate_sheets.company_id," not in sql.split("SELECT", 1)[1]
+    assert "rate_sheets.rate_entries" in sql
+
+
+async def test_clone_project_copies_each_table_once(monkeypatch):
+    """Test one statement per table and counter rebuild for the remapped projects."""
+    root, module = uuid4(), uuid4()
+    db = RecordingSession(tree=[root, module])
+    rebuilt = []
+
+    async def rebuild_counters(session, project_ids):
+        rebuilt.extend(project_ids)
+
+    monkeypatch.setattr(clone.evm, "rebuild_counters", rebuild_counters)
+    monkeypatch.setattr(clone, "new_salt", lambda: "salt")
+
+    result = await clone.clone_project(db, root, new_name="Copy", new_code="P-2")
+
+    inserts = [sql for sql in db.statements if sql.startswith("INSERT")]
+    assert len(inserts) == 2 + len(PROJECT_CHILD_MODELS)
+    assert result.id == remap_id(root, "salt")
+    assert rebuilt == [remap_id(root, "salt"), remap_id(module, "salt")]
+    assert result.total_rows == 2 * len(inserts)
+    assert "jsonb_array_elements" in next(sql for sql in inserts if sql.startswith("INSERT INTO deliverables"))
+
+
+async def test_clone_project_resets_progress_and_actuals(monkeypatch):
+    """Test that cloned deliverables carry estimates but no status, progress or actuals."""
+    db = RecordingSession(tree=[uuid4()])
+
+    async def rebuild_counters(session, project_ids):
+        pass
+
+    monkeypatch.setattr(clone.evm, "rebuild_counters", rebuild_counters)
+    await clone.clone_project(db, db.tree[0], new_name="Copy")
+
+    selected = {
+        table: sql.split("SELECT", 1)[1]
+        for sql in db.statements if sql.startswith("INSERT INTO")
+        for table in [sql.split()[2]]
+    }
+    deliverables = selected["deliverables"]
+    assert "deliverables.hours_total" in deliverables
+    for column in clone.RESET_DELIVERABLE_VALUES:
+        assert f"deliverables.{column}," not in deliverables
+    assert "resources.actual_hours," not in selected["resources"]
+    assert "resource_assignments.actual_hours," not in selected["resource_assignments"]
+    assert "resource_assignments.assigned_hours" in selected["resource_assignments"]
+
+
+@pytest.mark.parametrize("include_modules", [True, False])
+async def test_clone_missing_project(include_modules):
+    """Test that cloning a missing project writes nothing."""
+    db = RecordingSession()
+
+    assert await clone.clone_project(db, uuid4(), new_name="Copy", include_modules=include_modules) is None
+    assert len(db.statements) == 1
@@ -0,0 +1,39 @@
+"""Unit tests for the compressed JSON column type."""
+
+import pytest
+from app.models.types import RAW_MARKER, ZLIB_MARKER, CompressedJSON, decode_json, encode_json
+
+
+def test_small_values_stored_uncompressed():
+    """Test that values below the threshold skip compression."""
+    payload = encode_json([{"tag": "V-101"}], threshold=4096, level=3)
+
+    assert payload.startswith(RAW_MARKER)
+    assert decode_json(payload) == [{"tag": "V-101"}]
+
+
+def test_large_values_round_trip_compressed():
+    """Test that large values are compressed and decode unchanged."""
+    value = [{"tag": f"P-{i}", "scope": "typical"} for i in range(500)]
+    payload = encode_json(value, threshold=1024, level=3)
+
+    assert payload.startswith(ZLIB_MARKER)
+    assert len(payload) < len(str(value))
+    assert decode_json(payload) == value
+
+
+def test_column_type_handles_none():
+    """Test that NULL passes through the column type."""
+    column_type = CompressedJSON(threshold=16)
+
+    assert column_type.process_bind_param(None, None) is None
+    assert column_type.process_result_value(None, None) is None
+    assert column_type.process_result_value(
+        column_type.process_bind_param({"a": 1}, None), None
+    ) == {"a": 1}
+
+
+def test_unknown_marker_rejected():
+    """Test that payloads without a known marker are rejected."""
+    with pytest.raises(ValueError):
+        decode_json(b"x[]")
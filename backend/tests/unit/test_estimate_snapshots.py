@@ -0,0 +1,81 @@
+"""Unit tests for versioned estimate snapshots."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.estimate_version import EstimateVersion
+from app.services.estimation.snapshots import canonical_json, compare, content_hash, record_estimate_version
+
+
+INPUTS = {"project_size": "MEDIUM", "client_profile": "TYPE_B", "contingency_percent": 15.0}
+OUTPUTS = {"total_hours": 1200, "duration_weeks": 20, "confidence_level": "MEDIUM"}
+
+
+def version(number, inputs, outputs) -> EstimateVersion:
+    return EstimateVersion(
+        version=number,
+        inputs_hash=content_hash(inputs),
+        outputs_hash=content_hash(outputs),
+        total_hours=outputs["total_hours"],
+        duration_weeks=outputs["duration_weeks"],
+    )
+
+
+def test_content_hash_ignores_key_order():
+    """Test that equal documents share one address."""
+    reordered = dict(reversed(list(INPUTS.items())))
+
+    assert canonical_json(reordered) == canonical_json(INPUTS)
+    assert content_hash(reordered) == content_hash(INPUTS)
+    assert content_hash({**INPUTS, "contingency_percent": 20.0}) != content_hash(INPUTS)
+    assert len(content_hash(INPUTS)) == 64
+
+
+def test_compare_diffs_changed_parts():
+    """Test input/output diffs and headline deltas between two versions."""
+    new_inputs = {**INPUTS, "contingency_percent": 20.0}
+    new_outputs = {**OUTPUTS, "total_hours": 1260}
+    blobs = {content_hash(d): d for d in (INPUTS, OUTPUTS, new_inputs, new_outputs)}
+
+    result = compare(version(1, INPUTS, OUTPUTS), version(2, new_inputs, new_outputs), blobs)
+
+    assert result["inputs_diff"] == [{"op": "replace", "path": "/contingency_percent", "value": 20.0}]
+    assert result["outputs_diff"] == [{"op": "replace", "path": "/total_hours", "value": 1260}]
+    assert result["deltas"] == {"total_hours": 60, "duration_weeks": 0}
+
+
+def test_compare_skips_unchanged_blobs():
+    """Test that parts with equal hashes are not loaded or diffed."""
+    new_outputs = {**OUTPUTS, "duration_weeks": 22}
+    blobs = {content_hash(d): d for d in (OUTPUTS, new_outputs)}  # no input blobs
+
+    result = compare(version(1, INPUTS, OUTPUTS), version(2, INPUTS, new_outputs), blobs)
+
+    assert result["inputs_changed"] is False
+    assert result["inputs_diff"] == []
+    assert result["outputs_changed"] is True
+    assert result["deltas"]["duration_weeks"] == 2
+
+
+async def test_record_locks_project_before_numbering():
+    """Test that the project row is locked before the latest version is read."""
+    statements = []
+
+    class RecordingSession:
+        async def execute(self, statement):
+            statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            return SimpleNamespace(scalar_one_or_none=lambda: None)
+
+        def add(self, obj):
+            pass
+
+        async def flush(self):
+            pass
+
+    version, created = await record_estimate_version(RecordingSession(), uuid4(), INPUTS, OUTPUTS)
+
+    assert created and version.version == 1
+    assert statements[0].startswith("SELECT projects.id") and statements[0].endswith("FOR UPDATE")
+    assert "FROM estimate_versions" in statements[1]
@@ -2,7 +2,7 @@
 
 import pytest
 from app.services.estimation.engine import EstimationEngine
-from app.models.project import ProjectSize, ClientProfile
+from app.domain.enums import ProjectSize, ClientProfile
 
 
 @pytest.fixture
@@ -0,0 +1,96 @@
+"""Unit tests for earned value management."""
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.project import Project
+from app.services.evm import EVMMetrics, collect_changes, contribution
+
+
+def committed_deliverable(**values) -> Deliverable:
+    """A deliverable as loaded from the database."""
+    deliverable = Deliverable()
+    for attr, value in values.items():
+        set_committed_value(deliverable, attr, value)
+    return deliverable
+
+
+def test_contribution():
+    """Test a deliverable's budget, earned and actual hours."""
+    assert contribution({"hours_total": 200, "progress_percent": 25, "actual_hours_total": 60}) == (1, 0, 200, 50, 60)
+    assert contribution({"hours_total": 80, "progress_percent": 40, "status": DeliverableStatus.COMPLETED}) == (
+        1, 1, 80, 80, 0
+    )
+    assert contribution({"hours_total": None, "progress_percent": 150})[2:] == (0, 0, 0)
+
+
+def test_collect_changes_inserts_updates_and_deletes(fake_session):
+    """Test counter deltas for each kind of pending write."""
+    project_a, project_b = uuid4(), uuid4()
+    updated = committed_deliverable(
+        project_id=project_a, hours_total=100, progress_percent=20, actual_hours_total=30,
+        status=DeliverableStatus.IN_PROGRESS
+    )
+    updated.progress_percent = 100
+    updated.status = DeliverableStatus.COMPLETED
+    updated.actual_hours_total = 110
+    untouched = committed_deliverable(project_id=project_a, hours_total=50, progress_percent=0)
+    deleted = committed_deliverable(project_id=project_b, hours_total=40, progress_percent=50, actual_hours_total=25)
+
+    session = fake_session(
+        new=[Deliverable(project_id=project_a, hours_total=60, progress_percent=10)],
+        dirty=[updated, untouched],
+        deleted=[deleted],
+    )
+    changes = collect_changes(session)
+
+    # count, completed, budget, earned, actual
+    assert changes[project_a] == [1, 1, 60, pytest.approx(6 + 80), 80]
+    assert changes[project_b] == [-1, 0, -40, -20, -25]
+
+
+def test_collect_changes_skips_deleted_projects(fake_session):
+    """Test that deleting a project with its deliverables writes no counter deltas for it."""
+    deleted_id, kept_id = uuid4(), uuid4()
+    project = Project()
+    set_committed_value(project, "id", deleted_id)
+    session = fake_session(deleted=[
+        project,
+        committed_deliverable(project_id=deleted_id, hours_total=100, progress_percent=50),
+        committed_deliverable(project_id=deleted_id, hours_total=40),
+        committed_deliverable(project_id=kept_id, hours_total=20),
+    ])
+
+    changes = collect_changes(session)
+
+    assert deleted_id not in changes
+    assert changes[kept_id] == [-1, 0, -20, 0, 0]
+
+
+def test_metrics():
+    """Test CPI, SPI, EAC and variances."""
+    metrics = EVMMetrics(bac=1000.0, pv=500.0, ev=400.0, ac=500.0, remaining_hours=700.0)
+    data = metrics.to_dict()
+
+    assert data["cpi"] == 0.8
+    assert data["spi"] == 0.8
+    assert data["eac"] == 1250.0
+    assert data["etc"] == 750.0
+    assert data["vac"] == -250.0
+    assert data["cv"] == -100.0
+    assert data["sv"] == -100.0
+    assert data["percent_complete"] == 40.0
+    assert data["eac_bottom_up"] == 1200.0
+
+
+def test_metrics_without_progress():
+    """Test that ratios are undefined before any work is planned or done."""
+    data = EVMMetrics(bac=300.0, pv=0.0, ev=0.0, ac=0.0).to_dict()
+
+    assert data["cpi"] is None
+    assert data["spi"] is None
+    assert data["eac"] == 300.0
+    assert data["eac_bottom_up"] is None
@@ -0,0 +1,141 @@
+"""Unit tests for Excel exports and the export file cache."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+from openpyxl import load_workbook
+
+from app.models.deliverable import DeliverableStatus, Milestone
+from app.models.project import ProjectStatus
+from app.services.export import excel
+from app.services.export.excel import PROJECT_FIELDS, PortfolioWorkbook, ProjectWorkbook
+from app.services.export.file_cache import ExportFileCache
+
+
+def deliverable_row(sequence: int, name: str, hours: int) -> list:
+    """Row in DELIVERABLE_COLUMNS order."""
+    return [
+        sequence, name, "MECHANICAL", Milestone.IFC, DeliverableStatus.IN_PROGRESS, 50,
+        None, None, hours, hours, 0, 0, 0, 0, 0, hours, None
+    ]
+
+
+def sheet_rows(path, title):
+    workbook = load_workbook(path, read_only=True)
+    return [list(row) for row in workbook[title].iter_rows(values_only=True)]
+
+
+def test_project_workbook_sheets(tmp_path):
+    """Test that chunks accumulate into deliverable, cost and role sheets."""
+    project = SimpleNamespace(**{attr: None for _, attr in PROJECT_FIELDS})
+    project.name = "Pump Station"
+    project.status = ProjectStatus.ACTIVE
+
+    workbook = ProjectWorkbook()
+    workbook.write_project(project)
+    workbook.add_deliverables([deliverable_row(1, "P&ID", 100), deliverable_row(2, "Datasheet", 40)])
+    workbook.add_deliverables([deliverable_row(3, "P&ID", 60)])
+    path = tmp_path / "project.xlsx"
+    workbook.finish(path)
+
+    deliverables = sheet_rows(path, "Deliverables")
+    assert len(deliverables) == 4
+    assert deliverables[1][3] == "ifc"
+
+    roles = sheet_rows(path, "Roles")[1:]
+    assert sum(r[1] for r in roles) == 200
+    assert round(sum(r[2] for r in roles), 2) == round(workbook.total_cost, 2)
+
+    summary = {r[0]: r[1] if len(r) > 1 else None for r in sheet_rows(path, "Summary")[1:]}
+    assert summary["Status"] == "ACTIVE"
+    assert summary["Deliverable Count"] == 3
+
+
+def test_portfolio_workbook_groups_roles_by_project(tmp_path):
+    """Test that role costs are totalled per project and across the portfolio."""
+    first, second = uuid4(), uuid4()
+    workbook = PortfolioWorkbook()
+    workbook.add_deliverables([(first, "A-1", "Alpha", "P&ID", 100), (first, "A-1", "Alpha", "Datasheet", 20)])
+    workbook.add_deliverables([(second, "B-1", "Beta", "P&ID", 50)])
+    path = tmp_path / "portfolio.xlsx"
+    workbook.finish(path)
+
+    project_roles = sheet_rows(path, "Project Roles")[1:]
+    assert {r[0] for r in project_roles} == {"A-1", "B-1"}
+    assert sum(r[3] for r in project_roles if r[0] == "A-1") == 120
+    assert sum(r[1] for r in sheet_rows(path, "Roles")[1:]) == 170
+
+
+def test_file_cache_replaces_stale_versions(tmp_path):
+    """Test that storing a new version removes older files for the same key."""
+    cache = ExportFileCache(str(tmp_path))
+    for version, content in (("v1", b"old"), ("v2", b"new")):
+        temp = cache.temp_path(".xlsx")
+        temp.write_bytes(content)
+        cache.store(temp, "project", "p1", version, ".xlsx")
+
+    assert cache.get("project", "p1", "v1", ".xlsx") is None
+    path = cache.get("project", "p1", "v2", ".xlsx")
+    assert b"".join(cache.iter_file(path)) == b"new"
+    assert b"".join(cache.iter_file(path, 1, 1)) == b"e"
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+async def test_file_cache_single_flight(tmp_path):
+    """Test that concurrent misses for one version generate the file once."""
+    cache = ExportFileCache(str(tmp_path))
+    calls = []
+
+    async def generate(path):
+        calls.append(path)
+        await asyncio.sleep(0.01)
+        path.write_bytes(b"report")
+
+    paths = await asyncio.gather(*(
+        cache.get_or_create("report", "p1", "v1", ".pdf", generate) for _ in range(5)
+    ))
+
+    assert len(calls) == 1
+    assert len(set(paths)) == 1
+    assert await cache.get_or_create("report", "p1", "v1", ".pdf", generate) == paths[0]
+    assert len(calls) == 1
+
+
+async def test_project_export_streams_through_its_own_session(monkeypatch, tmp_path):
+    """Test that the shared generation task does not use the request's session."""
+    request_db = SimpleNamespace(name="request")
+    sessions = []
+
+    class Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    async def project_version(db, project_id, parts):
+        assert db is request_db
+        return "v1"
+
+    async def stream_into(db, query, write, chunk_size):
+        sessions.append(db)
+        write([deliverable_row(1, "P&ID", 100)])
+
+    async def run(fn, *args, **kwargs):
+        return fn(*args)
+
+    monkeypatch.setattr(excel, "AsyncSessionLocal", Session)
+    monkeypatch.setattr(excel, "project_version", project_version)
+    monkeypatch.setattr(excel, "_stream_into", stream_into)
+    monkeypatch.setattr(excel.offloader, "run", run)
+    project = SimpleNamespace(**{attr: None for _, attr in PROJECT_FIELDS}, id=uuid4())
+    project.name = "Pump Station"
+    cache = ExportFileCache(str(tmp_path))
+
+    path = await excel.export_project(request_db, project, cache=cache)
+
+    assert len(sessions) == 1 and isinstance(sessions[0], Session)
+    assert len(sheet_rows(path, "Deliverables")) == 2
+    assert await excel.export_project(request_db, project, cache=cache) == path
+    assert len(sessions) == 1
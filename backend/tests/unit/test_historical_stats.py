@@ -0,0 +1,128 @@
+"""Unit tests for historical actuals statistics."""
+
+import statistics
+
+import pytest
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.domain.stats import RunningStats
+from app.models.deliverable import Deliverable, DeliverableStatus
+from app.models.deliverable_stats import ANY
+from app.models.project import ProjectSize
+from app.services.estimation.confidence_scorer import ConfidenceScorer
+from app.services.estimation.historical_stats import (
+    collect_changes,
+    observation_ratio,
+    stats_keys,
+)
+
+
+def test_running_stats_matches_batch_statistics():
+    """Test incremental mean / variance against the statistics module."""
+    values = [1.1, 0.9, 1.4, 1.0, 1.25, 0.8]
+    stats = RunningStats.of(values)
+
+    assert stats.count == 6
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    assert stats.variance == pytest.approx(statistics.variance(values))
+
+
+def test_running_stats_merge_and_subtract():
+    """Test that merged samples can be removed again."""
+    a = RunningStats.of([1.0, 1.2, 0.9])
+    b = RunningStats.of([1.5, 0.7])
+
+    merged = RunningStats(a.count, a.mean, a.m2)
+    merged.merge(b)
+    assert merged.variance == pytest.approx(statistics.variance([1.0, 1.2, 0.9, 1.5, 0.7]))
+
+    merged.subtract(b)
+    assert merged.count == a.count
+    assert merged.mean == pytest.approx(a.mean)
+    assert merged.m2 == pytest.approx(a.m2)
+
+
+def test_observation_ratio_requires_actuals():
+    """Test that deliverables without usable hours are ignored."""
+    assert observation_ratio(100, 120) == pytest.approx(1.2)
+    assert observation_ratio(0, 120) is None
+    assert observation_ratio(100, None) is None
+
+
+def test_stats_keys_include_rollups():
+    """Test the exact, type and discipline keys."""
+    keys = stats_keys("P&ID", "process")
+
+    assert keys[0][0] == "P&ID"
+    assert keys[0][2] == "PROCESS"
+    assert keys[1][0] == ANY
+    assert keys[2][:2] == (ANY, ANY)
+
+
+def test_collect_changes_for_new_deliverables(fake_session):
+    """Test that inserted completed deliverables with actuals are counted."""
+    completed = dict(name="P&ID", discipline="PROCESS", hours_total=100, status=DeliverableStatus.COMPLETED)
+    session = fake_session(new=[
+        Deliverable(**completed, actual_hours_total=110),
+        Deliverable(**completed, actual_hours_total=90),
+        Deliverable(**completed),
+        Deliverable(**{**completed, "status": DeliverableStatus.IN_PROGRESS}, actual_hours_total=40),
+    ])
+
+    changes = collect_changes(session)
+    added, removed = changes[(ANY, ANY, "PROCESS")]
+
+    assert len(changes) == 3
+    assert added.count == 2
+    assert added.mean == pytest.approx(1.0)
+    assert removed.count == 0
+
+
+def committed_deliverable(**values) -> Deliverable:
+    deliverable = Deliverable()
+    for attr, value in values.items():
+        set_committed_value(deliverable, attr, value)
+    return deliverable
+
+
+def test_completing_and_reopening_adds_and_removes_sample(fake_session):
+    """Test that the status transition to and from COMPLETED moves the sample."""
+    values = dict(name="P&ID", discipline="PROCESS", hours_total=100, actual_hours_total=120)
+
+    completing = committed_deliverable(**values, status=DeliverableStatus.REVIEW)
+    completing.status = DeliverableStatus.COMPLETED
+    added, removed = collect_changes(fake_session(dirty=[completing]))[(ANY, ANY, "PROCESS")]
+    assert (added.count, removed.count) == (1, 0)
+    assert added.mean == pytest.approx(1.2)
+
+    reopening = committed_deliverable(**values, status=DeliverableStatus.COMPLETED)
+    reopening.status = DeliverableStatus.REVISION
+    added, removed = collect_changes(fake_session(dirty=[reopening]))[(ANY, ANY, "PROCESS")]
+    assert (added.count, removed.count) == (0, 1)
+    assert removed.mean == pytest.approx(1.2)
+
+    in_progress = committed_deliverable(**values, status=DeliverableStatus.IN_PROGRESS)
+    in_progress.actual_hours_total = 150
+    assert collect_changes(fake_session(dirty=[in_progress])) == {}
+
+
+def test_confidence_uses_historical_accuracy():
+    """Test that accurate history scores higher than none or poor history."""
+    scorer = ConfidenceScorer()
+    args = dict(complexity_factors={}, resource_availability={}, project_size=ProjectSize.SMALL)
+
+    none = scorer.calculate_confidence(**args)["score"]
+    accurate = scorer.calculate_confidence(
+        **args, historical_stats=RunningStats.of([1.0, 1.02, 0.98, 1.01, 0.99])
+    )["score"]
+    poor = scorer.calculate_confidence(
+        **args, historical_stats=RunningStats.of([1.6, 1.9, 1.4, 2.0, 1.7])
+    )["score"]
+    too_few = scorer.calculate_confidence(
+        **args, historical_stats=RunningStats.of([1.0, 1.0])
+    )["score"]
+
+    assert accurate > none
+    assert poor == none
+    assert too_few == none
@@ -0,0 +1,47 @@
+"""Unit tests for the import-light calculation core."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[2]
+
+
+def loaded_modules(modules, candidates):
+    """Candidates loaded by importing modules in a fresh interpreter."""
+    probe = (
+        "import json, sys\n"
+        f"for module in {tuple(modules)!r}: __import__(module)\n"
+        f"print(json.dumps([m for m in {tuple(candidates)!r} if m in sys.modules]))"
+    )
+    output = subprocess.run([sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def test_core_does_not_load_infrastructure():
+    """Test that the domain core and calculators import without DB, cache, settings or web stack."""
+    modules = ("app.domain", "app.services.estimation", "app.services.cost.cost_calculator")
+    infrastructure = ("sqlalchemy", "asyncpg", "redis", "fastapi", "pydantic_settings", "app.config")
+
+    assert loaded_modules(modules, infrastructure) == []
+
+
+@pytest.mark.parametrize("module", [
+    "app.services.export",
+    "app.services.catalog_import",
+    "app.services.estimation.calibration",
+])
+def test_heavy_libraries_are_deferred(module):
+    """Test that report, import and fitting libraries load only when used."""
+    assert loaded_modules((module,), ("scipy", "reportlab", "openpyxl")) == []
+
+
+def test_models_reexport_domain_enums():
+    """Test that existing imports of the enums from the models keep working."""
+    from app.domain import ProjectSize
+    from app.models.project import ProjectSize as ModelProjectSize
+
+    assert ModelProjectSize is ProjectSize
@@ -0,0 +1,81 @@
+"""Unit tests for the incremental cost model."""
+
+import random
+
+from app.services.cost.cost_calculator import CostCalculator, IncrementalCostModel
+
+
+DELIVERABLES = [
+    {"name": "P&ID", "hours": 120},
+    {"name": "Equipment Datasheet", "hours": 40},
+    {"name": "Control Narrative", "hours": 60},
+    {"name": "Piping Isometrics", "hours": 200},
+]
+
+
+def test_matches_full_calculation():
+    """Test that the incremental result equals calculate_project_cost."""
+    model = IncrementalCostModel()
+    model.sync(DELIVERABLES)
+
+    full = CostCalculator().calculate_project_cost(DELIVERABLES)
+    result = model.to_dict()
+
+    assert result["summary"] == full["summary"]
+    assert result["by_deliverable"] == full["by_deliverable"]
+    assert {r["role"]: r for r in result["by_role"]} == {r["role"]: r for r in full["by_role"]}
+    assert model.verify() == []
+
+
+def test_sync_only_reprices_changed_deliverables():
+    """Test that one edit recomputes one deliverable."""
+    model = IncrementalCostModel()
+    model.sync(DELIVERABLES)
+
+    edited = [dict(d) for d in DELIVERABLES]
+    edited[1]["hours"] = 80
+    assert model.sync(edited) == 1
+    assert model.sync(edited[:2]) == 2
+    assert model.to_dict()["summary"]["total_hours"] == 200
+    assert model.verify() == []
+
+
+def test_removing_last_deliverable_of_a_role_drops_the_role():
+    """Test that roles without contributing deliverables disappear."""
+    model = IncrementalCostModel()
+    model.add("a", "P&ID", 100)
+    model.remove("a")
+
+    assert model.role_hours == {}
+    assert model.to_dict()["summary"] == {
+        "total_hours": 0, "total_cost": 0.0, "deliverable_count": 0, "average_cost_per_hour": 0
+    }
+
+
+def test_random_edits_stay_consistent():
+    """Test that long add/update/remove sequences don't drift from a full recompute."""
+    rng = random.Random(7)
+    names = [d["name"] for d in DELIVERABLES]
+    model = IncrementalCostModel()
+
+    for step in range(500):
+        action = rng.random()
+        if model.breakdowns and action < 0.3:
+            model.remove(rng.choice(list(model.breakdowns)))
+        elif model.breakdowns and action < 0.7:
+            model.update(rng.choice(list(model.breakdowns)), rng.choice(names), rng.randint(0, 400))
+        else:
+            model.add(step, rng.choice(names), rng.randint(0, 400))
+
+    assert model.verify() == []
+
+
+def test_verify_reports_drift():
+    """Test that a corrupted running total is detected."""
+    model = IncrementalCostModel()
+    model.sync(DELIVERABLES)
+    model.total_cost += 5
+
+    mismatches = model.verify()
+    assert len(mismatches) == 1
+    assert mismatches[0].startswith("total_cost")
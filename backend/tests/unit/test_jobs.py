@@ -0,0 +1,140 @@
+"""Unit tests for the background job framework."""
+
+import asyncio
+
+import pytest
+
+from types import SimpleNamespace
+
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.jobs import submit_job
+from app.schemas.job import JobSubmit
+from app.workers.jobs import (
+    JobManager, JobRecord, JobStatus, JobStore, register_job, registered_jobs, requires_superuser
+)
+
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@register_job("test_add")
+async def add_job(ctx, a: int, b: int) -> dict:
+    await ctx.progress(50, "Adding")
+    return {"sum": a + b}
+
+
+@register_job("test_fail")
+async def failing_job(ctx) -> None:
+    raise RuntimeError("boom")
+
+
+@register_job("test_wait")
+async def waiting_job(ctx) -> None:
+    while True:
+        await ctx.progress(10, "Waiting")
+        await asyncio.sleep(0.01)
+
+
+@register_job("test_global", superuser=True)
+async def global_job(ctx) -> None:
+    pass
+
+
+def make_manager(shared: bool = False) -> JobManager:
+    """Create a local-backend job manager, optionally on fake Redis."""
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True) if shared else None
+    return JobManager(store=JobStore(redis_client=client), backend="local")
+
+
+@pytest.mark.parametrize("shared", [False, True])
+async def test_job_succeeds_with_result(shared):
+    """Test that a submitted job runs and stores its result."""
+    manager = make_manager(shared)
+    record = await manager.submit("test_add", {"a": 2, "b": 3}, user_id="u1")
+    assert record.status == JobStatus.PENDING
+
+    finished = await manager.wait(record.id)
+
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.progress == 100.0
+    assert finished.result == {"sum": 5}
+    assert finished.user_id == "u1"
+    assert finished.started_at and finished.finished_at
+
+
+async def test_job_failure_is_recorded():
+    """Test that an exception marks the job failed with its message."""
+    manager = make_manager()
+    record = await manager.submit("test_fail")
+
+    finished = await manager.wait(record.id)
+
+    assert finished.status == JobStatus.FAILED
+    assert finished.error == "boom"
+
+
+async def test_cancel_running_job():
+    """Test that a running job stops at its next progress report."""
+    manager = make_manager(shared=True)
+    record = await manager.submit("test_wait")
+    while (await manager.get(record.id)).status != JobStatus.RUNNING:
+        await asyncio.sleep(0.01)
+
+    await manager.cancel(record.id)
+    finished = await manager.wait(record.id)
+
+    assert finished.status == JobStatus.CANCELLED
+    assert finished.cancel_requested
+
+
+async def test_cancel_pending_celery_job(monkeypatch):
+    """Test that a revoked pending Celery job is marked cancelled."""
+    from app.workers.celery_app import celery_app
+
+    revoked = []
+    monkeypatch.setattr(celery_app.control, "revoke", revoked.append)
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    manager = JobManager(store=JobStore(redis_client=client), backend="celery")
+    record = JobRecord(id="job-1", name="test_add", params={"a": 1, "b": 2})
+    await manager.store.save(record)
+
+    cancelled = await manager.cancel(record.id)
+
+    assert revoked == [record.id]
+    assert cancelled.status == JobStatus.CANCELLED
+    assert cancelled.cancel_requested
+    assert cancelled.finished_at
+
+
+async def test_unknown_job_rejected():
+    """Test that only registered jobs can be submitted."""
+    manager = make_manager()
+    with pytest.raises(ValueError):
+        await manager.submit("no_such_job")
+
+
+async def test_cancel_finished_job_is_noop():
+    """Test that cancelling a finished job leaves it unchanged."""
+    manager = make_manager()
+    record = await manager.submit("test_add", {"a": 1, "b": 1})
+    await manager.wait(record.id)
+
+    cancelled = await manager.cancel(record.id)
+
+    assert cancelled.status == JobStatus.SUCCEEDED
+    assert not cancelled.cancel_requested
+
+
+async def test_superuser_jobs_are_restricted():
+    """Test that jobs changing global state are hidden from and refused to regular users."""
+    assert requires_superuser("complexity_calibration")
+    assert requires_superuser("deliverable_catalog_import")
+    assert not requires_superuser("test_add")
+    assert "test_global" not in registered_jobs(include_superuser=False)
+    assert "test_global" in registered_jobs()
+
+    user = SimpleNamespace(id="u1", is_superuser=False)
+    with pytest.raises(HTTPException) as exc_info:
+        await submit_job(job_in=JobSubmit(name="complexity_calibration", params={"activate": True}), current_user=user)
+    assert exc_info.value.status_code == 403
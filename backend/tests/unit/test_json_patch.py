@@ -0,0 +1,106 @@
+"""Unit tests for JSON Patch support."""
+
+import pytest
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.models.project import Project
+from app.services.json_patch import (
+    JSONPatchError,
+    apply_patch,
+    changed_paths,
+    compile_jsonb_patch,
+    diff,
+    parse_pointer,
+)
+
+
+@pytest.fixture
+def deliverables():
+    """Sample deliverables configuration."""
+    return [
+        {"name": "P&ID", "hours": 40, "enabled": True},
+        {"name": "Datasheet", "hours": 16, "enabled": False},
+    ]
+
+
+def test_parse_pointer_unescapes_tokens():
+    """Test RFC 6901 escaping."""
+    assert parse_pointer("") == []
+    assert parse_pointer("/a~1b/c~0d/0") == ["a/b", "c~d", "0"]
+
+    with pytest.raises(JSONPatchError):
+        parse_pointer("a/b")
+
+
+def test_apply_patch_operations(deliverables):
+    """Test each operation against a deliverables list."""
+    result = apply_patch(deliverables, [
+        {"op": "replace", "path": "/0/hours", "value": 48},
+        {"op": "add", "path": "/-", "value": {"name": "Spec", "hours": 8}},
+        {"op": "add", "path": "/0/notes", "value": "rev B"},
+        {"op": "remove", "path": "/1/enabled"},
+        {"op": "copy", "from": "/0/hours", "path": "/2/hours"},
+        {"op": "move", "from": "/2", "path": "/0"},
+        {"op": "test", "path": "/0/name", "value": "Spec"},
+    ])
+
+    assert [d["name"] for d in result] == ["Spec", "P&ID", "Datasheet"]
+    assert result[0]["hours"] == 48
+    assert result[1] == {"name": "P&ID", "hours": 48, "enabled": True, "notes": "rev B"}
+    assert "enabled" not in result[2]
+    assert deliverables[0]["hours"] == 40
+
+
+@pytest.mark.parametrize("operation", [
+    {"op": "replace", "path": "/5/hours", "value": 1},
+    {"op": "remove", "path": "/0/missing"},
+    {"op": "add", "path": "/3", "value": {}},
+    {"op": "add", "path": "/01", "value": {}},
+    {"op": "test", "path": "/0/hours", "value": 41},
+    {"op": "move", "from": "/0", "path": "/0/child"},
+])
+def test_apply_patch_rejects_invalid_operations(deliverables, operation):
+    """Test that failing operations abort the patch."""
+    with pytest.raises(JSONPatchError):
+        apply_patch(deliverables, [operation])
+
+
+def test_changed_paths():
+    """Test that only written paths are reported."""
+    assert changed_paths([
+        {"op": "test", "path": "/0/hours", "value": 40},
+        {"op": "replace", "path": "/0/hours", "value": 48},
+        {"op": "move", "from": "/1", "path": "/0"},
+        {"op": "replace", "path": "/0/hours", "value": 50},
+    ]) == ["/0/hours", "/1", "/0"]
+
+
+def test_compile_jsonb_patch_uses_jsonb_functions():
+    """Test that the SQL form uses jsonb_set / jsonb_insert and guards paths."""
+    source = select(
+        Project.id.label("id"),
+        func.coalesce(Project.deliverables_config, literal([], JSONB)).label("doc")
+    )
+    patched = compile_jsonb_patch(source, [
+        {"op": "replace", "path": "/0/hours", "value": 48},
+        {"op": "add", "path": "/1", "value": {"name": "Spec"}},
+        {"op": "remove", "path": "/2"},
+    ])
+    sql = str(select(patched).compile(dialect=postgresql.dialect()))
+
+    assert "jsonb_set" in sql
+    assert "jsonb_insert" in sql
+    assert "#-" in sql
+    assert "IS NOT NULL" in sql
+    assert set(patched.c.keys()) == {"id", "doc", "ok"}
+
+
+def test_diff_round_trips():
+    """Test that applying a diff reproduces the target document."""
+    old = {"a": 1, "b": [1, 2], "c": {"x/y": 1, "z": 2}}
+    new = {"a": 1, "b": [1, 3], "c": {"x/y": 2}, "d": None}
+
+    assert apply_patch(old, diff(old, new)) == new
+    assert diff(old, old) == []
@@ -0,0 +1,19 @@
+"""Unit tests for session listener registration."""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.services.listeners import LISTENER_MODULES, register_listeners
+
+
+def test_register_listeners_once():
+    """Test that registration adds every listener and is repeatable."""
+    listeners = [listener for module in LISTENER_MODULES for listener in module.SESSION_LISTENERS]
+    try:
+        register_listeners()
+        register_listeners()
+        assert all(event.contains(Session, identifier, fn) for identifier, fn in listeners)
+    finally:
+        for identifier, fn in listeners:
+            if event.contains(Session, identifier, fn):
+                event.remove(Session, identifier, fn)
@@ -0,0 +1,75 @@
+"""Unit tests for live estimate sessions."""
+
+import asyncio
+
+import pytest
+
+from app.services.estimation.engine import EstimationEngine
+from app.services.estimation.live import COSTS, ESTIMATE, LiveEstimateSession, affected_sections
+from app.services.json_patch import apply_patch
+
+
+@pytest.fixture
+def session():
+    """Session with estimate inputs and two deliverables."""
+    inputs = {
+        "estimate": {"project_size": "MEDIUM", "client_profile": "TYPE_B", "contingency_percent": 15.0},
+        "deliverables": [{"name": "P&ID", "hours": 40}, {"name": "Datasheet", "hours": 16}],
+    }
+    return LiveEstimateSession(inputs, engine=EstimationEngine(), debounce=0.02, max_delay=0.2)
+
+
+def test_affected_sections():
+    """Test that each input only invalidates the results that depend on it."""
+    assert affected_sections(["/estimate/contingency_percent"]) == {ESTIMATE}
+    assert affected_sections(["/deliverables/0/hours", "/custom_rates"]) == {COSTS}
+    assert affected_sections([""]) == {ESTIMATE, COSTS}
+
+
+def test_step_coalesces_deltas_and_sends_only_changes(session):
+    """Test that queued deltas are applied together and only changed fields are returned."""
+    before = session.result
+    session.submit({"seq": 1, "patch": [{"op": "replace", "path": "/deliverables/0/hours", "value": 50}]})
+    session.submit({"seq": 2, "patch": [{"op": "replace", "path": "/deliverables/0/hours", "value": 80}]})
+
+    message = session.step()
+
+    assert message["type"] == "patch"
+    assert message["seq"] == 2
+    assert session.recomputes == 1
+    assert session.inputs["deliverables"][0]["hours"] == 80
+    assert all(op["path"].startswith("/costs/") for op in message["ops"])
+    assert apply_patch(before, message["ops"]) == session.result
+    assert session.result[COSTS]["summary"]["total_hours"] == 96
+
+
+def test_invalid_delta_keeps_last_inputs(session):
+    """Test that a rejected patch is reported and leaves the session unchanged."""
+    inputs, result = session.inputs, session.result
+    session.submit({"seq": 3, "patch": [{"op": "replace", "path": "/estimate/contingency_percent", "value": 500}]})
+
+    message = session.step()
+
+    assert message["type"] == "error"
+    assert message["seq"] == 3
+    assert session.inputs == inputs
+    assert session.result == result
+
+
+async def test_run_debounces_bursts(session):
+    """Test that a burst of deltas produces one recompute."""
+    incoming: asyncio.Queue = asyncio.Queue()
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    task = asyncio.create_task(session.run(incoming.get, send))
+    for seq, hours in enumerate((41, 42, 43), start=1):
+        await incoming.put({"seq": seq, "patch": [{"op": "replace", "path": "/deliverables/1/hours", "value": hours}]})
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    assert [m["type"] for m in sent] == ["snapshot", "patch"]
+    assert sent[1]["seq"] == 3
+    assert session.inputs["deliverables"][1]["hours"] == 43
@@ -0,0 +1,68 @@
+"""Unit tests for queued structured logging."""
+
+import json
+import logging
+import queue
+import sys
+
+from app.core.logging import JsonFormatter, LogQueueHandler, SamplingFilter, request_id
+
+
+def make_record(name="app.services.estimation.engine", level=logging.DEBUG, msg="hours: %s", args=(40,), **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampling_keeps_fraction_of_low_level_records():
+    """Test per-logger sampling by prefix, sparing warnings and unlisted loggers."""
+    sampling = SamplingFilter({"app.services.estimation": 0.25, "app.services.estimation.live": 1.0})
+
+    kept = sum(sampling.filter(make_record()) for _ in range(100))
+
+    assert kept == 25
+    assert sampling.sampled_out == 75
+    assert all(sampling.filter(make_record(level=logging.WARNING)) for _ in range(10))
+    assert all(sampling.filter(make_record(name="app.services.estimation.live")) for _ in range(10))
+    assert all(sampling.filter(make_record(name="app.api")) for _ in range(10))
+
+
+def test_handler_captures_request_id_and_never_blocks():
+    """Test that records carry the caller's request id and overflow is dropped."""
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = LogQueueHandler(log_queue)
+
+    token = request_id.set("req-1")
+    try:
+        for _ in range(3):
+            handler.handle(make_record())
+    finally:
+        request_id.reset(token)
+
+    assert log_queue.qsize() == 2
+    assert handler.dropped == 1
+    record = log_queue.get_nowait()
+    assert record.request_id == "req-1"
+    assert record.getMessage() == "hours: 40"
+    assert record.args is None
+
+
+def test_json_formatter_includes_extra_fields_and_traceback():
+    """Test one JSON object per record with extras and the exception text."""
+    handler = LogQueueHandler(queue.Queue())
+    try:
+        raise ValueError("bad input")
+    except ValueError:
+        record = make_record(level=logging.ERROR, status_code=500)
+        record.exc_info = sys.exc_info()
+    prepared = handler.prepare(record)
+
+    entry = json.loads(JsonFormatter().format(prepared))
+
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "app.services.estimation.engine"
+    assert entry["message"] == "hours: 40"
+    assert entry["status_code"] == 500
+    assert entry["request_id"] is None
+    assert "ValueError: bad input" in entry["exc_info"]
+    assert record.exc_info is not None
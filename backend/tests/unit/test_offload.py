@@ -0,0 +1,75 @@
+"""Unit tests for CPU-bound work offloading."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.offload import CPUOffloader, OffloadRejected
+
+
+def make_offloader(**overrides) -> CPUOffloader:
+    options = {
+        "process_workers": 1,
+        "thread_workers": 2,
+        "max_pending": 4,
+        "queue_timeout": 1.0,
+        "size_threshold": 10,
+    }
+    options.update(overrides)
+    return CPUOffloader(**options)
+
+
+async def test_small_inputs_run_inline():
+    """Test that work below the size threshold stays on the caller's thread."""
+    offloader = make_offloader()
+
+    thread = await offloader.run(threading.get_ident, size=1, kind="thread")
+
+    assert thread == threading.get_ident()
+    assert offloader.stats["thread"].inline == 1
+    assert offloader.stats["thread"].submitted == 0
+
+
+async def test_large_inputs_offloaded_to_threads():
+    """Test that work above the threshold runs in the pool and is timed."""
+    offloader = make_offloader()
+    try:
+        thread = await offloader.run(threading.get_ident, size=100, kind="thread")
+    finally:
+        offloader.shutdown()
+
+    assert thread != threading.get_ident()
+    metrics = offloader.metrics()["thread"]
+    assert metrics["completed"] == 1
+    assert metrics["queue_time_ms"]["p50"] is not None
+
+
+async def test_process_pool_result_and_errors():
+    """Test that process-pool results return and exceptions propagate."""
+    offloader = make_offloader()
+    try:
+        assert await offloader.run(sum, [1, 2, 3], size=100) == 6
+        with pytest.raises(ValueError):
+            await offloader.run(int, "not a number", size=100)
+    finally:
+        offloader.shutdown()
+
+    assert offloader.stats["process"].completed == 1
+    assert offloader.stats["process"].failed == 1
+
+
+async def test_saturated_pool_rejects():
+    """Test backpressure: callers beyond max_pending are rejected after the timeout."""
+    offloader = make_offloader(thread_workers=1, max_pending=1, queue_timeout=0.05)
+    try:
+        busy = asyncio.create_task(offloader.run(time.sleep, 0.3, size=100, kind="thread"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(OffloadRejected):
+            await offloader.run(time.sleep, 0, size=100, kind="thread")
+        await busy
+    finally:
+        offloader.shutdown()
+
+    assert offloader.stats["thread"].rejected == 1
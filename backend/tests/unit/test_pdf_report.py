@@ -0,0 +1,110 @@
+"""Unit tests for the PDF estimate report and ranged downloads."""
+
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.projects import parse_range
+from app.services.export import pdf
+from app.services.export.file_cache import ExportFileCache
+from app.services.export.pdf import render_estimate_report
+
+
+def report_data(count: int) -> dict:
+    start = date(2025, 1, 6)
+    return {
+        "name": "Compressor <Upgrade> & Tie-ins",
+        "fields": [("Project Code", "CMP-001"), ("Status", "DRAFT")],
+        "deliverables": [
+            {
+                "sequence": i,
+                "name": ("P&ID", "Datasheet", "Specification")[i % 3],
+                "discipline": "MECHANICAL",
+                "phase": ("IFR", "IFC")[i % 2],
+                "hours": 10 + i,
+                "start": start + timedelta(days=i) if i % 5 else None,
+                "end": start + timedelta(days=i + 7) if i % 5 else None,
+                "duration_days": 7,
+                "critical": i % 4 == 0,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def test_render_estimate_report(tmp_path):
+    """Test that the report renders every section across multiple pages."""
+    path = tmp_path / "report.pdf"
+
+    pages = render_estimate_report(report_data(120), str(path))
+
+    assert pages >= 3
+    assert path.read_bytes().startswith(b"%PDF")
+
+
+def test_render_empty_project(tmp_path):
+    """Test that a project without deliverables still renders."""
+    path = tmp_path / "report.pdf"
+    assert render_estimate_report(report_data(0), str(path)) >= 1
+
+
+@pytest.mark.parametrize("header,expected", [
+    (None, None),
+    ("bytes=0-99", (0, 99)),
+    ("bytes=100-", (100, 999)),
+    ("bytes=-200", (800, 999)),
+    ("bytes=900-5000", (900, 999)),
+    ("bytes=0-1,5-6", None),
+    ("items=0-1", None),
+])
+def test_parse_range(header, expected):
+    """Test single byte-range parsing."""
+    assert parse_range(header, 1000) == expected
+
+
+def test_parse_range_unsatisfiable():
+    """Test that ranges beyond the file are rejected with 416."""
+    with pytest.raises(HTTPException) as exc:
+        parse_range("bytes=1000-", 1000)
+    assert exc.value.status_code == 416
+
+
+async def test_report_data_is_loaded_before_the_shared_render(monkeypatch, tmp_path):
+    """Test that the render task never uses the request's session, and hits skip the query."""
+    db = SimpleNamespace(closed=False)
+    loads = []
+
+    async def build_report_data(session, project):
+        assert not session.closed
+        loads.append(project.id)
+        return report_data(3)
+
+    async def project_version(session, project_id, parts):
+        return "v1"
+
+    async def run(fn, data, path, **kwargs):
+        Path(path).write_bytes(b"%PDF")
+        return 1
+
+    class ClosingCache(ExportFileCache):
+        async def get_or_create(self, *args):
+            # The request may end (and close its session) while the render runs
+            db.closed = True
+            return await super().get_or_create(*args)
+
+    monkeypatch.setattr(pdf, "build_report_data", build_report_data)
+    monkeypatch.setattr(pdf, "project_version", project_version)
+    monkeypatch.setattr(pdf.offloader, "run", run)
+    cache = ClosingCache(str(tmp_path))
+    project = SimpleNamespace(id=uuid4())
+
+    path = await pdf.export_estimate_report(db, project, cache=cache)
+    assert path.read_bytes() == b"%PDF"
+
+    db.closed = False
+    assert await pdf.export_estimate_report(db, project, cache=cache) == path
+    assert loads == [project.id]
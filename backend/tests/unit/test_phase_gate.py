@@ -0,0 +1,82 @@
+"""Unit tests for the phase-gate estimator."""
+
+import pytest
+
+from app.data.phase_gate_deliverables import PHASE_GATE_DELIVERABLES
+from app.services.cost.cost_calculator import CostCalculator
+from app.services.estimation.phase_gate import ACCURACY_BANDS, PhaseGateEstimator
+
+
+def catalog():
+    """Built-in frame/screen deliverables, repeated for the later phases."""
+    items = [dict(item) for items in PHASE_GATE_DELIVERABLES.values() for item in items]
+    later = [
+        {**item, "phase": phase, "base_hours": item["base_hours"] * factor}
+        for phase, factor in (("refine", 2), ("implement", 3))
+        for item in items if item["phase"] == "screen"
+    ]
+    return items + later
+
+
+def test_phase_totals_match_per_deliverable_costs():
+    """Test that the vectorized pass matches costing each deliverable on its own."""
+    items = catalog()
+    calculator = CostCalculator()
+
+    estimate = PhaseGateEstimator().estimate(items)
+
+    assert list(estimate.phases) == ["frame", "screen", "refine", "implement"]
+    for phase, result in estimate.phases.items():
+        phase_items = [i for i in items if i["phase"] == phase]
+        assert result["hours"] == sum(i["base_hours"] for i in phase_items)
+        assert result["deliverable_count"] == len(phase_items)
+        # CostCalculator rounds role hours; the blended rate does not
+        expected = sum(calculator.calculate_deliverable_cost(i["name"], i["base_hours"]).total_cost for i in phase_items)
+        assert result["cost"] == pytest.approx(expected, rel=0.02)
+        assert sum(d["hours"] for d in result["by_discipline"].values()) == pytest.approx(result["hours"])
+
+
+def test_accuracy_bands():
+    """Test that each phase total is widened by its gate's accuracy band."""
+    estimate = PhaseGateEstimator().estimate(catalog(), multiplier=1.2)
+
+    for phase, result in estimate.phases.items():
+        low, high = ACCURACY_BANDS[phase]
+        assert result["low_cost"] == pytest.approx(result["cost"] * (1 + low), abs=0.01)
+        assert result["high_hours"] == pytest.approx(result["hours"] * (1 + high), abs=0.1)
+    frame = estimate.phases["frame"]
+    assert frame["low_cost"] == pytest.approx(frame["cost"] * 0.5, abs=0.01)
+    assert estimate.totals["cost"] == pytest.approx(sum(p["cost"] for p in estimate.phases.values()))
+
+
+def test_only_changed_phase_is_recomputed():
+    """Test that re-estimating after a one-phase edit reuses the other phases."""
+    estimator = PhaseGateEstimator()
+    items = catalog()
+    first = estimator.estimate(items)
+    assert first.recomputed == ["frame", "screen", "refine", "implement"]
+
+    refine = next(i for i in items if i["phase"] == "refine")
+    refine["base_hours"] += 100
+    second = estimator.estimate(items, previous=first.phases)
+
+    assert second.recomputed == ["refine"]
+    assert second.phases["frame"] == first.phases["frame"]
+    assert second.phases["refine"]["hours"] == first.phases["refine"]["hours"] + 100
+    assert estimator.estimate(items, previous=second.phases).recomputed == []
+    assert estimator.estimate(items, multiplier=1.1, previous=second.phases).recomputed == list(second.phases)
+
+
+def test_completion_is_hours_weighted():
+    """Test that completion is only reported for phases with progress data."""
+    items = [
+        {"name": "PFD", "phase": "frame", "discipline": "process", "hours": 30, "progress_percent": 100},
+        {"name": "Design Basis", "phase": "frame", "discipline": "process", "hours": 10, "progress_percent": 0},
+        {"name": "Line List", "phase": "screen", "discipline": "piping", "hours": 20},
+        {"name": "Unphased", "discipline": "piping", "hours": 50},
+    ]
+
+    estimate = PhaseGateEstimator().estimate(items)
+
+    assert estimate.completion() == {"frame": 75.0}
+    assert list(estimate.phases) == ["frame", "screen"]
@@ -0,0 +1,106 @@
+"""Unit tests for project list filters, projection and serialization."""
+
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.endpoints.projects import serialize_project_list
+from app.crud.project import SUMMARY_COLUMNS, project_crud
+from app.domain.enums import ClientProfile, EngineeringDiscipline, ProjectStatus, ProjectType, WorkType
+from app.models.project import Project as ProjectModel
+from app.schemas.project import Project, ProjectListResponse, ProjectSummary
+
+
+def compile_query(query):
+    compiled = query.compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def project_row() -> ProjectModel:
+    """A fully loaded project row."""
+    return ProjectModel(
+        id=uuid4(),
+        created_at=datetime(2026, 1, 5),
+        work_type=WorkType.CONVENTIONAL,
+        name="Plant",
+        discipline=EngineeringDiscipline.MULTIDISCIPLINE,
+        project_type=ProjectType.STANDARD,
+        client_profile=ClientProfile.TYPE_B,
+        status=ProjectStatus.DRAFT,
+        process_type_overridden=False,
+        complexity_factors={"fast_track": True},
+        resource_availability={},
+        contingency_percent=15.0,
+        overhead_percent=10.0,
+        phase_completion={},
+        gate_approvals={},
+        campaign_monthly_hours={},
+        campaign_scheduled_deliverables=[],
+        selected_disciplines=["Process"],
+        equipment_list=[{"tag": "P-101"}],
+        deliverables_config=[{"name": "P&ID"}],
+    )
+
+
+def test_config_filters_use_jsonb_containment():
+    """Test that each configuration filter compiles to a @> predicate."""
+    query = project_crud.apply_config_filters(
+        project_crud.id_query(),
+        complexity_factors=["fast_track", "brownfield"],
+        selected_disciplines=["Process", "Civil"],
+        deliverable_name="P&ID",
+    )
+
+    sql, params = compile_query(query)
+
+    assert sql.count("@>") == 3
+    for column in ("complexity_factors", "selected_disciplines", "deliverables_config"):
+        assert f"projects.{column} @> " in sql
+    assert sorted(params.values(), key=str) == sorted([
+        {"fast_track": True, "brownfield": True},
+        ["Process", "Civil"],
+        [{"name": "P&ID"}],
+    ], key=str)
+
+
+def test_config_filters_are_optional():
+    """Test that no filters leave the query unchanged."""
+    query = project_crud.id_query()
+
+    assert project_crud.apply_config_filters(query) is query
+
+
+@pytest.mark.parametrize("full", [False, True])
+def test_list_query_projection(full):
+    """Test that list views load only the summary columns unless full."""
+    sql, _ = compile_query(project_crud._list_query(full))
+    selected = sql.split("FROM", 1)[0]
+
+    for column in SUMMARY_COLUMNS:
+        assert f"projects.{column.key}" in selected
+    for column in ("equipment_list", "deliverables_config", "campaign_monthly_hours", "complexity_factors"):
+        assert (f"projects.{column}" in selected) is full
+
+
+@pytest.mark.parametrize("full, schema", [(False, ProjectSummary), (True, Project)])
+def test_serialize_project_list(full, schema):
+    """Test that each mode serializes with its schema and selects it in the response union."""
+    items = serialize_project_list([project_row()], full)
+
+    assert type(items[0]) is schema
+    assert ("deliverables_config" in items[0].model_dump()) is full
+
+    response = ProjectListResponse.model_validate(
+        {"items": [item.model_dump() for item in items], "total": 1, "skip": 0, "limit": 100}
+    )
+    assert type(response.items[0]) is schema
+
+
+def test_summary_rejects_full_projects():
+    """Test that extra="forbid" keeps full projects from validating as summaries."""
+    full = serialize_project_list([project_row()], True)[0].model_dump()
+
+    with pytest.raises(ValueError):
+        ProjectSummary.model_validate(full)
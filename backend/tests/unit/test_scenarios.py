@@ -0,0 +1,125 @@
+"""Unit tests for batched scenario evaluation."""
+
+import random
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.models.project import ClientProfile, ProjectSize
+from app.services.estimation.engine import EstimationEngine
+from app.domain.stats import RunningStats
+from app.services.estimation.scenarios import BASELINE, ScenarioEvaluator, apply_overrides
+
+
+BASE = {
+    "project_size": "MEDIUM",
+    "complexity_factors": {"multidiscipline": True},
+    "client_profile": "TYPE_B",
+    "resource_availability": {"Process": 80.0, "Mechanical": 100.0},
+    "contingency_percent": 15.0,
+    "overhead_percent": 10.0,
+}
+
+
+def test_apply_overrides_merges_factor_maps():
+    """Test that factor and availability maps merge while other fields replace."""
+    inputs = apply_overrides(BASE, {
+        "complexity_factors": {"fast_track": True},
+        "resource_availability": {"Process": 50.0},
+        "contingency_percent": 20.0,
+        "overhead_percent": None,
+    })
+
+    assert inputs["complexity_factors"] == {"multidiscipline": True, "fast_track": True}
+    assert inputs["resource_availability"] == {"Process": 50.0, "Mechanical": 100.0}
+    assert inputs["contingency_percent"] == 20.0
+    assert inputs["overhead_percent"] == 10.0
+    assert BASE["complexity_factors"] == {"multidiscipline": True}
+
+
+def assert_rows_match_engine(engine, rows, scenarios, historical_stats):
+    """Assert every batched row equals a one-off engine estimate of its inputs."""
+    assert [r["name"] for r in rows] == [BASELINE] + [name for name, _ in scenarios]
+    for row, overrides in zip(rows, [{}] + [o for _, o in scenarios]):
+        inputs = apply_overrides(BASE, overrides)
+        expected = engine.calculate_estimate(
+            project_size=ProjectSize(inputs["project_size"]),
+            complexity_factors=inputs["complexity_factors"],
+            client_profile=ClientProfile(inputs["client_profile"]),
+            resource_availability=inputs["resource_availability"],
+            contingency_percent=inputs["contingency_percent"],
+            overhead_percent=inputs["overhead_percent"],
+            base_hours_override=inputs.get("base_hours_override"),
+            client_complexity=inputs.get("client_complexity", 5),
+            historical_stats=historical_stats,
+        )
+        assert row["total_hours"] == expected.total_hours, row["name"]
+        assert row["adjusted_hours"] == expected.adjusted_hours, row["name"]
+        assert row["duration_weeks"] == expected.duration_weeks, row["name"]
+        assert row["confidence_level"] == expected.confidence_level, row["name"]
+        assert row["confidence_score"] == expected.confidence_score, row["name"]
+        assert row["complexity_multiplier"] == expected.complexity_multiplier, row["name"]
+
+
+@pytest.mark.parametrize("historical_stats", [None, RunningStats(count=8, mean=1.2, m2=0.4)])
+def test_evaluate_matches_engine(historical_stats):
+    """Test that every batched row equals a one-off engine estimate."""
+    engine = EstimationEngine()
+    scenarios = [
+        ("fast track", {"complexity_factors": {"fast_track": True, "brownfield": True}}),
+        ("large", {"project_size": "LARGE", "client_profile": "TYPE_C"}),
+        ("thin team", {"resource_availability": {"Process": 40.0}, "client_complexity": 8}),
+        ("override", {"base_hours_override": 1234, "contingency_percent": 30.0}),
+        ("regulated", {
+            "project_size": "LARGE", "base_hours_override": 1000, "client_complexity": 3,
+            "complexity_factors": {"multidiscipline": False, "regulatory": True, "international": True},
+        }),
+    ]
+
+    rows = ScenarioEvaluator(engine).evaluate(BASE, scenarios, historical_stats=historical_stats)
+
+    assert_rows_match_engine(engine, rows, scenarios, historical_stats)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_evaluate_matches_engine_on_random_inputs(seed):
+    """Test the batch against the engine over a randomized sweep of inputs."""
+    rng = random.Random(seed)
+    engine = EstimationEngine()
+    factor_names = list(engine.complexity_calculator.factors)
+    scenarios = []
+    for i in range(100):
+        factors = rng.sample(factor_names, rng.randint(0, len(factor_names)))
+        rng.shuffle(factors)
+        overrides = {
+            "project_size": rng.choice(["SMALL", "MEDIUM", "LARGE"]),
+            "complexity_factors": {name: rng.random() < 0.8 for name in factors},
+            "client_complexity": rng.randint(1, 10),
+            "resource_availability": {"Process": float(rng.randint(0, 100))},
+            "contingency_percent": float(rng.choice([0, 5, 12.5, 15, 20, 33])),
+            "overhead_percent": float(rng.choice([0, 7.5, 10, 18])),
+        }
+        if rng.random() < 0.6:
+            overrides["base_hours_override"] = rng.randint(1, 20000)
+        scenarios.append((f"random {i}", overrides))
+    historical_stats = RunningStats(count=rng.randint(0, 12), mean=rng.uniform(0.7, 1.5), m2=rng.uniform(0, 2))
+
+    rows = ScenarioEvaluator(engine).evaluate(BASE, scenarios, historical_stats=historical_stats)
+
+    assert_rows_match_engine(engine, rows, scenarios, historical_stats)
+
+
+def test_deltas_are_relative_to_baseline():
+    """Test baseline deltas are zero and scenario deltas are differences."""
+    rows = ScenarioEvaluator(EstimationEngine()).evaluate(BASE, [("bigger", {"project_size": "LARGE"})])
+    baseline, bigger = rows
+
+    assert (baseline["delta_hours"], baseline["delta_percent"], baseline["delta_weeks"]) == (0, 0.0, 0)
+    assert bigger["delta_hours"] == bigger["total_hours"] - baseline["total_hours"] > 0
+    assert bigger["delta_weeks"] == bigger["duration_weeks"] - baseline["duration_weeks"]
+
+
+def test_invalid_scenario_is_rejected():
+    """Test that a scenario producing invalid inputs names the scenario."""
+    with pytest.raises(ValidationException, match="broken"):
+        ScenarioEvaluator(EstimationEngine()).evaluate(BASE, [("broken", {"contingency_percent": 500})])